@@ -9,9 +9,16 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
+import sys
 import os
 import json
 
+# backend 서비스 모듈 (순수 Python, 외부 의존성 없음)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from services.lunar_conversion import lunar_to_solar
+from services.ganji import Ganji, ELEMENTS
+
 # Google Gemini
 import google.generativeai as genai
 
@@ -68,6 +75,7 @@ class SajuRequest(BaseModel):
     birth_hour: Optional[int] = Field(None, ge=0, le=23)
     gender: str = Field(default="male")
     is_lunar: bool = Field(default=False)
+    is_leap_month: bool = Field(default=False)
 
 
 class SajuPillar(BaseModel):
@@ -83,6 +91,8 @@ class QuickAnalysisRequest(BaseModel):
     birth_day: int
     birth_hour: Optional[int] = None
     gender: str = "male"
+    is_lunar: bool = False
+    is_leap_month: bool = False
     question: Optional[str] = None
 
 
@@ -90,32 +100,6 @@ class QuickAnalysisRequest(BaseModel):
 class SajuCalculator:
     """만세력 기반 사주 계산"""
 
-    HEAVENLY_STEMS = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
-    EARTHLY_BRANCHES = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-
-    STEM_ELEMENTS = {
-        "갑": "wood", "을": "wood",
-        "병": "fire", "정": "fire",
-        "무": "earth", "기": "earth",
-        "경": "metal", "신": "metal",
-        "임": "water", "계": "water"
-    }
-
-    BRANCH_ELEMENTS = {
-        "자": "water", "축": "earth",
-        "인": "wood", "묘": "wood",
-        "진": "earth", "사": "fire",
-        "오": "fire", "미": "earth",
-        "신": "metal", "유": "metal",
-        "술": "earth", "해": "water"
-    }
-
-    BRANCH_ANIMALS = {
-        "자": "쥐", "축": "소", "인": "호랑이", "묘": "토끼",
-        "진": "용", "사": "뱀", "오": "말", "미": "양",
-        "신": "원숭이", "유": "닭", "술": "개", "해": "돼지"
-    }
-
     ELEMENT_KOREAN = {
         "wood": "목(木)", "fire": "화(火)", "earth": "토(土)",
         "metal": "금(金)", "water": "수(水)"
@@ -127,27 +111,15 @@ class SajuCalculator:
         7: 7, 8: 8, 9: 8, 10: 8, 11: 7, 12: 7
     }
 
-    def calculate_year_pillar(self, year: int, month: int, day: int) -> dict:
+    def calculate_year_pillar(self, year: int, month: int, day: int) -> Ganji:
         """년주 계산 - 입춘 기준"""
         # 입춘 전이면 전년도
         if month < 2 or (month == 2 and day < 4):
             year -= 1
 
-        stem_idx = (year - 4) % 10
-        branch_idx = (year - 4) % 12
-
-        stem = self.HEAVENLY_STEMS[stem_idx]
-        branch = self.EARTHLY_BRANCHES[branch_idx]
+        return Ganji(year - 4)
 
-        return {
-            "stem": stem,
-            "branch": branch,
-            "stem_element": self.STEM_ELEMENTS[stem],
-            "branch_element": self.BRANCH_ELEMENTS[branch],
-            "animal": self.BRANCH_ANIMALS[branch]
-        }
-
-    def calculate_month_pillar(self, year: int, month: int, day: int) -> dict:
+    def calculate_month_pillar(self, year: int, month: int, day: int) -> Ganji:
         """월주 계산 - 절기 기준"""
         # 절기 이전이면 전월
         if day < self.SOLAR_TERMS.get(month, 6):
@@ -162,17 +134,9 @@ class SajuCalculator:
         month_stem_idx = (month_stem_base + month - 1) % 10
         month_branch_idx = (month + 1) % 12
 
-        stem = self.HEAVENLY_STEMS[month_stem_idx]
-        branch = self.EARTHLY_BRANCHES[month_branch_idx]
+        return Ganji.from_parts(month_stem_idx, month_branch_idx)
 
-        return {
-            "stem": stem,
-            "branch": branch,
-            "stem_element": self.STEM_ELEMENTS[stem],
-            "branch_element": self.BRANCH_ELEMENTS[branch]
-        }
-
-    def calculate_day_pillar(self, year: int, month: int, day: int) -> dict:
+    def calculate_day_pillar(self, year: int, month: int, day: int) -> Ganji:
         """일주 계산"""
         # 기준일: 1900년 1월 1일 = 갑자일
         from datetime import date
@@ -180,48 +144,29 @@ class SajuCalculator:
         target_date = date(year, month, day)
         diff_days = (target_date - base_date).days
 
-        stem_idx = diff_days % 10
-        branch_idx = diff_days % 12
-
-        stem = self.HEAVENLY_STEMS[stem_idx]
-        branch = self.EARTHLY_BRANCHES[branch_idx]
+        return Ganji(diff_days)
 
-        return {
-            "stem": stem,
-            "branch": branch,
-            "stem_element": self.STEM_ELEMENTS[stem],
-            "branch_element": self.BRANCH_ELEMENTS[branch]
-        }
-
-    def calculate_hour_pillar(self, day_stem: str, hour: int) -> dict:
+    def calculate_hour_pillar(self, day_pillar: Ganji, hour: int) -> Ganji:
         """시주 계산"""
         # 시간을 지지로 변환 (23-01:자, 01-03:축, ...)
         hour_branch_idx = ((hour + 1) // 2) % 12
 
         # 일간에 따른 시간 천간 계산
-        day_stem_idx = self.HEAVENLY_STEMS.index(day_stem)
-        hour_stem_base = (day_stem_idx % 5) * 2
+        hour_stem_base = (day_pillar.stem_index % 5) * 2
         hour_stem_idx = (hour_stem_base + hour_branch_idx) % 10
 
-        stem = self.HEAVENLY_STEMS[hour_stem_idx]
-        branch = self.EARTHLY_BRANCHES[hour_branch_idx]
-
-        return {
-            "stem": stem,
-            "branch": branch,
-            "stem_element": self.STEM_ELEMENTS[stem],
-            "branch_element": self.BRANCH_ELEMENTS[branch]
-        }
+        return Ganji.from_parts(hour_stem_idx, hour_branch_idx)
 
-    def analyze_elements(self, pillars: list) -> dict:
+    def analyze_elements(self, pillars: List[Optional[Ganji]]) -> dict:
         """오행 분석"""
-        element_count = {"wood": 0, "fire": 0, "earth": 0, "metal": 0, "water": 0}
+        counts = [0] * len(ELEMENTS)
 
         for pillar in pillars:
-            if pillar:
-                element_count[pillar["stem_element"]] += 1
-                element_count[pillar["branch_element"]] += 1
+            if pillar is not None:
+                counts[pillar.stem_element_code] += 1
+                counts[pillar.branch_element_code] += 1
 
+        element_count = dict(zip(ELEMENTS, counts))
         dominant = max(element_count, key=element_count.get)
         weak = min(element_count, key=element_count.get)
 
@@ -239,6 +184,17 @@ class SajuCalculator:
             "gisin": dominant
         }
 
+    def _pillar_dict(self, pillar: Optional[Ganji]) -> Optional[dict]:
+        """응답용 기둥 딕셔너리"""
+        if pillar is None:
+            return None
+        return {
+            "stem": pillar.stem,
+            "branch": pillar.branch,
+            "stem_element": pillar.stem_element,
+            "branch_element": pillar.branch_element
+        }
+
     def get_full_saju(self, year: int, month: int, day: int, hour: Optional[int] = None) -> dict:
         """전체 사주 계산"""
         year_pillar = self.calculate_year_pillar(year, month, day)
@@ -247,16 +203,19 @@ class SajuCalculator:
 
         hour_pillar = None
         if hour is not None:
-            hour_pillar = self.calculate_hour_pillar(day_pillar["stem"], hour)
+            hour_pillar = self.calculate_hour_pillar(day_pillar, hour)
 
-        pillars = [year_pillar, month_pillar, day_pillar, hour_pillar]
-        elements = self.analyze_elements(pillars)
+        elements = self.analyze_elements([year_pillar, month_pillar, day_pillar, hour_pillar])
+
+        # 응답 직전에 문자열로 변환
+        year_data = self._pillar_dict(year_pillar)
+        year_data["animal"] = year_pillar.animal
 
         return {
-            "year_pillar": year_pillar,
-            "month_pillar": month_pillar,
-            "day_pillar": day_pillar,
-            "hour_pillar": hour_pillar,
+            "year_pillar": year_data,
+            "month_pillar": self._pillar_dict(month_pillar),
+            "day_pillar": self._pillar_dict(day_pillar),
+            "hour_pillar": self._pillar_dict(hour_pillar),
             "elements": elements
         }
 
@@ -418,16 +377,26 @@ async def health_check():
     }
 
 
+def resolve_solar_date(year: int, month: int, day: int, is_lunar: bool, is_leap_month: bool):
+    """음력 생일이면 양력 (년, 월, 일)로 변환"""
+    if not is_lunar:
+        return year, month, day
+    solar = lunar_to_solar(year, month, day, is_leap_month)
+    return solar.year, solar.month, solar.day
+
+
 @app.post("/api/saju/analyze")
 async def analyze_saju(request: SajuRequest):
     """사주 분석"""
     try:
-        saju_data = saju_calc.get_full_saju(
+        year, month, day = resolve_solar_date(
             request.birth_year,
             request.birth_month,
             request.birth_day,
-            request.birth_hour
+            request.is_lunar,
+            request.is_leap_month
         )
+        saju_data = saju_calc.get_full_saju(year, month, day, request.birth_hour)
 
         interpretation = await get_ai_interpretation(saju_data)
 
@@ -440,6 +409,8 @@ async def analyze_saju(request: SajuRequest):
             },
             "disclaimer": "본 결과는 통계적 분석이며 의학적/법적 조언을 대체하지 않습니다."
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -448,12 +419,14 @@ async def analyze_saju(request: SajuRequest):
 async def quick_analysis(request: QuickAnalysisRequest):
     """간편 분석"""
     try:
-        saju_data = saju_calc.get_full_saju(
+        year, month, day = resolve_solar_date(
             request.birth_year,
             request.birth_month,
             request.birth_day,
-            request.birth_hour
+            request.is_lunar,
+            request.is_leap_month
         )
+        saju_data = saju_calc.get_full_saju(year, month, day, request.birth_hour)
 
         interpretation = await get_ai_interpretation(saju_data, request.question)
 
@@ -475,6 +448,8 @@ async def quick_analysis(request: QuickAnalysisRequest):
             "question_answer": interpretation.get("question_answer") if request.question else None,
             "disclaimer": "본 결과는 통계적 분석이며 의학적/법적 조언을 대체하지 않습니다."
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
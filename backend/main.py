@@ -7,7 +7,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from routers import saju, astrology, physiognomy, synthesis
+from routers import saju, astrology, physiognomy, synthesis, places
+from services.ephemeris_pool import shutdown_ephemeris_pool
 
 
 @asynccontextmanager
@@ -17,6 +18,7 @@ async def lifespan(app: FastAPI):
     print("Astro-Synthesis API Server Started")
     yield
     # Shutdown
+    shutdown_ephemeris_pool()
     print("Server Shutdown")
 
 
@@ -41,6 +43,7 @@ app.include_router(saju.router, prefix="/api/saju", tags=["사주 (四柱)"])
 app.include_router(astrology.router, prefix="/api/astrology", tags=["점성술 (Astrology)"])
 app.include_router(physiognomy.router, prefix="/api/physiognomy", tags=["관상 (Physiognomy)"])
 app.include_router(synthesis.router, prefix="/api/synthesis", tags=["통합 분석 (Synthesis)"])
+app.include_router(places.router, prefix="/api/places", tags=["출생지 (Places)"])
 
 
 @app.get("/")
@@ -54,7 +57,8 @@ async def root():
             "사주": "/api/saju",
             "점성술": "/api/astrology",
             "관상": "/api/physiognomy",
-            "통합분석": "/api/synthesis"
+            "통합분석": "/api/synthesis",
+            "출생지": "/api/places"
         }
     }
 
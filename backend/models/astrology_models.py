@@ -46,6 +46,12 @@ class HouseSystem(str, Enum):
     PORPHYRY = "porphyry"
 
 
+class ZodiacType(str, Enum):
+    """황도 기준"""
+    TROPICAL = "tropical"    # 회귀황도 (서양 점성술 기본)
+    SIDEREAL = "sidereal"    # 항성황도 (Fagan-Bradley)
+
+
 class AspectType(str, Enum):
     """아스펙트 종류"""
     CONJUNCTION = "conjunction"  # 합 (0°)
@@ -55,6 +61,28 @@ class AspectType(str, Enum):
     SEXTILE = "sextile"         # 육합 (60°)
 
 
+class AspectPatternType(str, Enum):
+    """아스펙트 패턴 종류"""
+    STELLIUM = "stellium"          # 스텔리움 (3행성 이상 합)
+    GRAND_TRINE = "grand_trine"    # 그랜드 트라인
+    T_SQUARE = "t_square"          # T-스퀘어
+    GRAND_CROSS = "grand_cross"    # 그랜드 크로스
+    YOD = "yod"                    # 요드 (신의 손가락)
+    KITE = "kite"                  # 카이트
+
+
+class ChartTheme(str, Enum):
+    """천궁도 SVG 테마"""
+    LIGHT = "light"
+    DARK = "dark"
+
+
+class StreamFormat(str, Enum):
+    """스트리밍 응답 형식"""
+    NDJSON = "ndjson"    # 한 줄에 JSON 하나 (application/x-ndjson)
+    SSE = "sse"          # 서버 전송 이벤트 (text/event-stream)
+
+
 class AstrologyRequest(BaseModel):
     """점성술 차트 요청"""
     birth_year: int = Field(..., ge=1900, le=2100)
@@ -62,10 +90,13 @@ class AstrologyRequest(BaseModel):
     birth_day: int = Field(..., ge=1, le=31)
     birth_hour: int = Field(..., ge=0, le=23)
     birth_minute: int = Field(..., ge=0, le=59)
-    latitude: float = Field(..., ge=-90, le=90, description="출생지 위도")
-    longitude: float = Field(..., ge=-180, le=180, description="출생지 경도")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="출생지 위도 (location 사용 시 생략)")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="출생지 경도 (location 사용 시 생략)")
+    location: Optional[str] = Field(None, description="출생지 이름 (위도/경도 생략 시 지명 사전으로 해석)")
     timezone: str = Field("Asia/Seoul", description="시간대")
     house_system: HouseSystem = Field(HouseSystem.PLACIDUS, description="하우스 시스템")
+    zodiac_type: ZodiacType = Field(ZodiacType.TROPICAL, description="황도 기준")
+    topocentric: bool = Field(False, description="측심(출생지 기준) 행성 위치 사용 여부")
 
     class Config:
         json_schema_extra = {
@@ -110,6 +141,13 @@ class HouseCusp(BaseModel):
     degree: float
 
 
+class AspectPattern(BaseModel):
+    """아스펙트 패턴"""
+    pattern: AspectPatternType
+    planets: List[Planet] = Field(..., description="패턴을 이루는 행성")
+    apex: Optional[Planet] = Field(None, description="꼭짓점 행성 (T-스퀘어, 요드, 카이트)")
+
+
 class AstrologyResponse(BaseModel):
     """점성술 차트 응답"""
     # 기본 정보
@@ -125,6 +163,7 @@ class AstrologyResponse(BaseModel):
 
     # 아스펙트
     aspects: List[Aspect] = Field(..., description="메이저 아스펙트 목록")
+    aspect_patterns: List[AspectPattern] = Field(default_factory=list, description="아스펙트 패턴 (그랜드 트라인, T-스퀘어 등)")
 
     # Dignities (행성 위계)
     dignities: dict = Field(..., description="행성 품위 (domicile, exaltation, etc.)")
@@ -159,6 +198,124 @@ class TransitRequest(BaseModel):
     transit_date: datetime = Field(..., description="조회할 날짜")
 
 
+class TransitEventRequest(BaseModel):
+    """트랜짓 이벤트 (정확 시각/오브 진입·이탈) 탐색 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    start_date: datetime = Field(..., description="탐색 시작 시각 (시간대 없으면 UTC)")
+    end_date: datetime = Field(..., description="탐색 종료 시각 (시간대 없으면 UTC)")
+    planets: Optional[List[Planet]] = Field(None, description="트랜짓 행성 (기본: 전체)")
+    aspects: Optional[List[AspectType]] = Field(None, description="아스펙트 종류 (기본: 메이저 전체)")
+    include_orb: bool = Field(True, description="오브 진입/이탈 이벤트 포함 여부")
+
+
+class TransitTimelineRequest(BaseModel):
+    """트랜짓 타임라인 (일정 간격 스냅샷) 스트리밍 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    start_date: datetime = Field(..., description="시작 시각 (시간대 없으면 UTC)")
+    end_date: datetime = Field(..., description="종료 시각 (시간대 없으면 UTC)")
+    step_hours: int = Field(24, ge=1, le=720, description="스냅샷 간격 (시간)")
+    planets: Optional[List[Planet]] = Field(None, description="트랜짓 행성 (기본: 전체)")
+    aspects: Optional[List[AspectType]] = Field(None, description="아스펙트 종류 (기본: 메이저 전체)")
+    format: StreamFormat = Field(StreamFormat.NDJSON, description="스트리밍 형식")
+
+
+class ChartWheelRequest(BaseModel):
+    """천궁도 휠 SVG 요청 (transit_date가 있으면 트랜짓 이중 휠)"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    transit_date: Optional[datetime] = Field(None, description="바깥 링 트랜짓 시각 (시간대 없으면 UTC)")
+    theme: ChartTheme = Field(ChartTheme.LIGHT, description="색상 테마")
+
+
+class SynastryRequest(BaseModel):
+    """시너스트리 (두 사람 궁합) 요청"""
+    person_a: AstrologyRequest = Field(..., description="A의 출생 차트 정보")
+    person_b: AstrologyRequest = Field(..., description="B의 출생 차트 정보")
+    include_composite: bool = Field(True, description="컴포지트(중간점) 차트 포함 여부")
+    include_davison: bool = Field(True, description="데이비슨 차트 포함 여부")
+
+
+class SynastryBatchRequest(BaseModel):
+    """한 사람 × 여러 후보 궁합 순위 요청"""
+    person: AstrologyRequest = Field(..., description="기준 인물의 출생 차트 정보")
+    candidates: List[AstrologyRequest] = Field(..., min_length=1, max_length=1000, description="후보 출생 차트 목록")
+    limit: Optional[int] = Field(None, ge=1, description="반환할 상위 후보 수 (기본: 전체)")
+    top_aspects: int = Field(5, ge=0, le=50, description="후보별로 포함할 교차 아스펙트 수 (오브 순)")
+
+
+class ReturnRequest(BaseModel):
+    """리턴 차트 (행성이 출생 황경으로 돌아오는 시각) 탐색 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    planet: Planet = Field(Planet.SUN, description="리턴 행성 (태양 = 솔라 리턴, 달 = 루나 리턴)")
+    start_date: datetime = Field(..., description="탐색 시작 시각 (시간대 없으면 UTC)")
+    end_date: datetime = Field(..., description="탐색 종료 시각 (시간대 없으면 UTC)")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="리턴 차트 위치 위도 (기본: 출생지)")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="리턴 차트 위치 경도 (기본: 출생지)")
+    include_charts: bool = Field(True, description="리턴 시각별 행성/하우스 포함 여부")
+
+
+class ProgressionRequest(BaseModel):
+    """2차 진행 (하루 = 1년) 차트 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    start_age: float = Field(0, ge=0, le=120, description="시작 나이 (년)")
+    end_age: float = Field(30, ge=0, le=120, description="종료 나이 (년)")
+    step_months: int = Field(12, ge=1, le=120, description="나이 간격 (개월)")
+    planets: Optional[List[Planet]] = Field(None, description="진행 행성 (기본: 전체)")
+    include_aspects: bool = Field(True, description="진행 행성 × 출생 행성 아스펙트 포함 여부")
+
+
+class HouseComparisonRequest(BaseModel):
+    """하우스 시스템 비교 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    house_systems: Optional[List[HouseSystem]] = Field(None, description="비교할 하우스 시스템 (기본: 전체)")
+
+
+class AstrocartographyRequest(BaseModel):
+    """아스트로카토그래피 (행성 각도선 지도) 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    planets: Optional[List[Planet]] = Field(None, description="행성 (기본: 전체)")
+    latitude_step: float = Field(1.0, ge=0.25, le=5, description="위도 격자 간격 (도)")
+    latitude_limit: float = Field(80.0, gt=0, le=85, description="위도 범위 ±도")
+
+
+class RelocationPlace(BaseModel):
+    """이주 후보 도시 (위도/경도가 없으면 지명으로 해석)"""
+    name: Optional[str] = Field(None, description="도시 이름 또는 지명")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="위도")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="경도")
+
+
+class RelocationRequest(BaseModel):
+    """이주 차트 요청 (여러 도시 동시 계산)"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    places: List[RelocationPlace] = Field(..., min_length=1, max_length=200, description="후보 도시")
+    line_orb_km: float = Field(500.0, gt=0, le=3000, description="영향 각도선 거리 (km)")
+
+
+class ChartIndexRequest(BaseModel):
+    """유사도 인덱스에 출생 차트 등록 요청"""
+    key: str = Field(..., min_length=1, max_length=200, description="차트 키 (사용자 ID, 유명인 이름 등)")
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    birth_time_known: bool = Field(True, description="출생 시각을 아는지 여부 (모르면 ASC/MC 제외)")
+
+
+class SimilarChartRequest(BaseModel):
+    """유사 차트 검색 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    birth_time_known: bool = Field(True, description="출생 시각을 아는지 여부 (모르면 ASC/MC 제외)")
+    k: int = Field(10, ge=1, le=100, description="결과 수")
+    exclude_key: Optional[str] = Field(None, description="결과에서 제외할 키 (자기 자신)")
+
+
+class TransitPatternRequest(BaseModel):
+    """트랜짓으로 완성되는 아스펙트 패턴 탐색 요청"""
+    natal_chart: AstrologyRequest = Field(..., description="출생 차트 정보")
+    start_date: datetime = Field(..., description="탐색 시작 시각 (시간대 없으면 UTC)")
+    end_date: datetime = Field(..., description="탐색 종료 시각 (시간대 없으면 UTC)")
+    step_hours: int = Field(6, ge=1, le=168, description="탐색 간격 (시간)")
+    planets: Optional[List[Planet]] = Field(None, description="트랜짓 행성 (기본: 전체)")
+    patterns: Optional[List[AspectPatternType]] = Field(None, description="패턴 종류 (기본: 전체)")
+
+
 class TransitResponse(BaseModel):
     """트랜짓 (운세) 응답"""
     date: datetime
@@ -68,6 +68,7 @@ class SajuRequest(BaseModel):
     birth_minute: Optional[int] = Field(None, ge=0, le=59, description="출생 분")
     gender: Gender = Field(..., description="성별")
     is_lunar: bool = Field(False, description="음력 여부")
+    is_leap_month: bool = Field(False, description="윤달 여부 (음력 입력 시)")
     location: Optional[str] = Field(None, description="출생 지역 (시간대 보정용)")
 
     class Config:
@@ -80,6 +81,7 @@ class SajuRequest(BaseModel):
                 "birth_minute": 30,
                 "gender": "male",
                 "is_lunar": False,
+                "is_leap_month": False,
                 "location": "서울"
             }
         }
@@ -1,7 +1,8 @@
 """점성술 (Astrology) API 라우터"""
 
-from fastapi import APIRouter, HTTPException
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional
 from datetime import datetime
 import sys
 import os
@@ -10,13 +11,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.astrology_models import (
     AstrologyRequest, AstrologyResponse,
-    TransitRequest, TransitResponse,
+    TransitRequest, TransitResponse, TransitEventRequest, HouseComparisonRequest,
+    AstrocartographyRequest, RelocationRequest, ChartIndexRequest, SimilarChartRequest,
+    TransitPatternRequest, TransitTimelineRequest, StreamFormat, ChartWheelRequest,
+    SynastryRequest, SynastryBatchRequest, ReturnRequest, ProgressionRequest,
     ZodiacSign, Planet, HouseSystem
 )
-from services.astrology_service import AstrologyService
+from services.ephemeris_pool import get_ephemeris_pool
 
 router = APIRouter()
-astrology_service = AstrologyService()
+ephemeris_pool = get_ephemeris_pool()
 
 
 @router.post("/natal-chart", response_model=AstrologyResponse)
@@ -29,7 +33,7 @@ async def create_natal_chart(request: AstrologyRequest):
     - 성격 및 인생 테마 해석
     """
     try:
-        result = astrology_service.create_natal_chart(request)
+        result = await ephemeris_pool.run('astrology', 'create_natal_chart', request)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -46,8 +50,278 @@ async def get_transit(request: TransitRequest):
     - 특정 날짜의 운세 예측
     """
     try:
-        result = astrology_service.get_transit(request)
+        result = await ephemeris_pool.run('astrology', 'get_transit', request)
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/transit-events")
+async def stream_transit_events(request: TransitEventRequest):
+    """
+    트랜짓 이벤트 스트림 (NDJSON)
+
+    - 기간 내 트랜짓 × 네이탈 아스펙트의 정확 시각
+    - 오브 진입(enter) / 이탈(exit) 시각
+    - 한 줄에 이벤트 하나씩 시각 순으로 전송 (날짜별 /transit 반복 호출 대체)
+    - 출생 차트 준비와 30일 구간 계산은 모두 천체력 워커 풀에서 실행
+    """
+    try:
+        plan = await ephemeris_pool.run('astrology', 'plan_transit_events', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def lines():
+        chunks = [(plan, index) for index in range(len(plan['chunks']))]
+        async for text in ephemeris_pool.run_each('astrology', 'transit_event_chunk_text', chunks):
+            yield text
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/transit-timeline")
+async def stream_transit_timeline(request: TransitTimelineRequest):
+    """
+    트랜짓 타임라인 스트림 (NDJSON 또는 SSE)
+
+    - step_hours 간격의 트랜짓 행성 위치와 네이탈 하우스
+    - 시각별 트랜짓 × 네이탈 아스펙트 (오브 순)
+    - 계산되는 대로 구간 단위로 전송 (메모리 사용량은 기간과 무관)
+    - 출생 차트 준비와 구간 계산은 모두 천체력 워커 풀에서 실행
+    """
+    try:
+        plan = await ephemeris_pool.run('astrology', 'plan_transit_timeline', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def chunks():
+        calls = [(plan, index, request.format) for index in range(len(plan['chunks']))]
+        async for text in ephemeris_pool.run_each('astrology', 'transit_timeline_chunk_text', calls):
+            yield text
+
+    if request.format == StreamFormat.SSE:
+        return StreamingResponse(
+            chunks(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+@router.post("/chart-wheel")
+async def render_chart_wheel(request: ChartWheelRequest):
+    """
+    천궁도 휠 SVG (image/svg+xml)
+
+    - 출생 차트 단일 휠 (커스프, 행성, 아스펙트 선)
+    - transit_date 지정 시 바깥 링에 트랜짓 행성을 그린 이중 휠
+    - light / dark 테마
+    """
+    try:
+        svg = await ephemeris_pool.run('astrology', 'render_chart_wheel', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=svg, media_type="image/svg+xml")
+
+
+@router.post("/synastry")
+async def get_synastry(request: SynastryRequest):
+    """
+    시너스트리 (두 사람 궁합)
+
+    - 교차 아스펙트 (planet1 = A, planet2 = B)와 궁합 점수 (0-100)
+    - 하우스 오버레이 (A의 행성이 B의 몇 하우스에, 그 반대도)
+    - 컴포지트(중간점) 차트, 데이비슨 차트
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'synastry', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/synastry/batch")
+async def get_synastry_batch(request: SynastryBatchRequest):
+    """
+    한 사람 × 여러 후보 궁합 순위 (매칭용)
+
+    - 후보 전체의 교차 아스펙트를 한 번에 계산
+    - 점수 내림차순, 후보별 주요 교차 아스펙트
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'synastry_batch', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/returns")
+async def find_returns(request: ReturnRequest):
+    """
+    솔라/루나 리턴 차트
+
+    - 기간 내 행성이 출생 황경으로 돌아오는 정확한 시각 (모든 회차)
+    - 리턴 시각별 행성 위치와 하우스 (출생지 또는 지정 위치 기준)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'find_returns', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/progressions")
+async def get_progressions(request: ProgressionRequest):
+    """
+    2차 진행 차트 (하루 = 1년)
+
+    - 나이 구간의 진행 행성 위치, 태양호, 진행 ASC/MC
+    - 진행 행성 × 출생 행성 아스펙트 (오브 1도)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'get_progressions', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/house-comparison")
+async def compare_house_systems(request: HouseComparisonRequest):
+    """
+    하우스 시스템 비교
+
+    - 같은 출생 차트의 시스템별 커스프, ASC/MC
+    - 시스템별 행성 하우스 배치
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'compare_house_systems', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/astrocartography")
+async def get_astrocartography(request: AstrocartographyRequest):
+    """
+    아스트로카토그래피 (행성 각도선 지도)
+
+    - 행성별 ASC/DSC/MC/IC 선을 GeoJSON FeatureCollection으로 반환
+    - 좌표는 [경도, 위도], 날짜변경선에서 나뉜 MultiLineString
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'get_astrocartography', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/relocation")
+async def relocate(request: RelocationRequest):
+    """
+    이주 차트 (여러 후보 도시 동시 계산)
+
+    - 도시별 ASC/MC, 하우스 커스프, 행성 하우스 배치
+    - 도시에서 가까운 행성 각도선과 동서 거리 (km)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'relocate', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/chart-index")
+async def index_chart(request: ChartIndexRequest):
+    """
+    유사도 인덱스에 출생 차트 등록
+
+    - 같은 키는 한 번만 등록 가능
+    - 출생 시각을 모르면 birth_time_known=false (ASC/MC 제외)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'index_chart', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/similar-charts")
+async def find_similar_charts(request: SimilarChartRequest):
+    """
+    유사 차트 검색 ("나와 비슷한 차트", 유명인 매칭)
+
+    - 행성/ASC/MC 황경의 원형 특징 벡터 코사인 유사도 top-k
+    - 출생 시각을 모르면 birth_time_known=false (ASC/MC 제외)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'find_similar_charts', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/transit-patterns")
+async def find_transit_patterns(request: TransitPatternRequest):
+    """
+    트랜짓 아스펙트 패턴
+
+    - 트랜짓 행성이 네이탈 행성과 함께 완성하는 그랜드 트라인, T-스퀘어, 요드 등
+    - 패턴이 유지되는 시작/종료 시각 구간 (UTC)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'find_transit_patterns', request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    점성술 계산 캐시 통계
+
+    - 출생 차트 캐시 (메모리 LRU, sqlite 디스크 계층) 적중/미스/축출 횟수
+    - 하우스 커스프 캐시 통계
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'cache_stats')
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/retrograde-calendar")
+async def get_retrograde_calendar(
+    year: int = Query(..., ge=1900, le=2100, description="연도"),
+    planets: Optional[List[str]] = Query(None, description="행성 (기본: 수성 ~ 명왕성)")
+):
+    """
+    역행 달력
+
+    - 연도 내 행성별 역행 정류 / 순행 정류 시각 (UTC)
+    - 미리 계산한 입궁/정류 테이블 조회 (1900-2100년)
+    """
+    try:
+        return await ephemeris_pool.run('astrology', 'get_retrograde_calendar', year, planets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,69 @@
+"""출생지 (Places) API 라우터"""
+
+from fastapi import APIRouter, HTTPException, Query
+from datetime import datetime
+from typing import Optional
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.gazetteer import get_gazetteer, place_utc_offset, TRIE_TOP_K
+
+router = APIRouter()
+
+
+@router.get("/search")
+async def search_places(
+    q: str = Query(..., min_length=1, description="입력 중인 지명"),
+    limit: int = Query(10, ge=1, le=TRIE_TOP_K)
+):
+    """
+    출생지 자동완성
+
+    - 한글 자모 단위 접두어 검색 ('서ㅇ' → 서울)
+    - 초성 검색 ('ㅅㅇ' → 서울, 수원, ...)
+    - 영문 지명 검색 ('new' → 뉴욕, 뉴델리)
+    """
+    places = get_gazetteer().search(q, limit)
+    return {"query": q, "places": [place.to_dict() for place in places]}
+
+
+@router.get("/resolve")
+async def resolve_place(
+    q: str = Query(..., min_length=1, description="출생지 문자열"),
+    at: Optional[datetime] = Query(None, description="UTC 오프셋을 계산할 현지 시각")
+):
+    """
+    출생지 해석
+
+    - '서울특별시 강남구', '부산 해운대', 'New York, USA' 형식 지원
+    - 좌표와 시간대(IANA), 선택 시각의 UTC 오프셋 반환
+    """
+    place = get_gazetteer().resolve(q)
+    if place is None:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 출생지입니다: {q}")
+
+    result = place.to_dict()
+    if at is not None:
+        result["utc_offset_minutes"] = place_utc_offset(place, at.replace(tzinfo=None))
+    return result
+
+
+@router.get("/reverse")
+async def reverse_place(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    limit: int = Query(1, ge=1, le=20)
+):
+    """
+    좌표 → 가까운 지명 역조회
+
+    - 가까운 순으로 지명과 거리(km) 반환
+    """
+    nearest = get_gazetteer().nearest(latitude, longitude, limit)
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "places": [dict(place.to_dict(), distance_km=distance) for place, distance in nearest]
+    }
@@ -109,26 +109,64 @@ async def get_yearly_fortune(
     birth_year: int,
     birth_month: int,
     birth_day: int,
-    gender: str
+    gender: str,
+    is_lunar: bool = False,
+    is_leap_month: bool = False
 ):
     """
     특정 연도 운세 (세운) 조회
 
     - 해당 연도의 천간/지지와 사주의 상호작용 분석
+    - 음력 생일(윤달 포함) 입력 지원
     """
     try:
         request = SajuRequest(
             birth_year=birth_year,
             birth_month=birth_month,
             birth_day=birth_day,
-            gender=gender
+            gender=gender,
+            is_lunar=is_lunar,
+            is_leap_month=is_leap_month
         )
         fortune = saju_service.get_yearly_fortune(request, year)
         return {"year": year, "fortune": fortune}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/calendar/{year}")
+async def get_calendar(year: int, month: Optional[int] = None):
+    """
+    일진 달력 조회
+
+    - 월(month 지정) 또는 연 단위 날짜별 년/월/일 간지
+    - 음력 날짜 및 절입일 표시
+    """
+    if month is not None and not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="월은 1-12 사이여야 합니다.")
+
+    try:
+        days = saju_service.get_calendar(year, month)
+        return {"year": year, "month": month, "days": days}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    만세력 계산 캐시 통계
+
+    - calculate_saju LRU 캐시 (사주 분석) 적중/미스/축출 횟수
+    - 전체 사전 계산 테이블 사용 여부
+    """
+    return saju_service.lunar_calendar.cache_stats()
+
+
 @router.get("/compatibility")
 async def check_compatibility(
     person1_year: int,
@@ -138,12 +176,17 @@ async def check_compatibility(
     person2_year: int,
     person2_month: int,
     person2_day: int,
-    person2_gender: str
+    person2_gender: str,
+    person1_is_lunar: bool = False,
+    person1_is_leap_month: bool = False,
+    person2_is_lunar: bool = False,
+    person2_is_leap_month: bool = False
 ):
     """
     궁합 분석
 
     - 두 사람의 사주를 비교하여 궁합 점수 및 해석 제공
+    - 음력 생일(윤달 포함) 입력 지원
     """
     try:
         compatibility = saju_service.check_compatibility(
@@ -151,15 +194,21 @@ async def check_compatibility(
                 birth_year=person1_year,
                 birth_month=person1_month,
                 birth_day=person1_day,
-                gender=person1_gender
+                gender=person1_gender,
+                is_lunar=person1_is_lunar,
+                is_leap_month=person1_is_leap_month
             ),
             SajuRequest(
                 birth_year=person2_year,
                 birth_month=person2_month,
                 birth_day=person2_day,
-                gender=person2_gender
+                gender=person2_gender,
+                is_lunar=person2_is_lunar,
+                is_leap_month=person2_is_leap_month
             )
         )
         return compatibility
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
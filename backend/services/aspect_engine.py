@@ -0,0 +1,373 @@
+"""
+아스펙트 엔진 - 행성 간 각거리 행렬 기반 일괄 아스펙트 탐색
+
+두 행성 목록의 황경으로 (시각 ×) 행성 × 행성 각거리 행렬을 한 번에 만들고,
+아스펙트 종류별로 행성 쌍 오브 표와 비교해 성립하는 쌍만 골라냅니다.
+
+- 네이탈 × 네이탈: lon2를 생략하면 같은 목록의 위 삼각형(i < j)만 검사
+- 트랜짓 × 네이탈, 차트 × 차트: lon1/lon2에 각각 전달
+- 여러 시각: (시각 수, 행성 수) 배열을 넘기면 (시각, 행성, 행성) 단위로 일괄 검사
+
+결과는 인덱스/오브 배열만 담은 AspectHits로 반환하고, dict나 Aspect 모델로의
+변환은 필요할 때(to_dicts / to_models) 수행합니다.
+한 쌍에 여러 아스펙트가 겹치면 ASPECTS 순서상 앞선 것 하나만 기록합니다.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from models.astrology_models import Aspect, AspectType, Planet
+
+
+# 아스펙트 종류: 이름 -> (정확한 각도, 기본 오브), 순서가 우선순위
+ASPECTS = {
+    'conjunction': (0, 8),
+    'sextile': (60, 6),
+    'square': (90, 8),
+    'trine': (120, 8),
+    'opposition': (180, 8),
+    'quincunx': (150, 3),
+    'semi_sextile': (30, 2),
+    'semi_square': (45, 2),
+    'sesquiquadrate': (135, 2),
+}
+
+MAJOR_ASPECTS = ('conjunction', 'sextile', 'square', 'trine', 'opposition')
+MINOR_ASPECTS = ('quincunx', 'semi_sextile', 'semi_square', 'sesquiquadrate')
+ALL_ASPECTS = MAJOR_ASPECTS + MINOR_ASPECTS
+
+# 발광체(태양/달) 오브 - 메이저 아스펙트는 2도, 마이너는 1도 넓게
+LUMINARY_ORBS = {
+    luminary: {
+        name: orb + (2 if name in MAJOR_ASPECTS else 1)
+        for name, (_, orb) in ASPECTS.items()
+    }
+    for luminary in ('sun', 'moon')
+}
+
+
+class OrbTable:
+    """
+    행성별 아스펙트 오브 표
+
+    행성 쌍의 허용 오브는 두 행성 오브 중 큰 값을 사용합니다.
+    planet_orbs에 없는 행성/아스펙트는 aspect_orbs(기본값 ASPECTS)를 따릅니다.
+    """
+
+    def __init__(
+        self,
+        aspect_orbs: Optional[Dict[str, float]] = None,
+        planet_orbs: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        """
+        Args:
+            aspect_orbs: 아스펙트 이름 -> 기본 오브 (일부만 지정 가능)
+            planet_orbs: 행성 이름 -> {아스펙트 이름: 오브}
+        """
+        self.aspect_orbs = {name: orb for name, (_, orb) in ASPECTS.items()}
+        self.aspect_orbs.update(aspect_orbs or {})
+        self.planet_orbs = {
+            planet.lower(): dict(orbs) for planet, orbs in (planet_orbs or {}).items()
+        }
+        self._matrices = {}
+
+    def orb(self, planet: str, aspect: str) -> float:
+        """한 행성의 아스펙트 오브"""
+        return self.planet_orbs.get(planet.lower(), {}).get(aspect, self.aspect_orbs[aspect])
+
+    def pair_orb(self, planet1: str, planet2: str, aspect: str) -> float:
+        """행성 쌍의 허용 오브"""
+        return max(self.orb(planet1, aspect), self.orb(planet2, aspect))
+
+    def matrix(
+        self, names1: Sequence[str], names2: Sequence[str], aspects: Sequence[str]
+    ) -> 'np.ndarray':
+        """
+        (len(names1), len(names2), len(aspects)) 허용 오브 배열 (행성 구성별 캐시)
+        """
+        key = (tuple(names1), tuple(names2), tuple(aspects))
+        result = self._matrices.get(key)
+        if result is None:
+            orbs1 = np.array([[self.orb(p, a) for a in aspects] for p in names1], dtype=np.float64)
+            orbs2 = np.array([[self.orb(p, a) for a in aspects] for p in names2], dtype=np.float64)
+            result = np.maximum(orbs1[:, None, :], orbs2[None, :, :])
+            result.setflags(write=False)
+            self._matrices[key] = result
+        return result
+
+
+DEFAULT_ORB_TABLE = OrbTable()
+LUMINARY_ORB_TABLE = OrbTable(planet_orbs=LUMINARY_ORBS)
+
+
+def aspect_strength(orb_actual: float, orb_max: float) -> str:
+    """아스펙트 강도 (허용 오브 대비 실제 오브 비율)"""
+    ratio = orb_actual / orb_max
+    if ratio <= 0.25:
+        return 'exact'
+    elif ratio <= 0.5:
+        return 'strong'
+    elif ratio <= 0.75:
+        return 'moderate'
+    else:
+        return 'weak'
+
+
+def _take(column, order):
+    """배열/리스트 열을 같은 방식으로 재배열"""
+    if NUMPY_AVAILABLE and isinstance(column, np.ndarray):
+        return column[order]
+    return [column[k] for k in order]
+
+
+class AspectHits:
+    """
+    아스펙트 탐색 결과 (성립한 행성 쌍의 압축 배열)
+
+    Attributes:
+        names1, names2: 행성 이름 목록
+        aspects: 검사한 아스펙트 이름 목록 (aspect 열의 인덱스 대상)
+        epoch: 시각 인덱스 배열 (단일 시각이면 None)
+        index1, index2: names1/names2 인덱스 배열
+        aspect: aspects 인덱스 배열
+        separation: 실제 각거리 (0-180도)
+        orb: 정확한 각도와의 차이
+        max_orb: 해당 쌍의 허용 오브
+        applying: 어플라잉 여부 배열 (속도가 없으면 None)
+    """
+
+    COLUMNS = ('index1', 'index2', 'aspect', 'separation', 'orb', 'max_orb')
+
+    def __init__(self, names1, names2, aspects, epoch, index1, index2, aspect,
+                 separation, orb, max_orb, applying):
+        self.names1 = tuple(names1)
+        self.names2 = tuple(names2)
+        self.aspects = tuple(aspects)
+        self.epoch = epoch
+        self.index1 = index1
+        self.index2 = index2
+        self.aspect = aspect
+        self.separation = separation
+        self.orb = orb
+        self.max_orb = max_orb
+        self.applying = applying
+
+    def __len__(self) -> int:
+        return len(self.orb)
+
+    def select(self, order) -> 'AspectHits':
+        """인덱스 순서(또는 부분 집합)대로 재구성한 결과"""
+        return AspectHits(
+            self.names1, self.names2, self.aspects,
+            None if self.epoch is None else _take(self.epoch, order),
+            *(_take(getattr(self, name), order) for name in self.COLUMNS),
+            None if self.applying is None else _take(self.applying, order)
+        )
+
+    def sorted_by_orb(self, limit: Optional[int] = None) -> 'AspectHits':
+        """오브가 작은 순으로 정렬 (같은 오브는 원래 순서 유지)"""
+        if NUMPY_AVAILABLE and isinstance(self.orb, np.ndarray):
+            order = np.argsort(self.orb, kind='stable')
+        else:
+            order = sorted(range(len(self.orb)), key=self.orb.__getitem__)
+        return self.select(order[:limit])
+
+    def rows(self):
+        """(epoch, 행성1, 행성2, 아스펙트, 각거리, 오브, 허용 오브, 어플라잉) 튜플 순회"""
+        for k in range(len(self)):
+            yield (
+                None if self.epoch is None else int(self.epoch[k]),
+                self.names1[self.index1[k]],
+                self.names2[self.index2[k]],
+                self.aspects[self.aspect[k]],
+                float(self.separation[k]),
+                float(self.orb[k]),
+                float(self.max_orb[k]),
+                None if self.applying is None else bool(self.applying[k]),
+            )
+
+    def to_dicts(self) -> List[Dict]:
+        """SwissEphemeris.calculate_aspects 형식의 dict 목록"""
+        result = []
+        for epoch, p1, p2, name, _, orb, max_orb, applying in self.rows():
+            item = {
+                'planet1': p1,
+                'planet2': p2,
+                'aspect': name,
+                'angle': ASPECTS[name][0],
+                'orb': round(orb, 2),
+                'is_applying': True if applying is None else applying,
+                'strength': aspect_strength(orb, max_orb),
+            }
+            if epoch is not None:
+                item['epoch'] = epoch
+            result.append(item)
+        return result
+
+    def to_models(self) -> List[Aspect]:
+        """
+        Aspect 모델 목록 (planet1=names1 쪽, planet2=names2 쪽)
+
+        모델에 없는 행성(키론 등)이나 마이너 아스펙트는 건너뜁니다.
+        """
+        planets = {p.value: p for p in Planet}
+        aspect_types = {a.value: a for a in AspectType}
+        result = []
+        for _, p1, p2, name, separation, orb, _, applying in self.rows():
+            p1_enum = planets.get(p1.lower())
+            p2_enum = planets.get(p2.lower())
+            asp_enum = aspect_types.get(name)
+            if p1_enum and p2_enum and asp_enum:
+                result.append(Aspect(
+                    planet1=p1_enum,
+                    planet2=p2_enum,
+                    aspect_type=asp_enum,
+                    degree=separation,
+                    orb=orb,
+                    is_applying=True if applying is None else applying
+                ))
+        return result
+
+
+def position_columns(planets: Sequence) -> Tuple[List[str], List[float], Optional[List[float]]]:
+    """
+    행성 위치 목록에서 (이름, 황경, 속도) 열 추출
+
+    Args:
+        planets: SwissEphemeris 행성 dict 목록 또는 PlanetPosition 모델 목록
+
+    Returns:
+        (이름 목록, 황경 목록, 속도 목록 또는 None)
+    """
+    names, longitudes, speeds = [], [], []
+    for p in planets:
+        if isinstance(p, dict):
+            names.append(p['planet'])
+            longitudes.append(p['longitude'])
+            speeds.append(p.get('speed'))
+        else:
+            names.append(getattr(p.planet, 'value', p.planet))
+            longitudes.append(p.degree)
+            speeds.append(getattr(p, 'speed', None))
+    if any(s is None for s in speeds):
+        speeds = None
+    return names, longitudes, speeds
+
+
+def find_aspects(
+    lon1,
+    names1: Sequence[str],
+    lon2=None,
+    names2: Optional[Sequence[str]] = None,
+    speed1=None,
+    speed2=None,
+    aspects: Sequence[str] = MAJOR_ASPECTS,
+    orb_table: Optional[OrbTable] = None
+) -> AspectHits:
+    """
+    두 행성 목록 간 아스펙트 일괄 탐색
+
+    Args:
+        lon1: 황경 배열 (행성 수,) 또는 (시각 수, 행성 수)
+        names1: lon1 행성 이름
+        lon2: 상대 황경 배열 (생략하면 lon1 내부 쌍만 검사)
+        names2: lon2 행성 이름
+        speed1, speed2: 황경 속도 (도/일, lon과 같은 모양) - 둘 다 있어야 어플라잉 판정
+        aspects: 검사할 아스펙트 이름 (우선순위 순)
+        orb_table: 오브 표 (기본 DEFAULT_ORB_TABLE)
+
+    Returns:
+        AspectHits (시각, 행성1, 행성2 순으로 정렬)
+    """
+    orb_table = orb_table or DEFAULT_ORB_TABLE
+    aspects = tuple(aspects)
+    internal = lon2 is None
+    if internal:
+        lon2, names2, speed2 = lon1, names1, speed1
+    has_speed = speed1 is not None and speed2 is not None
+
+    if not NUMPY_AVAILABLE:
+        return _find_aspects_python(
+            lon1, names1, lon2, names2, speed1 if has_speed else None,
+            speed2 if has_speed else None, aspects, orb_table, internal
+        )
+
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+    batched = lon1.ndim > 1 or lon2.ndim > 1
+
+    # 부호 있는 각거리 [-180, 180) 과 절댓값 [0, 180]
+    signed = (lon1[..., :, None] - lon2[..., None, :] + 180.0) % 360.0 - 180.0
+    separation = np.abs(signed)
+    max_orbs = orb_table.matrix(names1, names2, aspects)
+
+    found = np.zeros(separation.shape, dtype=bool)
+    aspect_index = np.zeros(separation.shape, dtype=np.int8)
+    for k, name in enumerate(aspects):
+        hit = np.abs(separation - ASPECTS[name][0]) <= max_orbs[:, :, k]
+        hit &= ~found
+        aspect_index[hit] = k
+        found |= hit
+    if internal:
+        found &= np.triu(np.ones(found.shape[-2:], dtype=bool), k=1)
+
+    where = np.nonzero(found)
+    index1, index2 = where[-2], where[-1]
+    code = aspect_index[where]
+    sep = separation[where]
+    angle = np.array([ASPECTS[name][0] for name in aspects], dtype=np.float64)[code]
+
+    applying = None
+    if has_speed:
+        # d|sep - angle|/dt < 0 이면 어플라잉
+        relative = (
+            np.asarray(speed1, dtype=np.float64)[..., :, None]
+            - np.asarray(speed2, dtype=np.float64)[..., None, :]
+        )
+        relative = np.broadcast_to(relative, separation.shape)[where]
+        applying = np.sign(sep - angle) * np.sign(signed[where]) * relative < 0
+
+    return AspectHits(
+        names1, names2, aspects,
+        where[0] if batched else None,
+        index1, index2, code, sep, np.abs(sep - angle),
+        max_orbs[index1, index2, code], applying
+    )
+
+
+def _find_aspects_python(lon1, names1, lon2, names2, speed1, speed2,
+                         aspects, orb_table, internal) -> AspectHits:
+    """numpy가 없을 때의 단일 시각 탐색 (find_aspects와 같은 결과)"""
+    if lon1 and isinstance(lon1[0], (list, tuple)):
+        raise RuntimeError("여러 시각 아스펙트 탐색에는 numpy가 필요합니다.")
+
+    columns = ([], [], [], [], [], [])
+    applying = [] if speed1 is not None else None
+    for i, l1 in enumerate(lon1):
+        for j in range(i + 1 if internal else 0, len(lon2)):
+            signed = (l1 - lon2[j] + 180.0) % 360.0 - 180.0
+            separation = abs(signed)
+            for k, name in enumerate(aspects):
+                angle = ASPECTS[name][0]
+                max_orb = orb_table.pair_orb(names1[i], names2[j], name)
+                if abs(separation - angle) <= max_orb:
+                    for column, value in zip(columns, (i, j, k, separation,
+                                                       abs(separation - angle), max_orb)):
+                        column.append(value)
+                    if applying is not None:
+                        relative = speed1[i] - speed2[j]
+                        direction = (separation > angle) - (separation < angle)
+                        side = (signed > 0) - (signed < 0)
+                        applying.append(direction * side * relative < 0)
+                    break
+
+    return AspectHits(names1, names2, aspects, None, *columns, applying)
@@ -0,0 +1,307 @@
+"""
+아스펙트 패턴 탐지 - 그랜드 트라인, T-스퀘어, 요드, 그랜드 크로스, 카이트, 스텔리움
+
+find_aspects 결과를 차트(시각)별 · 아스펙트별 인접 비트마스크 배열
+    masks[e, a, i] 의 j번째 비트 = 차트 e에서 행성 i와 j가 아스펙트 a
+로 바꾼 뒤, 중첩 루프 대신 비트 연산으로 패턴을 찾습니다.
+    - 쌍 + 꼭짓점: (i, j)가 아스펙트 A이고 둘 다와 아스펙트 B인 행성 = mask_B[i] & mask_B[j]
+      (T-스퀘어: 충 + 사각, 요드: 육합 + 퀸컹스, 그랜드 트라인: 삼합 + 삼합)
+    - 그랜드 크로스: 충 쌍 두 개가 서로 사각 (4-사이클)
+    - 카이트: 그랜드 트라인의 한 꼭짓점과 충이고 나머지 둘과 육합인 행성
+    - 스텔리움: 합 그래프의 극대 클리크 (Bron-Kerbosch, 3행성 이상)
+쌍 순회는 모든 차트에 대해 NumPy로 한 번에 하므로 여러 차트(연구용 추출)나
+트랜짓 시계열(시각 × 행성)에도 그대로 쓸 수 있습니다. 행성 수는 64개까지입니다.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.aspect_engine import AspectHits, OrbTable, find_aspects
+
+
+# 패턴 종류
+PATTERNS = ('stellium', 'grand_trine', 't_square', 'grand_cross', 'yod', 'kite')
+
+# 패턴 탐지에 쓰는 아스펙트 (find_aspects 우선순위 순)
+PATTERN_ASPECTS = ('conjunction', 'sextile', 'square', 'trine', 'opposition', 'quincunx')
+
+# 스텔리움 최소 행성 수
+STELLIUM_MIN_PLANETS = 3
+
+# 비트마스크 폭
+MAX_PATTERN_PLANETS = 64
+
+_FULL = (1 << 64) - 1
+
+
+class PatternMatch(NamedTuple):
+    """패턴 1건"""
+    epoch: int                    # 차트(시각) 인덱스
+    pattern: str
+    planets: Tuple[str, ...]      # 패턴을 이루는 행성 (꼭짓점 포함, 입력 순서)
+    apex: Optional[str]           # T-스퀘어/요드/카이트의 꼭짓점
+
+    def to_dict(self) -> Dict:
+        return {'pattern': self.pattern, 'planets': list(self.planets), 'apex': self.apex}
+
+
+def _bit(j: int) -> 'np.uint64':
+    return np.uint64(1 << j)
+
+
+def _above(j: int) -> 'np.uint64':
+    """j보다 큰 인덱스의 비트"""
+    return np.uint64(_FULL ^ ((1 << (j + 1)) - 1))
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """설정된 비트 인덱스 (오름차순)"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def adjacency_masks(hits: AspectHits, count: int, epochs: int) -> 'np.ndarray':
+    """
+    아스펙트 결과를 인접 비트마스크로 변환
+
+    Args:
+        hits: find_aspects 결과 (한 행성 목록 내부 쌍)
+        count: 행성 수
+        epochs: 차트(시각) 수
+
+    Returns:
+        uint64 배열 shape (epochs, len(hits.aspects), count)
+    """
+    masks = np.zeros((epochs, len(hits.aspects), count), dtype=np.uint64)
+    if len(hits) == 0:
+        return masks
+    epoch = hits.epoch if hits.epoch is not None else np.zeros(len(hits), dtype=np.intp)
+    index1 = np.asarray(hits.index1, dtype=np.intp)
+    index2 = np.asarray(hits.index2, dtype=np.intp)
+    aspect = np.asarray(hits.aspect, dtype=np.intp)
+    one = np.uint64(1)
+    np.bitwise_or.at(masks, (epoch, aspect, index1), np.left_shift(one, index2.astype(np.uint64)))
+    np.bitwise_or.at(masks, (epoch, aspect, index2), np.left_shift(one, index1.astype(np.uint64)))
+    return masks
+
+
+def _pair_apexes(pair_graph: 'np.ndarray', apex_graph: 'np.ndarray'):
+    """
+    pair_graph로 이어진 (i < j) 쌍마다 apex_graph로 두 행성 모두와 이어진 꼭짓점 k
+
+    Yields:
+        (차트, i, j, k)
+    """
+    count = pair_graph.shape[1]
+    for i in range(count):
+        row = pair_graph[:, i]
+        if not row.any():
+            continue
+        for j in range(i + 1, count):
+            has = (row & _bit(j)) != 0
+            if not has.any():
+                continue
+            apex = np.where(has, apex_graph[:, i] & apex_graph[:, j], np.uint64(0))
+            for e in np.flatnonzero(apex).tolist():
+                for k in _iter_bits(int(apex[e])):
+                    yield e, i, j, k
+
+
+def _maximal_cliques(adjacency: List[int], candidates: int) -> Iterator[int]:
+    """Bron-Kerbosch (피벗) 극대 클리크 비트마스크"""
+    stack = [(0, candidates, 0)]
+    while stack:
+        clique, p, x = stack.pop()
+        if not p:
+            if not x:
+                yield clique
+            continue
+        pivot = max(_iter_bits(p | x), key=lambda u: bin(p & adjacency[u]).count('1'))
+        for v in _iter_bits(p & ~adjacency[pivot]):
+            stack.append((clique | (1 << v), p & adjacency[v], x & adjacency[v]))
+            p &= ~(1 << v)
+            x |= 1 << v
+
+
+def search_patterns(
+    masks: 'np.ndarray',
+    names: Sequence[str],
+    patterns: Sequence[str] = PATTERNS
+) -> List[PatternMatch]:
+    """
+    인접 비트마스크에서 패턴 탐색
+
+    Args:
+        masks: adjacency_masks 결과 (아스펙트 축은 PATTERN_ASPECTS 순서)
+        names: 행성 이름
+        patterns: 찾을 패턴 종류
+
+    Returns:
+        PatternMatch 목록 (차트 순)
+    """
+    unknown = [p for p in patterns if p not in PATTERNS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 패턴입니다: {', '.join(unknown)}")
+    conjunction, sextile, square, trine, opposition, quincunx = (
+        masks[:, PATTERN_ASPECTS.index(name)] for name in PATTERN_ASPECTS
+    )
+    found = []
+
+    def add(e, pattern, members, apex=None):
+        found.append(PatternMatch(
+            int(e), pattern, tuple(names[m] for m in sorted(members)),
+            None if apex is None else names[apex]
+        ))
+
+    if 'stellium' in patterns:
+        # 합 관계가 있는 행성이 3개 이상인 차트만 클리크 탐색
+        for e in np.flatnonzero((conjunction != 0).sum(axis=1) >= STELLIUM_MIN_PLANETS).tolist():
+            adjacency = [int(m) for m in conjunction[e]]
+            candidates = sum(1 << i for i, m in enumerate(adjacency) if m)
+            for clique in _maximal_cliques(adjacency, candidates):
+                if bin(clique).count('1') >= STELLIUM_MIN_PLANETS:
+                    add(e, 'stellium', _iter_bits(clique))
+
+    if 'grand_trine' in patterns or 'kite' in patterns:
+        for e, i, j, k in _pair_apexes(trine, trine):
+            if k < j:
+                continue
+            if 'grand_trine' in patterns:
+                add(e, 'grand_trine', (i, j, k))
+            if 'kite' in patterns:
+                for vertex, other1, other2 in ((i, j, k), (j, i, k), (k, i, j)):
+                    tails = int(opposition[e, vertex] & sextile[e, other1] & sextile[e, other2])
+                    for d in _iter_bits(tails):
+                        add(e, 'kite', (i, j, k, d), d)
+
+    if 't_square' in patterns or 'grand_cross' in patterns:
+        for e, a, c, b in _pair_apexes(opposition, square):
+            if 't_square' in patterns:
+                add(e, 't_square', (a, c, b), b)
+            if 'grand_cross' in patterns and b > a:
+                # 가장 작은 인덱스 a 기준으로 한 번만: b < d, 둘 다 a/c와 사각이고 서로 충
+                crosses = int(opposition[e, b] & square[e, a] & square[e, c] & _above(b))
+                for d in _iter_bits(crosses):
+                    add(e, 'grand_cross', (a, b, c, d))
+
+    if 'yod' in patterns:
+        for e, i, j, k in _pair_apexes(sextile, quincunx):
+            add(e, 'yod', (i, j, k), k)
+
+    found.sort(key=lambda match: match.epoch)
+    return found
+
+
+def detect_patterns(
+    longitudes,
+    names: Sequence[str],
+    patterns: Sequence[str] = PATTERNS,
+    orb_table: Optional[OrbTable] = None
+) -> List[PatternMatch]:
+    """
+    차트(들)의 아스펙트 패턴 탐지
+
+    Args:
+        longitudes: 황경 배열 (행성 수,) 또는 (차트 수, 행성 수)
+        names: 행성 이름
+        patterns: 찾을 패턴 종류
+        orb_table: 오브 표 (기본 DEFAULT_ORB_TABLE)
+
+    Returns:
+        PatternMatch 목록 (단일 차트면 epoch는 모두 0)
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("아스펙트 패턴 탐지에는 numpy가 필요합니다.")
+    if len(names) > MAX_PATTERN_PLANETS:
+        raise ValueError(f"패턴 탐지는 행성 {MAX_PATTERN_PLANETS}개까지 지원합니다.")
+
+    lon = np.atleast_2d(np.asarray(longitudes, dtype=np.float64))
+    hits = find_aspects(lon, names, aspects=PATTERN_ASPECTS, orb_table=orb_table)
+    return search_patterns(adjacency_masks(hits, len(names), lon.shape[0]), names, patterns)
+
+
+def transit_patterns(
+    transit_longitudes,
+    transit_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    natal_names: Sequence[str],
+    patterns: Sequence[str] = PATTERNS,
+    orb_table: Optional[OrbTable] = None
+) -> List[PatternMatch]:
+    """
+    트랜짓 시계열에서 네이탈 행성과 함께 완성되는 패턴
+
+    트랜짓 행성과 네이탈 행성을 한 그래프로 합쳐 탐색하고, 양쪽 행성을 모두
+    포함하는 패턴만 남깁니다. 행성 이름은 'transit_sun', 'natal_moon' 형식입니다.
+
+    Args:
+        transit_longitudes: 트랜짓 황경 (시각 수, 트랜짓 행성 수)
+        transit_names: 트랜짓 행성 이름
+        natal_longitudes: 네이탈 황경 (네이탈 행성 수,)
+        natal_names: 네이탈 행성 이름
+
+    Returns:
+        PatternMatch 목록 (epoch = 시각 인덱스)
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("아스펙트 패턴 탐지에는 numpy가 필요합니다.")
+    transit = np.atleast_2d(np.asarray(transit_longitudes, dtype=np.float64))
+    natal = np.broadcast_to(np.asarray(natal_longitudes, dtype=np.float64),
+                            (transit.shape[0], len(natal_names)))
+    names = list(transit_names) + list(natal_names)
+    if len(names) > MAX_PATTERN_PLANETS:
+        raise ValueError(f"패턴 탐지는 행성 {MAX_PATTERN_PLANETS}개까지 지원합니다.")
+
+    hits = find_aspects(np.concatenate([transit, natal], axis=1), names,
+                        aspects=PATTERN_ASPECTS, orb_table=orb_table)
+    labels = ([f"transit_{name}" for name in transit_names]
+              + [f"natal_{name}" for name in natal_names])
+    matches = search_patterns(adjacency_masks(hits, len(names), transit.shape[0]), labels, patterns)
+    return [
+        match for match in matches
+        if any(p.startswith('transit_') for p in match.planets)
+        and any(p.startswith('natal_') for p in match.planets)
+    ]
+
+
+def pattern_periods(matches: Sequence[PatternMatch], jds: Sequence[float]) -> List[Dict]:
+    """
+    시각별 패턴을 연속 구간으로 병합
+
+    Args:
+        matches: 시각 인덱스(epoch)를 가진 PatternMatch 목록
+        jds: 시각 인덱스별 Julian Day
+
+    Returns:
+        [{pattern, planets, apex, start_jd, end_jd}] (시작 시각 순)
+    """
+    open_periods: Dict[Tuple, Dict] = {}
+    closed = []
+    for match in sorted(matches, key=lambda m: m.epoch):
+        key = (match.pattern, match.planets, match.apex)
+        period = open_periods.get(key)
+        if period is not None and period['_last'] == match.epoch - 1:
+            period['_last'] = match.epoch
+            period['end_jd'] = float(jds[match.epoch])
+            continue
+        if period is not None:
+            closed.append(period)
+        open_periods[key] = dict(match.to_dict(), start_jd=float(jds[match.epoch]),
+                                 end_jd=float(jds[match.epoch]), _last=match.epoch)
+
+    periods = closed + list(open_periods.values())
+    for period in periods:
+        del period['_last']
+    periods.sort(key=lambda p: p['start_jd'])
+    return periods
@@ -0,0 +1,339 @@
+"""
+아스트로카토그래피 (Astrocartography) - 행성 각도선 지도와 이주(relocation) 차트
+
+출생 순간의 행성 적경 α, 적위 δ와 그리니치 항성시 θ(도)에 대해, 지도상의 각도선은
+    MC 선: λ = α - θ                       (행성이 자오선 위)
+    IC 선: λ = α - θ + 180
+    ASC 선: λ = α - θ - H0(φ)              (동쪽 지평선, 떠오름)
+    DSC 선: λ = α - θ + H0(φ)              (서쪽 지평선, 짐)
+    cos H0(φ) = -tan φ · tan δ
+입니다. 행성마다 swe.houses를 수천 번 부르는 대신 위도 격자 전체에 대해 위 식을
+NumPy로 한 번에 풉니다 (|tan φ · tan δ| > 1인 위도는 지평선에 닿지 않아 선이 없음).
+
+행성 위치는 SwissEphemeris.get_all_planets 한 번으로 구하고 (지심, 회귀황도),
+각도선 GeoJSON은 출생 JD별 LRU 캐시에 보관합니다.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.lru_cache import LRUCache
+from services.swiss_ephemeris import (
+    SWISSEPH_AVAILABLE, MAJOR_PLANETS, EphemerisMode, SwissEphemeris, assign_houses, get_ephemeris
+)
+
+
+# 각도선 종류
+ANGLES = ('asc', 'dsc', 'mc', 'ic')
+
+# 기본 위도 격자 (도) - 극지방은 선이 급격히 휘므로 제외
+DEFAULT_LATITUDE_STEP = 1.0
+DEFAULT_LATITUDE_LIMIT = 80.0
+
+# 이주 차트에서 "선 위"로 보는 동서 거리 (km)
+DEFAULT_LINE_ORB_KM = 500.0
+
+# 위도 1도 거리 (km)
+KM_PER_DEGREE = 111.32
+
+# 각도선 GeoJSON 캐시 크기 (출생 JD별)
+ASTROCARTOGRAPHY_CACHE_SIZE = 256
+
+
+def _wrap180(x: 'np.ndarray') -> 'np.ndarray':
+    """[-180, 180) 범위로 정규화"""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def equatorial_coordinates(
+    longitudes: Sequence[float],
+    latitudes: Sequence[float],
+    obliquity: float
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    황경/황위를 적경/적위로 변환 (벡터화)
+
+    Args:
+        longitudes: 황경 (도)
+        latitudes: 황위 (도)
+        obliquity: 황도경사 (도)
+
+    Returns:
+        (적경 [0, 360), 적위) 배열 (도)
+    """
+    lam = np.radians(np.asarray(longitudes, dtype=np.float64))
+    beta = np.radians(np.asarray(latitudes, dtype=np.float64))
+    eps = np.radians(obliquity)
+
+    sin_dec = np.sin(beta) * np.cos(eps) + np.cos(beta) * np.sin(eps) * np.sin(lam)
+    ra = np.arctan2(np.sin(lam) * np.cos(eps) - np.tan(beta) * np.sin(eps), np.cos(lam))
+    return np.degrees(ra) % 360.0, np.degrees(np.arcsin(np.clip(sin_dec, -1.0, 1.0)))
+
+
+def angular_line_longitudes(
+    ra: 'np.ndarray',
+    dec: 'np.ndarray',
+    gst: float,
+    latitudes: 'np.ndarray'
+) -> Dict[str, 'np.ndarray']:
+    """
+    행성 × 위도 격자의 각도선 경도
+
+    Args:
+        ra, dec: 행성별 적경/적위 (도), shape (P,)
+        gst: 그리니치 항성시 (도)
+        latitudes: 위도 (도), shape (L,)
+
+    Returns:
+        각도 이름 -> 경도 [-180, 180) 배열 shape (P, L), 선이 없는 위도는 NaN
+    """
+    meridian = (ra - gst)[:, None]
+    cos_h0 = -np.tan(np.radians(latitudes))[None, :] * np.tan(np.radians(dec))[:, None]
+    with np.errstate(invalid='ignore'):
+        h0 = np.degrees(np.arccos(np.where(np.abs(cos_h0) <= 1.0, cos_h0, np.nan)))
+
+    shape = (len(ra), len(latitudes))
+    return {
+        'asc': _wrap180(meridian - h0),
+        'dsc': _wrap180(meridian + h0),
+        'mc': np.broadcast_to(_wrap180(meridian), shape),
+        'ic': np.broadcast_to(_wrap180(meridian + 180.0), shape),
+    }
+
+
+def _polylines(longitudes: 'np.ndarray', latitudes: 'np.ndarray') -> List[List[List[float]]]:
+    """
+    경도/위도 점열을 GeoJSON 좌표 목록으로 변환
+
+    NaN 구간에서 끊고, 날짜변경선(±180)을 넘는 곳은 경계점을 보간해 나눕니다.
+    """
+    lines = []
+    current = []
+    previous = None
+    for lon, lat in zip(longitudes.tolist(), latitudes.tolist()):
+        if lon != lon:  # NaN
+            if len(current) > 1:
+                lines.append(current)
+            current, previous = [], None
+            continue
+        if previous is not None and abs(lon - previous[0]) > 180.0:
+            # 날짜변경선 교차점
+            edge = 180.0 if previous[0] > 0 else -180.0
+            unwrapped = lon + 360.0 if previous[0] > 0 else lon - 360.0
+            t = (edge - previous[0]) / (unwrapped - previous[0])
+            crossing_lat = round(previous[1] + t * (lat - previous[1]), 4)
+            current.append([edge, crossing_lat])
+            if len(current) > 1:
+                lines.append(current)
+            current = [[-edge, crossing_lat]]
+        current.append([round(lon, 4), round(lat, 4)])
+        previous = (lon, lat)
+    if len(current) > 1:
+        lines.append(current)
+    return lines
+
+
+class Astrocartography:
+    """행성 각도선 지도 / 이주 차트 계산"""
+
+    def __init__(
+        self,
+        ephemeris: Optional[SwissEphemeris] = None,
+        cache_size: int = ASTROCARTOGRAPHY_CACHE_SIZE
+    ):
+        """
+        Args:
+            ephemeris: 천체력 (기본 싱글톤)
+            cache_size: 각도선 GeoJSON LRU 캐시 크기 (0이면 캐시 안 함)
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("아스트로카토그래피에는 numpy가 필요합니다.")
+        self.ephemeris = ephemeris or get_ephemeris()
+        self.line_cache = LRUCache(cache_size)
+
+    def _sidereal_frame(self, jd: float) -> Tuple[float, float]:
+        """(그리니치 항성시, 진황도경사) (도)"""
+        if SWISSEPH_AVAILABLE:
+            return self.ephemeris.armc_and_obliquity(jd, 0.0)
+        # 평균 항성시 / 평균 황도경사 근사
+        t = (jd - 2451545.0) / 36525.0
+        return (280.46061837 + 360.98564736629 * (jd - 2451545.0)) % 360.0, 23.439291 - 0.0130042 * t
+
+    def _planet_frame(self, jd: float, planets: Optional[Sequence[str]] = None):
+        """
+        행성 위치 1세트와 적도 좌표
+
+        Returns:
+            (행성 위치 목록, 적경, 적위, 그리니치 항성시)
+        """
+        positions = self.ephemeris.get_all_planets(jd)
+        if planets:
+            wanted = {p.lower() for p in planets}
+            positions = [p for p in positions if p['planet'] in wanted]
+            if not positions:
+                raise ValueError("각도선을 계산할 행성이 없습니다.")
+
+        gst, obliquity = self._sidereal_frame(jd)
+        ra, dec = equatorial_coordinates(
+            [p['longitude'] for p in positions],
+            [p['latitude'] for p in positions],
+            obliquity
+        )
+        return positions, ra, dec, gst
+
+    def planet_lines(
+        self,
+        jd: float,
+        planets: Optional[Sequence[str]] = None,
+        latitude_step: float = DEFAULT_LATITUDE_STEP,
+        latitude_limit: float = DEFAULT_LATITUDE_LIMIT
+    ) -> Dict:
+        """
+        행성별 ASC/DSC/MC/IC 각도선 (GeoJSON FeatureCollection)
+
+        같은 입력의 결과는 캐시된 객체를 그대로 반환하므로 수정하지 마세요.
+
+        Args:
+            jd: 출생 Julian Day (UT)
+            planets: 행성 이름 목록 (기본: 주요 10행성)
+            latitude_step: 위도 격자 간격 (도)
+            latitude_limit: 위도 범위 ±limit (도)
+
+        Returns:
+            각도선마다 MultiLineString Feature 1개 ([경도, 위도] 좌표)
+        """
+        if latitude_step <= 0 or not 0 < latitude_limit < 90:
+            raise ValueError("위도 격자 간격은 양수, 위도 범위는 0-90도 사이여야 합니다.")
+
+        planet_key = tuple(sorted(p.lower() for p in planets)) if planets else MAJOR_PLANETS
+        key = (round(jd, 6), planet_key, latitude_step, latitude_limit)
+        cached = self.line_cache.get(key)
+        if cached is not None:
+            return cached
+
+        positions, ra, dec, gst = self._planet_frame(jd, planets)
+        count = int(round(2 * latitude_limit / latitude_step))
+        latitudes = np.linspace(-latitude_limit, latitude_limit, count + 1)
+        lines = angular_line_longitudes(ra, dec, gst, latitudes)
+
+        features = []
+        for i, position in enumerate(positions):
+            for angle in ANGLES:
+                coordinates = _polylines(lines[angle][i], latitudes)
+                if not coordinates:
+                    continue
+                features.append({
+                    'type': 'Feature',
+                    'geometry': {'type': 'MultiLineString', 'coordinates': coordinates},
+                    'properties': {
+                        'planet': position['planet'],
+                        'angle': angle,
+                        'right_ascension': round(float(ra[i]), 4),
+                        'declination': round(float(dec[i]), 4),
+                    },
+                })
+
+        result = {
+            'type': 'FeatureCollection',
+            'features': features,
+            'properties': {
+                'julian_day': jd,
+                'sidereal_time': round(gst, 6),
+            },
+        }
+        self.line_cache.put(key, result)
+        return result
+
+    def relocate(
+        self,
+        jd: float,
+        places: Sequence[Tuple[str, float, float]],
+        house_system: str = 'placidus',
+        mode: Optional[EphemerisMode] = None,
+        line_orb_km: float = DEFAULT_LINE_ORB_KM
+    ) -> List[Dict]:
+        """
+        여러 후보 도시의 이주 차트를 한 번에 계산
+
+        행성 위치는 출생 순간 1세트를 모든 도시에 재사용하고 (측심 보정 없음),
+        도시별 하우스는 calculate_houses (커스프 캐시)로 구합니다.
+        각도선까지의 동서 거리는 도시 위도 전체에 대해 한 번에 계산합니다.
+
+        Args:
+            jd: 출생 Julian Day (UT)
+            places: (이름, 위도, 경도) 목록
+            house_system: 하우스 시스템
+            mode: 계산 모드 (항성황도 여부만 사용)
+            line_orb_km: 이 거리 안의 각도선을 도시의 영향선으로 반환
+
+        Returns:
+            도시별 ASC/MC, 하우스, 행성 하우스 배치, 가까운 각도선
+        """
+        if not places:
+            return []
+        if mode is not None and mode.topocentric:
+            mode = mode._replace(topocentric=False)
+
+        positions, ra, dec, gst = self._planet_frame(jd)
+        chart_positions = positions if mode is None or mode.is_default else self.ephemeris.get_all_planets(jd, mode)
+        names = [p['planet'] for p in positions]
+        chart_longitudes = [p['longitude'] for p in chart_positions]
+
+        # 도시 × 행성 × 각도 동서 거리 (km)
+        place_lats = np.array([lat for _, lat, _ in places], dtype=np.float64)
+        place_lons = np.array([lon for _, _, lon in places], dtype=np.float64)
+        lines = angular_line_longitudes(ra, dec, gst, place_lats)
+        km_per_lon = KM_PER_DEGREE * np.cos(np.radians(place_lats))
+        distances = np.stack([
+            np.abs(_wrap180(place_lons[None, :] - lines[angle])) * km_per_lon[None, :]
+            for angle in ANGLES
+        ], axis=-1)  # (P, N, 4), 선이 없으면 NaN
+
+        results = []
+        for n, (name, latitude, longitude) in enumerate(places):
+            houses = self.ephemeris.calculate_houses(jd, latitude, longitude, house_system, mode)
+            house_numbers = assign_houses(chart_longitudes, [h['cusp'] for h in houses['houses']])
+
+            nearby = []
+            planet_index, angle_index = np.nonzero(distances[:, n, :] <= line_orb_km)
+            for p, a in zip(planet_index.tolist(), angle_index.tolist()):
+                nearby.append({
+                    'planet': names[p],
+                    'angle': ANGLES[a],
+                    'distance_km': round(float(distances[p, n, a]), 1),
+                })
+            nearby.sort(key=lambda line: line['distance_km'])
+
+            results.append({
+                'name': name,
+                'latitude': latitude,
+                'longitude': longitude,
+                'ascendant': houses['ascendant'],
+                'midheaven': houses['midheaven'],
+                'houses': houses['houses'],
+                'planet_houses': dict(zip(names, house_numbers)),
+                'lines': nearby,
+            })
+
+        return results
+
+
+# 싱글톤 인스턴스
+_astrocartography_instance = None
+
+
+def get_astrocartography() -> Astrocartography:
+    """아스트로카토그래피 싱글톤 인스턴스 반환"""
+    global _astrocartography_instance
+    if _astrocartography_instance is None:
+        _astrocartography_instance = Astrocartography()
+    return _astrocartography_instance
@@ -1,7 +1,8 @@
 """점성술 (Astrology) 분석 서비스 - Swiss Ephemeris 기반 정밀 계산"""
 
 from datetime import datetime, timezone
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
+import json
 import sys
 import os
 
@@ -9,11 +10,33 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.astrology_models import (
     AstrologyRequest, AstrologyResponse,
-    TransitRequest, TransitResponse,
-    ZodiacSign, Planet, HouseSystem,
+    TransitRequest, TransitResponse, TransitEventRequest, HouseComparisonRequest,
+    AstrocartographyRequest, RelocationRequest, ChartIndexRequest, SimilarChartRequest,
+    TransitPatternRequest, TransitTimelineRequest, StreamFormat, ChartWheelRequest, ChartTheme,
+    SynastryRequest, SynastryBatchRequest, ReturnRequest, ProgressionRequest,
+    AspectPattern, AspectPatternType,
+    ZodiacSign, ZodiacType, Planet, HouseSystem,
     PlanetPosition, Aspect, AspectType, HouseCusp
 )
-from services.swiss_ephemeris import get_ephemeris, SwissEphemeris
+from services.swiss_ephemeris import (
+    get_ephemeris, SwissEphemeris, EphemerisMode, MAJOR_PLANETS, assign_houses
+)
+from services.gazetteer import get_gazetteer
+from services.aspect_engine import MAJOR_ASPECTS, find_aspects, position_columns
+from services.transit_events import (
+    find_returns, timeline_chunks, transit_event_chunks, transit_events_between, transit_timeline_snapshots
+)
+from services.progressions import TROPICAL_YEAR_DAYS, secondary_progressions
+from services.astrocartography import get_astrocartography
+from services.chart_index import chart_vector, get_chart_index
+from services.chart_cache import get_natal_chart_cache
+from services.chart_wheel import WheelAspect, WheelPlanet, get_chart_wheel_renderer
+from services.synastry import (
+    composite_chart_data, geographic_midpoint, house_overlay, midpoint, synastry_scores
+)
+from services.aspect_patterns import (
+    NUMPY_AVAILABLE, PATTERNS, detect_patterns, transit_patterns, pattern_periods
+)
 
 
 class AstrologyService:
@@ -72,6 +95,19 @@ class AstrologyService:
         'opposition': AspectType.OPPOSITION
     }
 
+    # 역행 달력 기본 행성 (태양/달은 역행하지 않음)
+    RETROGRADE_PLANETS = ('mercury', 'venus', 'mars', 'jupiter',
+                          'saturn', 'uranus', 'neptune', 'pluto')
+
+    # 트랜짓 이벤트 탐색 최대 기간 (일)
+    MAX_TRANSIT_EVENT_DAYS = 3660
+
+    # 트랜짓 타임라인 최대 스냅샷 수
+    MAX_TRANSIT_TIMELINE_STEPS = 100000
+
+    # 트랜짓 패턴 탐색에서 한 번에 계산하는 시각 수
+    TRANSIT_PATTERN_CHUNK = 2000
+
     def __init__(self):
         """서비스 초기화 - Swiss Ephemeris 연결"""
         self.ephemeris: SwissEphemeris = get_ephemeris()
@@ -83,20 +119,99 @@ class AstrologyService:
 
         Swiss Ephemeris가 사용 가능한 경우 정밀 계산을 수행하고,
         그렇지 않은 경우 기존 근사 계산으로 폴백합니다.
+        같은 입력의 차트는 출생 차트 캐시(services/chart_cache.py)에서 반환하고,
+        천궁도 SVG는 차트 휠 렌더러 캐시(services/chart_wheel.py)에서 채웁니다.
         """
+        chart = self._natal_chart(request)
+        chart.chart_svg = self._chart_wheel_svg(chart)
+        return chart
+
+    def _natal_chart(self, request: AstrologyRequest) -> AstrologyResponse:
+        """출생 차트 (캐시 사용, SVG 없음) - 트랜짓/시너스트리 등 내부 계산용"""
+        request = self.resolve_birthplace(request)
         if self.use_swiss_ephemeris:
-            return self._create_natal_chart_precise(request)
+            return get_natal_chart_cache().get_or_create(
+                request, self._create_natal_chart_precise, variant='swiss'
+            )
         else:
-            return self._create_natal_chart_fallback(request)
+            return get_natal_chart_cache().get_or_create(
+                request, self._create_natal_chart_fallback, variant='fallback'
+            )
+
+    def _chart_wheel_svg(
+        self,
+        chart: AstrologyResponse,
+        outer_planets: Optional[List[PlanetPosition]] = None,
+        aspects: Optional[List[Aspect]] = None,
+        theme: ChartTheme = ChartTheme.LIGHT
+    ) -> str:
+        """
+        천궁도 휠 SVG
+
+        Args:
+            chart: 출생 차트 (안쪽 링)
+            outer_planets: 바깥 링 행성 (트랜짓/상대, 있으면 이중 휠)
+            aspects: 아스펙트 선 (기본: 출생 차트 아스펙트) - planet1은 바깥 링 쪽
+            theme: 색상 테마
+        """
+        inner = [WheelPlanet(p.planet.value, p.degree, p.is_retrograde) for p in chart.planets]
+        rings = [inner]
+        if outer_planets is not None:
+            rings.append([WheelPlanet(p.planet.value, p.degree, p.is_retrograde) for p in outer_planets])
+
+        first = {p.name: p.longitude for p in rings[-1]}
+        second = {p.name: p.longitude for p in inner}
+        lines = []
+        for aspect in (chart.aspects if aspects is None else aspects):
+            lon1 = first.get(aspect.planet1.value)
+            lon2 = second.get(aspect.planet2.value)
+            if lon1 is not None and lon2 is not None:
+                lines.append(WheelAspect(aspect.aspect_type.value, lon1, lon2))
+
+        return get_chart_wheel_renderer().render(
+            [h.degree for h in chart.houses], rings, lines, ChartTheme(theme).value
+        )
+
+    def render_chart_wheel(self, request: ChartWheelRequest) -> str:
+        """
+        천궁도 휠 SVG - transit_date가 있으면 바깥 링에 트랜짓 행성과 트랜짓 아스펙트
+        """
+        natal = self.resolve_birthplace(request.natal_chart)
+        chart = self._natal_chart(natal)
+        if request.transit_date is None:
+            return self._chart_wheel_svg(chart, theme=request.theme)
+
+        transit_planets = self._get_current_planet_positions_precise(
+            request.transit_date, self._ephemeris_mode(natal)
+        )
+        transit_aspects = self._calculate_transit_aspects(chart.planets, transit_planets)
+        return self._chart_wheel_svg(chart, transit_planets, transit_aspects, request.theme)
+
+    def resolve_birthplace(self, request: AstrologyRequest) -> AstrologyRequest:
+        """
+        위도/경도가 없는 요청의 출생지(location)를 지명 사전으로 해석
+
+        시간대를 따로 지정하지 않았으면 출생지의 시간대도 채웁니다.
+        """
+        if request.latitude is not None and request.longitude is not None:
+            return request
+        if not request.location:
+            raise ValueError("출생지 위도/경도 또는 지명(location)이 필요합니다.")
+
+        place = get_gazetteer().resolve(request.location)
+        if place is None:
+            raise ValueError(f"알 수 없는 출생지입니다: {request.location}")
+
+        update = {'latitude': place.latitude, 'longitude': place.longitude}
+        if 'timezone' not in request.model_fields_set:
+            update['timezone'] = place.timezone
+        return request.model_copy(update=update)
 
     def _create_natal_chart_precise(self, request: AstrologyRequest) -> AstrologyResponse:
         """Swiss Ephemeris를 사용한 정밀 출생 차트 생성"""
 
         # 출생 datetime 생성
-        birth_dt = datetime(
-            request.birth_year, request.birth_month, request.birth_day,
-            request.birth_hour or 12, request.birth_minute or 0
-        )
+        birth_dt = self._birth_datetime(request)
 
         # 하우스 시스템 결정
         house_system = getattr(request, 'house_system', 'placidus') or 'placidus'
@@ -106,9 +221,14 @@ class AstrologyService:
             birth_datetime=birth_dt,
             latitude=request.latitude,
             longitude=request.longitude,
-            house_system=house_system
+            house_system=house_system,
+            mode=self._ephemeris_mode(request)
         )
 
+        return self._chart_response(chart_data)
+
+    def _chart_response(self, chart_data: Dict) -> AstrologyResponse:
+        """SwissEphemeris.get_natal_chart 형식의 차트 데이터를 응답 모델로 변환"""
         # 행성 위치 변환
         planets = self._convert_planets(chart_data['planets'])
 
@@ -117,6 +237,7 @@ class AstrologyService:
 
         # 아스펙트 변환
         aspects = self._convert_aspects(chart_data['aspects'])
+        aspect_patterns = self._calculate_aspect_patterns(chart_data['planets'])
 
         # 품위 변환
         dignities = chart_data['dignities']
@@ -141,12 +262,36 @@ class AstrologyService:
             planets=planets,
             houses=houses,
             aspects=aspects,
+            aspect_patterns=aspect_patterns,
             dignities=dignities,
-            chart_svg=None,  # SVG는 별도 구현 가능
+            chart_svg=None,
             personality_summary=personality_summary,
             life_themes=life_themes
         )
 
+    def _birth_datetime(self, request: AstrologyRequest) -> datetime:
+        """요청의 출생 일시 (시간이 없으면 정오)"""
+        return datetime(
+            request.birth_year, request.birth_month, request.birth_day,
+            request.birth_hour or 12, request.birth_minute or 0
+        )
+
+    def _ephemeris_mode(self, request: AstrologyRequest) -> EphemerisMode:
+        """요청의 황도 기준/측심 여부를 계산 모드로 변환"""
+        return EphemerisMode(
+            sidereal=request.zodiac_type == ZodiacType.SIDEREAL,
+            topocentric=request.topocentric,
+            latitude=request.latitude,
+            longitude=request.longitude,
+        )
+
+    def _in_mode_of(self, reference: AstrologyRequest, request: AstrologyRequest) -> AstrologyRequest:
+        """request를 reference의 황도 기준/측심 설정으로 맞춘 요청 (비교 차트를 같은 기준으로 계산)"""
+        return request.model_copy(update={
+            'zodiac_type': reference.zodiac_type,
+            'topocentric': reference.topocentric,
+        })
+
     def _convert_planets(self, ephemeris_planets: List[Dict]) -> List[PlanetPosition]:
         """Swiss Ephemeris 행성 데이터를 모델로 변환"""
         result = []
@@ -228,6 +373,7 @@ class AstrologyService:
 
         # 6. 아스펙트 계산
         aspects = self._calculate_aspects(planets)
+        aspect_patterns = self._calculate_aspect_patterns(planets)
 
         # 7. 품위 (Dignities) 계산
         dignities = self._calculate_dignities(planets)
@@ -243,6 +389,7 @@ class AstrologyService:
             planets=planets,
             houses=houses,
             aspects=aspects,
+            aspect_patterns=aspect_patterns,
             dignities=dignities,
             chart_svg=None,
             personality_summary=personality_summary,
@@ -357,34 +504,22 @@ class AstrologyService:
 
     def _calculate_aspects(self, planets: List[PlanetPosition]) -> List[Aspect]:
         """아스펙트 계산"""
-        aspects = []
-        aspect_angles = {
-            AspectType.CONJUNCTION: (0, 8),
-            AspectType.SEXTILE: (60, 6),
-            AspectType.SQUARE: (90, 8),
-            AspectType.TRINE: (120, 8),
-            AspectType.OPPOSITION: (180, 8),
-        }
-
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i + 1:]:
-                diff = abs(p1.degree - p2.degree)
-                if diff > 180:
-                    diff = 360 - diff
-
-                for aspect_type, (angle, orb) in aspect_angles.items():
-                    if abs(diff - angle) <= orb:
-                        aspects.append(Aspect(
-                            planet1=p1.planet,
-                            planet2=p2.planet,
-                            aspect_type=aspect_type,
-                            degree=diff,
-                            orb=abs(diff - angle),
-                            is_applying=True
-                        ))
-                        break
-
-        return aspects
+        names, longitudes, _ = position_columns(planets)
+        return find_aspects(longitudes, names).to_models()
+
+    def _calculate_aspect_patterns(self, planets: List) -> List[AspectPattern]:
+        """아스펙트 패턴 탐지 (행성 dict 또는 PlanetPosition 목록, numpy가 없으면 생략)"""
+        if not NUMPY_AVAILABLE:
+            return []
+        names, longitudes, _ = position_columns(planets)
+        return [
+            AspectPattern(
+                pattern=AspectPatternType(match.pattern),
+                planets=[Planet(p) for p in match.planets],
+                apex=Planet(match.apex) if match.apex else None
+            )
+            for match in detect_patterns(longitudes, names)
+        ]
 
     def _calculate_dignities(self, planets: List[PlanetPosition]) -> Dict:
         """행성 품위 계산"""
@@ -479,10 +614,13 @@ class AstrologyService:
         현재 행성 위치와 출생 차트의 상호작용을 분석합니다.
         """
         # 출생 차트 생성
-        natal_chart = self.create_natal_chart(request.natal_chart)
+        natal = self.resolve_birthplace(request.natal_chart)
+        natal_chart = self._natal_chart(natal)
 
-        # 현재/지정된 날짜의 행성 위치 (Swiss Ephemeris 사용)
-        current_planets = self._get_current_planet_positions_precise(request.transit_date)
+        # 현재/지정된 날짜의 행성 위치 (Swiss Ephemeris 사용, 출생 차트와 같은 황도 기준)
+        current_planets = self._get_current_planet_positions_precise(
+            request.transit_date, self._ephemeris_mode(natal)
+        )
 
         # 트랜짓 아스펙트 계산
         transit_aspects = self._calculate_transit_aspects(natal_chart.planets, current_planets)
@@ -499,14 +637,608 @@ class AstrologyService:
             highlights=highlights
         )
 
-    def _get_current_planet_positions_precise(self, date: datetime) -> List[PlanetPosition]:
-        """Swiss Ephemeris를 사용한 정밀 행성 위치 계산"""
+    def plan_transit_events(self, request: TransitEventRequest) -> Dict:
+        """
+        트랜짓 이벤트 스트림 준비 - 요청 검증, 출생 차트 계산, 구간 분할
+
+        라우터는 이 호출과 구간별 transit_event_chunk_text를 모두 워커 풀에서 실행합니다.
+
+        Returns:
+            구간 계산 인자 (pickle 가능), chunks = [(구간 시작 JD, 구간 끝 JD)]
+        """
+        span = request.end_date - request.start_date
+        if span.total_seconds() <= 0:
+            raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+        if span.days > self.MAX_TRANSIT_EVENT_DAYS:
+            raise ValueError(f"탐색 기간은 최대 {self.MAX_TRANSIT_EVENT_DAYS}일입니다.")
+
+        natal = self.resolve_birthplace(request.natal_chart)
+        natal_chart = self._natal_chart(natal)
+        natal_names, natal_longitudes, _ = position_columns(natal_chart.planets)
+
+        return {
+            'natal_names': list(natal_names),
+            'natal_longitudes': list(natal_longitudes),
+            'planets': [p.value for p in request.planets] if request.planets else None,
+            'aspects': [a.value for a in request.aspects] if request.aspects else list(MAJOR_ASPECTS),
+            'include_orb': request.include_orb,
+            'mode': self._ephemeris_mode(natal),
+            'chunks': transit_event_chunks(
+                self.ephemeris.datetime_to_julian(request.start_date),
+                self.ephemeris.datetime_to_julian(request.end_date)
+            ),
+        }
+
+    def transit_event_chunk(self, plan: Dict, index: int) -> List[Dict]:
+        """plan_transit_events 결과의 index번째 구간 이벤트 (시각 순)"""
+        start_jd, end_jd = plan['chunks'][index]
+        events = transit_events_between(
+            plan['natal_names'], plan['natal_longitudes'], start_jd, end_jd,
+            planets=plan['planets'],
+            aspects=plan['aspects'],
+            include_orb=plan['include_orb'],
+            ephemeris=self.ephemeris,
+            mode=plan['mode']
+        )
+        return [event.to_dict(self.ephemeris) for event in events]
+
+    def transit_event_chunk_text(self, plan: Dict, index: int) -> str:
+        """transit_event_chunk 결과를 NDJSON 텍스트로 (스트리밍 응답용 - 직렬화도 워커에서)"""
+        return "".join(
+            json.dumps(event, ensure_ascii=False) + "\n" for event in self.transit_event_chunk(plan, index)
+        )
+
+    def iter_transit_events(self, request: TransitEventRequest) -> Iterator[Dict]:
+        """
+        기간 내 트랜짓 이벤트 (정확 시각, 오브 진입/이탈) 스트림
+
+        요청 검증과 출생 차트 계산은 즉시 수행하고, 이벤트는 반환된
+        이터레이터를 소비할 때 구간 단위로 계산됩니다.
+        """
+        plan = self.plan_transit_events(request)
+        return (
+            event
+            for index in range(len(plan['chunks']))
+            for event in self.transit_event_chunk(plan, index)
+        )
+
+    def plan_transit_timeline(self, request: TransitTimelineRequest) -> Dict:
+        """
+        트랜짓 타임라인 스트림 준비 - 요청 검증, 출생 차트 계산, 구간 분할
+
+        라우터는 이 호출과 구간별 transit_timeline_chunk_text를 모두 워커 풀에서 실행합니다.
+
+        Returns:
+            구간 계산 인자 (pickle 가능), chunks = [(첫 스냅샷 인덱스, 끝 인덱스)]
+        """
+        span = request.end_date - request.start_date
+        if span.total_seconds() < 0:
+            raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+        if span.days > self.MAX_TRANSIT_EVENT_DAYS:
+            raise ValueError(f"탐색 기간은 최대 {self.MAX_TRANSIT_EVENT_DAYS}일입니다.")
+        if span.total_seconds() / 3600 / request.step_hours >= self.MAX_TRANSIT_TIMELINE_STEPS:
+            raise ValueError(f"스냅샷은 최대 {self.MAX_TRANSIT_TIMELINE_STEPS}개입니다. 간격을 늘려주세요.")
+
+        natal = self.resolve_birthplace(request.natal_chart)
+        natal_chart = self._natal_chart(natal)
+        natal_names, natal_longitudes, _ = position_columns(natal_chart.planets)
+        start_jd = self.ephemeris.datetime_to_julian(request.start_date)
+        step_days = request.step_hours / 24.0
+
+        return {
+            'natal_names': list(natal_names),
+            'natal_longitudes': list(natal_longitudes),
+            'natal_cusps': [h.degree for h in natal_chart.houses],
+            'start_jd': start_jd,
+            'step_days': step_days,
+            'planets': [p.value for p in request.planets] if request.planets else None,
+            'aspects': [a.value for a in request.aspects] if request.aspects else list(MAJOR_ASPECTS),
+            'mode': self._ephemeris_mode(natal),
+            'chunks': timeline_chunks(
+                start_jd, self.ephemeris.datetime_to_julian(request.end_date), step_days
+            ),
+        }
+
+    def transit_timeline_chunk(self, plan: Dict, index: int) -> List[Dict]:
+        """plan_transit_timeline 결과의 index번째 구간 스냅샷 (시각 순)"""
+        first, stop = plan['chunks'][index]
+        return transit_timeline_snapshots(
+            plan['natal_names'], plan['natal_longitudes'],
+            plan['start_jd'], plan['step_days'], first, stop,
+            planets=plan['planets'],
+            aspects=plan['aspects'],
+            natal_cusps=plan['natal_cusps'],
+            ephemeris=self.ephemeris,
+            mode=plan['mode']
+        )
+
+    def transit_timeline_chunk_text(
+        self,
+        plan: Dict,
+        index: int,
+        stream_format: StreamFormat = StreamFormat.NDJSON
+    ) -> str:
+        """
+        transit_timeline_chunk 결과를 NDJSON 또는 SSE 텍스트로 (스트리밍 응답용 - 직렬화도 워커에서)
+
+        SSE 이벤트 id는 기간 전체의 스냅샷 인덱스입니다.
+        """
+        snapshots = self.transit_timeline_chunk(plan, index)
+        if StreamFormat(stream_format) == StreamFormat.SSE:
+            first = plan['chunks'][index][0]
+            return "".join(
+                f"id: {first + i}\nevent: snapshot\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+                for i, snapshot in enumerate(snapshots)
+            )
+        return "".join(json.dumps(snapshot, ensure_ascii=False) + "\n" for snapshot in snapshots)
+
+    def iter_transit_timeline(self, request: TransitTimelineRequest) -> Iterator[Dict]:
+        """
+        기간 내 일정 간격 트랜짓 스냅샷 (행성 위치, 네이탈 하우스, 트랜짓-네이탈 아스펙트) 스트림
+
+        요청 검증과 출생 차트 계산은 즉시 수행하고, 스냅샷은 반환된
+        이터레이터를 소비할 때 구간 단위로 계산됩니다.
+        """
+        plan = self.plan_transit_timeline(request)
+        return (
+            snapshot
+            for index in range(len(plan['chunks']))
+            for snapshot in self.transit_timeline_chunk(plan, index)
+        )
+
+    def compare_house_systems(self, request: HouseComparisonRequest) -> Dict:
+        """
+        하우스 시스템 비교 - 같은 출생 차트를 여러 하우스 시스템으로 계산
+
+        Returns:
+            시스템별 커스프/ASC/MC와 행성별 하우스 번호
+        """
+        natal = self.resolve_birthplace(request.natal_chart)
+        house_systems = [s.value for s in (request.house_systems or HouseSystem)]
+        mode = self._ephemeris_mode(natal)
+
+        jd = self.ephemeris.datetime_to_julian(self._birth_datetime(natal))
+        planets = self.ephemeris.get_all_planets(jd, mode)
+        longitudes = [p['longitude'] for p in planets]
+        results = self.ephemeris.calculate_houses_multi(
+            jd, natal.latitude, natal.longitude, house_systems, mode
+        )
+
+        systems = []
+        for name, houses in results.items():
+            house_numbers = assign_houses(longitudes, [h['cusp'] for h in houses['houses']])
+            systems.append({
+                'house_system': name,
+                'houses': houses['houses'],
+                'ascendant': houses['ascendant'],
+                'midheaven': houses['midheaven'],
+                'planet_houses': {p['planet']: house for p, house in zip(planets, house_numbers)},
+            })
+
+        return {'julian_day': jd, 'systems': systems}
+
+    def synastry(self, request: SynastryRequest) -> Dict:
+        """
+        시너스트리 - 두 사람의 교차 아스펙트, 하우스 오버레이, 궁합 점수,
+        컴포지트/데이비슨 차트
+
+        교차 아스펙트의 planet1은 A, planet2는 B의 행성입니다. B의 차트도
+        A의 황도 기준/측심 설정으로 계산합니다.
+        """
+        person_a = self.resolve_birthplace(request.person_a)
+        person_b = self._in_mode_of(person_a, self.resolve_birthplace(request.person_b))
+        chart_a = self._natal_chart(person_a)
+        chart_b = self._natal_chart(person_b)
+
+        names_a, longitudes_a, _ = position_columns(chart_a.planets)
+        names_b, longitudes_b, _ = position_columns(chart_b.planets)
+        hits = find_aspects(longitudes_a, names_a, longitudes_b, names_b).sorted_by_orb()
+
+        result = {
+            **synastry_scores(hits)[0],
+            'aspects': hits.to_dicts(),
+            'house_overlays': {
+                'a_in_b': dict(zip(names_a, house_overlay(longitudes_a, [h.degree for h in chart_b.houses]))),
+                'b_in_a': dict(zip(names_b, house_overlay(longitudes_b, [h.degree for h in chart_a.houses]))),
+            },
+        }
+        if request.include_composite:
+            result['composite'] = self._composite_chart(person_a, person_b, chart_a, chart_b)
+        if request.include_davison:
+            result['davison'] = self._davison_chart(person_a, person_b)
+        return result
+
+    def synastry_batch(self, request: SynastryBatchRequest) -> Dict:
+        """
+        한 사람 × 여러 후보 궁합 순위
+
+        후보 차트의 황경을 (후보 수, 행성 수) 배열로 묶어 교차 아스펙트를
+        한 번에 계산합니다 (numpy가 없으면 후보별로 계산). 후보 차트는 모두
+        기준 인물의 황도 기준/측심 설정으로 계산합니다.
+
+        Returns:
+            점수 내림차순 후보 목록 [{index, score, harmony, tension, aspect_count, aspects}]
+        """
+        chart = self._natal_chart(request.person)
+        names, longitudes, _ = position_columns(chart.planets)
+
+        candidate_names, candidate_longitudes = None, []
+        for candidate in request.candidates:
+            candidate = self._in_mode_of(request.person, candidate)
+            names_b, longitudes_b, _ = position_columns(self._natal_chart(candidate).planets)
+            if candidate_names is not None and names_b != candidate_names:
+                raise ValueError("후보 차트의 행성 구성이 서로 다릅니다.")
+            candidate_names = names_b
+            candidate_longitudes.append(longitudes_b)
+
+        if NUMPY_AVAILABLE:
+            hits = find_aspects(longitudes, names, candidate_longitudes, candidate_names)
+            scores = synastry_scores(hits, len(candidate_longitudes))
+            per_candidate = [[] for _ in candidate_longitudes]
+            for item in hits.sorted_by_orb().to_dicts():
+                per_candidate[item.pop('epoch')].append(item)
+        else:
+            scores, per_candidate = [], []
+            for longitudes_b in candidate_longitudes:
+                hits = find_aspects(longitudes, names, longitudes_b, candidate_names)
+                scores.append(synastry_scores(hits)[0])
+                per_candidate.append(hits.sorted_by_orb().to_dicts())
+
+        ranking = [
+            {'index': i, **score, 'aspects': per_candidate[i][:request.top_aspects]}
+            for i, score in enumerate(scores)
+        ]
+        ranking.sort(key=lambda item: item['score'], reverse=True)
+        return {'count': len(ranking), 'ranking': ranking[:request.limit]}
+
+    def _composite_chart(
+        self,
+        person_a: AstrologyRequest,
+        person_b: AstrologyRequest,
+        chart_a: AstrologyResponse,
+        chart_b: AstrologyResponse
+    ) -> AstrologyResponse:
+        """컴포지트 차트 - 행성/MC 중간점, 하우스는 평균 위도에서 컴포지트 MC 기준 (A의 설정 사용)"""
+        mode = self._ephemeris_mode(person_a)
+        midheavens = []
+        for person in (person_a, person_b):
+            jd = self.ephemeris.datetime_to_julian(self._birth_datetime(person))
+            houses = self.ephemeris.calculate_houses(
+                jd, person.latitude, person.longitude, person_a.house_system.value, mode
+            )
+            midheavens.append((jd, houses['midheaven']['longitude']))
+
+        (jd_a, mc_a), (jd_b, mc_b) = midheavens
+        chart_data = composite_chart_data(
+            self.ephemeris,
+            [(p.planet.value, p.degree) for p in chart_a.planets],
+            [(p.planet.value, p.degree) for p in chart_b.planets],
+            midpoint(mc_a, mc_b),
+            (person_a.latitude + person_b.latitude) / 2.0,
+            (jd_a + jd_b) / 2.0,
+            person_a.house_system.value,
+            mode
+        )
+        return self._chart_response(chart_data)
+
+    def _davison_chart(self, person_a: AstrologyRequest, person_b: AstrologyRequest) -> AstrologyResponse:
+        """데이비슨 차트 - 두 출생 시각의 중간 시각, 두 출생지의 대권 중간점에서 계산 (A의 설정 사용)"""
+        jd = (
+            self.ephemeris.datetime_to_julian(self._birth_datetime(person_a))
+            + self.ephemeris.datetime_to_julian(self._birth_datetime(person_b))
+        ) / 2.0
+        latitude, longitude = geographic_midpoint(
+            person_a.latitude, person_a.longitude, person_b.latitude, person_b.longitude
+        )
+        mode = self._ephemeris_mode(person_a)._replace(latitude=latitude, longitude=longitude)
+        chart_data = self.ephemeris.get_natal_chart(
+            birth_datetime=self.ephemeris.julian_to_datetime(jd),
+            latitude=latitude,
+            longitude=longitude,
+            house_system=person_a.house_system.value,
+            mode=mode
+        )
+        return self._chart_response(chart_data)
+
+    def find_returns(self, request: ReturnRequest) -> Dict:
+        """
+        리턴 차트 - 기간 내 행성이 출생 황경으로 돌아오는 모든 시각 (출생 차트의 황도 기준/측심 설정 사용)
+
+        격자 부호 변화로 구간을 잡고 뉴턴법으로 정밀화하며, 리턴 시각별 차트는
+        행성 위치를 get_positions_bulk 한 번으로 계산합니다 (10년치 루나 리턴도 한 번의 호출).
+
+        Returns:
+            출생 황경과 시각 순 리턴 목록 [{datetime, julian_day, (planets, houses, ascendant, midheaven)}]
+        """
+        span = request.end_date - request.start_date
+        if span.total_seconds() <= 0:
+            raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+        if span.days > self.MAX_TRANSIT_EVENT_DAYS:
+            raise ValueError(f"탐색 기간은 최대 {self.MAX_TRANSIT_EVENT_DAYS}일입니다.")
+
+        natal = self.resolve_birthplace(request.natal_chart)
+        planet = request.planet.value
+        birth_jd = self.ephemeris.datetime_to_julian(self._birth_datetime(natal))
+        natal_mode = self._ephemeris_mode(natal)
+        natal_longitude = float(
+            self.ephemeris.get_positions_bulk([planet], [birth_jd], natal_mode)[0]['longitude'][0]
+        )
+
+        # 리턴 차트 위치 (측심이면 관측 위치도 여기로)
+        latitude = natal.latitude if request.latitude is None else request.latitude
+        longitude = natal.longitude if request.longitude is None else request.longitude
+        mode = natal_mode._replace(latitude=latitude, longitude=longitude)
+
+        roots = find_returns(
+            planet, natal_longitude,
+            self.ephemeris.datetime_to_julian(request.start_date),
+            self.ephemeris.datetime_to_julian(request.end_date),
+            ephemeris=self.ephemeris,
+            mode=mode
+        )
+        returns = [
+            {'datetime': self.ephemeris.julian_to_datetime(jd).isoformat(), 'julian_day': round(jd, 6)}
+            for jd in roots.tolist()
+        ]
+
+        if request.include_charts and returns:
+            positions = self.ephemeris.get_positions_bulk(list(MAJOR_PLANETS), roots, mode).T
+            for item, jd, row in zip(returns, roots.tolist(), positions):
+                houses = self.ephemeris.calculate_houses(
+                    jd, latitude, longitude, natal.house_system.value, mode
+                )
+                longitudes = row['longitude'].tolist()
+                house_numbers = assign_houses(longitudes, [h['cusp'] for h in houses['houses']])
+                item['ascendant'] = houses['ascendant']
+                item['midheaven'] = houses['midheaven']
+                item['houses'] = [h['cusp'] for h in houses['houses']]
+                item['planets'] = [
+                    {
+                        'planet': name,
+                        'longitude': round(lon, 4),
+                        'sign': self.ephemeris.ZODIAC_SIGNS[int(lon // 30) % 12],
+                        'house': house,
+                        'is_retrograde': retrograde,
+                    }
+                    for name, lon, house, retrograde in zip(
+                        MAJOR_PLANETS, longitudes, house_numbers, row['is_retrograde'].tolist()
+                    )
+                ]
+
+        return {'planet': planet, 'natal_longitude': round(natal_longitude, 4), 'returns': returns}
+
+    def get_progressions(self, request: ProgressionRequest) -> Dict:
+        """
+        2차 진행 차트 (하루 = 1년, 출생 차트의 황도 기준/측심 설정 사용) - 나이 격자 전체를 한 번에 계산
+
+        Returns:
+            나이 순 진행 차트 목록 [{age, date, planets, solar_arc, ascendant, midheaven, houses, aspects}]
+        """
+        if request.end_age < request.start_age:
+            raise ValueError("종료 나이는 시작 나이보다 크거나 같아야 합니다.")
+
+        natal = self.resolve_birthplace(request.natal_chart)
+        house_system = natal.house_system.value
+        birth_jd = self.ephemeris.datetime_to_julian(self._birth_datetime(natal))
+        mode = self._ephemeris_mode(natal)
+        natal_positions = self.ephemeris.get_positions_bulk(
+            list(MAJOR_PLANETS), [birth_jd], mode
+        )['longitude'][:, 0]
+        natal_houses = self.ephemeris.calculate_houses(
+            birth_jd, natal.latitude, natal.longitude, house_system, mode
+        )
+
+        step = request.step_months / 12.0
+        count = int((request.end_age - request.start_age) / step + 1e-9) + 1
+        ages = [request.start_age + i * step for i in range(count)]
+
+        progressions = secondary_progressions(
+            birth_jd, ages, list(MAJOR_PLANETS), natal_positions.tolist(),
+            natal_houses['midheaven']['longitude'], natal.latitude, house_system,
+            planets=[p.value for p in request.planets] if request.planets else None,
+            include_aspects=request.include_aspects,
+            mode=mode,
+            ephemeris=self.ephemeris
+        )
+        for item in progressions:
+            item['date'] = self.ephemeris.julian_to_datetime(
+                birth_jd + item['age'] * TROPICAL_YEAR_DAYS
+            ).date().isoformat()
+        return {'birth_julian_day': birth_jd, 'progressions': progressions}
+
+    def get_astrocartography(self, request: AstrocartographyRequest) -> Dict:
+        """
+        행성 각도선 지도 (GeoJSON FeatureCollection)
+
+        각도선은 출생 시각만으로 정해지므로 출생지는 해석하지 않습니다.
+        """
+        jd = self.ephemeris.datetime_to_julian(self._birth_datetime(request.natal_chart))
+        return get_astrocartography().planet_lines(
+            jd,
+            planets=[p.value for p in request.planets] if request.planets else None,
+            latitude_step=request.latitude_step,
+            latitude_limit=request.latitude_limit
+        )
+
+    def relocate(self, request: RelocationRequest) -> Dict:
+        """
+        후보 도시별 이주 차트 (하우스, 행성 하우스 배치, 가까운 각도선)
+
+        위도/경도가 없는 도시는 지명 사전으로 해석합니다.
+        """
+        places = []
+        for place in request.places:
+            if place.latitude is not None and place.longitude is not None:
+                places.append((place.name, place.latitude, place.longitude))
+                continue
+            resolved = get_gazetteer().resolve(place.name)
+            if resolved is None:
+                raise ValueError(f"알 수 없는 도시입니다: {place.name}")
+            places.append((place.name, resolved.latitude, resolved.longitude))
+
+        natal = request.natal_chart
+        jd = self.ephemeris.datetime_to_julian(self._birth_datetime(natal))
+        house_system = getattr(natal, 'house_system', 'placidus') or 'placidus'
+        return {
+            'julian_day': jd,
+            'house_system': house_system,
+            'places': get_astrocartography().relocate(
+                jd, places, house_system,
+                mode=EphemerisMode(sidereal=natal.zodiac_type == ZodiacType.SIDEREAL),
+                line_orb_km=request.line_orb_km
+            ),
+        }
+
+    def _chart_vector(self, request: AstrologyRequest, birth_time_known: bool = True):
+        """
+        유사도 인덱스용 특징 벡터
+
+        인덱스 전체가 같은 기준이어야 하므로 황도 기준과 무관하게 회귀황도로 계산하고,
+        출생 시각을 모르면(birth_time_known=False) ASC/MC를 쓰지 않습니다.
+        """
+        request = self.resolve_birthplace(request)
+        chart = self.ephemeris.get_natal_chart(
+            birth_datetime=self._birth_datetime(request),
+            latitude=request.latitude,
+            longitude=request.longitude
+        )
+        return chart_vector(chart, include_angles=birth_time_known)
+
+    def index_chart(self, request: ChartIndexRequest) -> Dict:
+        """유사도 인덱스에 출생 차트 등록 (파일에 덧붙여 저장)"""
+        index = get_chart_index()
+        row = index.add(request.key, self._chart_vector(request.natal_chart, request.birth_time_known))
+        return {'key': request.key, 'row': row, 'size': len(index)}
+
+    def find_similar_charts(self, request: SimilarChartRequest) -> Dict:
+        """
+        유사 차트 검색
+
+        Returns:
+            인덱스 크기와 코사인 유사도 내림차순 결과 (각거리는 가중 평균 황경 차이, 도)
+        """
+        index = get_chart_index()
+        exclude = [request.exclude_key] if request.exclude_key else None
+        matches = index.search(
+            self._chart_vector(request.natal_chart, request.birth_time_known), request.k, exclude
+        )
+        return {
+            'size': len(index),
+            'matches': [
+                {'key': key, 'similarity': similarity, 'angular_distance': distance}
+                for key, similarity, distance in matches
+            ],
+        }
+
+    def find_transit_patterns(self, request: TransitPatternRequest) -> Dict:
+        """
+        트랜짓 행성이 네이탈 행성과 함께 완성하는 아스펙트 패턴 구간
+
+        step_hours 간격의 시각 격자 위치를 TRANSIT_PATTERN_CHUNK 단위로 일괄 계산하고,
+        연속된 시각에 유지되는 같은 패턴은 한 구간으로 합칩니다.
+
+        Returns:
+            구간 목록 [{pattern, planets, apex, start, end}] (시작 시각 순)
+        """
+        span = request.end_date - request.start_date
+        if span.total_seconds() <= 0:
+            raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+        if span.days > self.MAX_TRANSIT_EVENT_DAYS:
+            raise ValueError(f"탐색 기간은 최대 {self.MAX_TRANSIT_EVENT_DAYS}일입니다.")
+
+        natal = self.resolve_birthplace(request.natal_chart)
+        natal_chart = self._natal_chart(natal)
+        natal_names, natal_longitudes, _ = position_columns(natal_chart.planets)
+        mode = self._ephemeris_mode(natal)
+        transit_names = [p.value for p in request.planets] if request.planets else list(MAJOR_PLANETS)
+        patterns = [p.value for p in request.patterns] if request.patterns else PATTERNS
+
+        start_jd = self.ephemeris.datetime_to_julian(request.start_date)
+        end_jd = self.ephemeris.datetime_to_julian(request.end_date)
+        step = request.step_hours / 24.0
+        jds = [start_jd + i * step for i in range(int((end_jd - start_jd) / step + 1e-9) + 1)]
+
+        matches = []
+        for offset in range(0, len(jds), self.TRANSIT_PATTERN_CHUNK):
+            chunk = jds[offset:offset + self.TRANSIT_PATTERN_CHUNK]
+            longitudes = self.ephemeris.get_positions_bulk(transit_names, chunk, mode)['longitude'].T
+            for match in transit_patterns(longitudes, transit_names, natal_longitudes,
+                                          natal_names, patterns):
+                matches.append(match._replace(epoch=match.epoch + offset))
+
+        periods = pattern_periods(matches, jds)
+        for period in periods:
+            period['start'] = self.ephemeris.julian_to_datetime(period.pop('start_jd')).isoformat()
+            period['end'] = self.ephemeris.julian_to_datetime(period.pop('end_jd')).isoformat()
+        return {'step_hours': request.step_hours, 'periods': periods}
+
+    def cache_stats(self) -> Dict:
+        """출생 차트 / 하우스 커스프 / 천궁도 SVG 캐시 통계"""
+        return {
+            'natal_chart': get_natal_chart_cache().stats(),
+            'houses': self.ephemeris.house_cache.stats(),
+            'chart_wheel': get_chart_wheel_renderer().cache.stats(),
+        }
+
+    def get_retrograde_calendar(self, year: int, planets: Optional[List[str]] = None) -> Dict:
+        """
+        연간 역행 달력 - 입궁/정류 테이블 기반
+
+        Args:
+            year: 연도 (UTC 기준 1월 1일 ~ 다음 해 1월 1일)
+            planets: 행성 이름 목록 (기본: 수성 ~ 명왕성)
+
+        Returns:
+            연도와 시작 시각 순 역행 구간 목록
+        """
+        table = self.ephemeris.planet_events
+        if table is None:
+            raise RuntimeError("입궁/정류 테이블(data/planet_events.bin)이 없습니다.")
+
+        start_jd = self.ephemeris.datetime_to_julian(datetime(year, 1, 1, tzinfo=timezone.utc))
+        end_jd = self.ephemeris.datetime_to_julian(datetime(year + 1, 1, 1, tzinfo=timezone.utc))
+        if not (table.covers('sun', start_jd) and table.covers('sun', end_jd - 1e-6)):
+            raise ValueError("역행 달력은 1900-2100년만 지원합니다.")
+
+        planets = [p.lower() for p in (planets or self.RETROGRADE_PLANETS)]
+        unknown = [p for p in planets if p not in table.planets]
+        if unknown:
+            raise ValueError(f"지원하지 않는 행성입니다: {', '.join(unknown)}")
+
+        def describe(jd):
+            if jd is None:
+                return None, None
+            sign = self.ephemeris.ZODIAC_SIGNS[table.sign_index(planet, jd)] if table.covers(planet, jd) else None
+            return self.ephemeris.julian_to_datetime(jd).isoformat(), sign
+
+        periods = []
+        for planet in planets:
+            for retrograde_jd, direct_jd in table.retrograde_periods(planet, start_jd, end_jd):
+                retrograde_at, retrograde_sign = describe(retrograde_jd)
+                direct_at, direct_sign = describe(direct_jd)
+                periods.append({
+                    'planet': planet,
+                    'retrograde_start': retrograde_at,
+                    'direct_start': direct_at,
+                    'retrograde_sign': retrograde_sign,
+                    'direct_sign': direct_sign,
+                })
+
+        periods.sort(key=lambda p: p['retrograde_start'] or '')
+        return {'year': year, 'periods': periods}
+
+    def _get_current_planet_positions_precise(
+        self,
+        date: datetime,
+        mode: Optional[EphemerisMode] = None
+    ) -> List[PlanetPosition]:
+        """Swiss Ephemeris를 사용한 정밀 행성 위치 계산 (mode: 출생 차트의 계산 모드)"""
         if self.use_swiss_ephemeris:
             # Julian Day 계산
             jd = self.ephemeris.datetime_to_julian(date)
 
             # 모든 행성 위치 계산
-            ephemeris_planets = self.ephemeris.get_all_planets(jd)
+            ephemeris_planets = self.ephemeris.get_all_planets(jd, mode)
 
             # 모델로 변환
             return self._convert_planets(ephemeris_planets)
@@ -533,38 +1265,16 @@ class AstrologyService:
         self, natal: List[PlanetPosition], transit: List[PlanetPosition]
     ) -> List[Aspect]:
         """트랜짓 아스펙트 계산 - 네이탈 행성과 트랜짓 행성 간의 아스펙트"""
-        aspects = []
-        aspect_angles = {
-            AspectType.CONJUNCTION: (0, 8),
-            AspectType.SEXTILE: (60, 6),
-            AspectType.SQUARE: (90, 8),
-            AspectType.TRINE: (120, 8),
-            AspectType.OPPOSITION: (180, 8),
-        }
+        natal_names, natal_longitudes, _ = position_columns(natal)
+        transit_names, transit_longitudes, _ = position_columns(transit)
+
+        # 트랜짓 행성(planet1) × 네이탈 행성(planet2)
+        hits = find_aspects(
+            transit_longitudes, transit_names, natal_longitudes, natal_names
+        )
 
-        # 네이탈과 트랜짓 간의 아스펙트만 계산
-        for natal_planet in natal:
-            for transit_planet in transit:
-                diff = abs(natal_planet.degree - transit_planet.degree)
-                if diff > 180:
-                    diff = 360 - diff
-
-                for aspect_type, (angle, orb) in aspect_angles.items():
-                    orb_actual = abs(diff - angle)
-                    if orb_actual <= orb:
-                        aspects.append(Aspect(
-                            planet1=transit_planet.planet,  # 트랜짓 행성
-                            planet2=natal_planet.planet,     # 네이탈 행성
-                            aspect_type=aspect_type,
-                            degree=diff,
-                            orb=orb_actual,
-                            is_applying=True
-                        ))
-                        break
-
-        # 오브(정확도)가 작은 순으로 정렬
-        aspects.sort(key=lambda x: x.orb)
-        return aspects[:15]  # 상위 15개
+        # 오브(정확도)가 작은 순으로 상위 15개
+        return hits.sorted_by_orb(limit=15).to_models()
 
     def _interpret_transits(
         self, aspects: List[Aspect], current_planets: List[PlanetPosition] = None
@@ -0,0 +1,219 @@
+"""
+출생 차트 결과 캐시 (Natal Chart Cache)
+
+출생 차트는 입력(출생 일시, 시간대, 출생지 좌표, 하우스 시스템, 황도 기준, 측심 여부)의
+순수 함수이므로, 이를 정규화한 JSON의 SHA-256을 키로 AstrologyResponse를 보관합니다.
+create_natal_chart를 거치는 get_transit, 트랜짓 이벤트/패턴, 통합 분석이 모두 공유합니다.
+
+- 메모리 계층: 크기 제한 LRU (TTL 없음), 값은 응답 JSON 문자열
+  (호출자마다 model_validate_json으로 독립된 객체를 돌려줌)
+- 디스크 계층 (선택): NATAL_CHART_CACHE_DB 경로의 sqlite - 재시작 후에도,
+  워커 프로세스 사이에서도 공유. 메모리 미스일 때만 조회
+
+좌표는 COORD_DECIMALS 자리(약 11m)로 양자화하고 계산도 양자화된 좌표로 하므로
+같은 키의 결과는 어느 요청이 먼저 채웠는지와 무관합니다.
+"""
+
+from typing import Callable, Dict, Optional
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.astrology_models import AstrologyRequest, AstrologyResponse, HouseSystem, ZodiacType
+from services.lru_cache import LRUCache
+
+
+# 메모리 계층 크기 (차트 수, 항목당 약 4KB)
+CHART_CACHE_SIZE = 4096
+
+# 디스크 계층 sqlite 경로 (빈 값이면 메모리만)
+CHART_CACHE_DB = os.environ.get("NATAL_CHART_CACHE_DB", "")
+
+# 응답 형식이 바뀌면 올려서 디스크 계층의 이전 항목을 무효화
+CHART_CACHE_VERSION = 1
+
+# 좌표 양자화 자릿수
+COORD_DECIMALS = 4
+
+
+def quantize_request(request: AstrologyRequest) -> AstrologyRequest:
+    """출생지 좌표를 캐시 키 정밀도로 반올림한 요청 (좌표가 있어야 함)"""
+    return request.model_copy(update={
+        'latitude': round(request.latitude, COORD_DECIMALS),
+        'longitude': round(request.longitude, COORD_DECIMALS),
+    })
+
+
+def chart_key(request: AstrologyRequest, variant: str = '') -> str:
+    """
+    출생 차트 캐시 키 - 정규화한 입력의 SHA-256
+
+    Args:
+        request: 출생지 좌표가 해석된 요청
+        variant: 계산 경로 구분 (정밀/근사 등)
+    """
+    canonical = {
+        'v': CHART_CACHE_VERSION,
+        'variant': variant,
+        'birth': [request.birth_year, request.birth_month, request.birth_day,
+                  request.birth_hour, request.birth_minute],
+        'timezone': request.timezone,
+        'lat': round(request.latitude, COORD_DECIMALS),
+        'lon': round(request.longitude, COORD_DECIMALS),
+        'house_system': HouseSystem(request.house_system).value,
+        'zodiac_type': ZodiacType(request.zodiac_type).value,
+        'topocentric': request.topocentric,
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class NatalChartCache:
+    """출생 차트 응답 캐시 (메모리 LRU + 선택적 sqlite)"""
+
+    def __init__(self, maxsize: int = CHART_CACHE_SIZE, db_path: Optional[str] = None):
+        """
+        Args:
+            maxsize: 메모리 계층 최대 차트 수 (0이면 메모리 캐시 안 함)
+            db_path: sqlite 파일 경로 (없으면 디스크 계층 없음)
+        """
+        self.memory = LRUCache(maxsize)
+        self.db_path = db_path or None
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._db = None
+        self._db_lock = threading.Lock()
+        if self.db_path:
+            self._open_db()
+
+    def _open_db(self):
+        """sqlite 연결 (여러 프로세스가 같은 파일을 쓰도록 WAL 모드)"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS natal_chart ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        db.commit()
+        self._db = db
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT response FROM natal_chart WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading natal chart cache: {e}")
+            return None
+        if row is None:
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        return row[0]
+
+    def _disk_put(self, key: str, payload: str):
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO natal_chart (key, response, created) VALUES (?, ?, ?)",
+                    (key, payload, time.time())
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing natal chart cache: {e}")
+
+    def get(self, key: str) -> Optional[AstrologyResponse]:
+        """캐시된 응답 (호출마다 새 객체), 없으면 None"""
+        payload = self.memory.get(key)
+        if payload is None:
+            payload = self._disk_get(key)
+            if payload is None:
+                return None
+            self.memory.put(key, payload)
+        return AstrologyResponse.model_validate_json(payload)
+
+    def put(self, key: str, response: AstrologyResponse):
+        """응답 저장 (메모리 + 디스크)"""
+        payload = response.model_dump_json()
+        self.memory.put(key, payload)
+        self._disk_put(key, payload)
+
+    def get_or_create(
+        self,
+        request: AstrologyRequest,
+        factory: Callable[[AstrologyRequest], AstrologyResponse],
+        variant: str = ''
+    ) -> AstrologyResponse:
+        """
+        캐시 조회 후 없으면 factory로 계산해 저장
+
+        Args:
+            request: 출생지 좌표가 해석된 요청
+            factory: 양자화된 요청으로 차트를 계산하는 함수
+            variant: 계산 경로 구분 (키에 포함)
+        """
+        key = chart_key(request, variant)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        response = factory(quantize_request(request))
+        self.put(key, response)
+        return response
+
+    def clear(self):
+        """메모리/디스크 항목과 통계 초기화"""
+        self.memory.clear()
+        self.disk_hits = self.disk_misses = 0
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM natal_chart")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        """메모리 LRU 통계와 디스크 계층 적중/미스/항목 수"""
+        stats = self.memory.stats()
+        disk = None
+        if self._db is not None:
+            with self._db_lock:
+                size = self._db.execute("SELECT COUNT(*) FROM natal_chart").fetchone()[0]
+            disk = {'path': self.db_path, 'size': size,
+                    'hits': self.disk_hits, 'misses': self.disk_misses}
+        stats['disk'] = disk
+        return stats
+
+
+# 싱글톤 인스턴스
+_natal_chart_cache_instance = None
+_natal_chart_cache_lock = threading.Lock()
+
+
+def get_natal_chart_cache() -> NatalChartCache:
+    """
+    출생 차트 캐시 싱글톤 인스턴스 반환 (프로세스 내 모든 AstrologyService가 공유)
+
+    디스크 계층을 열 수 없으면 메모리 계층만 사용합니다.
+    """
+    global _natal_chart_cache_instance
+    with _natal_chart_cache_lock:
+        if _natal_chart_cache_instance is None:
+            try:
+                _natal_chart_cache_instance = NatalChartCache(db_path=CHART_CACHE_DB)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: natal chart cache database unavailable ({e}). Using memory only.")
+                _natal_chart_cache_instance = NatalChartCache()
+        return _natal_chart_cache_instance
@@ -0,0 +1,432 @@
+"""
+출생 차트 유사도 인덱스 - "나와 비슷한 차트" / 유명인 매칭
+
+각 출생 차트를 행성 황경의 원형 특징 벡터로 임베딩합니다.
+    v = [w_1 cos λ_1, w_1 sin λ_1, ..., w_F cos λ_F, w_F sin λ_F] / ‖·‖
+두 벡터의 내적(코사인 유사도)은 Σ w² cos Δλ / Σ w² 이므로 0도/360도 경계가 없고,
+각거리 arccos(유사도)는 가중 평균 황경 차이처럼 읽힙니다.
+특징은 주요 10행성과 ASC/MC(출생 시각을 알 때만)이며, 세대 행성은 가중치를 낮춥니다.
+
+벡터는 연속된 float32 행렬로 보관하고 top-k 질의는 SEARCH_BLOCK_ROWS 행씩 행렬곱과
+argpartition으로 처리합니다 (트리 없이 전수 탐색, 100만 건 × 24차원 ≈ 96MB).
+
+저장 형식 (data/chart_index.bin + data/chart_index.keys):
+    헤더(magic, version, 차원, 건수) + float32 행렬 / UTF-8 키 한 줄에 하나
+건수는 헤더에만 있으므로 삽입은 파일 끝에 행과 키를 덧붙이고 헤더를 마지막에 갱신하며,
+로드는 행렬을 복사 없이 메모리 매핑합니다 (첫 삽입 때 여유 용량을 둔 버퍼로 복사).
+
+워커 프로세스(EPHEMERIS_WORKERS>0, uvicorn 워커)마다 인덱스를 따로 들고 있으므로
+삽입은 잠금 파일(data/chart_index.lock)에 배타 flock을 잡고, 검색은 공유 flock을 잡은 뒤
+다른 프로세스가 덧붙인 행/키를 먼저 읽어 옵니다 (헤더 건수 비교, 새 행만 읽음).
+fcntl이 없는 환경(Windows)에서는 파일 쓰기를 한 프로세스에서만 하세요.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+import mmap
+import struct
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from services.solar_terms import DATA_DIR
+from services.swiss_ephemeris import MAJOR_PLANETS
+
+
+CHART_INDEX_PATH = os.path.join(DATA_DIR, 'chart_index.bin')
+
+# 특징 (행성 + 각도)과 가중치 - 외행성은 같은 세대 전체가 비슷하므로 낮춤
+FEATURES = MAJOR_PLANETS + ('ascendant', 'midheaven')
+FEATURE_WEIGHTS = {
+    'sun': 1.5, 'moon': 1.5,
+    'mercury': 1.0, 'venus': 1.0, 'mars': 1.0,
+    'jupiter': 0.75, 'saturn': 0.75,
+    'uranus': 0.5, 'neptune': 0.5, 'pluto': 0.5,
+    'ascendant': 1.0, 'midheaven': 0.75,
+}
+ANGLE_FEATURES = ('ascendant', 'midheaven')
+FEATURE_DIM = 2 * len(FEATURES)
+
+# 전수 탐색 블록 크기 (행)
+SEARCH_BLOCK_ROWS = 65536
+
+# 첫 삽입 시 확보하는 최소 용량 (행)
+MIN_CAPACITY = 1024
+
+# 파일 헤더: magic, version, 차원, 건수
+_HEADER = struct.Struct('<4sHHI')
+_MAGIC = b'CIDX'
+_VERSION = 1
+
+
+def _keys_path(path: str) -> str:
+    """벡터 파일에 대응하는 키 파일 경로"""
+    return os.path.splitext(path)[0] + '.keys'
+
+
+def _lock_path(path: str) -> str:
+    """벡터 파일에 대응하는 프로세스 간 잠금 파일 경로"""
+    return os.path.splitext(path)[0] + '.lock'
+
+
+def feature_vectors(longitudes, include_angles=True) -> 'np.ndarray':
+    """
+    특징 황경을 정규화된 원형 특징 벡터로 변환 (벡터화)
+
+    Args:
+        longitudes: FEATURES 순서 황경 (도), shape (F,) 또는 (N, F)
+        include_angles: ASC/MC 사용 여부 (bool 또는 차트별 (N,) 배열)
+
+    Returns:
+        float32 배열 shape (FEATURE_DIM,) 또는 (N, FEATURE_DIM)
+    """
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    single = lon.ndim == 1
+    lon = np.atleast_2d(lon)
+    if lon.shape[1] != len(FEATURES):
+        raise ValueError(f"특징 황경은 {len(FEATURES)}개여야 합니다.")
+
+    weights = np.broadcast_to(
+        np.array([FEATURE_WEIGHTS[name] for name in FEATURES]), lon.shape
+    ).copy()
+    angle_columns = [FEATURES.index(name) for name in ANGLE_FEATURES]
+    angles = np.broadcast_to(np.asarray(include_angles, dtype=bool), (lon.shape[0],))
+    weights[:, angle_columns] *= angles[:, None]
+
+    vectors = np.empty((lon.shape[0], FEATURE_DIM), dtype=np.float64)
+    vectors[:, 0::2] = weights * np.cos(lon)
+    vectors[:, 1::2] = weights * np.sin(lon)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors.astype(np.float32)
+    return vectors[0] if single else vectors
+
+
+def chart_vector(chart: Dict, include_angles: bool = True) -> 'np.ndarray':
+    """
+    SwissEphemeris.get_natal_chart 결과를 특징 벡터로 변환
+
+    Args:
+        chart: get_natal_chart 결과 (planets, houses)
+        include_angles: ASC/MC 사용 여부 (출생 시각을 모르면 False)
+    """
+    longitudes = {p['planet']: p['longitude'] for p in chart['planets']}
+    longitudes['ascendant'] = chart['houses']['ascendant']['longitude']
+    longitudes['midheaven'] = chart['houses']['midheaven']['longitude']
+    missing = [name for name in FEATURES if name not in longitudes]
+    if missing:
+        raise ValueError(f"차트에 없는 특징입니다: {', '.join(missing)}")
+    return feature_vectors([longitudes[name] for name in FEATURES], include_angles)
+
+
+class ChartIndex:
+    """출생 차트 특징 벡터 인덱스 (전수 탐색 top-k)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        빈 인덱스 생성
+
+        Args:
+            path: 삽입을 덧붙여 기록할 파일 경로 (없으면 메모리에만 보관)
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("차트 유사도 인덱스에는 numpy가 필요합니다.")
+        self.path = path
+        self.keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.empty((0, FEATURE_DIM), dtype=np.float32)
+        self._count = 0
+        self._mmap = None
+        self._keys_bytes = 0  # 키 파일에서 등록된 키가 차지하는 바이트 수
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def vectors(self) -> 'np.ndarray':
+        """등록된 벡터 (count × FEATURE_DIM float32, 읽기 전용으로 사용)"""
+        return self._vectors[:self._count]
+
+    @classmethod
+    def load(cls, path: str = CHART_INDEX_PATH) -> 'ChartIndex':
+        """인덱스 파일을 메모리 매핑 (벡터는 복사하지 않음)"""
+        with open(path, 'rb') as f:
+            magic, version, dim, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != _VERSION or dim != FEATURE_DIM:
+                raise ValueError("지원하지 않는 차트 인덱스 형식입니다.")
+            if os.fstat(f.fileno()).st_size < _HEADER.size + count * dim * 4:
+                raise ValueError("차트 인덱스 크기가 올바르지 않습니다.")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if count else None
+
+        with open(_keys_path(path), 'r', encoding='utf-8') as f:
+            keys = [line.rstrip('\n') for line, _ in zip(f, range(count))]
+        if len(keys) != count:
+            raise ValueError("차트 인덱스 키 수가 올바르지 않습니다.")
+
+        index = cls(path)
+        if mm is not None:
+            index._mmap = mm
+            index._vectors = np.frombuffer(mm, dtype=np.float32, count=count * dim,
+                                           offset=_HEADER.size).reshape(count, dim)
+        index._count = count
+        index._keys_bytes = sum(len(key.encode('utf-8')) + 1 for key in keys)
+        index.keys = keys
+        index._rows = {key: row for row, key in enumerate(keys)}
+        return index
+
+    @contextmanager
+    def _file_lock(self, shared: bool = False, path: Optional[str] = None):
+        """
+        프로세스 간 파일 잠금 (삽입/저장은 배타, 검색은 공유)
+
+        파일 경로가 없거나 fcntl이 없으면 잠그지 않습니다.
+        """
+        path = path or self.path
+        if path is None or not FCNTL_AVAILABLE:
+            yield
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(_lock_path(path), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """
+        다른 프로세스가 파일에 덧붙인 행/키를 읽어 옴 (self._lock과 파일 잠금 안에서 호출)
+
+        헤더 건수가 메모리 건수보다 클 때만 새 행을 읽고, 형식이 맞지 않거나
+        아직 파일이 없으면 그대로 둡니다.
+        """
+        if self.path is None:
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                magic, version, dim, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or version != _VERSION or dim != FEATURE_DIM or count <= self._count:
+                    return
+                f.seek(_HEADER.size + self._count * FEATURE_DIM * 4)
+                data = f.read((count - self._count) * FEATURE_DIM * 4)
+            with open(_keys_path(self.path), 'rb') as f:
+                f.seek(self._keys_bytes)
+                lines = f.read().split(b'\n')[:count - self._count]
+        except (OSError, struct.error):
+            return
+        added = count - self._count
+        if len(data) != added * FEATURE_DIM * 4 or len(lines) != added:
+            return
+
+        start = self._count
+        self._reserve(count)
+        self._vectors[start:count] = np.frombuffer(data, dtype=np.float32).reshape(added, FEATURE_DIM)
+        for row, line in enumerate(lines, start):
+            key = line.decode('utf-8')
+            self.keys.append(key)
+            self._rows[key] = row
+        self._keys_bytes += sum(len(line) + 1 for line in lines)
+        self._count = count
+
+    def save(self, path: str = CHART_INDEX_PATH):
+        """인덱스 전체를 원자적으로 기록하고 이후 삽입을 이 파일에 덧붙임"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock, self._file_lock(path=path):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, FEATURE_DIM, self._count))
+                f.write(np.ascontiguousarray(self.vectors).tobytes())
+            tmp_keys = f"{_keys_path(path)}.{os.getpid()}.tmp"
+            with open(tmp_keys, 'w', encoding='utf-8') as f:
+                f.writelines(key + '\n' for key in self.keys)
+            os.replace(tmp_keys, _keys_path(path))
+            os.replace(tmp_path, path)
+            self.path = path
+            self._keys_bytes = sum(len(key.encode('utf-8')) + 1 for key in self.keys)
+
+    def add(self, key: str, vector) -> int:
+        """차트 1건 삽입, 행 번호 반환"""
+        return self.add_many([key], np.asarray(vector, dtype=np.float32)[None, :])[0]
+
+    def add_many(self, keys: Sequence[str], vectors) -> List[int]:
+        """
+        여러 차트 삽입 (파일 경로가 있으면 파일 끝에 덧붙여 기록)
+
+        Args:
+            keys: 차트 키 (중복 불가, 줄바꿈 불가)
+            vectors: feature_vectors 결과 shape (N, FEATURE_DIM)
+
+        Returns:
+            삽입된 행 번호
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(keys), FEATURE_DIM):
+            raise ValueError(f"벡터는 ({len(keys)}, {FEATURE_DIM}) 형태여야 합니다.")
+        if len(set(keys)) != len(keys):
+            raise ValueError("같은 요청에 중복된 키가 있습니다.")
+        for key in keys:
+            if not key or '\n' in key or '\r' in key:
+                raise ValueError("키는 비어 있거나 줄바꿈을 포함할 수 없습니다.")
+
+        with self._lock, self._file_lock():
+            self._refresh()
+            duplicated = [key for key in keys if key in self._rows]
+            if duplicated:
+                raise ValueError(f"이미 등록된 차트입니다: {', '.join(duplicated)}")
+
+            start = self._count
+            self._reserve(start + len(keys))
+            self._vectors[start:start + len(keys)] = vectors
+            if self.path is not None:
+                self._append_file(start, vectors, keys)
+
+            self._count += len(keys)
+            for row, key in enumerate(keys, start):
+                self.keys.append(key)
+                self._rows[key] = row
+            return list(range(start, start + len(keys)))
+
+    def _reserve(self, rows: int):
+        """용량 확보 (메모리 매핑 상태거나 부족하면 두 배로 늘린 버퍼에 복사)"""
+        if self._mmap is None and rows <= self._vectors.shape[0]:
+            return
+        capacity = max(rows, 2 * self._vectors.shape[0], MIN_CAPACITY)
+        grown = np.empty((capacity, FEATURE_DIM), dtype=np.float32)
+        grown[:self._count] = self._vectors[:self._count]
+        self._vectors = grown
+        # 진행 중인 검색이 이전 뷰를 쓰고 있을 수 있으므로 매핑은 참조만 놓음
+        self._mmap = None
+
+    def _append_file(self, start: int, vectors: 'np.ndarray', keys: Sequence[str]):
+        """
+        행과 키를 파일 끝에 쓰고 헤더 건수를 마지막에 갱신
+
+        헤더 갱신 전에 중단된 이전 삽입의 잔여 행/키는 헤더 건수 기준 위치에서 덮어씁니다.
+        """
+        if start == 0 or not os.path.exists(self.path):
+            # 첫 삽입이면 (읽지 못한 이전 파일이 있어도) 새 파일로 시작
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, FEATURE_DIM, 0))
+            open(_keys_path(self.path), 'wb').close()
+            self._keys_bytes = 0
+
+        encoded = b''.join(key.encode('utf-8') + b'\n' for key in keys)
+        with open(_keys_path(self.path), 'r+b') as f:
+            f.truncate(self._keys_bytes)
+            f.seek(self._keys_bytes)
+            f.write(encoded)
+        with open(self.path, 'r+b') as f:
+            f.seek(_HEADER.size + start * FEATURE_DIM * 4)
+            f.write(vectors.tobytes())
+            f.flush()
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, FEATURE_DIM, start + len(keys)))
+        self._keys_bytes += len(encoded)
+
+    def search_many(
+        self,
+        queries,
+        k: int = 10,
+        exclude: Optional[Sequence[str]] = None
+    ) -> List[List[Tuple[str, float, float]]]:
+        """
+        여러 질의 벡터의 top-k 유사 차트
+
+        Args:
+            queries: feature_vectors 결과 shape (Q, FEATURE_DIM)
+            k: 질의당 결과 수
+            exclude: 결과에서 뺄 키 (예: 자기 자신)
+
+        Returns:
+            질의별 (키, 코사인 유사도, 각거리(도)) 목록, 유사도 내림차순
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        with self._lock:
+            with self._file_lock(shared=True):
+                self._refresh()
+            vectors = self.vectors
+            keys = list(self.keys)
+            excluded = [self._rows[key] for key in (exclude or ()) if key in self._rows]
+
+        count = len(keys)
+        k = min(k, count - len(excluded))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        # 블록별 후보 top-k를 모은 뒤 최종 top-k
+        best_scores = []
+        best_rows = []
+        for start in range(0, count, SEARCH_BLOCK_ROWS):
+            block = vectors[start:start + SEARCH_BLOCK_ROWS]
+            scores = queries @ block.T
+            for row in excluded:
+                if start <= row < start + len(block):
+                    scores[:, row - start] = -np.inf
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+            else:
+                top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+            best_scores.append(scores)
+            best_rows.append(top + start)
+
+        scores = np.concatenate(best_scores, axis=1)
+        rows = np.concatenate(best_rows, axis=1)
+        order = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+        scores = np.take_along_axis(scores, order, axis=1)
+        rows = np.take_along_axis(rows, order, axis=1)
+        distances = np.degrees(np.arccos(np.clip(scores, -1.0, 1.0)))
+
+        return [
+            [(keys[row], round(float(score), 6), round(float(distance), 4))
+             for row, score, distance in zip(q_rows.tolist(), q_scores, q_distances)]
+            for q_rows, q_scores, q_distances in zip(rows, scores, distances)
+        ]
+
+    def search(
+        self,
+        vector,
+        k: int = 10,
+        exclude: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, float, float]]:
+        """질의 벡터 1개의 top-k 유사 차트 (search_many 참고)"""
+        return self.search_many(np.asarray(vector, dtype=np.float32)[None, :], k, exclude)[0]
+
+
+# 싱글톤 인스턴스
+_chart_index_instance = None
+_chart_index_lock = threading.Lock()
+
+
+def get_chart_index(path: str = CHART_INDEX_PATH) -> ChartIndex:
+    """
+    차트 유사도 인덱스 싱글톤 인스턴스 반환
+
+    인덱스 파일이 없거나 읽을 수 없으면 이 경로에 기록할 빈 인덱스를 만듭니다.
+    """
+    global _chart_index_instance
+    with _chart_index_lock:
+        if _chart_index_instance is None:
+            try:
+                _chart_index_instance = ChartIndex.load(path)
+            except (OSError, ValueError, struct.error):
+                _chart_index_instance = ChartIndex(path)
+        return _chart_index_instance
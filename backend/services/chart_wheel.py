@@ -0,0 +1,394 @@
+"""
+천궁도 휠 SVG 렌더러 (Chart Wheel Renderer)
+
+차트마다 바뀌지 않는 뼈대(황도 12궁 링, 별자리 기호, 1도/5도 눈금, 행성 띠 경계)는
+테마 × 링 수(단일/이중 휠)마다 한 번 만들어 string.Template으로 보관합니다.
+황도 링은 회전 각도 자리표시자($rotation)를 가진 그룹으로 그려 두고 어센던트만큼
+돌리므로, 같은 뼈대가 모든 차트와 하우스 시스템에 그대로 쓰입니다.
+
+요청마다 만드는 층은 하우스 커스프, 행성 기호(겹치지 않게 벌린 위치), 아스펙트 선뿐이며,
+완성된 SVG는 입력(테마, 커스프, 행성, 아스펙트)의 해시로 LRU 캐시에 보관합니다.
+
+좌표계: 황경 λ는 화면 각도 180° + (λ - ASC) (반시계, +x 기준)에 그려져
+어센던트가 9시 방향, 황경이 커질수록 반시계 방향으로 진행합니다.
+"""
+
+from string import Template
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+import hashlib
+import json
+import math
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.lru_cache import LRUCache
+
+
+# 렌더링 결과 캐시 크기 (SVG 수, 항목당 약 10KB)
+CHART_WHEEL_CACHE_SIZE = 1024
+
+# 캔버스 크기 (px)
+WHEEL_SIZE = 400
+CENTER = WHEEL_SIZE / 2
+
+# 반지름 (px): 황도 링 바깥/안쪽, 행성 띠 경계 (바깥쪽부터), 하우스 번호, 아스펙트 원
+ZODIAC_OUTER_RADIUS = 190
+ZODIAC_INNER_RADIUS = 160
+WHEEL_LAYOUTS = {
+    1: {'bands': (160, 110), 'house_numbers': 103, 'aspect': 96},
+    2: {'bands': (160, 132, 104), 'house_numbers': 97, 'aspect': 90},
+}
+
+# 행성 기호 크기 (px) - 같은 띠에서 기호 사이 최소 간격
+GLYPH_SIZE = 14
+
+ZODIAC_GLYPHS = ('♈', '♉', '♊', '♋', '♌', '♍', '♎', '♏', '♐', '♑', '♒', '♓')
+SIGN_ELEMENTS = ('fire', 'earth', 'air', 'water') * 3
+
+PLANET_GLYPHS = {
+    'sun': '☉', 'moon': '☽', 'mercury': '☿', 'venus': '♀', 'mars': '♂',
+    'jupiter': '♃', 'saturn': '♄', 'uranus': '♅', 'neptune': '♆', 'pluto': '♇',
+    'north_node': '☊', 'chiron': '⚷',
+}
+
+# 테마별 색상 (프론트엔드 chart.js와 같은 팔레트)
+THEMES = {
+    'light': {
+        'background': '#f5f5f7',
+        'lines': '#d2d2d7',
+        'text': '#1d1d1f',
+        'text_secondary': '#8e8e93',
+        'fire': '#ff3b30', 'earth': '#8b5a2b', 'air': '#007aff', 'water': '#34c759',
+        'rings': ('#1d1d1f', '#007aff'),
+        'retrograde': '#ff3b30',
+        'aspects': {
+            'trine': '#34c759', 'sextile': '#007aff', 'square': '#ff3b30',
+            'opposition': '#ff9500', 'conjunction': '#8e8e93',
+        },
+    },
+    'dark': {
+        'background': '#161b22',
+        'lines': '#484f58',
+        'text': '#f0f6fc',
+        'text_secondary': '#8b949e',
+        'fire': '#ff3b30', 'earth': '#d4a574', 'air': '#5ac8fa', 'water': '#34c759',
+        'rings': ('#f0f6fc', '#5ac8fa'),
+        'retrograde': '#ff3b30',
+        'aspects': {
+            'trine': '#34c759', 'sextile': '#5ac8fa', 'square': '#ff3b30',
+            'opposition': '#ff9500', 'conjunction': '#8b949e',
+        },
+    },
+}
+DEFAULT_THEME = 'light'
+
+
+class WheelPlanet(NamedTuple):
+    """휠에 그릴 행성 1개"""
+    name: str
+    longitude: float
+    is_retrograde: bool = False
+
+
+class WheelAspect(NamedTuple):
+    """휠에 그릴 아스펙트 선 1개 (두 행성의 실제 황경)"""
+    aspect: str
+    longitude1: float
+    longitude2: float
+
+
+def _point(radius: float, angle: float) -> Tuple[float, float]:
+    """화면 각도(도, 반시계)와 반지름 -> SVG 좌표"""
+    rad = math.radians(angle)
+    return CENTER + radius * math.cos(rad), CENTER - radius * math.sin(rad)
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.1f}"
+
+
+def spread_longitudes(longitudes: Sequence[float], min_gap: float) -> List[float]:
+    """
+    원 위의 점들이 min_gap(도) 이상 떨어지도록 벌린 표시 위치
+
+    간격이 좁은 이웃을 묶음으로 합치고, 묶음은 원래 위치의 평균을 중심으로
+    min_gap 간격으로 펼칩니다. 펼친 묶음이 이웃과 다시 겹치면 합치기를 반복합니다.
+
+    Args:
+        longitudes: 황경 (도)
+        min_gap: 최소 간격 (도) - 모두 놓을 수 없으면 360/개수로 줄임
+
+    Returns:
+        입력 순서대로 표시 황경 (0-360 범위로 정규화하지 않음)
+    """
+    count = len(longitudes)
+    if count < 2:
+        return [float(lon) for lon in longitudes]
+    gap = min(min_gap, 360.0 / count)
+
+    values = [lon % 360 for lon in longitudes]
+    order = sorted(range(count), key=values.__getitem__)
+    # 가장 넓은 빈틈 다음에서 시작해야 펼친 순서가 360도 경계를 넘지 않음
+    widest = max(range(count), key=lambda k: (values[order[(k + 1) % count]] - values[order[k]]) % 360)
+    start = (widest + 1) % count
+    points = [(values[i], i) for i in order[start:]] + [(values[i] + 360, i) for i in order[:start]]
+
+    # 묶음: (점 목록 [(위치, 입력 인덱스)], 중심 = 원래 위치 평균)
+    def make(members):
+        return members, sum(v for v, _ in members) / len(members)
+
+    def first(cluster):
+        return cluster[1] - (len(cluster[0]) - 1) / 2 * gap
+
+    def last(cluster):
+        return cluster[1] + (len(cluster[0]) - 1) / 2 * gap
+
+    clusters = [make([point]) for point in points]
+    changed = True
+    while changed:
+        changed = False
+        merged = [clusters[0]]
+        for cluster in clusters[1:]:
+            if first(cluster) - last(merged[-1]) < gap - 1e-9:
+                merged[-1] = make(merged[-1][0] + cluster[0])
+                changed = True
+            else:
+                merged.append(cluster)
+        # 마지막 묶음과 첫 묶음이 360도를 돌아 겹치면 첫 묶음을 뒤로 옮겨 합침
+        if len(merged) > 1 and first(merged[0]) + 360 - last(merged[-1]) < gap - 1e-9:
+            wrapped = [(v + 360, i) for v, i in merged[0][0]]
+            merged = merged[1:-1] + [make(merged[-1][0] + wrapped)]
+            changed = True
+        clusters = merged
+
+    result = [0.0] * count
+    for cluster in clusters:
+        base = first(cluster)
+        for k, (_, index) in enumerate(cluster[0]):
+            result[index] = base + k * gap
+    return result
+
+
+class ChartWheelRenderer:
+    """천궁도 휠 SVG 렌더러 (뼈대 템플릿 + 결과 캐시)"""
+
+    def __init__(self, cache_size: int = CHART_WHEEL_CACHE_SIZE):
+        """
+        Args:
+            cache_size: 렌더링 결과 캐시 크기 (0이면 캐시 안 함)
+        """
+        self.cache = LRUCache(cache_size)
+        self._skeletons: Dict[Tuple[str, int], Template] = {}
+        self._lock = threading.Lock()
+
+    def skeleton(self, theme: str = DEFAULT_THEME, rings: int = 1) -> Template:
+        """
+        테마 × 링 수별 뼈대 템플릿 (최초 1회 생성)
+
+        자리표시자: $rotation (황도 링 회전, 도), $counter (기호 역회전), $layers (차트별 층)
+        """
+        if theme not in THEMES:
+            raise ValueError(f"알 수 없는 테마입니다: {theme}")
+        if rings not in WHEEL_LAYOUTS:
+            raise ValueError(f"지원하지 않는 링 수입니다: {rings}")
+
+        key = (theme, rings)
+        template = self._skeletons.get(key)
+        if template is None:
+            with self._lock:
+                template = self._skeletons.get(key)
+                if template is None:
+                    template = Template(self._build_skeleton(THEMES[theme], WHEEL_LAYOUTS[rings]))
+                    self._skeletons[key] = template
+        return template
+
+    def _build_skeleton(self, colors: Dict, layout: Dict) -> str:
+        """뼈대 SVG 문자열 생성 (황도 링은 황경 0도가 9시 방향인 기준 자세)"""
+        outer, inner = ZODIAC_OUTER_RADIUS, ZODIAC_INNER_RADIUS
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{WHEEL_SIZE}" height="{WHEEL_SIZE}" '
+            f'viewBox="0 0 {WHEEL_SIZE} {WHEEL_SIZE}" font-family="sans-serif">',
+            f'<rect width="{WHEEL_SIZE}" height="{WHEEL_SIZE}" fill="{colors["background"]}" rx="12"/>',
+            f'<g transform="rotate($rotation {_fmt(CENTER)} {_fmt(CENTER)})">',
+        ]
+
+        # 별자리 구역 (원소 색 옅게)
+        for sign in range(12):
+            a0, a1 = 180.0 + sign * 30, 180.0 + (sign + 1) * 30
+            x0, y0 = _point(outer, a0)
+            x1, y1 = _point(outer, a1)
+            x2, y2 = _point(inner, a1)
+            x3, y3 = _point(inner, a0)
+            parts.append(
+                f'<path d="M{_fmt(x0)} {_fmt(y0)}A{outer} {outer} 0 0 0 {_fmt(x1)} {_fmt(y1)}'
+                f'L{_fmt(x2)} {_fmt(y2)}A{inner} {inner} 0 0 1 {_fmt(x3)} {_fmt(y3)}Z" '
+                f'fill="{colors[SIGN_ELEMENTS[sign]]}" fill-opacity="0.08" '
+                f'stroke="{colors["lines"]}" stroke-width="0.5"/>'
+            )
+
+        # 1도/5도 눈금 (경로 하나)
+        ticks = []
+        for degree in range(360):
+            if degree % 30 == 0:
+                continue
+            length = 6 if degree % 5 == 0 else 3
+            xa, ya = _point(inner, 180.0 + degree)
+            xb, yb = _point(inner + length, 180.0 + degree)
+            ticks.append(f'M{_fmt(xa)} {_fmt(ya)}L{_fmt(xb)} {_fmt(yb)}')
+        parts.append(f'<path d="{"".join(ticks)}" stroke="{colors["text_secondary"]}" stroke-width="0.5"/>')
+
+        # 별자리 기호 (링과 함께 돌고 기호만 역회전해 똑바로 세움)
+        for sign in range(12):
+            x, y = _point((outer + inner) / 2 + 2, 180.0 + sign * 30 + 15)
+            parts.append(
+                f'<text x="{_fmt(x)}" y="{_fmt(y)}" transform="rotate($counter {_fmt(x)} {_fmt(y)})" '
+                f'text-anchor="middle" dominant-baseline="central" font-size="15" '
+                f'fill="{colors[SIGN_ELEMENTS[sign]]}">{ZODIAC_GLYPHS[sign]}</text>'
+            )
+        parts.append('</g>')
+
+        # 행성 띠 경계와 아스펙트 원
+        for radius in (outer,) + layout['bands'] + (layout['aspect'],):
+            parts.append(
+                f'<circle cx="{_fmt(CENTER)}" cy="{_fmt(CENTER)}" r="{radius}" fill="none" '
+                f'stroke="{colors["lines"]}" stroke-width="{1.5 if radius == outer else 0.75}"/>'
+            )
+        parts.append('$layers</svg>')
+        return ''.join(parts)
+
+    def render(
+        self,
+        cusps: Sequence[float],
+        rings: Sequence[Sequence[WheelPlanet]],
+        aspects: Sequence[WheelAspect] = (),
+        theme: str = DEFAULT_THEME
+    ) -> str:
+        """
+        천궁도 휠 SVG (같은 입력은 캐시에서 반환)
+
+        Args:
+            cusps: 1궁부터 12궁까지 커스프 황경 (1궁 = 어센던트)
+            rings: 행성 링 목록 - 1개면 단일 휠, 2개면 이중 휠(안쪽 = 출생, 바깥쪽 = 트랜짓/상대)
+            aspects: 아스펙트 선 (실제 황경 기준)
+            theme: 'light' 또는 'dark'
+
+        Returns:
+            SVG 문자열
+        """
+        if len(cusps) != 12:
+            raise ValueError("하우스 커스프 12개가 필요합니다.")
+        template = self.skeleton(theme, len(rings))
+
+        key = hashlib.sha256(json.dumps([
+            theme,
+            [round(c, 2) for c in cusps],
+            [[(p.name, round(p.longitude, 2), bool(p.is_retrograde)) for p in ring] for ring in rings],
+            [(a.aspect, round(a.longitude1, 2), round(a.longitude2, 2)) for a in aspects],
+        ], separators=(',', ':')).encode('utf-8')).hexdigest()
+        svg = self.cache.get(key)
+        if svg is not None:
+            return svg
+
+        colors = THEMES[theme]
+        layout = WHEEL_LAYOUTS[len(rings)]
+        ascendant = cusps[0]
+        layers = [
+            self._cusp_layer(cusps, colors, layout),
+            self._aspect_layer(aspects, ascendant, colors, layout),
+        ]
+        # 띠는 바깥쪽부터: rings[0](출생)이 가장 안쪽 띠
+        bands = layout['bands']
+        for depth, ring in enumerate(reversed(rings)):
+            ring_index = len(rings) - 1 - depth
+            layers.append(self._planet_layer(
+                ring, ascendant, bands[depth], bands[depth + 1], colors['rings'][ring_index], colors
+            ))
+
+        svg = template.substitute(
+            rotation=_fmt(ascendant), counter=_fmt(-ascendant), layers=''.join(layers)
+        )
+        self.cache.put(key, svg)
+        return svg
+
+    def _cusp_layer(self, cusps: Sequence[float], colors: Dict, layout: Dict) -> str:
+        """하우스 커스프 선 (ASC/IC/DSC/MC 굵게)과 하우스 번호"""
+        ascendant = cusps[0]
+        lines, numbers = [], []
+        for house, cusp in enumerate(cusps, start=1):
+            angle = 180.0 + cusp - ascendant
+            xa, ya = _point(ZODIAC_INNER_RADIUS, angle)
+            xb, yb = _point(layout['aspect'], angle)
+            width = 1.5 if house in (1, 4, 7, 10) else 0.75
+            lines.append(
+                f'<line x1="{_fmt(xa)}" y1="{_fmt(ya)}" x2="{_fmt(xb)}" y2="{_fmt(yb)}" '
+                f'stroke="{colors["text_secondary"]}" stroke-width="{width}"/>'
+            )
+            span = (cusps[house % 12] - cusp) % 360
+            x, y = _point(layout['house_numbers'], angle + span / 2)
+            numbers.append(
+                f'<text x="{_fmt(x)}" y="{_fmt(y)}" text-anchor="middle" dominant-baseline="central" '
+                f'font-size="8" fill="{colors["text_secondary"]}">{house}</text>'
+            )
+        return ''.join(lines) + ''.join(numbers)
+
+    def _aspect_layer(self, aspects: Sequence[WheelAspect], ascendant: float,
+                      colors: Dict, layout: Dict) -> str:
+        """아스펙트 선 (합은 선 길이가 0에 가까우므로 생략)"""
+        radius = layout['aspect']
+        lines = []
+        for aspect, lon1, lon2 in aspects:
+            if aspect == 'conjunction':
+                continue
+            color = colors['aspects'].get(aspect, colors['text_secondary'])
+            xa, ya = _point(radius, 180.0 + lon1 - ascendant)
+            xb, yb = _point(radius, 180.0 + lon2 - ascendant)
+            dash = ' stroke-dasharray="4 2"' if aspect in ('sextile', 'trine') else ''
+            lines.append(
+                f'<line x1="{_fmt(xa)}" y1="{_fmt(ya)}" x2="{_fmt(xb)}" y2="{_fmt(yb)}" '
+                f'stroke="{color}" stroke-width="1" stroke-opacity="0.7"{dash}/>'
+            )
+        return ''.join(lines)
+
+    def _planet_layer(self, planets: Sequence[WheelPlanet], ascendant: float, outer: float,
+                      inner: float, color: str, colors: Dict) -> str:
+        """행성 띠 1개 - 실제 위치 눈금 + 겹치지 않게 벌린 기호 (+ 역행 표시)"""
+        radius = (outer + inner) / 2
+        display = spread_longitudes(
+            [p.longitude for p in planets], math.degrees(GLYPH_SIZE / radius)
+        )
+        parts = []
+        for planet, shown in zip(planets, display):
+            xa, ya = _point(outer, 180.0 + planet.longitude - ascendant)
+            xb, yb = _point(outer - 5, 180.0 + planet.longitude - ascendant)
+            parts.append(
+                f'<line x1="{_fmt(xa)}" y1="{_fmt(ya)}" x2="{_fmt(xb)}" y2="{_fmt(yb)}" '
+                f'stroke="{color}" stroke-width="1"/>'
+            )
+            x, y = _point(radius, 180.0 + shown - ascendant)
+            glyph = PLANET_GLYPHS.get(planet.name, planet.name[:2].title())
+            parts.append(
+                f'<text x="{_fmt(x)}" y="{_fmt(y)}" text-anchor="middle" dominant-baseline="central" '
+                f'font-size="{GLYPH_SIZE - 1}" fill="{color}"><title>{planet.name} '
+                f'{planet.longitude % 30:.0f}°{"℞" if planet.is_retrograde else ""}</title>{glyph}</text>'
+            )
+            if planet.is_retrograde:
+                parts.append(
+                    f'<text x="{_fmt(x + 6)}" y="{_fmt(y + 6)}" font-size="6" '
+                    f'fill="{colors["retrograde"]}">℞</text>'
+                )
+        return ''.join(parts)
+
+
+# 싱글톤 인스턴스
+_chart_wheel_renderer_instance = None
+
+
+def get_chart_wheel_renderer() -> ChartWheelRenderer:
+    """천궁도 휠 렌더러 싱글톤 인스턴스 반환"""
+    global _chart_wheel_renderer_instance
+    if _chart_wheel_renderer_instance is None:
+        _chart_wheel_renderer_instance = ChartWheelRenderer()
+    return _chart_wheel_renderer_instance
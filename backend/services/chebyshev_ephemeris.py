@@ -0,0 +1,411 @@
+"""
+체비쇼프 보간 천체력 (Chebyshev Ephemeris Cache)
+1900-2101년 주요 행성의 지심 황경/황위/거리를 일정 길이 구간별 체비쇼프
+다항식 계수로 보관하고 다항식 평가만으로 위치와 황경 속도를 계산
+
+계수 테이블(data/ephemeris_cheb.bin)은 Swiss Ephemeris로 오프라인 생성한
+산출물이며 메모리 매핑하여 사용하므로, 평가 경로에는 pyswisseph가 필요
+없습니다. 구간 길이/차수는 JPL DE 계열 배치를 따릅니다 (달 4일, 수성 8일,
+태양/금성/화성 16일, 외행성 32일).
+
+생성에 사용한 Swiss Ephemeris 대비 오차 상한 (float32 계수, validate로 검증):
+    태양과 3° 이상 떨어진 경우   황경 1.5″, 황위 2″, 거리 상대오차 2e-7, 속도 0.002°/일
+    합(태양과 3° 이내) 부근      황경 10″, 황위 8″, 속도 0.05°/일
+태양, 달, 수성, 금성, 화성은 대부분 황경 0.1″ 이내입니다. 합 부근 오차는 Swiss Ephemeris가 적용하는
+태양 중력에 의한 빛 굴절 보정이 며칠 사이에 뾰족하게 변해 다항식으로
+따라가지 못하기 때문입니다.
+
+    python services/chebyshev_ephemeris.py build       # 테이블 재생성
+    python services/chebyshev_ephemeris.py validate    # 오차 검증
+"""
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+import math
+import mmap
+import random
+import struct
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.solar_terms import DATA_DIR
+
+
+CHEBYSHEV_PATH = os.path.join(DATA_DIR, 'ephemeris_cheb.bin')
+
+# 1900-01-01 00:00 UT ~ 2101-01-01 00:00 UT
+START_JD = 2415020.5
+END_JD = 2488434.5
+
+# 행성별 (구간 길이 일, 계수 개수)
+PLANET_SEGMENTS = {
+    'sun': (16, 10),
+    'moon': (4, 12),
+    'mercury': (8, 12),
+    'venus': (16, 10),
+    'mars': (16, 9),
+    'jupiter': (32, 10),
+    'saturn': (32, 10),
+    'uranus': (32, 10),
+    'neptune': (32, 10),
+    'pluto': (32, 10),
+}
+PLANET_NAMES = tuple(PLANET_SEGMENTS)
+
+# 구간별 성분: 황경 (연속 전개, 도), 황위 (도), 거리 (AU)
+COMPONENTS = 3
+
+# 생성 원천 대비 오차 상한 (태양과의 이각이 CONJUNCTION_ELONGATION 이상일 때)
+ERROR_BOUND = {
+    'longitude_arcsec': 1.5,
+    'latitude_arcsec': 2.0,
+    'distance_relative': 2e-7,
+    'speed_deg_per_day': 2e-3,
+}
+
+# 태양 부근 (빛 굴절 보정 구간) 오차 상한
+CONJUNCTION_ELONGATION = 3.0
+CONJUNCTION_ERROR_BOUND = {
+    'longitude_arcsec': 10.0,
+    'latitude_arcsec': 8.0,
+    'distance_relative': 2e-7,
+    'speed_deg_per_day': 5e-2,
+}
+
+# 파일 헤더: magic, version, 행성 수, 원천 천체력 플래그, reserved, 시작/종료 JD
+_HEADER = struct.Struct('<4sHHHHdd')
+_MAGIC = b'CHEB'
+_VERSION = 1
+
+# 행성 디렉터리: 행성 번호, 계수 개수, 구간 길이 (일), reserved, 구간 수, 계수 시작 위치 (float 단위)
+_DIRECTORY = struct.Struct('<HHHHII')
+
+
+def _clenshaw(coeffs, start: int, n: int, x: float) -> float:
+    """체비쇼프 급수 Σ c_k T_k(x) 평가"""
+    b1 = b2 = 0.0
+    x2 = 2.0 * x
+    for k in range(start + n - 1, start, -1):
+        b1, b2 = x2 * b1 - b2 + coeffs[k], b1
+    return x * b1 - b2 + coeffs[start]
+
+
+def _clenshaw_derivative(coeffs, start: int, n: int, x: float) -> float:
+    """체비쇼프 급수의 x 미분 Σ k c_k U_{k-1}(x) 평가"""
+    b1 = b2 = 0.0
+    x2 = 2.0 * x
+    for k in range(n - 1, 0, -1):
+        b1, b2 = x2 * b1 - b2 + k * coeffs[start + k], b1
+    return b1
+
+
+class ChebyshevEphemeris:
+    """체비쇼프 계수 테이블 기반 행성 위치 계산기"""
+
+    def __init__(self, buffer, start_jd: float, end_jd: float, source_flag: int,
+                 segments: Dict[str, Tuple[int, int, int, int]]):
+        """
+        Args:
+            buffer: 헤더를 포함한 테이블 버퍼 (mmap 또는 bytes)
+            start_jd: 첫 구간 시작 Julian Day (UT)
+            end_jd: 테이블 종료 Julian Day (UT)
+            source_flag: 생성에 사용한 Swiss Ephemeris 천체력 플래그
+            segments: 행성별 (계수 개수, 구간 길이, 구간 수, 계수 시작 위치)
+        """
+        self.buffer = buffer
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.source_flag = source_flag
+        self.segments = segments
+
+        data_offset = _HEADER.size + len(segments) * _DIRECTORY.size
+        if sys.byteorder == 'little':
+            self.coeffs = memoryview(buffer)[data_offset:].cast('f')
+        else:
+            self.coeffs = array('f', bytes(buffer[data_offset:]))
+            self.coeffs.byteswap()
+        self._data_offset = data_offset
+        self._arrays: Dict[str, 'np.ndarray'] = {}
+
+    @classmethod
+    def from_buffer(cls, buffer) -> 'ChebyshevEphemeris':
+        """헤더와 디렉터리를 검증하고 버퍼를 래핑"""
+        magic, version, planet_count, source_flag, _, start_jd, end_jd = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("지원하지 않는 체비쇼프 천체력 형식입니다.")
+
+        segments = {}
+        total = 0
+        for i in range(planet_count):
+            planet, n, days, _, count, offset = _DIRECTORY.unpack_from(
+                buffer, _HEADER.size + i * _DIRECTORY.size
+            )
+            segments[PLANET_NAMES[planet]] = (n, days, count, offset)
+            total += count * COMPONENTS * n
+
+        data_offset = _HEADER.size + planet_count * _DIRECTORY.size
+        if len(buffer) != data_offset + total * 4:
+            raise ValueError("체비쇼프 천체력 크기가 올바르지 않습니다.")
+        return cls(buffer, start_jd, end_jd, source_flag, segments)
+
+    @classmethod
+    def load(cls, path: str = CHEBYSHEV_PATH) -> 'ChebyshevEphemeris':
+        """계수 테이블 파일을 읽기 전용으로 메모리 매핑"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def covers(self, planet: str, jd: float) -> bool:
+        """해당 행성/시각이 테이블 범위 안인지 여부"""
+        return planet in self.segments and self.start_jd <= jd < self.end_jd
+
+    def position(self, planet: str, jd: float) -> Tuple[float, float, float, float]:
+        """
+        행성 지심 위치 계산
+
+        Args:
+            planet: 행성 이름 (PLANET_NAMES)
+            jd: Julian Day (UT)
+
+        Returns:
+            (황경 0-360도, 황위 도, 거리 AU, 황경 속도 도/일)
+        """
+        n, days, count, offset = self.segments[planet]
+        t = jd - self.start_jd
+        index = int(t // days)
+        if not 0 <= index < count:
+            raise ValueError(f"체비쇼프 천체력 범위 밖의 시각입니다: JD {jd}")
+
+        x = 2.0 * (t - index * days) / days - 1.0
+        base = offset + index * COMPONENTS * n
+        coeffs = self.coeffs
+        return (
+            _clenshaw(coeffs, base, n, x) % 360.0,
+            _clenshaw(coeffs, base + n, n, x),
+            _clenshaw(coeffs, base + 2 * n, n, x),
+            _clenshaw_derivative(coeffs, base, n, x) * 2.0 / days,
+        )
+
+    def _coefficient_array(self, planet: str) -> 'np.ndarray':
+        """행성 계수의 (구간 수, 성분, 계수) float32 배열 뷰 (매핑 버퍼 공유)"""
+        coeffs = self._arrays.get(planet)
+        if coeffs is None:
+            n, _, count, offset = self.segments[planet]
+            raw = np.frombuffer(self.buffer, dtype='<f4', count=count * COMPONENTS * n,
+                                offset=self._data_offset + offset * 4)
+            coeffs = raw.reshape(count, COMPONENTS, n)
+            self._arrays[planet] = coeffs
+        return coeffs
+
+    def position_array(self, planet: str, jd: 'np.ndarray') -> Tuple['np.ndarray', ...]:
+        """
+        행성 지심 위치 일괄 계산 (구간 조회와 Clenshaw 점화식을 배열 연산으로 수행)
+
+        Args:
+            planet: 행성 이름 (PLANET_NAMES)
+            jd: Julian Day (UT) 배열, 모두 테이블 범위 안이어야 함
+
+        Returns:
+            (황경 0-360도, 황위 도, 거리 AU, 황경 속도 도/일) 배열 튜플
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("일괄 천체력 계산에는 numpy가 필요합니다.")
+
+        n, days, count, _ = self.segments[planet]
+        t = np.asarray(jd, dtype=np.float64) - self.start_jd
+        index = np.floor(t / days).astype(np.int64)
+        if index.size and (index.min() < 0 or index.max() >= count):
+            raise ValueError("체비쇼프 천체력 범위 밖의 시각이 포함되어 있습니다.")
+
+        x = 2.0 * (t - index * days) / days - 1.0
+        c = self._coefficient_array(planet)[index].astype(np.float64)  # (m, 3, n)
+
+        # 세 성분 동시 Clenshaw, 황경은 미분 급수도 함께 평가
+        x2 = (2.0 * x)[:, None]
+        b1 = np.zeros(c.shape[:2])
+        b2 = np.zeros(c.shape[:2])
+        d1 = np.zeros(x.shape)
+        d2 = np.zeros(x.shape)
+        for k in range(n - 1, 0, -1):
+            b1, b2 = x2 * b1 - b2 + c[:, :, k], b1
+            d1, d2 = x2[:, 0] * d1 - d2 + k * c[:, 0, k], d1
+        values = x[:, None] * b1 - b2 + c[:, :, 0]
+
+        return (
+            np.mod(values[:, 0], 360.0),
+            values[:, 1],
+            values[:, 2],
+            d1 * 2.0 / days,
+        )
+
+
+def fit_segment(ephemeris_fn, t0: float, days: int, n: int) -> List[float]:
+    """
+    한 구간의 체비쇼프 계수 계산 (체비쇼프 노드 보간)
+
+    Args:
+        ephemeris_fn: jd → (황경, 황위, 거리) 함수
+        t0: 구간 시작 Julian Day
+        days: 구간 길이 (일)
+        n: 계수 개수
+
+    Returns:
+        황경/황위/거리 순으로 이어 붙인 계수 3n개
+    """
+    angles = [math.pi * (k + 0.5) / n for k in range(n)]
+    samples = [ephemeris_fn(t0 + (math.cos(a) + 1.0) * days / 2.0) for a in angles]
+
+    # 노드는 시간순으로 단조이므로 앞 표본 기준으로 황경을 연속 전개
+    longitudes = [samples[0][0]]
+    for lon, _, _ in samples[1:]:
+        prev = longitudes[-1]
+        longitudes.append(prev + (lon - prev + 180.0) % 360.0 - 180.0)
+
+    coeffs = []
+    for values in (longitudes, [s[1] for s in samples], [s[2] for s in samples]):
+        for j in range(n):
+            c = 2.0 / n * sum(v * math.cos(j * a) for v, a in zip(values, angles))
+            coeffs.append(c / 2.0 if j == 0 else c)
+    return coeffs
+
+
+def build_chebyshev_table(start_jd: float = START_JD, end_jd: float = END_JD) -> bytes:
+    """
+    Swiss Ephemeris로 체비쇼프 계수 테이블 생성 (오프라인 1회 실행)
+
+    Returns:
+        헤더를 포함한 테이블 바이트열
+    """
+    from services.swiss_ephemeris import SwissEphemeris, SWISSEPH_AVAILABLE
+    if not SWISSEPH_AVAILABLE:
+        raise RuntimeError("체비쇼프 천체력 생성에는 pyswisseph가 필요합니다.")
+    import swisseph as swe
+
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    source_flag = swe.calc_ut(start_jd, swe.SUN, flags)[1] & (swe.FLG_JPLEPH | swe.FLG_SWIEPH | swe.FLG_MOSEPH)
+
+    directory = bytearray()
+    data = array('f')
+    for planet_index, planet in enumerate(PLANET_NAMES):
+        n, days = PLANET_SEGMENTS[planet][1], PLANET_SEGMENTS[planet][0]
+        code = SwissEphemeris.PLANETS[planet]
+        count = math.ceil((end_jd - start_jd) / days)
+        directory += _DIRECTORY.pack(planet_index, n, days, 0, count, len(data))
+
+        def ephemeris_fn(jd, code=code):
+            return swe.calc_ut(jd, code, flags)[0][:3]
+
+        for index in range(count):
+            data.extend(fit_segment(ephemeris_fn, start_jd + index * days, days, n))
+
+    if sys.byteorder != 'little':
+        data.byteswap()
+    header = _HEADER.pack(_MAGIC, _VERSION, len(PLANET_NAMES), source_flag, 0, start_jd, end_jd)
+    return header + bytes(directory) + data.tobytes()
+
+
+def write_chebyshev_table(data: bytes, path: str = CHEBYSHEV_PATH):
+    """테이블을 원자적으로 파일에 기록"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def validate(table: ChebyshevEphemeris, samples: int = 2000, seed: int = 0) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    임의 시각에서 Swiss Ephemeris와 비교한 행성별 최대 오차
+
+    태양과의 이각이 CONJUNCTION_ELONGATION 미만인 표본은 'conjunction',
+    나머지는 'general'로 나누어 집계합니다.
+
+    Returns:
+        {행성: {'general' | 'conjunction': {'longitude_arcsec', 'latitude_arcsec',
+                                            'distance_relative', 'speed_deg_per_day'}}}
+    """
+    import swisseph as swe
+    from services.swiss_ephemeris import SwissEphemeris
+
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    rng = random.Random(seed)
+    result = {}
+    for planet in table.segments:
+        code = SwissEphemeris.PLANETS[planet]
+        groups = {'general': dict.fromkeys(ERROR_BOUND, 0.0),
+                  'conjunction': dict.fromkeys(ERROR_BOUND, 0.0)}
+        for _ in range(samples):
+            jd = rng.uniform(table.start_jd, table.end_jd)
+            ref = swe.calc_ut(jd, code, flags)[0]
+            sun = swe.calc_ut(jd, swe.SUN, flags)[0][0]
+            elongation = abs((ref[0] - sun + 180.0) % 360.0 - 180.0)
+            near_sun = planet not in ('sun', 'moon') and elongation < CONJUNCTION_ELONGATION
+            errors = groups['conjunction' if near_sun else 'general']
+
+            lon, lat, dist, speed = table.position(planet, jd)
+            errors['longitude_arcsec'] = max(errors['longitude_arcsec'],
+                                             abs((lon - ref[0] + 180.0) % 360.0 - 180.0) * 3600)
+            errors['latitude_arcsec'] = max(errors['latitude_arcsec'], abs(lat - ref[1]) * 3600)
+            errors['distance_relative'] = max(errors['distance_relative'], abs(dist - ref[2]) / ref[2])
+            errors['speed_deg_per_day'] = max(errors['speed_deg_per_day'], abs(speed - ref[3]))
+        result[planet] = groups
+    return result
+
+
+# 싱글톤 인스턴스
+_chebyshev_instance = None
+_chebyshev_loaded = False
+
+
+def get_chebyshev_ephemeris(path: str = CHEBYSHEV_PATH) -> Optional[ChebyshevEphemeris]:
+    """
+    체비쇼프 천체력 싱글톤 인스턴스 반환
+
+    테이블 파일이 없거나 읽을 수 없으면 None을 반환합니다 (최초 호출 시 1회 시도).
+    """
+    global _chebyshev_instance, _chebyshev_loaded
+    if not _chebyshev_loaded:
+        try:
+            _chebyshev_instance = ChebyshevEphemeris.load(path)
+        except (OSError, ValueError, struct.error):
+            _chebyshev_instance = None
+        _chebyshev_loaded = True
+    return _chebyshev_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="체비쇼프 보간 천체력 테이블 생성/검증")
+    parser.add_argument('command', choices=['build', 'validate'])
+    parser.add_argument('--output', default=CHEBYSHEV_PATH)
+    parser.add_argument('--samples', type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        data = build_chebyshev_table()
+        write_chebyshev_table(data, args.output)
+        print(f"{len(PLANET_NAMES)} planets, {len(data)} bytes -> {args.output}")
+    else:
+        table = ChebyshevEphemeris.load(args.output)
+        failed = False
+        bounds = {'general': ERROR_BOUND, 'conjunction': CONJUNCTION_ERROR_BOUND}
+        for planet, groups in validate(table, args.samples).items():
+            for group, errors in groups.items():
+                over = [k for k, v in errors.items() if v > bounds[group][k]]
+                failed = failed or bool(over)
+                print(f"{planet:8s} {group:11s}", ' '.join(f"{k}={v:.3g}" for k, v in errors.items()),
+                      'FAIL' if over else 'ok')
+        sys.exit(1 if failed else 0)
@@ -0,0 +1,258 @@
+"""
+천체력 실행 계층 (Ephemeris Worker Pool)
+
+pyswisseph는 프로세스 전역 C 상태를 쓰고 계산 중 GIL을 놓지 않으므로,
+async 라우터가 이벤트 루프에서 직접 호출하면 다른 요청이 모두 멈춥니다.
+이 모듈은 천체력/점성술 계산을 워커에서 실행하고 asyncio future로 돌려줍니다.
+
+- EPHEMERIS_WORKERS=0 (기본): 전용 스레드 EPHEMERIS_THREADS개 (기본 4) - 서버리스처럼
+  프로세스를 만들 수 없는 환경에서도 이벤트 루프는 막지 않음. 스레드는 같은 서비스
+  인스턴스를 공유하고 GIL 때문에 동시에 한 계산만 진행되지만, 긴 요청 하나가 뒤의
+  짧은 요청을 모두 줄 세우지는 않음 (uvicorn 워커 프로세스마다 풀이 하나씩 생김)
+- EPHEMERIS_WORKERS=N: spawn 프로세스 N개 - 프로세스마다 천체력/테이블을
+  한 번 초기화하고 여러 코어로 분산
+
+항성황도/측심 같은 모드는 전역 설정을 바꾸지 않고 요청(EphemerisMode,
+AstrologyRequest.zodiac_type/topocentric)에 실어 보냅니다.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import multiprocessing
+import threading
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 워커 프로세스 수 (0이면 스레드 풀)
+DEFAULT_WORKERS = int(os.environ.get("EPHEMERIS_WORKERS", "0"))
+
+# 스레드 풀 크기 (EPHEMERIS_WORKERS=0일 때)
+DEFAULT_THREADS = int(os.environ.get("EPHEMERIS_THREADS", "4"))
+
+# 워커에서 호출할 수 있는 대상과 메서드
+ALLOWED_METHODS = {
+    'ephemeris': frozenset({
+        'get_natal_chart', 'get_all_planets', 'get_planet_position',
+        'calculate_houses', 'calculate_houses_multi', 'calculate_houses_from_midheaven',
+        'calculate_aspects', 'get_positions_bulk',
+        'get_sign_and_retrograde',
+    }),
+    'astrology': frozenset({
+        'create_natal_chart', 'get_transit', 'get_retrograde_calendar',
+        'compare_house_systems', 'get_astrocartography', 'relocate',
+        'index_chart', 'find_similar_charts', 'find_transit_patterns', 'cache_stats',
+        'render_chart_wheel', 'synastry', 'synastry_batch', 'find_returns', 'get_progressions',
+        'plan_transit_events', 'transit_event_chunk', 'transit_event_chunk_text',
+        'plan_transit_timeline', 'transit_timeline_chunk', 'transit_timeline_chunk_text',
+    }),
+}
+
+# 호출 1건: (대상, 메서드, 위치 인자, 키워드 인자)
+Call = Tuple[str, str, tuple, dict]
+
+# 워커별 계산 대상 (프로세스당 1회 생성, 스레드 풀은 모든 스레드가 공유)
+_worker_targets: Optional[Dict[str, Any]] = None
+_worker_targets_lock = threading.Lock()
+
+
+def _init_worker(ephe_path: Optional[str] = None):
+    """워커 초기화 - 천체력 경로 설정과 서비스 생성 (테이블 메모리 매핑 포함)"""
+    global _worker_targets
+    from services.swiss_ephemeris import SWISSEPH_AVAILABLE, get_ephemeris
+    from services.astrology_service import AstrologyService
+
+    with _worker_targets_lock:
+        if _worker_targets is not None:
+            return
+
+        if ephe_path and SWISSEPH_AVAILABLE:
+            import swisseph as swe
+            swe.set_ephe_path(ephe_path)
+
+        _worker_targets = {
+            'ephemeris': get_ephemeris(),
+            'astrology': AstrologyService(),
+        }
+
+
+def _run_call(target: str, method: str, args: tuple, kwargs: dict) -> Any:
+    """워커에서 호출 1건 실행"""
+    return getattr(_worker_targets[target], method)(*args, **kwargs)
+
+
+def _run_batch(calls: Sequence[Call]) -> List[Any]:
+    """워커에서 여러 호출을 순서대로 실행 (프로세스 간 왕복 1회)"""
+    return [_run_call(*call) for call in calls]
+
+
+def _check_call(target: str, method: str):
+    if method not in ALLOWED_METHODS.get(target, ()):
+        raise ValueError(f"허용되지 않은 천체력 호출입니다: {target}.{method}")
+
+
+class EphemerisPool:
+    """천체력 계산 워커 풀"""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        ephe_path: Optional[str] = None,
+        threads: int = DEFAULT_THREADS
+    ):
+        """
+        Args:
+            workers: 프로세스 수 (0이면 스레드 풀)
+            ephe_path: Ephemeris 데이터 파일 경로 (워커마다 설정)
+            threads: 스레드 풀 크기 (workers=0일 때)
+        """
+        self.workers = max(workers, 0)
+        self.threads = max(threads, 1)
+        self.ephe_path = ephe_path
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def process_based(self) -> bool:
+        """프로세스 풀 사용 여부"""
+        return self.workers > 0
+
+    def _get_executor(self):
+        """실행기 생성 (최초 제출 시 1회)"""
+        with self._lock:
+            if self._executor is None:
+                if self.process_based:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_worker,
+                        initargs=(self.ephe_path,)
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.threads,
+                        thread_name_prefix='ephemeris',
+                        initializer=_init_worker,
+                        initargs=(self.ephe_path,)
+                    )
+            return self._executor
+
+    def _discard(self, executor):
+        """깨진 실행기 폐기 - 다음 제출 때 새로 만듦 (이미 교체됐으면 그대로 둠)"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def _submit(self, fn, *args) -> Future:
+        """
+        제출 - 워커 프로세스가 죽어 풀이 깨졌으면 새로 만들어 1회 재시도
+
+        계산 도중 워커가 죽으면 그 호출은 BrokenProcessPool로 실패하고
+        (같은 입력으로 다시 죽을 수 있으므로 재시도하지 않음), 풀은 폐기되어
+        다음 호출부터 새 워커로 실행됩니다.
+        """
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._discard(executor)
+            executor = self._get_executor()
+            future = executor.submit(fn, *args)
+
+        def on_done(done: Future):
+            if not done.cancelled() and isinstance(done.exception(), BrokenProcessPool):
+                self._discard(executor)
+
+        future.add_done_callback(on_done)
+        return future
+
+    def submit(self, target: str, method: str, *args, **kwargs) -> Future:
+        """
+        호출 1건 제출
+
+        Args:
+            target: 'ephemeris' (SwissEphemeris) 또는 'astrology' (AstrologyService)
+            method: ALLOWED_METHODS에 있는 메서드 이름
+            *args, **kwargs: 메서드 인자 (프로세스 풀이면 pickle 가능해야 함)
+
+        Returns:
+            결과 Future
+        """
+        _check_call(target, method)
+        return self._submit(_run_call, target, method, args, kwargs)
+
+    def submit_batch(self, calls: Sequence[Call]) -> Future:
+        """
+        여러 호출을 워커 1개에 묶어서 제출
+
+        Args:
+            calls: (대상, 메서드, 위치 인자, 키워드 인자) 목록
+
+        Returns:
+            결과 목록 Future (calls 순서)
+        """
+        calls = [(target, method, tuple(args), dict(kwargs)) for target, method, args, kwargs in calls]
+        for target, method, _, _ in calls:
+            _check_call(target, method)
+        return self._submit(_run_batch, calls)
+
+    async def run(self, target: str, method: str, *args, **kwargs) -> Any:
+        """호출 1건을 실행하고 이벤트 루프를 막지 않고 결과 대기"""
+        return await asyncio.wrap_future(self.submit(target, method, *args, **kwargs))
+
+    async def run_batch(self, calls: Sequence[Call]) -> List[Any]:
+        """여러 호출을 묶어서 실행하고 결과 목록 대기"""
+        return await asyncio.wrap_future(self.submit_batch(calls))
+
+    async def run_each(self, target: str, method: str, arg_list: Sequence[tuple]) -> AsyncIterator[Any]:
+        """
+        같은 메서드를 인자 목록 순서대로 하나씩 실행하며 결과를 내보냄 (스트리밍 응답용)
+
+        결과를 내보내기 전에 다음 호출을 미리 제출하므로 전송과 다음 계산이 겹치고,
+        동시에 대기하는 호출은 최대 2건입니다. 소비자가 중단하면 대기 중인 호출은 취소합니다.
+        """
+        pending = None
+        try:
+            for args in arg_list:
+                future = self.submit(target, method, *args)
+                if pending is not None:
+                    yield await asyncio.wrap_future(pending)
+                pending = future
+            if pending is not None:
+                yield await asyncio.wrap_future(pending)
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """워커 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 싱글톤 인스턴스
+_ephemeris_pool_instance = None
+
+
+def get_ephemeris_pool() -> EphemerisPool:
+    """천체력 워커 풀 싱글톤 인스턴스 반환 (워커는 첫 제출 시 시작)"""
+    global _ephemeris_pool_instance
+    if _ephemeris_pool_instance is None:
+        _ephemeris_pool_instance = EphemerisPool()
+    return _ephemeris_pool_instance
+
+
+def shutdown_ephemeris_pool():
+    """앱 종료 시 워커 정리"""
+    global _ephemeris_pool_instance
+    if _ephemeris_pool_instance is not None:
+        _ephemeris_pool_instance.shutdown()
+        _ephemeris_pool_instance = None
@@ -0,0 +1,158 @@
+"""
+60갑자 (六十甲子) 간지 타입
+간지를 0-59 정수 하나로 표현하고 천간/지지/오행/음양/띠/한자를
+미리 계산한 조회 튜플에서 꺼내 쓰는 경량 타입
+
+계산 경로에서는 정수 인덱스만 주고받고, 문자열 변환은 응답 직전에만 합니다.
+"""
+
+from typing import Dict
+
+
+# 천간 (天干) - 10개
+HEAVENLY_STEMS = ("갑", "을", "병", "정", "무", "기", "경", "신", "임", "계")
+STEMS_HANJA = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
+
+# 지지 (地支) - 12개
+EARTHLY_BRANCHES = ("자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해")
+BRANCHES_HANJA = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
+
+# 지지 동물 (띠)
+BRANCH_ANIMALS = ("쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양", "원숭이", "닭", "개", "돼지")
+
+# 오행 코드 (0-4) → 이름
+ELEMENTS = ("wood", "fire", "earth", "metal", "water")
+
+# 천간/지지 인덱스 → 오행 코드
+STEM_ELEMENT_CODES = (0, 0, 1, 1, 2, 2, 3, 3, 4, 4)
+BRANCH_ELEMENT_CODES = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+
+# 음양 (천간/지지 인덱스 짝수 = 양)
+YIN_YANG = ("양", "음")
+
+# 60갑자 인덱스별 이름 ('갑자', '甲子', ...)
+GANJI_NAMES = tuple(HEAVENLY_STEMS[i % 10] + EARTHLY_BRANCHES[i % 12] for i in range(60))
+GANJI_HANJA = tuple(STEMS_HANJA[i % 10] + BRANCHES_HANJA[i % 12] for i in range(60))
+
+# 60갑자 인덱스별 조회 튜플
+_STEM = tuple(HEAVENLY_STEMS[i % 10] for i in range(60))
+_BRANCH = tuple(EARTHLY_BRANCHES[i % 12] for i in range(60))
+_STEM_ELEMENT = tuple(STEM_ELEMENT_CODES[i % 10] for i in range(60))
+_BRANCH_ELEMENT = tuple(BRANCH_ELEMENT_CODES[i % 12] for i in range(60))
+_ANIMAL = tuple(BRANCH_ANIMALS[i % 12] for i in range(60))
+_NAME_INDEX = {name: i for i, name in enumerate(GANJI_NAMES)}
+
+
+def ganji_index(stem_index: int, branch_index: int) -> int:
+    """천간/지지 인덱스를 60갑자 인덱스 (0=갑자)로 변환 (음양이 같은 조합만 유효)"""
+    return (6 * stem_index - 5 * branch_index) % 60
+
+
+class Ganji:
+    """60갑자 간지 (0=갑자 ... 59=계해)"""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        """
+        Args:
+            index: 60갑자 인덱스 (60으로 나눈 나머지 사용)
+        """
+        self.index = index % 60
+
+    @classmethod
+    def from_parts(cls, stem_index: int, branch_index: int) -> 'Ganji':
+        """천간/지지 인덱스로 생성"""
+        if (stem_index - branch_index) % 2:
+            raise ValueError("천간과 지지의 음양이 다른 조합은 간지가 아닙니다.")
+        return cls(ganji_index(stem_index, branch_index))
+
+    @classmethod
+    def from_name(cls, name: str) -> 'Ganji':
+        """'갑자' 형식의 간지 이름으로 생성"""
+        index = _NAME_INDEX.get(name)
+        if index is None:
+            raise ValueError(f"알 수 없는 간지입니다: {name}")
+        return cls(index)
+
+    @property
+    def stem_index(self) -> int:
+        return self.index % 10
+
+    @property
+    def branch_index(self) -> int:
+        return self.index % 12
+
+    @property
+    def stem(self) -> str:
+        return _STEM[self.index]
+
+    @property
+    def branch(self) -> str:
+        return _BRANCH[self.index]
+
+    @property
+    def name(self) -> str:
+        return GANJI_NAMES[self.index]
+
+    @property
+    def hanja(self) -> str:
+        return GANJI_HANJA[self.index]
+
+    @property
+    def stem_element_code(self) -> int:
+        return _STEM_ELEMENT[self.index]
+
+    @property
+    def branch_element_code(self) -> int:
+        return _BRANCH_ELEMENT[self.index]
+
+    @property
+    def stem_element(self) -> str:
+        return ELEMENTS[_STEM_ELEMENT[self.index]]
+
+    @property
+    def branch_element(self) -> str:
+        return ELEMENTS[_BRANCH_ELEMENT[self.index]]
+
+    @property
+    def yin_yang(self) -> str:
+        return YIN_YANG[self.index % 2]
+
+    @property
+    def animal(self) -> str:
+        return _ANIMAL[self.index]
+
+    def shift(self, steps: int) -> 'Ganji':
+        """60갑자 순서로 steps만큼 이동한 간지 (음수면 역행)"""
+        return Ganji(self.index + steps)
+
+    def to_dict(self) -> Dict[str, str]:
+        """응답용 기둥 딕셔너리 (stem, branch, 오행, full)"""
+        i = self.index
+        return {
+            'stem': _STEM[i],
+            'branch': _BRANCH[i],
+            'stem_element': ELEMENTS[_STEM_ELEMENT[i]],
+            'branch_element': ELEMENTS[_BRANCH_ELEMENT[i]],
+            'full': GANJI_NAMES[i]
+        }
+
+    def __int__(self) -> int:
+        return self.index
+
+    __index__ = __int__
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Ganji):
+            return self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.index
+
+    def __str__(self) -> str:
+        return GANJI_NAMES[self.index]
+
+    def __repr__(self) -> str:
+        return f"Ganji({self.index}, '{GANJI_NAMES[self.index]}')"
@@ -0,0 +1,639 @@
+"""
+출생지 지명 사전 (Gazetteer)
+국내 시/군/구와 주요 해외 도시의 좌표와 시간대를 번들 바이너리 테이블
+(data/gazetteer.bin)로 보관하여 네트워크 없이 출생지를 해석
+
+- 이름/별칭 정확 조회 및 '서울특별시 강남구' 같은 주소형 문자열 해석
+- 한글 자모 단위 접두어 트라이 자동완성 ('서ㅇ' → 서울, 'ㅅㅇ' 초성 검색 포함)
+- 구면 좌표 KD-트리(파일에 저장된 암묵적 트리)로 최근접 지명 역조회
+
+원본 목록은 data/gazetteer.tsv이며, 바이너리가 없거나 원본과 맞지 않으면
+최초 로드 시 생성합니다. 이름 인덱스와 KD-트리 좌표는 첫 조회 때 만듭니다.
+
+    python services/gazetteer.py build    # 테이블 재생성
+"""
+
+from array import array
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import heapq
+import math
+import mmap
+import re
+import struct
+import threading
+import unicodedata
+import zlib
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.solar_terms import DATA_DIR
+
+
+GAZETTEER_SOURCE_PATH = os.path.join(DATA_DIR, 'gazetteer.tsv')
+GAZETTEER_PATH = os.path.join(DATA_DIR, 'gazetteer.bin')
+
+# 파일 헤더: magic, version, 시간대 수, KD-트리 노드 수, 지명 수, 문자열 크기, 원본 CRC32
+_HEADER = struct.Struct('<4sHHHHII')
+_MAGIC = b'GZTR'
+_VERSION = 1
+
+# 레코드: 위도/경도 (1e-6도), 문자열 오프셋/길이, 상위 지명 인덱스, 시간대 인덱스,
+#         종류, 국가 코드 (ISO 3166-1 alpha-2)
+RECORD = struct.Struct('<iiIHHBB2s')
+# 시간대 레코드: 문자열 오프셋/길이
+TZ_RECORD = struct.Struct('<IH')
+
+NO_PARENT = 0xFFFF
+COORD_SCALE = 1_000_000
+
+# 레코드 문자열 내 이름/별칭 구분자
+_NAME_SEPARATOR = '\x1f'
+
+# 지명 종류 (province는 주소 해석에만 쓰고 역조회 대상에서 제외)
+KINDS = ('province', 'city', 'district')
+KIND_PROVINCE = 0
+
+# 지구 평균 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# 자동완성 노드별 보관 후보 수
+TRIE_TOP_K = 16
+
+
+class Place(NamedTuple):
+    """지명 레코드"""
+    id: int
+    name: str
+    aliases: Tuple[str, ...]
+    kind: str
+    region: str
+    country: str
+    latitude: float
+    longitude: float
+    timezone: str
+
+    @property
+    def display_name(self) -> str:
+        """상위 지명을 포함한 표시 이름 ('서울 강남구')"""
+        return f"{self.region} {self.name}" if self.region else self.name
+
+    def to_dict(self) -> Dict:
+        """API 응답용 딕셔너리"""
+        result = self._asdict()
+        result['aliases'] = list(self.aliases)
+        result['display_name'] = self.display_name
+        return result
+
+
+# ============================================
+# 한글 자모 분해
+# ============================================
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_END = 0xD7A3
+
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+# 겹모음/겹받침은 타자 순서대로 낱자로 분해 ('과' 입력 중 '고'가 접두어가 되도록)
+_JUNGSEONG = (
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅗㅏ', 'ㅗㅐ',
+    'ㅗㅣ', 'ㅛ', 'ㅜ', 'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅠ', 'ㅡ', 'ㅡㅣ', 'ㅣ',
+)
+_JONGSEONG = (
+    '', 'ㄱ', 'ㄲ', 'ㄱㅅ', 'ㄴ', 'ㄴㅈ', 'ㄴㅎ', 'ㄷ', 'ㄹ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ',
+    'ㄹㅌ', 'ㄹㅍ', 'ㄹㅎ', 'ㅁ', 'ㅂ', 'ㅂㅅ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+# 낱자로 입력된 겹자모 분해
+_COMPAT_COMPOUNDS = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+
+def normalize_name(text: str) -> str:
+    """조회 키 정규화 (NFC, 대소문자 무시, 공백/쉼표 정리)"""
+    text = unicodedata.normalize('NFC', text).casefold()
+    return ' '.join(re.split(r'[\s,]+', text.strip())).strip()
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 낱자열로 분해 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_END:
+            code -= _HANGUL_BASE
+            out.append(_CHOSEONG[code // 588])
+            out.append(_JUNGSEONG[(code % 588) // 28])
+            out.append(_JONGSEONG[code % 28])
+        else:
+            out.append(_COMPAT_COMPOUNDS.get(ch, ch))
+    return ''.join(out)
+
+
+def choseong_of(text: str) -> str:
+    """한글 음절의 초성만 추출 (한글이 아니면 빈 문자열)"""
+    out = []
+    for ch in text:
+        code = ord(ch) - _HANGUL_BASE
+        if 0 <= code <= _HANGUL_END - _HANGUL_BASE:
+            out.append(_CHOSEONG[code // 588])
+        elif not ch.isspace():
+            return ''
+    return ''.join(out)
+
+
+def _unit_vector(latitude: float, longitude: float) -> Tuple[float, float, float]:
+    """위경도를 단위 구면 직교 좌표로 변환 (경도 ±180 경계 없이 거리 비교)"""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_km(chord_squared: float) -> float:
+    """단위 구면 현 길이 제곱을 대원 거리 (km)로 변환"""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(chord_squared) / 2, 1.0))
+
+
+class Gazetteer:
+    """지명 사전 (바이너리 테이블 래퍼)"""
+
+    def __init__(self, buffer, count: int, kd_count: int, tz_count: int, checksum: int):
+        """
+        Args:
+            buffer: 헤더를 포함한 테이블 버퍼 (mmap 또는 bytes)
+            count: 지명 수
+            kd_count: KD-트리에 포함된 지명 수
+            tz_count: 시간대 수
+            checksum: 생성 시 원본 목록 CRC32
+        """
+        self.buffer = buffer
+        self.count = count
+        self.kd_count = kd_count
+        self.checksum = checksum
+
+        self._kd_offset = _HEADER.size + count * RECORD.size
+        tz_offset = self._kd_offset + kd_count * 2
+        self._text_offset = tz_offset + tz_count * TZ_RECORD.size
+        self.timezones = tuple(
+            self._text(*TZ_RECORD.unpack_from(buffer, tz_offset + i * TZ_RECORD.size))
+            for i in range(tz_count)
+        )
+
+        self._lock = threading.Lock()
+        self._places: List[Optional[Place]] = [None] * count
+        self._name_index = None
+        self._kd_order = None
+        self._kd_points = None
+
+    @classmethod
+    def from_buffer(cls, buffer) -> 'Gazetteer':
+        """헤더를 검증하고 버퍼를 지명 사전으로 래핑"""
+        magic, version, tz_count, kd_count, count, text_size, checksum = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("지원하지 않는 지명 사전 형식입니다.")
+        expected = (_HEADER.size + count * RECORD.size + kd_count * 2
+                    + tz_count * TZ_RECORD.size + text_size)
+        if len(buffer) != expected:
+            raise ValueError("지명 사전 크기가 올바르지 않습니다.")
+        return cls(buffer, count, kd_count, tz_count, checksum)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> 'Gazetteer':
+        """지명 사전 파일을 읽기 전용으로 메모리 매핑"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._text_offset + offset
+        return bytes(self.buffer[start:start + length]).decode('utf-8')
+
+    def place(self, place_id: int) -> Place:
+        """지명 인덱스로 레코드 조회 (첫 접근 시 디코딩 후 보관)"""
+        cached = self._places[place_id]
+        if cached is not None:
+            return cached
+
+        lat, lon, offset, length, parent, tz, kind, country = RECORD.unpack_from(
+            self.buffer, _HEADER.size + place_id * RECORD.size
+        )
+        name, *aliases = self._text(offset, length).split(_NAME_SEPARATOR)
+        place = Place(
+            id=place_id,
+            name=name,
+            aliases=tuple(aliases),
+            kind=KINDS[kind],
+            region='' if parent == NO_PARENT else self.place(parent).name,
+            country=country.decode('ascii'),
+            latitude=lat / COORD_SCALE,
+            longitude=lon / COORD_SCALE,
+            timezone=self.timezones[tz]
+        )
+        self._places[place_id] = place
+        return place
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ============================================
+    # 이름 조회 / 자동완성
+    # ============================================
+
+    def _ensure_name_index(self):
+        """정확 조회 사전과 자모/초성 트라이를 한 번만 생성"""
+        if self._name_index is not None:
+            return self._name_index
+
+        with self._lock:
+            if self._name_index is not None:
+                return self._name_index
+
+            exact: Dict[str, List[int]] = {}
+            # 트라이 노드: 자식 딕셔너리 목록과 노드별 상위 후보 목록 (우선순위 = 지명 인덱스)
+            jamo_children: List[Dict[str, int]] = [{}]
+            jamo_top: List[List[int]] = [[]]
+            cho_children: List[Dict[str, int]] = [{}]
+            cho_top: List[List[int]] = [[]]
+
+            def insert(children, top, key, place_id):
+                node = 0
+                for ch in key:
+                    child = children[node].get(ch)
+                    if child is None:
+                        child = len(children)
+                        children[node][ch] = child
+                        children.append({})
+                        top.append([])
+                    node = child
+                    bucket = top[node]
+                    if len(bucket) < TRIE_TOP_K and place_id not in bucket:
+                        bucket.append(place_id)
+
+            for place_id in range(self.count):
+                place = self.place(place_id)
+                for label in (place.name,) + place.aliases:
+                    key = normalize_name(label)
+                    ids = exact.setdefault(key, [])
+                    if place_id not in ids:
+                        ids.append(place_id)
+                    insert(jamo_children, jamo_top, decompose_jamo(key), place_id)
+                    initials = choseong_of(key)
+                    if initials:
+                        insert(cho_children, cho_top, initials, place_id)
+
+            self._name_index = (
+                {key: tuple(ids) for key, ids in exact.items()},
+                (jamo_children, jamo_top),
+                (cho_children, cho_top),
+            )
+        return self._name_index
+
+    def lookup(self, name: str) -> List[Place]:
+        """이름/별칭 정확 일치 지명 목록 (우선순위 순)"""
+        exact = self._ensure_name_index()[0]
+        return [self.place(i) for i in exact.get(normalize_name(name), ())]
+
+    def search(self, prefix: str, limit: int = 10) -> List[Place]:
+        """
+        접두어 자동완성
+
+        한글은 자모 단위로 비교하므로 입력 중인 음절('서ㅇ', '서우')도
+        일치하며, 초성만 입력하면('ㅅㅇ') 초성 트라이를 사용합니다.
+
+        Args:
+            prefix: 입력 중인 지명
+            limit: 최대 결과 수 (최대 TRIE_TOP_K)
+
+        Returns:
+            우선순위 순 지명 목록
+        """
+        key = normalize_name(prefix)
+        if not key or limit <= 0:
+            return []
+
+        _, jamo_trie, cho_trie = self._ensure_name_index()
+        if all(ch in _CHOSEONG_SET for ch in key.replace(' ', '')):
+            children, top = cho_trie
+            key = key.replace(' ', '')
+        else:
+            children, top = jamo_trie
+            key = decompose_jamo(key)
+
+        node = 0
+        for ch in key:
+            node = children[node].get(ch)
+            if node is None:
+                return []
+        return [self.place(i) for i in top[node][:limit]]
+
+    def resolve(self, location: Optional[str]) -> Optional[Place]:
+        """
+        주소형 출생지 문자열을 가장 구체적인 지명으로 해석
+
+        '서울특별시 강남구 역삼동', '부산 해운대', 'New York, USA'처럼 앞 토큰을
+        상위 지명으로 보고 뒤에서부터 알려진 가장 긴 지명을 찾습니다. 같은
+        이름(중구, 광주 등)은 앞서 나온 상위 지명으로 구분합니다. 띄어쓰기
+        없는 입력('서울강남구')은 가장 긴 접두 지명으로 해석합니다.
+
+        Returns:
+            지명 레코드, 알 수 없으면 None
+        """
+        if not location:
+            return None
+        key = normalize_name(location)
+        if not key:
+            return None
+        exact = self._ensure_name_index()[0]
+
+        ids = exact.get(key)
+        if ids:
+            return self.place(ids[0])
+
+        tokens = key.split(' ')
+        for end in range(len(tokens), 0, -1):
+            for start in range(end):
+                ids = exact.get(' '.join(tokens[start:end]))
+                if ids:
+                    return self._disambiguate(ids, tokens[:start], exact)
+
+        compact = key.replace(' ', '')
+        for end in range(len(compact), 1, -1):
+            ids = exact.get(compact[:end])
+            if ids:
+                rest = compact[end:]
+                child = self._resolve_compact_child(rest, ids[0], exact) if rest else None
+                return child or self.place(ids[0])
+        return None
+
+    def _disambiguate(self, ids: Tuple[int, ...], context: List[str], exact: Dict) -> Place:
+        """앞선 토큰이 가리키는 상위 지명 아래의 후보를 우선 선택"""
+        parents = {self.place(i).name for token in context for i in exact.get(token, ())}
+        if parents:
+            for place_id in ids:
+                if self.place(place_id).region in parents:
+                    return self.place(place_id)
+        return self.place(ids[0])
+
+    def _resolve_compact_child(self, rest: str, parent_id: int, exact: Dict) -> Optional[Place]:
+        """띄어쓰기 없는 입력에서 상위 지명 뒤에 이어지는 하위 지명 탐색"""
+        parent = self.place(parent_id).name
+        for end in range(len(rest), 1, -1):
+            for place_id in exact.get(rest[:end], ()):
+                if self.place(place_id).region == parent:
+                    return self.place(place_id)
+        return None
+
+    # ============================================
+    # 좌표 역조회 (KD-트리)
+    # ============================================
+
+    def _ensure_kd_points(self) -> array:
+        """KD-트리 순서의 단위 벡터 좌표 (x, y, z 평탄 배열)"""
+        if self._kd_points is None:
+            order = array('H')
+            order.frombytes(bytes(self.buffer[self._kd_offset:self._kd_offset + self.kd_count * 2]))
+            if sys.byteorder != 'little':
+                order.byteswap()
+            points = array('d')
+            for place_id in order:
+                place = self.place(place_id)
+                points.extend(_unit_vector(place.latitude, place.longitude))
+            self._kd_order = order
+            self._kd_points = points
+        return self._kd_points
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> List[Tuple[Place, float]]:
+        """
+        좌표에서 가까운 지명 k개 (시/군/구, 도 단위 제외)
+
+        Returns:
+            (지명, 대원 거리 km) 목록, 가까운 순
+        """
+        points = self._ensure_kd_points()
+        order = self._kd_order
+        target = _unit_vector(latitude, longitude)
+        k = max(1, min(k, self.kd_count))
+        # (-거리², KD 위치) 최대 힙
+        heap: List[Tuple[float, int]] = []
+
+        def visit(lo: int, hi: int, depth: int):
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            base = mid * 3
+            dx = target[0] - points[base]
+            dy = target[1] - points[base + 1]
+            dz = target[2] - points[base + 2]
+            d2 = dx * dx + dy * dy + dz * dz
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, mid))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, mid))
+
+            diff = target[depth % 3] - points[base + depth % 3]
+            if diff < 0:
+                visit(lo, mid, depth + 1)
+                if len(heap) < k or diff * diff < -heap[0][0]:
+                    visit(mid + 1, hi, depth + 1)
+            else:
+                visit(mid + 1, hi, depth + 1)
+                if len(heap) < k or diff * diff < -heap[0][0]:
+                    visit(lo, mid, depth + 1)
+
+        visit(0, self.kd_count, 0)
+        return [
+            (self.place(order[mid]), round(_chord_to_km(-neg_d2), 3))
+            for neg_d2, mid in sorted(heap, reverse=True)
+        ]
+
+    def reverse(self, latitude: float, longitude: float) -> Optional[Place]:
+        """좌표에서 가장 가까운 지명"""
+        if self.kd_count == 0:
+            return None
+        return self.nearest(latitude, longitude, 1)[0][0]
+
+
+def place_utc_offset(place: Place, dt: datetime) -> int:
+    """
+    출생지 현지 시각의 UTC 오프셋 (분)
+
+    한국은 역사적 표준시/서머타임 전환 인덱스를, 그 외 지역은 IANA
+    시간대 데이터베이스(zoneinfo)를 사용합니다.
+    """
+    if place.timezone == 'Asia/Seoul':
+        from services.korea_timezone import get_korea_timezone_index
+        return get_korea_timezone_index().utc_offset(dt) // 60
+
+    from zoneinfo import ZoneInfo
+    return int(dt.replace(tzinfo=ZoneInfo(place.timezone)).utcoffset().total_seconds()) // 60
+
+
+# ============================================
+# 테이블 생성
+# ============================================
+
+def source_checksum(path: str = GAZETTEER_SOURCE_PATH) -> int:
+    """원본 지명 목록 식별용 CRC32"""
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read()) & 0xFFFFFFFF
+
+
+def read_source(path: str = GAZETTEER_SOURCE_PATH) -> List[Dict]:
+    """
+    원본 TSV 읽기
+
+    열: name, aliases('|' 구분), kind, region, country, latitude, longitude, timezone
+    """
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            name, aliases, kind, region, country, lat, lon, tz = line.split('\t')
+            rows.append({
+                'name': name,
+                'aliases': [a for a in aliases.split('|') if a],
+                'kind': kind,
+                'region': region,
+                'country': country,
+                'latitude': float(lat),
+                'longitude': float(lon),
+                'timezone': tz,
+            })
+    return rows
+
+
+def _kd_layout(ids: List[int], points: Dict[int, Tuple[float, float, float]], depth: int = 0) -> List[int]:
+    """암묵적 KD-트리 배열 순서 ([lo, hi) 구간의 분할 노드가 (lo + hi) // 2에 위치)"""
+    if not ids:
+        return []
+    axis = depth % 3
+    ids = sorted(ids, key=lambda i: points[i][axis])
+    mid = len(ids) // 2
+    return (_kd_layout(ids[:mid], points, depth + 1) + [ids[mid]]
+            + _kd_layout(ids[mid + 1:], points, depth + 1))
+
+
+def build_gazetteer(path: str = GAZETTEER_SOURCE_PATH) -> bytes:
+    """
+    원본 TSV에서 지명 사전 바이너리 생성
+
+    광역시 자치구처럼 '구'/'군'으로 끝나는 세 글자 이상 지명은 접미사를 뗀
+    별칭('강남', '해운대')을 함께 등록합니다.
+
+    Returns:
+        헤더를 포함한 테이블 바이트열
+    """
+    rows = read_source(path)
+    timezones = sorted({row['timezone'] for row in rows})
+    tz_index = {tz: i for i, tz in enumerate(timezones)}
+    top_level = {}
+    for i, row in enumerate(rows):
+        if not row['region']:
+            top_level.setdefault(row['name'], i)
+
+    text = bytearray()
+    records = bytearray()
+    points = {}
+    for i, row in enumerate(rows):
+        aliases = list(row['aliases'])
+        name = row['name']
+        if row['kind'] == 'district' and len(name) >= 3 and name[-1] in '구군':
+            aliases.append(name[:-1])
+        encoded = _NAME_SEPARATOR.join([name] + aliases).encode('utf-8')
+
+        if row['region'] and row['region'] not in top_level:
+            raise ValueError(f"알 수 없는 상위 지명: {row['region']} ({name})")
+        kind = KINDS.index(row['kind'])
+        records += RECORD.pack(
+            round(row['latitude'] * COORD_SCALE),
+            round(row['longitude'] * COORD_SCALE),
+            len(text), len(encoded),
+            top_level[row['region']] if row['region'] else NO_PARENT,
+            tz_index[row['timezone']],
+            kind,
+            row['country'].encode('ascii')
+        )
+        text += encoded
+        if kind != KIND_PROVINCE:
+            points[i] = _unit_vector(row['latitude'], row['longitude'])
+
+    kd_order = array('H', _kd_layout(list(points), points))
+    if sys.byteorder != 'little':
+        kd_order.byteswap()
+
+    tz_records = bytearray()
+    for tz in timezones:
+        encoded = tz.encode('ascii')
+        tz_records += TZ_RECORD.pack(len(text), len(encoded))
+        text += encoded
+
+    header = _HEADER.pack(_MAGIC, _VERSION, len(timezones), len(kd_order), len(rows),
+                          len(text), source_checksum(path))
+    return header + bytes(records) + kd_order.tobytes() + bytes(tz_records) + bytes(text)
+
+
+def write_gazetteer(data: bytes, path: str = GAZETTEER_PATH):
+    """지명 사전을 원자적으로 파일에 기록 (동시 기동한 워커 간 경합 방지)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# 싱글톤 인스턴스
+_gazetteer_instance = None
+
+
+def get_gazetteer(path: str = GAZETTEER_PATH) -> Gazetteer:
+    """
+    지명 사전 싱글톤 인스턴스 반환
+
+    파일이 없거나 원본 목록과 맞지 않으면 새로 생성하여 저장하고,
+    저장할 수 없는 환경에서는 메모리에 보관합니다.
+    """
+    global _gazetteer_instance
+    if _gazetteer_instance is not None:
+        return _gazetteer_instance
+
+    checksum = source_checksum()
+    try:
+        gazetteer = Gazetteer.load(path)
+        if gazetteer.checksum == checksum:
+            _gazetteer_instance = gazetteer
+            return gazetteer
+    except (OSError, ValueError, struct.error):
+        pass
+
+    data = build_gazetteer()
+    try:
+        write_gazetteer(data, path)
+        _gazetteer_instance = Gazetteer.load(path)
+    except OSError:
+        _gazetteer_instance = Gazetteer.from_buffer(data)
+    return _gazetteer_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="출생지 지명 사전 생성")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', default=GAZETTEER_PATH)
+    args = parser.parse_args()
+
+    data = build_gazetteer()
+    write_gazetteer(data, args.output)
+    gazetteer = Gazetteer.from_buffer(data)
+    print(f"{gazetteer.count} places, {len(gazetteer.timezones)} timezones ({len(data)} bytes) -> {args.output}")
@@ -0,0 +1,159 @@
+"""
+한국 역사적 표준시/서머타임 전환 인덱스
+표준시 변경과 서머타임 시작/종료 시각을 하나의 정렬된 전환 배열로 합쳐
+bisect 한 번으로 해당 시각의 총 UTC 오프셋을 구함
+
+전환 시각은 전환 직전 벽시계(현지 시각) 기준입니다. 서머타임 종료로 같은
+벽시계 시각이 두 번 나타나는 구간은 첫 번째(서머타임) 시각으로 해석하고,
+시작으로 건너뛴 구간은 새 오프셋을 적용합니다.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import List, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.solar_terms import datetime_to_epoch
+
+
+# 현재 한국 표준시 (UTC+9)
+KST_OFFSET_MINUTES = 540
+
+# 한국 표준시 역사
+# (시작일, 종료일, UTC 오프셋 분)
+KOREA_TZ_HISTORY = [
+    # 1908년 이전: 지방 평균시 (약 UTC+8:28)
+    (datetime(1, 1, 1), datetime(1908, 3, 31), 508),
+    # 1908-1912: 한국 표준시 (UTC+8:30)
+    (datetime(1908, 4, 1), datetime(1912, 1, 1), 510),
+    # 1912-1954: 일본 표준시 (UTC+9:00)
+    (datetime(1912, 1, 1), datetime(1954, 3, 21), 540),
+    # 1954-1961: 한국 표준시 (UTC+8:30)
+    (datetime(1954, 3, 21), datetime(1961, 8, 10), 510),
+    # 1961-현재: 한국 표준시 (UTC+9:00)
+    (datetime(1961, 8, 10), datetime(2100, 1, 1), 540),
+]
+
+# 한국 서머타임 시행 구간 (IANA tzdata ROK 규칙)
+# (시작 시각, 종료 시각, 서머타임 오프셋 분)
+# 시작은 표준시 벽시계, 종료는 서머타임 벽시계 기준
+KOREA_DST_HISTORY = [
+    (datetime(1948, 6, 1), datetime(1948, 9, 13), 60),
+    (datetime(1949, 4, 3), datetime(1949, 9, 11), 60),
+    (datetime(1950, 4, 1), datetime(1950, 9, 10), 60),
+    (datetime(1951, 5, 6), datetime(1951, 9, 9), 60),
+    (datetime(1955, 5, 5), datetime(1955, 9, 9), 60),
+    (datetime(1956, 5, 20), datetime(1956, 9, 30), 60),
+    (datetime(1957, 5, 5), datetime(1957, 9, 22), 60),
+    (datetime(1958, 5, 4), datetime(1958, 9, 21), 60),
+    (datetime(1959, 5, 3), datetime(1959, 9, 20), 60),
+    (datetime(1960, 5, 1), datetime(1960, 9, 18), 60),
+    (datetime(1987, 5, 10, 2), datetime(1987, 10, 11, 3), 60),
+    (datetime(1988, 5, 8, 2), datetime(1988, 10, 9, 3), 60),
+]
+
+
+def _standard_offset_at(dt: datetime) -> int:
+    """표준시 구간 표에서 해당 시각의 표준 UTC 오프셋 (분)"""
+    for start, end, offset in KOREA_TZ_HISTORY:
+        if start <= dt < end:
+            return offset
+    return KOREA_TZ_HISTORY[-1][2]
+
+
+def build_transitions() -> List[Tuple[datetime, int, int]]:
+    """
+    표준시 변경과 서머타임 시작/종료를 시간순 전환 목록으로 병합
+
+    Returns:
+        (전환 시각, 표준 오프셋 분, 서머타임 오프셋 분) 목록
+    """
+    transitions = [(start, offset, 0) for start, _, offset in KOREA_TZ_HISTORY]
+    for start, end, dst in KOREA_DST_HISTORY:
+        transitions.append((start, _standard_offset_at(start), dst))
+        transitions.append((end, _standard_offset_at(end), 0))
+    transitions.sort()
+    return transitions
+
+
+class KoreaTimezoneIndex:
+    """한국 역사적 UTC 오프셋 전환 인덱스"""
+
+    def __init__(self, transitions: List[Tuple[datetime, int, int]]):
+        """
+        Args:
+            transitions: build_transitions() 결과 (시간순)
+        """
+        self.transitions = transitions
+        self.starts = array('d', (datetime_to_epoch(dt) for dt, _, _ in transitions))
+        # 총 오프셋 / 서머타임 오프셋 (초)
+        self.offsets = array('l', ((std + dst) * 60 for _, std, dst in transitions))
+        self.dst_offsets = array('l', (dst * 60 for _, _, dst in transitions))
+        self._arrays = None
+
+    def _position(self, dt: datetime) -> int:
+        """해당 현지 시각에 유효한 전환 위치"""
+        return max(bisect_right(self.starts, datetime_to_epoch(dt)) - 1, 0)
+
+    def utc_offset(self, dt: datetime) -> int:
+        """현지 시각의 총 UTC 오프셋 (초, 서머타임 포함)"""
+        return self.offsets[self._position(dt)]
+
+    def dst_offset(self, dt: datetime) -> int:
+        """현지 시각의 서머타임 오프셋 (초, 미시행이면 0)"""
+        return self.dst_offsets[self._position(dt)]
+
+    def to_kst(self, dt: datetime) -> datetime:
+        """현지 시각을 현재 한국 표준시(UTC+9, 서머타임 제외) 기준으로 변환"""
+        return dt + timedelta(seconds=KST_OFFSET_MINUTES * 60 - self.utc_offset(dt))
+
+    def utc_offset_array(self, datetimes: 'np.ndarray') -> 'np.ndarray':
+        """
+        datetime64 배열의 총 UTC 오프셋 일괄 조회 (searchsorted 1회)
+
+        Args:
+            datetimes: 현지 시각 datetime64 배열
+
+        Returns:
+            오프셋 (초) int64 배열
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("일괄 시간대 조회에는 numpy가 필요합니다.")
+        if self._arrays is None:
+            self._arrays = (
+                np.frombuffer(self.starts, dtype=np.float64),
+                np.frombuffer(self.offsets, dtype=np.dtype('l')).astype(np.int64),
+            )
+        starts, offsets = self._arrays
+
+        seconds = np.asarray(datetimes, dtype='datetime64[s]').astype(np.int64)
+        pos = np.maximum(np.searchsorted(starts, seconds, side='right') - 1, 0)
+        return offsets[pos]
+
+    def to_kst_array(self, datetimes: 'np.ndarray') -> 'np.ndarray':
+        """datetime64 배열을 현재 한국 표준시 기준으로 일괄 변환"""
+        local = np.asarray(datetimes, dtype='datetime64[s]')
+        correction = KST_OFFSET_MINUTES * 60 - self.utc_offset_array(local)
+        return local + correction.astype('timedelta64[s]')
+
+
+# 싱글톤 인스턴스
+_korea_timezone_index = None
+
+
+def get_korea_timezone_index() -> KoreaTimezoneIndex:
+    """한국 시간대 전환 인덱스 싱글톤 인스턴스 반환"""
+    global _korea_timezone_index
+    if _korea_timezone_index is None:
+        _korea_timezone_index = KoreaTimezoneIndex(build_transitions())
+    return _korea_timezone_index
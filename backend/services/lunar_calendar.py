@@ -3,30 +3,60 @@
 음력 변환, 절기 계산, 한국 시간대 보정을 포함한 정밀 사주 계산
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 from typing import Optional, Tuple, Dict, List
 import math
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from lunardate import LunarDate
-    LUNARDATE_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    LUNARDATE_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+from services.solar_terms import (
+    SOLAR_TERMS, TERMS_PER_YEAR, IPCHUN_INDEX, EPOCH_ORDINAL, SECONDS_PER_DAY,
+    SolarTermTable, get_solar_term_table, approximate_term_date, date_to_epoch
+)
+from services import lunar_conversion
+from services.ganji import (
+    Ganji, ganji_index, ELEMENTS, BRANCH_ELEMENT_CODES,
+    HEAVENLY_STEMS, STEMS_HANJA, EARTHLY_BRANCHES, BRANCHES_HANJA, BRANCH_ANIMALS
+)
+from services.manse_table import (
+    ManseDayTable, get_manse_table,
+    YEAR_GANJI, MONTH_GANJI, DAY_GANJI,
+    LUNAR_YEAR, LUNAR_MONTH, LUNAR_DAY, IS_LEAP, SOLAR_TERM
+)
+from services import saju_table
+from services.saju_table import SajuHourTable, get_saju_table, shifted_date
+from services.lru_cache import LRUCache
+from services.korea_timezone import (
+    KOREA_TZ_HISTORY, KOREA_DST_HISTORY, KoreaTimezoneIndex, get_korea_timezone_index
+)
+from services.solar_time import to_true_solar_time
+
+
+# calculate_saju 결과 LRU 캐시 크기 (반복 조회되는 생년월일시)
+SAJU_CACHE_SIZE = 8192
 
 
 class LunarCalendar:
     """만세력 정밀 계산 클래스"""
 
     # 천간 (天干) - 10개
-    HEAVENLY_STEMS = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
-    STEMS_HANJA = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+    HEAVENLY_STEMS = HEAVENLY_STEMS
+    STEMS_HANJA = STEMS_HANJA
 
     # 지지 (地支) - 12개
-    EARTHLY_BRANCHES = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-    BRANCHES_HANJA = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+    EARTHLY_BRANCHES = EARTHLY_BRANCHES
+    BRANCHES_HANJA = BRANCHES_HANJA
 
     # 지지 동물
-    BRANCH_ANIMALS = ["쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양", "원숭이", "닭", "개", "돼지"]
+    BRANCH_ANIMALS = BRANCH_ANIMALS
 
     # 오행 매핑
     STEM_ELEMENTS = {
@@ -46,21 +76,11 @@ class LunarCalendar:
         "술": "earth", "해": "water"
     }
 
+    # 오행 코드 (ganji_range 오행 배열의 값 → 이름)
+    ELEMENT_CODES = ELEMENTS
+
     # 절기 (24절기) - 태양 황경 기준
-    SOLAR_TERMS = [
-        ("소한", 285), ("대한", 300),   # 1월
-        ("입춘", 315), ("우수", 330),   # 2월
-        ("경칩", 345), ("춘분", 0),     # 3월
-        ("청명", 15), ("곡우", 30),     # 4월
-        ("입하", 45), ("소만", 60),     # 5월
-        ("망종", 75), ("하지", 90),     # 6월
-        ("소서", 105), ("대서", 120),   # 7월
-        ("입추", 135), ("처서", 150),   # 8월
-        ("백로", 165), ("추분", 180),   # 9월
-        ("한로", 195), ("상강", 210),   # 10월
-        ("입동", 225), ("소설", 240),   # 11월
-        ("대설", 255), ("동지", 270),   # 12월
-    ]
+    SOLAR_TERMS = SOLAR_TERMS
 
     # 절기 기준 월 (절입일 기준)
     # 인월(1월)은 입춘부터 시작
@@ -70,40 +90,60 @@ class LunarCalendar:
         9: "한로", 10: "입동", 11: "대설", 12: "소한"
     }
 
-    # 한국 서머타임 역사
-    # (시작년, 종료년, DST 오프셋 분)
-    KOREA_DST_HISTORY = [
-        # 1948-1951: 서머타임 시행
-        (1948, 1951, 60),
-        # 1955-1960: 서머타임 시행
-        (1955, 1960, 60),
-        # 1987-1988: 서머타임 시행
-        (1987, 1988, 60),
-    ]
-
-    # 한국 표준시 역사
-    # (시작일, 종료일, UTC 오프셋 분)
-    KOREA_TZ_HISTORY = [
-        # 1908년 이전: 지방 평균시 (약 UTC+8:28)
-        (datetime(1, 1, 1), datetime(1908, 3, 31), 508),
-        # 1908-1912: 한국 표준시 (UTC+8:30)
-        (datetime(1908, 4, 1), datetime(1912, 1, 1), 510),
-        # 1912-1954: 일본 표준시 (UTC+9:00)
-        (datetime(1912, 1, 1), datetime(1954, 3, 21), 540),
-        # 1954-1961: 한국 표준시 (UTC+8:30)
-        (datetime(1954, 3, 21), datetime(1961, 8, 10), 510),
-        # 1961-현재: 한국 표준시 (UTC+9:00)
-        (datetime(1961, 8, 10), datetime(2100, 1, 1), 540),
-    ]
-
-    def __init__(self):
-        """만세력 초기화"""
+    # 한국 서머타임 역사 (시작 시각, 종료 시각, DST 오프셋 분)
+    KOREA_DST_HISTORY = KOREA_DST_HISTORY
+
+    # 한국 표준시 역사 (시작일, 종료일, UTC 오프셋 분)
+    KOREA_TZ_HISTORY = KOREA_TZ_HISTORY
+
+    def __init__(
+        self,
+        use_day_table: bool = True,
+        use_saju_table: bool = False,
+        cache_size: int = SAJU_CACHE_SIZE
+    ):
+        """
+        만세력 초기화
+
+        Args:
+            use_day_table: 만세력 일별 테이블 사용 여부 (False면 매번 계산,
+                테이블 생성 시 사용)
+            use_saju_table: 전체 (날짜, 시) 사전 계산 테이블 사용 여부
+                (없으면 최초 1회 생성)
+            cache_size: calculate_saju LRU 캐시 크기 (0이면 캐시 안 함)
+        """
         # 일진 기준일: 1900년 1월 1일 = 갑진일 (甲辰日)
         # 실제 역사적 기준: 갑자일 순환
         self.base_date = datetime(1900, 1, 1)
         self.base_stem_index = 0  # 갑
         self.base_branch_index = 4  # 진
 
+        # 1900-2100 절입 시각 인덱스 (프로세스당 1회 생성, bisect 조회)
+        self.solar_terms: SolarTermTable = get_solar_term_table()
+
+        # 표준시 변경/서머타임 전환 인덱스 (bisect 조회)
+        self.timezone_index: KoreaTimezoneIndex = get_korea_timezone_index()
+
+        # 1900-2100 만세력 일별 테이블 (메모리 매핑, 날짜당 O(1) 조회)
+        self.day_table: Optional[ManseDayTable] = get_manse_table() if use_day_table else None
+
+        # ganji_range용 NumPy 조회 배열 (최초 사용 시 생성)
+        self._range_arrays = None
+
+        # 반복 조회 캐시
+        self.saju_cache = LRUCache(cache_size)
+
+        # 1900-2100 전체 (날짜, 시) 사전 계산 테이블 (선택, 메모리 매핑)
+        self.saju_table: Optional[SajuHourTable] = None
+        if use_saju_table:
+            self.saju_table = get_saju_table(self)
+
+    def _day_record(self, year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> Optional[Tuple]:
+        """만세력 일별 테이블 레코드 (테이블 미사용/범위 밖이면 None)"""
+        if self.day_table is None:
+            return None
+        return self.day_table.record_at(year, month, day, hour * 60 + minute)
+
     def solar_to_lunar(self, year: int, month: int, day: int) -> Dict:
         """
         양력을 음력으로 변환
@@ -116,25 +156,26 @@ class LunarCalendar:
         Returns:
             음력 날짜 정보 딕셔너리
         """
-        if not LUNARDATE_AVAILABLE:
+        rec = self._day_record(year, month, day)
+        if rec is not None and rec[LUNAR_YEAR]:
             return {
-                'lunar_year': year,
-                'lunar_month': month,
-                'lunar_day': day,
-                'is_leap_month': False,
-                'available': False
+                'lunar_year': rec[LUNAR_YEAR],
+                'lunar_month': rec[LUNAR_MONTH],
+                'lunar_day': rec[LUNAR_DAY],
+                'is_leap_month': bool(rec[IS_LEAP]),
+                'available': True
             }
 
         try:
-            lunar = LunarDate.fromSolarDate(year, month, day)
+            lunar_year, lunar_month, lunar_day, is_leap = lunar_conversion.solar_to_lunar(year, month, day)
             return {
-                'lunar_year': lunar.year,
-                'lunar_month': lunar.month,
-                'lunar_day': lunar.day,
-                'is_leap_month': lunar.isLeapMonth,
+                'lunar_year': lunar_year,
+                'lunar_month': lunar_month,
+                'lunar_day': lunar_day,
+                'is_leap_month': is_leap,
                 'available': True
             }
-        except Exception as e:
+        except ValueError as e:
             return {
                 'lunar_year': year,
                 'lunar_month': month,
@@ -157,24 +198,15 @@ class LunarCalendar:
         Returns:
             양력 날짜 정보 딕셔너리
         """
-        if not LUNARDATE_AVAILABLE:
-            return {
-                'solar_year': year,
-                'solar_month': month,
-                'solar_day': day,
-                'available': False
-            }
-
         try:
-            lunar = LunarDate(year, month, day, is_leap)
-            solar = lunar.toSolarDate()
+            solar = lunar_conversion.lunar_to_solar(year, month, day, is_leap)
             return {
                 'solar_year': solar.year,
                 'solar_month': solar.month,
                 'solar_day': solar.day,
                 'available': True
             }
-        except Exception as e:
+        except ValueError as e:
             return {
                 'solar_year': year,
                 'solar_month': month,
@@ -193,13 +225,7 @@ class LunarCalendar:
         Returns:
             절기명: datetime 딕셔너리
         """
-        terms = {}
-
-        for term_name, longitude in self.SOLAR_TERMS:
-            dt = self._calculate_solar_term_date(year, longitude)
-            terms[term_name] = dt
-
-        return terms
+        return self.solar_terms.year_term_dates(year)
 
     def _calculate_solar_term_date(self, year: int, target_longitude: float) -> datetime:
         """
@@ -212,35 +238,11 @@ class LunarCalendar:
         Returns:
             해당 절기의 datetime
         """
-        # 태양 황경을 기준으로 날짜 추정
-        # 춘분(0도)은 약 3월 21일
+        return approximate_term_date(year, target_longitude)
 
-        # 기준점: 춘분 (태양 황경 0도 ≈ 3월 21일)
-        spring_equinox = datetime(year, 3, 21, 0, 0, 0)
-
-        # 태양은 하루에 약 0.9856도 이동
-        days_per_degree = 1 / 0.9856
-
-        # 목표 황경까지의 각도 차이
-        if target_longitude == 0:
-            angle_diff = 0
-        elif target_longitude > 0:
-            angle_diff = target_longitude
-        else:
-            angle_diff = target_longitude + 360
-
-        days_diff = angle_diff * days_per_degree
-
-        result_date = spring_equinox + timedelta(days=days_diff)
-
-        # 연도 조정
-        if result_date.year != year:
-            if result_date.year > year:
-                result_date = result_date - timedelta(days=365)
-            else:
-                result_date = result_date + timedelta(days=365)
-
-        return result_date
+    def _locate_solar_term(self, year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> int:
+        """해당 시각(기본 자정) 직전 절입의 인덱스 위치"""
+        return self.solar_terms.locate(date_to_epoch(year, month, day) + hour * 3600 + minute * 60)
 
     def get_month_by_solar_term(self, year: int, month: int, day: int) -> int:
         """
@@ -257,64 +259,43 @@ class LunarCalendar:
         Returns:
             절기 기준 월 (1-12, 1=인월)
         """
-        target_date = datetime(year, month, day)
-        terms = self.get_solar_term_dates(year)
+        rec = self._day_record(year, month, day)
+        if rec is not None:
+            return (rec[SOLAR_TERM] // 2 - 1) % 12 + 1
 
-        # 이전 연도 절기도 필요할 수 있음
-        prev_year_terms = self.get_solar_term_dates(year - 1)
+        return self.solar_terms.saju_month(self._locate_solar_term(year, month, day))
 
-        # 절입일 목록 생성 (월 시작 절기만)
-        entry_dates = []
-        for saju_month, term_name in self.MONTH_START_TERMS.items():
-            if term_name in terms:
-                entry_dates.append((saju_month, terms[term_name]))
-            elif term_name in prev_year_terms:
-                entry_dates.append((saju_month, prev_year_terms[term_name]))
-
-        # 날짜순 정렬
-        entry_dates.sort(key=lambda x: x[1])
-
-        # 해당 날짜의 월 결정
-        result_month = 12  # 기본값
-        for saju_month, entry_date in entry_dates:
-            if target_date >= entry_date:
-                result_month = saju_month
-            else:
-                break
-
-        return result_month
-
-    def calculate_year_pillar(self, year: int, month: int, day: int) -> Tuple[str, str]:
+    def calculate_year_pillar(
+        self, year: int, month: int, day: int, hour: int = 0, minute: int = 0
+    ) -> Ganji:
         """
         년주 (年柱) 계산
 
-        사주의 년은 입춘 기준으로 바뀜
+        사주의 년은 입춘 절입 시각 기준으로 바뀜
 
         Args:
             year: 양력 년
             month: 양력 월
             day: 양력 일
+            hour: 시 (절입 시각 비교용, 기본 자정)
+            minute: 분
 
         Returns:
-            (천간, 지지) 튜플
+            년주 간지
         """
-        # 입춘 날짜 확인
-        terms = self.get_solar_term_dates(year)
-        ipchun = terms.get("입춘", datetime(year, 2, 4))
-
-        target_date = datetime(year, month, day)
+        rec = self._day_record(year, month, day, hour, minute)
+        if rec is not None:
+            return Ganji(rec[YEAR_GANJI])
 
         # 입춘 이전이면 전년도 간지
-        if target_date < ipchun:
-            year = year - 1
-
-        # 60갑자 계산 (기원전 4년이 갑자년)
-        stem_index = (year - 4) % 10
-        branch_index = (year - 4) % 12
+        year = self.solar_terms.saju_year(self._locate_solar_term(year, month, day, hour, minute))
 
-        return (self.HEAVENLY_STEMS[stem_index], self.EARTHLY_BRANCHES[branch_index])
+        # 60갑자 계산 (서기 4년이 갑자년)
+        return Ganji(year - 4)
 
-    def calculate_month_pillar(self, year: int, month: int, day: int) -> Tuple[str, str]:
+    def calculate_month_pillar(
+        self, year: int, month: int, day: int, hour: int = 0, minute: int = 0
+    ) -> Ganji:
         """
         월주 (月柱) 계산
 
@@ -324,16 +305,22 @@ class LunarCalendar:
             year: 양력 년
             month: 양력 월
             day: 양력 일
+            hour: 시 (절입 시각 비교용, 기본 자정)
+            minute: 분
 
         Returns:
-            (천간, 지지) 튜플
+            월주 간지
         """
-        # 절기 기준 월
-        saju_month = self.get_month_by_solar_term(year, month, day)
+        rec = self._day_record(year, month, day, hour, minute)
+        if rec is not None:
+            return Ganji(rec[MONTH_GANJI])
+
+        # 절기 기준 월과 사주 연도 (같은 절입 위치에서 함께 결정)
+        pos = self._locate_solar_term(year, month, day, hour, minute)
+        saju_month = self.solar_terms.saju_month(pos)
 
         # 년주의 천간
-        year_stem, _ = self.calculate_year_pillar(year, month, day)
-        year_stem_index = self.HEAVENLY_STEMS.index(year_stem)
+        year_stem_index = (self.solar_terms.saju_year(pos) - 4) % 10
 
         # 월간 계산 (년간에 따른 월간 시작점)
         # 갑/기년 -> 병인월 시작
@@ -349,12 +336,9 @@ class LunarCalendar:
         # 월지 (인월=1, 묘월=2, ...)
         month_branch_index = (saju_month + 1) % 12  # 인=2
 
-        return (
-            self.HEAVENLY_STEMS[month_stem_index],
-            self.EARTHLY_BRANCHES[month_branch_index]
-        )
+        return Ganji(ganji_index(month_stem_index, month_branch_index))
 
-    def calculate_day_pillar(self, year: int, month: int, day: int) -> Tuple[str, str]:
+    def calculate_day_pillar(self, year: int, month: int, day: int) -> Ganji:
         """
         일주 (日柱) 계산
 
@@ -366,28 +350,29 @@ class LunarCalendar:
             day: 양력 일
 
         Returns:
-            (천간, 지지) 튜플
+            일주 간지
         """
+        rec = self._day_record(year, month, day)
+        if rec is not None:
+            return Ganji(rec[DAY_GANJI])
+
         target_date = datetime(year, month, day)
         days_diff = (target_date - self.base_date).days
 
         # 1900년 1월 1일 = 갑진일 (甲辰日)
         # 천간: 갑(0), 지지: 진(4)
-        stem_index = (self.base_stem_index + days_diff) % 10
-        branch_index = (self.base_branch_index + days_diff) % 12
-
-        return (self.HEAVENLY_STEMS[stem_index], self.EARTHLY_BRANCHES[branch_index])
+        return Ganji(ganji_index(self.base_stem_index, self.base_branch_index) + days_diff)
 
-    def calculate_hour_pillar(self, day_stem: str, hour: int) -> Tuple[str, str]:
+    def calculate_hour_pillar(self, day_stem_index: int, hour: int) -> Ganji:
         """
         시주 (時柱) 계산
 
         Args:
-            day_stem: 일간 (천간)
+            day_stem_index: 일간 (천간 인덱스, Ganji.stem_index)
             hour: 시간 (0-23)
 
         Returns:
-            (천간, 지지) 튜플
+            시주 간지
         """
         # 시지 계산
         # 자시(23-01), 축시(01-03), 인시(03-05), ...
@@ -397,13 +382,12 @@ class LunarCalendar:
             branch_index = ((hour + 1) // 2) % 12
 
         # 시간 계산 (일간에 따른 시간 시작점)
-        day_stem_index = self.HEAVENLY_STEMS.index(day_stem)
         hour_stem_starts = [0, 2, 4, 6, 8]  # 갑, 병, 무, 경, 임
         hour_stem_start = hour_stem_starts[day_stem_index % 5]
 
         stem_index = (hour_stem_start + branch_index) % 10
 
-        return (self.HEAVENLY_STEMS[stem_index], self.EARTHLY_BRANCHES[branch_index])
+        return Ganji(ganji_index(stem_index, branch_index))
 
     def apply_korea_timezone(
         self,
@@ -411,29 +395,34 @@ class LunarCalendar:
         birth_location: str = "서울"
     ) -> datetime:
         """
-        한국 역사적 시간대 보정
+        한국 역사적 시간대 보정 (표준시 변경 + 서머타임)
+
+        당시 총 UTC 오프셋과 현재 표준시(UTC+9)의 차이를 적용합니다.
 
         Args:
-            dt: 출생 datetime
+            dt: 출생 datetime (당시 현지 시각)
             birth_location: 출생 지역
 
         Returns:
             보정된 datetime
         """
-        # 현재 표준시(UTC+9)와의 차이 적용
-        current_offset = 540  # 현재 KST
+        return self.timezone_index.to_kst(dt)
+
+    def apply_korea_timezone_array(self, datetimes: 'np.ndarray') -> 'np.ndarray':
+        """
+        한국 역사적 시간대 일괄 보정
 
-        for start, end, offset in self.KOREA_TZ_HISTORY:
-            if start <= dt < end:
-                # 과거 시간대와 현재의 차이
-                offset_diff = current_offset - offset
-                return dt + timedelta(minutes=offset_diff)
+        Args:
+            datetimes: 출생 시각 datetime64 배열 (당시 현지 시각)
 
-        return dt
+        Returns:
+            보정된 datetime64[s] 배열
+        """
+        return self.timezone_index.to_kst_array(datetimes)
 
     def check_dst(self, dt: datetime) -> bool:
         """
-        서머타임 적용 여부 확인
+        서머타임 적용 여부 확인 (실제 시작/종료 시각 기준)
 
         Args:
             dt: 확인할 datetime
@@ -441,27 +430,25 @@ class LunarCalendar:
         Returns:
             서머타임 적용 여부
         """
-        year = dt.year
-        month = dt.month
-
-        for start_year, end_year, offset in self.KOREA_DST_HISTORY:
-            if start_year <= year <= end_year:
-                # 서머타임은 보통 4월-10월 적용
-                if 4 <= month <= 10:
-                    return True
+        return self.timezone_index.dst_offset(dt) > 0
 
-        return False
-
-    def get_full_saju(
+    def calculate_saju(
         self,
         year: int,
         month: int,
         day: int,
         hour: Optional[int] = None,
-        apply_timezone: bool = True
+        apply_timezone: bool = True,
+        minute: Optional[int] = None,
+        longitude: Optional[float] = None,
+        use_cache: bool = True
     ) -> Dict:
         """
-        완전한 사주팔자 계산
+        사주팔자 간지 계산 (문자열 변환 없이 Ganji로 반환)
+
+        시간대 보정 → 년/월/일주 → 진태양시 보정 → 시주 순으로 계산합니다.
+        진태양시 보정은 시주 판단에만 적용합니다.
+        같은 입력은 LRU 캐시에서 반환합니다 (호출자별로 복사본 반환).
 
         Args:
             year: 출생 양력 년
@@ -469,77 +456,238 @@ class LunarCalendar:
             day: 출생 양력 일
             hour: 출생 시간 (0-23, 없으면 시주 제외)
             apply_timezone: 한국 시간대 보정 적용 여부
+            minute: 출생 분 (없으면 0)
+            longitude: 출생지 경도 (있으면 시주에 진태양시 보정)
+            use_cache: LRU 캐시 사용 여부 (사전 계산 테이블 생성 시 False)
 
         Returns:
-            사주 정보 딕셔너리
+            year/month/day/hour 기둥 Ganji와 보정된 양력 날짜 딕셔너리
         """
-        # 시간대 보정
+        minute = minute or 0
+
+        # 사전 계산 테이블 (정시 입력, 시간 미입력은 보정과 무관)
+        if (self.saju_table is not None and minute == 0 and longitude is None
+                and (apply_timezone or hour is None)):
+            rec = self.saju_table.lookup(year, month, day, hour)
+            if rec is not None:
+                return self._saju_from_record(rec, year, month, day)
+
+        if not use_cache:
+            return self._compute_saju(year, month, day, hour, apply_timezone, minute, longitude)
+
+        key = (year, month, day, hour, minute, longitude, apply_timezone)
+        result = self.saju_cache.get(key)
+        if result is None:
+            result = self._compute_saju(year, month, day, hour, apply_timezone, minute, longitude)
+            self.saju_cache.put(key, result)
+
+        # 캐시 항목이 호출자 수정에 오염되지 않도록 날짜 딕셔너리 복사 (Ganji는 값 객체로 공유)
+        solar_date = dict(result['solar_date'])
+        if solar_date['true_solar_time'] is not None:
+            solar_date['true_solar_time'] = dict(solar_date['true_solar_time'])
+        return {**result, 'solar_date': solar_date}
+
+    def _compute_saju(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int],
+        apply_timezone: bool,
+        minute: int,
+        longitude: Optional[float]
+    ) -> Dict:
+        """calculate_saju 결과 딕셔너리 생성 (캐시 미스 시)"""
+        if hour is None:
+            minute = 0
+
+        # 시간대 보정 (서머타임 포함)
         if apply_timezone and hour is not None:
-            dt = datetime(year, month, day, hour)
+            dt = datetime(year, month, day, hour, minute)
             dt = self.apply_korea_timezone(dt)
-            year, month, day, hour = dt.year, dt.month, dt.day, dt.hour
+            year, month, day, hour, minute = dt.year, dt.month, dt.day, dt.hour, dt.minute
 
-        # 년주
-        year_stem, year_branch = self.calculate_year_pillar(year, month, day)
+        day_pillar = self.calculate_day_pillar(year, month, day)
 
-        # 월주
-        month_stem, month_branch = self.calculate_month_pillar(year, month, day)
-
-        # 일주
-        day_stem, day_branch = self.calculate_day_pillar(year, month, day)
-
-        # 시주
+        # 진태양시 보정 후 시주
         hour_pillar = None
+        true_solar_time = None
         if hour is not None:
-            hour_stem, hour_branch = self.calculate_hour_pillar(day_stem, hour)
-            hour_pillar = {
-                'stem': hour_stem,
-                'branch': hour_branch,
-                'stem_element': self.STEM_ELEMENTS[hour_stem],
-                'branch_element': self.BRANCH_ELEMENTS[hour_branch],
-                'full': f"{hour_stem}{hour_branch}"
-            }
-
-        # 음력 정보
-        lunar_info = self.solar_to_lunar(year, month, day)
-
-        # 년주 동물띠
-        year_branch_index = self.EARTHLY_BRANCHES.index(year_branch)
-        zodiac_animal = self.BRANCH_ANIMALS[year_branch_index]
+            solar_hour = hour
+            if longitude is not None:
+                solar_dt = to_true_solar_time(datetime(year, month, day, hour, minute), longitude)
+                solar_hour = solar_dt.hour
+                true_solar_time = {'hour': solar_dt.hour, 'minute': solar_dt.minute}
+            hour_pillar = self.calculate_hour_pillar(day_pillar.stem_index, solar_hour)
 
         return {
-            'year_pillar': {
-                'stem': year_stem,
-                'branch': year_branch,
-                'stem_element': self.STEM_ELEMENTS[year_stem],
-                'branch_element': self.BRANCH_ELEMENTS[year_branch],
-                'full': f"{year_stem}{year_branch}",
-                'animal': zodiac_animal
-            },
-            'month_pillar': {
-                'stem': month_stem,
-                'branch': month_branch,
-                'stem_element': self.STEM_ELEMENTS[month_stem],
-                'branch_element': self.BRANCH_ELEMENTS[month_branch],
-                'full': f"{month_stem}{month_branch}"
-            },
-            'day_pillar': {
-                'stem': day_stem,
-                'branch': day_branch,
-                'stem_element': self.STEM_ELEMENTS[day_stem],
-                'branch_element': self.BRANCH_ELEMENTS[day_branch],
-                'full': f"{day_stem}{day_branch}"
-            },
-            'hour_pillar': hour_pillar,
-            'lunar_date': lunar_info,
+            'year': self.calculate_year_pillar(year, month, day, hour or 0, minute),
+            'month': self.calculate_month_pillar(year, month, day, hour or 0, minute),
+            'day': day_pillar,
+            'hour': hour_pillar,
             'solar_date': {
                 'year': year,
                 'month': month,
                 'day': day,
-                'hour': hour
+                'hour': hour,
+                'minute': minute if hour is not None else None,
+                'true_solar_time': true_solar_time
             }
         }
 
+    def _saju_from_record(self, rec: Tuple, year: int, month: int, day: int) -> Dict:
+        """사전 계산 테이블 레코드를 calculate_saju 결과 형식으로 변환"""
+        solar = shifted_date(year, month, day, rec[saju_table.DAY_SHIFT])
+        hour_ganji = rec[saju_table.HOUR_GANJI]
+        corrected = rec[saju_table.CORRECTED_MINUTE]
+        has_time = corrected != saju_table.NO_TIME
+
+        return {
+            'year': Ganji(rec[saju_table.YEAR_GANJI]),
+            'month': Ganji(rec[saju_table.MONTH_GANJI]),
+            'day': Ganji(rec[saju_table.DAY_GANJI]),
+            'hour': Ganji(hour_ganji) if hour_ganji != saju_table.NO_HOUR else None,
+            'solar_date': {
+                'year': solar.year,
+                'month': solar.month,
+                'day': solar.day,
+                'hour': corrected // 60 if has_time else None,
+                'minute': corrected % 60 if has_time else None,
+                'true_solar_time': None
+            }
+        }
+
+    def get_full_saju(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int] = None,
+        apply_timezone: bool = True,
+        minute: Optional[int] = None,
+        longitude: Optional[float] = None
+    ) -> Dict:
+        """
+        완전한 사주팔자 계산
+
+        간지는 calculate_saju(LRU 캐시)로 구하고 문자열 딕셔너리와 음력 날짜를 덧붙입니다.
+
+        Args:
+            year: 출생 양력 년
+            month: 출생 양력 월
+            day: 출생 양력 일
+            hour: 출생 시간 (0-23, 없으면 시주 제외)
+            apply_timezone: 한국 시간대 보정 적용 여부
+            minute: 출생 분 (없으면 0)
+            longitude: 출생지 경도 (있으면 시주에 진태양시 보정)
+
+        Returns:
+            사주 정보 딕셔너리
+        """
+        saju = self.calculate_saju(year, month, day, hour, apply_timezone, minute, longitude)
+        solar_date = saju['solar_date']
+
+        # 년주 동물띠
+        year_pillar = saju['year'].to_dict()
+        year_pillar['animal'] = saju['year'].animal
+
+        return {
+            'year_pillar': year_pillar,
+            'month_pillar': saju['month'].to_dict(),
+            'day_pillar': saju['day'].to_dict(),
+            'hour_pillar': saju['hour'].to_dict() if saju['hour'] is not None else None,
+            'lunar_date': self.solar_to_lunar(solar_date['year'], solar_date['month'], solar_date['day']),
+            'solar_date': solar_date
+        }
+
+    def cache_stats(self) -> Dict:
+        """calculate_saju 캐시 통계 (적중/미스/축출, 사전 계산 테이블 사용 여부)"""
+        stats = self.saju_cache.stats()
+        stats['precomputed_table'] = self.saju_table is not None
+        return stats
+
+    def _get_range_arrays(self) -> Tuple:
+        """절입 시각 / 지지 오행 코드 NumPy 배열 (절입 배열은 복사 없이 공유)"""
+        if self._range_arrays is None:
+            self._range_arrays = (
+                np.frombuffer(self.solar_terms.instants, dtype=np.float64),
+                np.array(BRANCH_ELEMENT_CODES, dtype=np.uint8),
+                np.array([2, 4, 6, 8, 0], dtype=np.int64),  # 년간별 인월 천간 (병, 무, 경, 임, 갑)
+            )
+        return self._range_arrays
+
+    def ganji_range(self, start: date, end: date) -> Dict[str, 'np.ndarray']:
+        """
+        기간 내 모든 날짜의 간지/오행/음력 일괄 계산 (일진 달력용)
+
+        날짜마다 get_full_saju를 호출하는 대신 base_date 기준 일수 오프셋의
+        정수 연산과 절기 인덱스 searchsorted 한 번으로 기간 전체를 계산합니다.
+        년주/월주는 각 날짜 자정 기준입니다.
+
+        Args:
+            start: 시작 날짜
+            end: 종료 날짜 (포함)
+
+        Returns:
+            날짜 순서의 배열 딕셔너리
+            - date: datetime64[D]
+            - year_ganji, month_ganji, day_ganji: 60갑자 인덱스 (0=갑자)
+            - {year,month,day}_stem_element, {year,month,day}_branch_element:
+              ELEMENT_CODES 인덱스
+            - solar_term: 관할 절기 (SOLAR_TERMS 인덱스)
+            - term_starts: 당일 절입 여부
+            - lunar_year, lunar_month, lunar_day, is_leap_month: 음력 날짜
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("ganji_range에는 numpy가 필요합니다.")
+
+        start_ordinal, end_ordinal = start.toordinal(), end.toordinal()
+        if start_ordinal > end_ordinal:
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+        if (start_ordinal < ManseDayTable.START_DATE.toordinal()
+                or end_ordinal > ManseDayTable.END_DATE.toordinal()):
+            raise ValueError(
+                f"만세력 범위({ManseDayTable.START_DATE}~{ManseDayTable.END_DATE}) 밖의 기간입니다."
+            )
+
+        instants, branch_elements, month_stem_starts = self._get_range_arrays()
+        ordinals = np.arange(start_ordinal, end_ordinal + 1, dtype=np.int64)
+
+        # 일주: 기준일로부터의 일수 오프셋
+        base_ganji = ganji_index(self.base_stem_index, self.base_branch_index)
+        day_ganji = (base_ganji + ordinals - self.base_date.toordinal()) % 60
+
+        # 년주/월주: 자정 직전 절입 위치 (다음 날 자정과 다르면 당일 절입)
+        midnight = (ordinals - EPOCH_ORDINAL) * SECONDS_PER_DAY - self.solar_terms.utc_offset
+        pos = np.searchsorted(instants, midnight, side='right') - 1
+        next_pos = np.searchsorted(instants, midnight + SECONDS_PER_DAY, side='right') - 1
+
+        term = pos % TERMS_PER_YEAR
+        saju_year = self.solar_terms.start_year + pos // TERMS_PER_YEAR - (term < IPCHUN_INDEX)
+        year_ganji = (saju_year - 4) % 60
+
+        saju_month = (term // 2 - 1) % 12 + 1
+        month_stem = (month_stem_starts[year_ganji % 5] + saju_month - 1) % 10
+        month_ganji = ganji_index(month_stem, (saju_month + 1) % 12)
+
+        lunar_year, lunar_month, lunar_day, is_leap = lunar_conversion.solar_to_lunar_array(ordinals)
+
+        result = {
+            'date': (ordinals - EPOCH_ORDINAL).astype('datetime64[D]'),
+            'solar_term': term.astype(np.uint8),
+            'term_starts': next_pos != pos,
+            'lunar_year': lunar_year,
+            'lunar_month': lunar_month,
+            'lunar_day': lunar_day,
+            'is_leap_month': is_leap,
+        }
+        for name, ganji in (('year', year_ganji), ('month', month_ganji), ('day', day_ganji)):
+            ganji = ganji.astype(np.uint8)
+            result[f'{name}_ganji'] = ganji
+            result[f'{name}_stem_element'] = ganji % 10 // 2
+            result[f'{name}_branch_element'] = branch_elements[ganji % 12]
+        return result
+
     def get_element_summary(self, saju: Dict) -> Dict[str, int]:
         """
         오행 분포 계산
@@ -572,8 +720,14 @@ _lunar_calendar_instance = None
 
 
 def get_lunar_calendar() -> LunarCalendar:
-    """만세력 싱글톤 인스턴스 반환"""
+    """
+    만세력 싱글톤 인스턴스 반환
+
+    환경 변수 SAJU_PRECOMPUTE_TABLE=1이면 전체 사전 계산 테이블을 사용합니다.
+    """
     global _lunar_calendar_instance
     if _lunar_calendar_instance is None:
-        _lunar_calendar_instance = LunarCalendar()
+        _lunar_calendar_instance = LunarCalendar(
+            use_saju_table=os.environ.get("SAJU_PRECOMPUTE_TABLE", "") == "1"
+        )
     return _lunar_calendar_instance
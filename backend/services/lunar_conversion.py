@@ -0,0 +1,179 @@
+"""
+음양력 변환 엔진
+1899-2100 음력 연도별 월 대소/윤달 정보를 압축한 내장 테이블과 누적 일수
+bisect로 외부 라이브러리 없이 양력↔음력을 변환
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# 음력 연도 정보 (1899-2100)
+# bit 16: 윤달 대소 (1=30일), bit 15-4: 1-12월 대소 (1=30일), bit 3-0: 윤달 (0=없음)
+# 1900-2099는 lunardate 테이블, 1899/2100은 천문 계산(삭·중기, UTC+8)으로 보충
+LUNAR_YEAR_INFOS = (
+    0x0ab50, 0x04bd8, 0x04ae0, 0x0a570, 0x054d5, 0x0d260, 0x0d950, 0x16554, 0x056a0, 0x09ad0,  # 1899-1908
+    0x055d2, 0x04ae0, 0x0a5b6, 0x0a4d0, 0x0d250, 0x1d255, 0x0b540, 0x0d6a0, 0x0ada2, 0x095b0,  # 1909-1918
+    0x14977, 0x04970, 0x0a4b0, 0x0b4b5, 0x06a50, 0x06d40, 0x1ab54, 0x02b60, 0x09570, 0x052f2,  # 1919-1928
+    0x04970, 0x06566, 0x0d4a0, 0x0ea50, 0x06e95, 0x05ad0, 0x02b60, 0x186e3, 0x092e0, 0x1c8d7,  # 1929-1938
+    0x0c950, 0x0d4a0, 0x1d8a6, 0x0b550, 0x056a0, 0x1a5b4, 0x025d0, 0x092d0, 0x0d2b2, 0x0a950,  # 1939-1948
+    0x0b557, 0x06ca0, 0x0b550, 0x15355, 0x04da0, 0x0a5d0, 0x14573, 0x052b0, 0x0a9a8, 0x0e950,  # 1949-1958
+    0x06aa0, 0x0aea6, 0x0ab50, 0x04b60, 0x0aae4, 0x0a570, 0x05260, 0x0f263, 0x0d950, 0x05b57,  # 1959-1968
+    0x056a0, 0x096d0, 0x04dd5, 0x04ad0, 0x0a4d0, 0x0d4d4, 0x0d250, 0x0d558, 0x0b540, 0x0b5a0,  # 1969-1978
+    0x195a6, 0x095b0, 0x049b0, 0x0a974, 0x0a4b0, 0x0b27a, 0x06a50, 0x06d40, 0x0af46, 0x0ab60,  # 1979-1988
+    0x09570, 0x04af5, 0x04970, 0x064b0, 0x074a3, 0x0ea50, 0x06b58, 0x05ac0, 0x0ab60, 0x096d5,  # 1989-1998
+    0x092e0, 0x0c960, 0x0d954, 0x0d4a0, 0x0da50, 0x07552, 0x056a0, 0x0abb7, 0x025d0, 0x092d0,  # 1999-2008
+    0x0cab5, 0x0a950, 0x0b4a0, 0x0baa4, 0x0ad50, 0x055d9, 0x04ba0, 0x0a5b0, 0x15176, 0x052b0,  # 2009-2018
+    0x0a930, 0x07954, 0x06aa0, 0x0ad50, 0x05b52, 0x04b60, 0x0a6e6, 0x0a4e0, 0x0d260, 0x0ea65,  # 2019-2028
+    0x0d530, 0x05aa0, 0x076a3, 0x096d0, 0x04afb, 0x04ad0, 0x0a4d0, 0x1d0b6, 0x0d250, 0x0d520,  # 2029-2038
+    0x0dd45, 0x0b5a0, 0x056d0, 0x055b2, 0x049b0, 0x0a577, 0x0a4b0, 0x0aa50, 0x1b255, 0x06d20,  # 2039-2048
+    0x0ada0, 0x14b63, 0x09370, 0x049f8, 0x04970, 0x064b0, 0x168a6, 0x0ea50, 0x06aa0, 0x1a6c4,  # 2049-2058
+    0x0aae0, 0x092e0, 0x0d2e3, 0x0c960, 0x0d557, 0x0d4a0, 0x0da50, 0x05d55, 0x056a0, 0x0a6d0,  # 2059-2068
+    0x055d4, 0x052d0, 0x0a9b8, 0x0a950, 0x0b4a0, 0x0b6a6, 0x0ad50, 0x055a0, 0x0aba4, 0x0a5b0,  # 2069-2078
+    0x052b0, 0x0b273, 0x06930, 0x07337, 0x06aa0, 0x0ad50, 0x14b55, 0x04b60, 0x0a570, 0x054e4,  # 2079-2088
+    0x0d160, 0x0e968, 0x0d520, 0x0daa0, 0x16aa6, 0x056d0, 0x04ae0, 0x0a9d4, 0x0a2d0, 0x0d150,  # 2089-2098
+    0x0f252, 0x0d520,  # 2099-2100
+)
+
+LUNAR_START_YEAR = 1899
+LUNAR_END_YEAR = LUNAR_START_YEAR + len(LUNAR_YEAR_INFOS) - 1
+
+# 음력 1899년 1월 1일
+LUNAR_START_DATE = date(1899, 2, 10)
+_START_ORDINAL = LUNAR_START_DATE.toordinal()
+
+
+def leap_month_for_year(year: int) -> Optional[int]:
+    """해당 음력 연도의 윤달 (없으면 None)"""
+    if not LUNAR_START_YEAR <= year <= LUNAR_END_YEAR:
+        raise ValueError(f"음력 연도 범위({LUNAR_START_YEAR}-{LUNAR_END_YEAR}) 밖입니다: {year}")
+    return LUNAR_YEAR_INFOS[year - LUNAR_START_YEAR] % 16 or None
+
+
+def _iter_months(year_info: int):
+    """(월, 윤달 여부, 일수) 순회"""
+    leap_month = year_info % 16
+    for month in range(1, 13):
+        yield month, False, 29 + ((year_info >> (16 - month)) & 1)
+        if month == leap_month:
+            yield month, True, 29 + ((year_info >> 16) & 1)
+
+
+def _build_month_index():
+    """모든 음력 월의 시작 일수 오프셋과 (년, 월, 윤달, 일수) 인덱스 생성"""
+    starts = array('i')
+    months = []
+    lookup: Dict[Tuple[int, int, bool], Tuple[int, int]] = {}
+
+    offset = 0
+    for i, year_info in enumerate(LUNAR_YEAR_INFOS):
+        year = LUNAR_START_YEAR + i
+        for month, is_leap, days in _iter_months(year_info):
+            starts.append(offset)
+            months.append((year, month, is_leap))
+            lookup[(year, month, is_leap)] = (offset, days)
+            offset += days
+
+    starts.append(offset)  # 범위 끝 (음력 2101년 1월 1일)
+    return starts, tuple(months), lookup
+
+
+_MONTH_STARTS, _MONTHS, _MONTH_LOOKUP = _build_month_index()
+_TOTAL_DAYS = _MONTH_STARTS[-1]
+
+# 변환 가능한 양력 범위
+SOLAR_START_DATE = LUNAR_START_DATE
+SOLAR_END_DATE = date.fromordinal(_START_ORDINAL + _TOTAL_DAYS - 1)
+
+
+def solar_to_lunar(year: int, month: int, day: int) -> Tuple[int, int, int, bool]:
+    """
+    양력을 음력으로 변환
+
+    Args:
+        year: 양력 년
+        month: 양력 월
+        day: 양력 일
+
+    Returns:
+        (음력 년, 음력 월, 음력 일, 윤달 여부) 튜플
+    """
+    offset = date(year, month, day).toordinal() - _START_ORDINAL
+    if not 0 <= offset < _TOTAL_DAYS:
+        raise ValueError(f"변환 가능한 양력 범위({SOLAR_START_DATE}~{SOLAR_END_DATE}) 밖입니다.")
+
+    index = bisect_right(_MONTH_STARTS, offset) - 1
+    lunar_year, lunar_month, is_leap = _MONTHS[index]
+    return lunar_year, lunar_month, offset - _MONTH_STARTS[index] + 1, is_leap
+
+
+def lunar_to_solar(year: int, month: int, day: int, is_leap: bool = False) -> date:
+    """
+    음력을 양력으로 변환
+
+    Args:
+        year: 음력 년
+        month: 음력 월
+        day: 음력 일
+        is_leap: 윤달 여부
+
+    Returns:
+        양력 date
+    """
+    entry = _MONTH_LOOKUP.get((year, month, bool(is_leap)))
+    if entry is None:
+        if not LUNAR_START_YEAR <= year <= LUNAR_END_YEAR:
+            raise ValueError(f"음력 연도 범위({LUNAR_START_YEAR}-{LUNAR_END_YEAR}) 밖입니다: {year}")
+        if is_leap:
+            raise ValueError(f"음력 {year}년에는 윤{month}월이 없습니다.")
+        raise ValueError(f"잘못된 음력 월입니다: {month}")
+
+    start, days = entry
+    if not 1 <= day <= days:
+        raise ValueError(f"음력 {year}년 {'윤' if is_leap else ''}{month}월은 {days}일까지입니다.")
+
+    return date.fromordinal(_START_ORDINAL + start + day - 1)
+
+
+# 일괄 변환용 NumPy 인덱스 (최초 사용 시 생성)
+_month_arrays = None
+
+
+def solar_to_lunar_array(ordinals) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    양력 날짜 배열을 음력으로 일괄 변환 (searchsorted 1회)
+
+    Args:
+        ordinals: date.toordinal() 값 배열
+
+    Returns:
+        (음력 년, 음력 월, 음력 일, 윤달 여부) 배열 튜플
+    """
+    global _month_arrays
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("일괄 음력 변환에는 numpy가 필요합니다.")
+
+    offsets = np.asarray(ordinals, dtype=np.int64) - _START_ORDINAL
+    if offsets.size and (offsets.min() < 0 or offsets.max() >= _TOTAL_DAYS):
+        raise ValueError(f"변환 가능한 양력 범위({SOLAR_START_DATE}~{SOLAR_END_DATE}) 밖입니다.")
+
+    if _month_arrays is None:
+        _month_arrays = (
+            np.frombuffer(_MONTH_STARTS, dtype=np.intc).astype(np.int64),
+            np.array([m[0] for m in _MONTHS], dtype=np.uint16),
+            np.array([m[1] for m in _MONTHS], dtype=np.uint8),
+            np.array([m[2] for m in _MONTHS], dtype=bool),
+        )
+    starts, years, months, leaps = _month_arrays
+
+    index = np.searchsorted(starts, offsets, side='right') - 1
+    days = (offsets - starts[index] + 1).astype(np.uint8)
+    return years[index], months[index], days, leaps[index]
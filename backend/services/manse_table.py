@@ -0,0 +1,237 @@
+"""
+만세력 일별 테이블 (萬歲曆 日辰表)
+1900-2100년 모든 양력 날짜에 대해 년/월/일 간지, 음력 날짜, 윤달 여부,
+관할 절기를 고정 폭 레코드로 보관하는 메모리 매핑 바이너리 테이블
+
+파일이 없으면 최초 로드 시 생성하며, 모든 워커 프로세스가 같은 페이지를
+공유합니다.
+
+    python services/manse_table.py build    # 테이블 재생성
+"""
+
+from datetime import date
+from typing import Optional, Tuple
+import math
+import mmap
+import struct
+import zlib
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.solar_terms import (
+    DATA_DIR, EPOCH_ORDINAL, SECONDS_PER_DAY, SolarTermTable, get_solar_term_table
+)
+
+
+MANSE_DAYS_PATH = os.path.join(DATA_DIR, 'manse_days.bin')
+
+# 파일 헤더: magic, version, flags, 시작 ordinal, 레코드 수, 절기 테이블 CRC32
+_HEADER = struct.Struct('<4sHHiiI')
+_MAGIC = b'MSDY'
+_VERSION = 2
+
+# 헤더 플래그
+FLAG_LUNAR = 0x01  # 음력 필드 유효
+
+# 레코드: 년간지, 월간지, 일간지 (0-59), 음력 년/월/일 (변환 불가 시 0), 윤달,
+#         관할 절기 (0-23), 당일 절입 시각 (자정 기준 분, 없으면 NO_TERM_CHANGE)
+RECORD = struct.Struct('<BBBHBBBBH')
+NO_TERM_CHANGE = 0xFFFF
+
+# 레코드 필드 인덱스
+YEAR_GANJI, MONTH_GANJI, DAY_GANJI = 0, 1, 2
+LUNAR_YEAR, LUNAR_MONTH, LUNAR_DAY, IS_LEAP = 3, 4, 5, 6
+SOLAR_TERM, TERM_CHANGE_MINUTE = 7, 8
+
+
+def solar_terms_checksum(solar_terms: SolarTermTable) -> int:
+    """테이블 생성에 사용한 절기 인덱스 식별용 CRC32"""
+    return zlib.crc32(solar_terms.instants) & 0xFFFFFFFF
+
+
+class ManseDayTable:
+    """만세력 일별 레코드 테이블"""
+
+    START_DATE = date(1900, 1, 1)
+    END_DATE = date(2100, 12, 31)
+
+    def __init__(self, buffer, start_ordinal: int, count: int, flags: int, checksum: int):
+        """
+        Args:
+            buffer: 헤더를 포함한 테이블 버퍼 (mmap 또는 bytes)
+            start_ordinal: 첫 레코드의 date.toordinal()
+            count: 레코드 수
+            flags: 헤더 플래그
+            checksum: 생성 시 절기 인덱스 CRC32
+        """
+        self.buffer = buffer
+        self.start_ordinal = start_ordinal
+        self.count = count
+        self.flags = flags
+        self.checksum = checksum
+        self.has_lunar = bool(flags & FLAG_LUNAR)
+
+    @classmethod
+    def from_buffer(cls, buffer) -> 'ManseDayTable':
+        """헤더를 검증하고 버퍼를 테이블로 래핑"""
+        magic, version, flags, start_ordinal, count, checksum = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("지원하지 않는 만세력 테이블 형식입니다.")
+        if len(buffer) != _HEADER.size + count * RECORD.size:
+            raise ValueError("만세력 테이블 크기가 올바르지 않습니다.")
+        return cls(buffer, start_ordinal, count, flags, checksum)
+
+    @classmethod
+    def load(cls, path: str = MANSE_DAYS_PATH) -> 'ManseDayTable':
+        """테이블 파일을 읽기 전용으로 메모리 매핑"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def record(self, ordinal: int) -> Optional[Tuple]:
+        """
+        date.toordinal() 값에 해당하는 레코드 반환
+
+        Returns:
+            레코드 튜플 (범위 밖이면 None)
+        """
+        index = ordinal - self.start_ordinal
+        if 0 <= index < self.count:
+            return RECORD.unpack_from(self.buffer, _HEADER.size + index * RECORD.size)
+        return None
+
+    def record_at(self, year: int, month: int, day: int, minute_of_day: int = 0) -> Optional[Tuple]:
+        """
+        특정 시각에 유효한 레코드 반환
+
+        당일 절입 시각 이후라면 년/월 간지와 관할 절기는 절입 후 값이 담긴
+        다음 날 레코드에서 가져옵니다.
+        """
+        ordinal = date(year, month, day).toordinal()
+        rec = self.record(ordinal)
+        if rec is not None and minute_of_day >= rec[TERM_CHANGE_MINUTE]:
+            after = self.record(ordinal + 1)
+            if after is not None:
+                return (after[YEAR_GANJI], after[MONTH_GANJI]) + rec[DAY_GANJI:SOLAR_TERM] + after[SOLAR_TERM:]
+        return rec
+
+
+def build_day_table(calendar, solar_terms: Optional[SolarTermTable] = None) -> bytes:
+    """
+    만세력 일별 테이블 생성
+
+    Args:
+        calendar: 테이블을 사용하지 않는 LunarCalendar 인스턴스 (계산 경로)
+        solar_terms: 절기 인덱스 (기본: 싱글톤)
+
+    Returns:
+        헤더를 포함한 테이블 바이트열
+    """
+    solar_terms = solar_terms or get_solar_term_table()
+    start = ManseDayTable.START_DATE.toordinal()
+    end = ManseDayTable.END_DATE.toordinal()
+    count = end - start + 1
+
+    out = bytearray(_HEADER.size + count * RECORD.size)
+    has_lunar = True
+
+    for index in range(count):
+        d = date.fromordinal(start + index)
+        y, m, dd = d.year, d.month, d.day
+
+        pos = calendar._locate_solar_term(y, m, dd)
+        next_term_seconds = solar_terms.instants[pos + 1] + solar_terms.utc_offset
+        midnight = (start + index - EPOCH_ORDINAL) * SECONDS_PER_DAY
+        if next_term_seconds < midnight + SECONDS_PER_DAY:
+            change_minute = math.ceil((next_term_seconds - midnight) / 60)
+        else:
+            change_minute = NO_TERM_CHANGE
+
+        # 음력 변환 범위 밖 날짜는 음력 년 0으로 기록
+        lunar = calendar.solar_to_lunar(y, m, dd)
+        if lunar.get('available'):
+            lunar_fields = (lunar['lunar_year'], lunar['lunar_month'], lunar['lunar_day'],
+                            int(lunar['is_leap_month']))
+        else:
+            has_lunar = False
+            lunar_fields = (0, 0, 0, 0)
+
+        RECORD.pack_into(
+            out, _HEADER.size + index * RECORD.size,
+            calendar.calculate_year_pillar(y, m, dd).index,
+            calendar.calculate_month_pillar(y, m, dd).index,
+            calendar.calculate_day_pillar(y, m, dd).index,
+            *lunar_fields,
+            solar_terms.term_index(pos),
+            change_minute
+        )
+
+    flags = FLAG_LUNAR if has_lunar else 0
+    _HEADER.pack_into(out, 0, _MAGIC, _VERSION, flags, start, count, solar_terms_checksum(solar_terms))
+    return bytes(out)
+
+
+def write_day_table(data: bytes, path: str = MANSE_DAYS_PATH):
+    """테이블을 원자적으로 파일에 기록 (동시 기동한 워커 간 경합 방지)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# 싱글톤 인스턴스
+_manse_table_instance = None
+
+
+def get_manse_table(path: str = MANSE_DAYS_PATH) -> ManseDayTable:
+    """
+    만세력 일별 테이블 싱글톤 인스턴스 반환
+
+    파일이 없거나 현재 절기 인덱스와 맞지 않으면 새로 생성하여 저장하고,
+    저장할 수 없는 환경에서는 메모리에 보관합니다.
+    """
+    global _manse_table_instance
+    if _manse_table_instance is not None:
+        return _manse_table_instance
+
+    from services.lunar_calendar import LunarCalendar
+
+    checksum = solar_terms_checksum(get_solar_term_table())
+    try:
+        table = ManseDayTable.load(path)
+        if table.checksum == checksum and table.has_lunar:
+            _manse_table_instance = table
+            return table
+    except (OSError, ValueError, struct.error):
+        pass
+
+    data = build_day_table(LunarCalendar(use_day_table=False))
+    try:
+        write_day_table(data, path)
+        _manse_table_instance = ManseDayTable.load(path)
+    except OSError:
+        _manse_table_instance = ManseDayTable.from_buffer(data)
+    return _manse_table_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="만세력 일별 테이블 생성")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', default=MANSE_DAYS_PATH)
+    args = parser.parse_args()
+
+    from services.lunar_calendar import LunarCalendar
+
+    data = build_day_table(LunarCalendar(use_day_table=False))
+    write_day_table(data, args.output)
+    table = ManseDayTable.from_buffer(data)
+    print(f"{table.count} days ({ManseDayTable.START_DATE}-{ManseDayTable.END_DATE}) -> {args.output}")
@@ -0,0 +1,345 @@
+"""
+행성 입궁(ingress) · 정류(station) 테이블
+1900-2100년 각 행성의 별자리 입궁 시각과 순행/역행 전환(정류) 시각을 행성별
+정렬 배열로 보관하고, "지금 토성은 어느 별자리인가", "수성이 역행 중인가"를
+calc_ut 없이 bisect 한 번으로 답합니다.
+
+테이블(data/planet_events.bin)은 Swiss Ephemeris 황경의 30도 경계 통과와
+황경 속도의 부호 변화를 격자에서 찾고 근을 구해 오프라인으로 생성한
+산출물이며 메모리 매핑하여 사용합니다. 천체력 파일이 없어 계산할 수 없는
+천체(예: seas_18.se1 없는 키론)는 건너뛰며, 조회 측은 covers()로 확인 후
+calc_ut로 폴백합니다.
+
+    python services/planet_events.py build    # 테이블 재생성
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+import mmap
+import struct
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.solar_terms import DATA_DIR
+
+
+PLANET_EVENTS_PATH = os.path.join(DATA_DIR, 'planet_events.bin')
+
+# 1900-01-01 00:00 UT ~ 2101-01-01 00:00 UT
+START_JD = 2415020.5
+END_JD = 2488434.5
+
+# 행성별 탐색 격자 간격 (일) - 한 칸 사이에 경계 2개나 정류 2번이 생기지 않도록
+GRID_STEP_DAYS = {
+    'moon': 0.25,
+    'north_node': 0.25,
+    'mercury': 0.5,
+}
+DEFAULT_GRID_STEP_DAYS = 1.0
+
+# 근 정밀도 (일, 약 0.1초)
+ROOT_TOLERANCE_DAYS = 1e-6
+MAX_ROOT_ITERATIONS = 60
+
+# 파일 헤더: magic, version, 행성 수, 시작/종료 JD
+_HEADER = struct.Struct('<4sHHdd')
+_MAGIC = b'PEVT'
+_VERSION = 1
+
+# 행성 디렉터리: 이름, 입궁 시작 위치/개수, 정류 시작 위치/개수, 시작 시점 별자리/역행 여부
+_DIRECTORY = struct.Struct('<16sIIIIBB6x')
+
+
+class PlanetEventTable:
+    """
+    행성별 입궁/정류 시각 인덱스
+
+    입궁 배열은 (시각, 들어간 별자리 인덱스), 정류 배열은 (시각, 정류 후 역행 여부)
+    이며 각 행성 구간은 시간순으로 정렬되어 있습니다. 테이블 시작 시점의
+    별자리/역행 여부는 디렉터리에 따로 보관합니다.
+    """
+
+    def __init__(self, buffer, start_jd: float, end_jd: float, directory: dict):
+        """
+        Args:
+            buffer: 헤더를 포함한 테이블 버퍼 (mmap 또는 bytes)
+            start_jd: 테이블 시작 Julian Day (UT)
+            end_jd: 테이블 종료 Julian Day (UT)
+            directory: 행성별 (입궁 위치, 입궁 수, 정류 위치, 정류 수, 시작 별자리, 시작 역행)
+        """
+        self.buffer = buffer
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.directory = directory
+        self.planets = tuple(directory)
+
+        ingress_total = sum(entry[1] for entry in directory.values())
+        station_total = sum(entry[3] for entry in directory.values())
+        offset = _HEADER.size + len(directory) * _DIRECTORY.size
+        float_end = offset + (ingress_total + station_total) * 8
+
+        if sys.byteorder == 'little':
+            jds = memoryview(buffer)[offset:float_end].cast('d')
+        else:
+            jds = array('d', bytes(buffer[offset:float_end]))
+            jds.byteswap()
+        flags = memoryview(buffer)[float_end:float_end + ingress_total + station_total]
+
+        self._ingress_jd = jds[:ingress_total]
+        self._station_jd = jds[ingress_total:]
+        self._ingress_sign = flags[:ingress_total]
+        self._station_retrograde = flags[ingress_total:]
+
+        # 행성별 슬라이스 (bisect 대상)
+        self._slices = {
+            planet: (
+                self._ingress_jd[i_off:i_off + i_count],
+                self._ingress_sign[i_off:i_off + i_count],
+                self._station_jd[s_off:s_off + s_count],
+                self._station_retrograde[s_off:s_off + s_count],
+            )
+            for planet, (i_off, i_count, s_off, s_count, _, _) in directory.items()
+        }
+
+    @classmethod
+    def from_buffer(cls, buffer) -> 'PlanetEventTable':
+        """헤더와 디렉터리를 검증하고 버퍼를 래핑"""
+        magic, version, planet_count, start_jd, end_jd = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("지원하지 않는 입궁/정류 테이블 형식입니다.")
+
+        directory = {}
+        ingress_total = station_total = 0
+        for i in range(planet_count):
+            name, i_off, i_count, s_off, s_count, sign, retrograde = _DIRECTORY.unpack_from(
+                buffer, _HEADER.size + i * _DIRECTORY.size
+            )
+            directory[name.rstrip(b'\0').decode('ascii')] = (
+                i_off, i_count, s_off, s_count, sign, retrograde
+            )
+            ingress_total += i_count
+            station_total += s_count
+
+        expected = (_HEADER.size + planet_count * _DIRECTORY.size
+                    + (ingress_total + station_total) * 9)
+        if len(buffer) != expected:
+            raise ValueError("입궁/정류 테이블 크기가 올바르지 않습니다.")
+        return cls(buffer, start_jd, end_jd, directory)
+
+    @classmethod
+    def load(cls, path: str = PLANET_EVENTS_PATH) -> 'PlanetEventTable':
+        """테이블 파일을 읽기 전용으로 메모리 매핑"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def covers(self, planet: str, jd: float) -> bool:
+        """해당 행성/시각이 테이블 범위 안인지 여부"""
+        return planet in self._slices and self.start_jd <= jd < self.end_jd
+
+    def _check(self, planet: str, jd: float):
+        if not self.covers(planet, jd):
+            raise ValueError(f"입궁/정류 테이블 범위 밖입니다: {planet}, JD {jd}")
+
+    def sign_index(self, planet: str, jd: float) -> int:
+        """해당 시각 행성의 별자리 인덱스 (0=aries)"""
+        self._check(planet, jd)
+        ingress_jd, ingress_sign, _, _ = self._slices[planet]
+        pos = bisect_right(ingress_jd, jd) - 1
+        return ingress_sign[pos] if pos >= 0 else self.directory[planet][4]
+
+    def is_retrograde(self, planet: str, jd: float) -> bool:
+        """해당 시각 행성의 역행 여부"""
+        self._check(planet, jd)
+        _, _, station_jd, station_retrograde = self._slices[planet]
+        pos = bisect_right(station_jd, jd) - 1
+        return bool(station_retrograde[pos] if pos >= 0 else self.directory[planet][5])
+
+    def ingresses(self, planet: str, start_jd: float, end_jd: float) -> List[Tuple[float, int]]:
+        """기간 [start_jd, end_jd) 의 (입궁 시각, 들어간 별자리 인덱스) 목록"""
+        ingress_jd, ingress_sign, _, _ = self._slices[planet]
+        lo, hi = bisect_left(ingress_jd, start_jd), bisect_left(ingress_jd, end_jd)
+        return [(ingress_jd[i], ingress_sign[i]) for i in range(lo, hi)]
+
+    def stations(self, planet: str, start_jd: float, end_jd: float) -> List[Tuple[float, bool]]:
+        """기간 [start_jd, end_jd) 의 (정류 시각, 정류 후 역행 여부) 목록"""
+        _, _, station_jd, station_retrograde = self._slices[planet]
+        lo, hi = bisect_left(station_jd, start_jd), bisect_left(station_jd, end_jd)
+        return [(station_jd[i], bool(station_retrograde[i])) for i in range(lo, hi)]
+
+    def retrograde_periods(
+        self, planet: str, start_jd: float, end_jd: float
+    ) -> List[Tuple[Optional[float], Optional[float]]]:
+        """
+        기간과 겹치는 역행 구간 (역행 정류 시각, 순행 정류 시각) 목록
+
+        테이블 범위 밖에서 시작하거나 끝나는 구간의 경계는 None입니다.
+        """
+        _, _, station_jd, station_retrograde = self._slices[planet]
+
+        # 기간 시작 시점의 상태 (역행 중이면 직전 역행 정류부터)
+        pos = bisect_right(station_jd, start_jd) - 1
+        retrograde = station_retrograde[pos] if pos >= 0 else self.directory[planet][5]
+        period_start = station_jd[pos] if retrograde and pos >= 0 else None
+
+        periods = []
+        for i in range(pos + 1, len(station_jd)):
+            if station_retrograde[i]:
+                if station_jd[i] >= end_jd:
+                    break
+                retrograde, period_start = True, station_jd[i]
+            elif retrograde:
+                periods.append((period_start, station_jd[i]))
+                retrograde = False
+        if retrograde:
+            periods.append((period_start, None))
+        return periods
+
+
+def _wrap180(x: float) -> float:
+    """[-180, 180) 범위로 정규화"""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def _find_root(fn, lo: float, hi: float, f_lo: float) -> float:
+    """구간 [lo, hi]에서 부호가 바뀌는 fn의 근 (Illinois 가위치법)"""
+    f_hi = fn(hi)
+    side = 0
+    t = lo
+    for _ in range(MAX_ROOT_ITERATIONS):
+        t = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+        f = fn(t)
+        if (f < 0) == (f_lo < 0):
+            lo, f_lo = t, f
+            if side == -1:
+                f_hi *= 0.5
+            side = -1
+        else:
+            hi, f_hi = t, f
+            if side == 1:
+                f_lo *= 0.5
+            side = 1
+        if hi - lo < ROOT_TOLERANCE_DAYS:
+            break
+    return t
+
+
+def build_planet_events(start_jd: float = START_JD, end_jd: float = END_JD) -> bytes:
+    """
+    Swiss Ephemeris로 입궁/정류 테이블 생성 (오프라인 1회 실행)
+
+    Returns:
+        헤더를 포함한 테이블 바이트열
+    """
+    from services.swiss_ephemeris import SwissEphemeris, SWISSEPH_AVAILABLE
+    if not SWISSEPH_AVAILABLE:
+        raise RuntimeError("입궁/정류 테이블 생성에는 pyswisseph가 필요합니다.")
+    import swisseph as swe
+
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    entries = []
+    for planet, code in SwissEphemeris.PLANETS.items():
+        def calc(jd, code=code):
+            return swe.calc_ut(jd, code, flags)[0]
+
+        try:
+            calc(start_jd)
+        except swe.Error as e:
+            print(f"Skipping {planet}: {e}")
+            continue
+
+        step = GRID_STEP_DAYS.get(planet, DEFAULT_GRID_STEP_DAYS)
+        count = int((end_jd - start_jd) / step) + 1
+        grid = [start_jd + i * step for i in range(count)] + [end_jd]
+        values = [calc(jd) for jd in grid]
+
+        ingresses, stations = [], []
+        for (t0, v0), (t1, v1) in zip(zip(grid, values), zip(grid[1:], values[1:])):
+            sign0, sign1 = int(v0[0] // 30) % 12, int(v1[0] // 30) % 12
+            if sign0 != sign1:
+                # 순행이면 들어간 별자리의 시작, 역행이면 떠난 별자리의 시작이 경계
+                delta = (sign1 - sign0) % 12
+                if delta not in (1, 11):
+                    raise ValueError(f"{planet}: 격자 한 칸에 별자리 경계가 여러 개입니다 (JD {t0}).")
+                boundary = (sign1 if delta == 1 else sign0) * 30.0
+                jd = _find_root(
+                    lambda t: _wrap180(calc(t)[0] - boundary), t0, t1, _wrap180(v0[0] - boundary)
+                )
+                ingresses.append((jd, sign1))
+            if (v0[3] < 0) != (v1[3] < 0):
+                jd = _find_root(lambda t: calc(t)[3], t0, t1, v0[3])
+                stations.append((jd, v1[3] < 0))
+
+        initial = values[0]
+        entries.append((planet, ingresses, stations, int(initial[0] // 30) % 12, initial[3] < 0))
+
+    directory = bytearray()
+    ingress_jd, station_jd = array('d'), array('d')
+    ingress_sign, station_retrograde = bytearray(), bytearray()
+    for planet, ingresses, stations, sign, retrograde in entries:
+        directory += _DIRECTORY.pack(
+            planet.encode('ascii'), len(ingress_jd), len(ingresses),
+            len(station_jd), len(stations), sign, retrograde
+        )
+        ingress_jd.extend(jd for jd, _ in ingresses)
+        ingress_sign.extend(s for _, s in ingresses)
+        station_jd.extend(jd for jd, _ in stations)
+        station_retrograde.extend(r for _, r in stations)
+
+    jds = ingress_jd + station_jd
+    if sys.byteorder != 'little':
+        jds.byteswap()
+    header = _HEADER.pack(_MAGIC, _VERSION, len(entries), start_jd, end_jd)
+    return header + bytes(directory) + jds.tobytes() + bytes(ingress_sign + station_retrograde)
+
+
+def write_planet_events(data: bytes, path: str = PLANET_EVENTS_PATH):
+    """테이블을 원자적으로 파일에 기록"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+# 싱글톤 인스턴스
+_planet_events_instance = None
+_planet_events_loaded = False
+
+
+def get_planet_event_table(path: str = PLANET_EVENTS_PATH) -> Optional[PlanetEventTable]:
+    """
+    입궁/정류 테이블 싱글톤 인스턴스 반환
+
+    테이블 파일이 없거나 읽을 수 없으면 None을 반환합니다 (최초 호출 시 1회 시도).
+    """
+    global _planet_events_instance, _planet_events_loaded
+    if not _planet_events_loaded:
+        try:
+            _planet_events_instance = PlanetEventTable.load(path)
+        except (OSError, ValueError, struct.error):
+            _planet_events_instance = None
+        _planet_events_loaded = True
+    return _planet_events_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="행성 입궁/정류 테이블 생성")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', default=PLANET_EVENTS_PATH)
+    args = parser.parse_args()
+
+    data = build_planet_events()
+    write_planet_events(data, args.output)
+    table = PlanetEventTable.from_buffer(data)
+    print(f"{len(table.planets)} planets, {len(table._ingress_jd)} ingresses, "
+          f"{len(table._station_jd)} stations, {len(data)} bytes -> {args.output}")
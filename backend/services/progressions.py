@@ -0,0 +1,131 @@
+"""
+2차 진행법 (Secondary Progressions) - 하루 = 1년
+
+나이 a(년)의 진행 차트는 출생 시각 + a일의 행성 위치입니다.
+나이 격자 전체의 진행 시각을 배열로 만들어 get_positions_bulk 한 번으로 위치를 구하고,
+진행 행성 × 출생 행성 아스펙트도 시각 축으로 묶은 find_aspects 한 번으로 찾습니다.
+
+진행 MC는 태양호(solar arc = 진행 태양 - 출생 태양)만큼 출생 MC를 옮긴 값이고,
+진행 ASC/커스프는 진행 MC와 출생 위도로 계산합니다.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.aspect_engine import MAJOR_ASPECTS, OrbTable, find_aspects
+from services.swiss_ephemeris import MAJOR_PLANETS, EphemerisMode, SwissEphemeris, get_ephemeris
+
+
+# 회귀년 길이 (일) - 나이(년) <-> 경과 일수 변환
+TROPICAL_YEAR_DAYS = 365.242199
+
+# 진행 아스펙트 오브 (진행 행성은 하루 1도 미만으로 움직이므로 1도)
+PROGRESSION_ORB_TABLE = OrbTable(aspect_orbs={name: 1.0 for name in MAJOR_ASPECTS})
+
+
+def progressed_julian_days(birth_jd: float, ages: Sequence[float]) -> 'np.ndarray':
+    """나이(년) 배열 -> 진행 차트 시각 (출생 시각 + 나이 일)"""
+    return birth_jd + np.asarray(ages, dtype=np.float64)
+
+
+def secondary_progressions(
+    birth_jd: float,
+    ages: Sequence[float],
+    natal_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    natal_midheaven: float,
+    latitude: float,
+    house_system: str = 'placidus',
+    planets: Optional[Sequence[str]] = None,
+    include_aspects: bool = True,
+    mode: Optional[EphemerisMode] = None,
+    ephemeris: Optional[SwissEphemeris] = None
+) -> List[Dict]:
+    """
+    나이 목록의 진행 차트 일괄 계산
+
+    Args:
+        birth_jd: 출생 Julian Day (UT)
+        ages: 나이 (년) 목록
+        natal_names, natal_longitudes: 출생 행성 이름/황경
+        natal_midheaven: 출생 MC 황경
+        latitude: 출생지 위도 (진행 하우스용)
+        house_system: 하우스 시스템
+        planets: 진행 행성 (기본: 주요 10행성)
+        include_aspects: 진행 행성 × 출생 행성 아스펙트 포함 여부
+        mode: 계산 모드 (진행 행성/하우스, 출생 황경과 같은 기준이어야 함)
+        ephemeris: 천체력 (기본 싱글톤)
+
+    Returns:
+        나이 순서대로 {age, julian_day, planets, solar_arc, ascendant, midheaven, houses, aspects}
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("진행 차트 일괄 계산에는 numpy가 필요합니다.")
+
+    ephemeris = ephemeris or get_ephemeris()
+    planets = [p.lower() for p in (planets or MAJOR_PLANETS)]
+    jd = progressed_julian_days(birth_jd, ages)
+    positions = ephemeris.get_positions_bulk(planets, jd, mode).T    # (나이, 행성)
+
+    natal_by_name = dict(zip(natal_names, natal_longitudes))
+    if 'sun' in planets and 'sun' in natal_by_name:
+        progressed_sun = positions['longitude'][:, planets.index('sun')]
+    else:
+        progressed_sun = ephemeris.get_positions_bulk(['sun'], jd, mode)[0]['longitude']
+    natal_sun = natal_by_name.get('sun')
+    if natal_sun is None:
+        natal_sun = ephemeris.get_positions_bulk(['sun'], [birth_jd], mode)[0]['longitude'][0]
+    solar_arc = np.mod(progressed_sun - natal_sun, 360.0)
+
+    aspect_rows = [[] for _ in range(jd.size)]
+    if include_aspects:
+        hits = find_aspects(
+            positions['longitude'], planets, natal_longitudes, natal_names,
+            aspects=MAJOR_ASPECTS, orb_table=PROGRESSION_ORB_TABLE
+        ).sorted_by_orb()
+        for epoch, progressed, natal, aspect, _, orb, _, _ in hits.rows():
+            aspect_rows[epoch].append({
+                'progressed_planet': progressed,
+                'natal_planet': natal,
+                'aspect': aspect,
+                'orb': round(orb, 2),
+            })
+
+    signs = ephemeris.ZODIAC_SIGNS
+    longitudes = positions['longitude'].tolist()
+    sign_indexes = positions['sign_index'].tolist()
+    retrogrades = positions['is_retrograde'].tolist()
+    results = []
+    for e, (age, epoch_jd, arc) in enumerate(zip(ages, jd.tolist(), solar_arc.tolist())):
+        houses = ephemeris.calculate_houses_from_midheaven(
+            (natal_midheaven + arc) % 360.0, latitude, epoch_jd, house_system, mode
+        )
+        results.append({
+            'age': round(float(age), 4),
+            'julian_day': round(epoch_jd, 6),
+            'planets': [
+                {
+                    'planet': planet,
+                    'longitude': round(longitudes[e][i], 4),
+                    'sign': signs[sign_indexes[e][i]],
+                    'sign_degree': round(longitudes[e][i] % 30, 4),
+                    'is_retrograde': retrogrades[e][i],
+                }
+                for i, planet in enumerate(planets)
+            ],
+            'solar_arc': round(arc, 4),
+            'ascendant': houses['ascendant'],
+            'midheaven': houses['midheaven'],
+            'houses': [h['cusp'] for h in houses['houses']],
+            'aspects': aspect_rows[e],
+        })
+    return results
@@ -1,7 +1,8 @@
 """사주 (四柱) 분석 서비스 - 만세력 기반 정밀 계산"""
 
-from datetime import datetime
-from typing import Optional, List, Dict
+from datetime import date, datetime
+from typing import Optional, List, Dict, Tuple
+import calendar
 import sys
 import os
 
@@ -12,35 +13,16 @@ from models.saju_models import (
     Element, TenGod, DaeunPeriod
 )
 from services.lunar_calendar import get_lunar_calendar, LunarCalendar
+from services.ganji import Ganji, ELEMENTS, GANJI_NAMES
+from services.solar_time import resolve_longitude
 
 
-class SajuService:
-    """사주 분석 서비스 클래스 - 만세력 기반 정밀 계산"""
+# 오행 코드 (Ganji.stem_element_code 등) → Element
+ELEMENT_BY_CODE = tuple(Element(name) for name in ELEMENTS)
 
-    # 천간 (天干)
-    HEAVENLY_STEMS = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
 
-    # 지지 (地支)
-    EARTHLY_BRANCHES = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-
-    # 천간 오행 매핑
-    STEM_ELEMENTS = {
-        "갑": Element.WOOD, "을": Element.WOOD,
-        "병": Element.FIRE, "정": Element.FIRE,
-        "무": Element.EARTH, "기": Element.EARTH,
-        "경": Element.METAL, "신": Element.METAL,
-        "임": Element.WATER, "계": Element.WATER
-    }
-
-    # 지지 오행 매핑
-    BRANCH_ELEMENTS = {
-        "자": Element.WATER, "축": Element.EARTH,
-        "인": Element.WOOD, "묘": Element.WOOD,
-        "진": Element.EARTH, "사": Element.FIRE,
-        "오": Element.FIRE, "미": Element.EARTH,
-        "신": Element.METAL, "유": Element.METAL,
-        "술": Element.EARTH, "해": Element.WATER
-    }
+class SajuService:
+    """사주 분석 서비스 클래스 - 만세력 기반 정밀 계산"""
 
     # 오행 상생 관계
     GENERATING = {
@@ -76,58 +58,73 @@ class SajuService:
         else:
             return self._analyze_fallback(request)
 
+    def _resolve_solar_date(self, request: SajuRequest) -> Tuple[int, int, int]:
+        """
+        요청의 생년월일을 양력으로 변환
+
+        음력 입력(is_lunar)이면 윤달 여부까지 반영하여 양력 날짜로 바꿉니다.
+
+        Returns:
+            (양력 년, 양력 월, 양력 일) 튜플
+        """
+        if not request.is_lunar:
+            return request.birth_year, request.birth_month, request.birth_day
+
+        solar = self.lunar_calendar.lunar_to_solar(
+            request.birth_year, request.birth_month, request.birth_day,
+            is_leap=request.is_leap_month
+        )
+        if not solar['available']:
+            raise ValueError(f"음력 날짜 변환 실패: {solar.get('error', '')}")
+
+        return solar['solar_year'], solar['solar_month'], solar['solar_day']
+
     def _analyze_precise(self, request: SajuRequest) -> SajuResponse:
         """만세력 기반 정밀 사주 분석"""
 
-        # 1. 만세력으로 사주팔자 계산
-        saju_data = self.lunar_calendar.get_full_saju(
-            year=request.birth_year,
-            month=request.birth_month,
-            day=request.birth_day,
+        # 1. 만세력으로 사주팔자 계산 (음력 입력은 양력으로 변환,
+        #    출생지를 알면 시주에 진태양시 보정)
+        birth_year, birth_month, birth_day = self._resolve_solar_date(request)
+        saju = self.lunar_calendar.calculate_saju(
+            year=birth_year,
+            month=birth_month,
+            day=birth_day,
             hour=request.birth_hour,
-            apply_timezone=True
+            apply_timezone=True,
+            minute=request.birth_minute,
+            longitude=resolve_longitude(request.location)
         )
+        year_pillar, month_pillar = saju['year'], saju['month']
+        day_pillar, hour_pillar = saju['day'], saju['hour']
 
-        # 2. 모델로 변환
-        year_pillar = self._convert_to_pillar(saju_data['year_pillar'])
-        month_pillar = self._convert_to_pillar(saju_data['month_pillar'])
-        day_pillar = self._convert_to_pillar(saju_data['day_pillar'])
-
-        hour_pillar = None
-        if saju_data['hour_pillar']:
-            hour_pillar = self._convert_to_pillar(saju_data['hour_pillar'])
-
-        # 3. 오행 균형 분석
+        # 2. 오행 균형 분석
         element_balance = self._analyze_element_balance(year_pillar, month_pillar, day_pillar, hour_pillar)
         dominant_element = max(element_balance, key=element_balance.get)
         weak_element = min(element_balance, key=element_balance.get)
 
-        # 4. 용신/기신 결정
-        day_master_element = self.STEM_ELEMENTS[day_pillar.stem]
+        # 3. 용신/기신 결정
+        day_master_element = ELEMENT_BY_CODE[day_pillar.stem_element_code]
         yongsin = self._determine_yongsin(day_master_element, element_balance)
         gisin = self.CONTROLLING[yongsin]
 
-        # 5. 십신 분석
-        ten_gods = self._analyze_ten_gods(day_pillar.stem, year_pillar, month_pillar, hour_pillar)
+        # 4. 십신 분석
+        ten_gods = self._analyze_ten_gods(day_pillar, year_pillar, month_pillar, hour_pillar)
 
-        # 6. 대운 계산
-        daeun = self._calculate_daeun(request.gender, month_pillar, request.birth_year)
+        # 5. 대운 계산
+        daeun = self._calculate_daeun(request.gender, month_pillar, birth_year)
 
-        # 7. 세운 (올해 운세)
+        # 6. 세운 (올해 운세)
         current_year = datetime.now().year
         yearly_fortune = self._get_yearly_fortune(day_pillar, current_year)
 
-        # 8. 종합 해석
+        # 7. 종합 해석
         summary = self._generate_summary(day_master_element, element_balance, yongsin)
 
-        # 9. 음력 정보 추가
-        lunar_info = saju_data.get('lunar_date', {})
-
         return SajuResponse(
-            year_pillar=year_pillar,
-            month_pillar=month_pillar,
-            day_pillar=day_pillar,
-            hour_pillar=hour_pillar,
+            year_pillar=self._convert_to_pillar(year_pillar),
+            month_pillar=self._convert_to_pillar(month_pillar),
+            day_pillar=self._convert_to_pillar(day_pillar),
+            hour_pillar=self._convert_to_pillar(hour_pillar) if hour_pillar is not None else None,
             element_balance=element_balance,
             dominant_element=dominant_element,
             weak_element=weak_element,
@@ -139,29 +136,27 @@ class SajuService:
             summary=summary
         )
 
-    def _convert_to_pillar(self, pillar_data: Dict) -> SajuPillar:
-        """만세력 데이터를 SajuPillar 모델로 변환"""
-        stem = pillar_data['stem']
-        branch = pillar_data['branch']
-
+    def _convert_to_pillar(self, ganji: Ganji) -> SajuPillar:
+        """간지를 SajuPillar 응답 모델로 변환"""
         return SajuPillar(
-            stem=stem,
-            branch=branch,
-            stem_element=self.STEM_ELEMENTS[stem],
-            branch_element=self.BRANCH_ELEMENTS[branch]
+            stem=ganji.stem,
+            branch=ganji.branch,
+            stem_element=ELEMENT_BY_CODE[ganji.stem_element_code],
+            branch_element=ELEMENT_BY_CODE[ganji.branch_element_code]
         )
 
     def _analyze_fallback(self, request: SajuRequest) -> SajuResponse:
         """기존 근사 계산 방식 (폴백)"""
 
         # 1. 사주팔자 계산
-        year_pillar = self._calculate_year_pillar(request.birth_year)
-        month_pillar = self._calculate_month_pillar(request.birth_year, request.birth_month)
-        day_pillar = self._calculate_day_pillar(request.birth_year, request.birth_month, request.birth_day)
+        birth_year, birth_month, birth_day = self._resolve_solar_date(request)
+        year_pillar = self._calculate_year_pillar(birth_year)
+        month_pillar = self._calculate_month_pillar(birth_year, birth_month)
+        day_pillar = self._calculate_day_pillar(birth_year, birth_month, birth_day)
 
         hour_pillar = None
         if request.birth_hour is not None:
-            hour_pillar = self._calculate_hour_pillar(day_pillar.stem, request.birth_hour)
+            hour_pillar = self._calculate_hour_pillar(day_pillar, request.birth_hour)
 
         # 2. 오행 균형 분석
         element_balance = self._analyze_element_balance(year_pillar, month_pillar, day_pillar, hour_pillar)
@@ -169,15 +164,15 @@ class SajuService:
         weak_element = min(element_balance, key=element_balance.get)
 
         # 3. 용신/기신 결정
-        day_master_element = self.STEM_ELEMENTS[day_pillar.stem]
+        day_master_element = ELEMENT_BY_CODE[day_pillar.stem_element_code]
         yongsin = self._determine_yongsin(day_master_element, element_balance)
         gisin = self.CONTROLLING[yongsin]
 
         # 4. 십신 분석
-        ten_gods = self._analyze_ten_gods(day_pillar.stem, year_pillar, month_pillar, hour_pillar)
+        ten_gods = self._analyze_ten_gods(day_pillar, year_pillar, month_pillar, hour_pillar)
 
         # 5. 대운 계산
-        daeun = self._calculate_daeun(request.gender, month_pillar, request.birth_year)
+        daeun = self._calculate_daeun(request.gender, month_pillar, birth_year)
 
         # 6. 세운 (올해 운세)
         current_year = datetime.now().year
@@ -187,10 +182,10 @@ class SajuService:
         summary = self._generate_summary(day_master_element, element_balance, yongsin)
 
         return SajuResponse(
-            year_pillar=year_pillar,
-            month_pillar=month_pillar,
-            day_pillar=day_pillar,
-            hour_pillar=hour_pillar,
+            year_pillar=self._convert_to_pillar(year_pillar),
+            month_pillar=self._convert_to_pillar(month_pillar),
+            day_pillar=self._convert_to_pillar(day_pillar),
+            hour_pillar=self._convert_to_pillar(hour_pillar) if hour_pillar is not None else None,
             element_balance=element_balance,
             dominant_element=dominant_element,
             weak_element=weak_element,
@@ -202,23 +197,12 @@ class SajuService:
             summary=summary
         )
 
-    def _calculate_year_pillar(self, year: int) -> SajuPillar:
+    def _calculate_year_pillar(self, year: int) -> Ganji:
         """년주 계산"""
         # 1984년이 갑자년 기준
-        stem_index = (year - 4) % 10
-        branch_index = (year - 4) % 12
+        return Ganji(year - 4)
 
-        stem = self.HEAVENLY_STEMS[stem_index]
-        branch = self.EARTHLY_BRANCHES[branch_index]
-
-        return SajuPillar(
-            stem=stem,
-            branch=branch,
-            stem_element=self.STEM_ELEMENTS[stem],
-            branch_element=self.BRANCH_ELEMENTS[branch]
-        )
-
-    def _calculate_month_pillar(self, year: int, month: int) -> SajuPillar:
+    def _calculate_month_pillar(self, year: int, month: int) -> Ganji:
         """월주 계산"""
         # 년간에 따른 월간 시작점
         year_stem_index = (year - 4) % 10
@@ -230,86 +214,50 @@ class SajuService:
         # 월지 (인월=1월, 묘월=2월, ...)
         branch_index = (month + 1) % 12
 
-        stem = self.HEAVENLY_STEMS[stem_index]
-        branch = self.EARTHLY_BRANCHES[branch_index]
-
-        return SajuPillar(
-            stem=stem,
-            branch=branch,
-            stem_element=self.STEM_ELEMENTS[stem],
-            branch_element=self.BRANCH_ELEMENTS[branch]
-        )
+        return Ganji.from_parts(stem_index, branch_index)
 
-    def _calculate_day_pillar(self, year: int, month: int, day: int) -> SajuPillar:
+    def _calculate_day_pillar(self, year: int, month: int, day: int) -> Ganji:
         """일주 계산 (간략화된 버전)"""
         # 실제로는 만세력 데이터를 사용해야 함
         # 여기서는 간략화된 계산 사용
 
-        from datetime import date
-
         # 기준일: 1900년 1월 1일 = 갑진일
         base_date = date(1900, 1, 1)
         target_date = date(year, month, day)
         days_diff = (target_date - base_date).days
 
-        stem_index = (days_diff + 0) % 10  # 갑 기준
-        branch_index = (days_diff + 4) % 12  # 진 기준
-
-        stem = self.HEAVENLY_STEMS[stem_index]
-        branch = self.EARTHLY_BRANCHES[branch_index]
+        return Ganji.from_parts(0, 4).shift(days_diff)  # 갑진 기준
 
-        return SajuPillar(
-            stem=stem,
-            branch=branch,
-            stem_element=self.STEM_ELEMENTS[stem],
-            branch_element=self.BRANCH_ELEMENTS[branch]
-        )
-
-    def _calculate_hour_pillar(self, day_stem: str, hour: int) -> SajuPillar:
+    def _calculate_hour_pillar(self, day_pillar: Ganji, hour: int) -> Ganji:
         """시주 계산"""
         # 시지 계산 (23-01시=자시, 01-03시=축시, ...)
         branch_index = ((hour + 1) // 2) % 12
 
         # 일간에 따른 시간 시작점
-        day_stem_index = self.HEAVENLY_STEMS.index(day_stem)
-        stem_start = (day_stem_index * 2) % 10
+        stem_start = (day_pillar.stem_index * 2) % 10
         stem_index = (stem_start + branch_index) % 10
 
-        stem = self.HEAVENLY_STEMS[stem_index]
-        branch = self.EARTHLY_BRANCHES[branch_index]
-
-        return SajuPillar(
-            stem=stem,
-            branch=branch,
-            stem_element=self.STEM_ELEMENTS[stem],
-            branch_element=self.BRANCH_ELEMENTS[branch]
-        )
+        return Ganji.from_parts(stem_index, branch_index)
 
     def _analyze_element_balance(
         self,
-        year: SajuPillar,
-        month: SajuPillar,
-        day: SajuPillar,
-        hour: Optional[SajuPillar]
+        year: Ganji,
+        month: Ganji,
+        day: Ganji,
+        hour: Optional[Ganji]
     ) -> Dict[str, int]:
         """오행 균형 분석"""
-        balance = {
-            Element.WOOD: 0,
-            Element.FIRE: 0,
-            Element.EARTH: 0,
-            Element.METAL: 0,
-            Element.WATER: 0
-        }
+        counts = [0] * len(ELEMENTS)
 
         pillars = [year, month, day]
-        if hour:
+        if hour is not None:
             pillars.append(hour)
 
         for pillar in pillars:
-            balance[pillar.stem_element] += 1
-            balance[pillar.branch_element] += 1
+            counts[pillar.stem_element_code] += 1
+            counts[pillar.branch_element_code] += 1
 
-        return {k.value: v for k, v in balance.items()}
+        return dict(zip(ELEMENTS, counts))
 
     def _determine_yongsin(self, day_master: Element, balance: Dict[str, int]) -> Element:
         """용신 결정 (간략화)"""
@@ -329,18 +277,18 @@ class SajuService:
 
     def _analyze_ten_gods(
         self,
-        day_stem: str,
-        year: SajuPillar,
-        month: SajuPillar,
-        hour: Optional[SajuPillar]
+        day: Ganji,
+        year: Ganji,
+        month: Ganji,
+        hour: Optional[Ganji]
     ) -> List[TenGod]:
         """십신 분석"""
         ten_gods = []
-        day_element = self.STEM_ELEMENTS[day_stem]
+        day_element = ELEMENT_BY_CODE[day.stem_element_code]
 
         # 각 기둥의 천간에 대한 십신 분석
         for pillar, pillar_name in [(year, "년간"), (month, "월간")]:
-            other_element = self.STEM_ELEMENTS[pillar.stem]
+            other_element = ELEMENT_BY_CODE[pillar.stem_element_code]
             god = self._get_ten_god(day_element, other_element)
             ten_gods.append(TenGod(
                 name=god["name"],
@@ -373,7 +321,7 @@ class SajuService:
 
         return ten_god_map["same"]
 
-    def _calculate_daeun(self, gender: str, month_pillar: SajuPillar, birth_year: int) -> List[DaeunPeriod]:
+    def _calculate_daeun(self, gender: str, month_pillar: Ganji, birth_year: int) -> List[DaeunPeriod]:
         """대운 계산"""
         daeun_list = []
 
@@ -387,36 +335,26 @@ class SajuService:
 
         forward = (is_yang_year and is_male) or (not is_yang_year and not is_male)
 
-        month_stem_index = self.HEAVENLY_STEMS.index(month_pillar.stem)
-        month_branch_index = self.EARTHLY_BRANCHES.index(month_pillar.branch)
-
-        for i in range(8):  # 8개 대운
-            if forward:
-                stem_index = (month_stem_index + i + 1) % 10
-                branch_index = (month_branch_index + i + 1) % 12
-            else:
-                stem_index = (month_stem_index - i - 1) % 10
-                branch_index = (month_branch_index - i - 1) % 12
-
-            stem = self.HEAVENLY_STEMS[stem_index]
-            branch = self.EARTHLY_BRANCHES[branch_index]
+        for i in range(8):  # 8개 대운 (월주에서 60갑자 순/역행)
+            ganji = month_pillar.shift(i + 1 if forward else -(i + 1))
+            element = ELEMENT_BY_CODE[ganji.stem_element_code]
 
             daeun_list.append(DaeunPeriod(
                 start_age=start_age + (i * 10),
                 end_age=start_age + (i * 10) + 9,
-                stem=stem,
-                branch=branch,
-                element=self.STEM_ELEMENTS[stem],
-                interpretation=f"{stem}{branch} 대운: {self.STEM_ELEMENTS[stem].value} 기운이 강해지는 시기"
+                stem=ganji.stem,
+                branch=ganji.branch,
+                element=element,
+                interpretation=f"{ganji.name} 대운: {element.value} 기운이 강해지는 시기"
             ))
 
         return daeun_list
 
-    def _get_yearly_fortune(self, day_pillar: SajuPillar, year: int) -> str:
+    def _get_yearly_fortune(self, day_pillar: Ganji, year: int) -> str:
         """올해 운세 (세운)"""
         year_pillar = self._calculate_year_pillar(year)
-        day_element = self.STEM_ELEMENTS[day_pillar.stem]
-        year_element = self.STEM_ELEMENTS[year_pillar.stem]
+        day_element = ELEMENT_BY_CODE[day_pillar.stem_element_code]
+        year_element = ELEMENT_BY_CODE[year_pillar.stem_element_code]
 
         if year_element == day_element:
             return f"{year}년은 비견의 해로, 경쟁과 협력이 공존하는 한 해입니다. 자기 주도적인 활동이 유리합니다."
@@ -449,18 +387,66 @@ class SajuService:
 
     def get_yearly_fortune(self, request: SajuRequest, year: int) -> str:
         """특정 연도 운세 조회"""
-        day_pillar = self._calculate_day_pillar(
-            request.birth_year, request.birth_month, request.birth_day
-        )
+        day_pillar = self._calculate_day_pillar(*self._resolve_solar_date(request))
         return self._get_yearly_fortune(day_pillar, year)
 
+    def get_calendar(self, year: int, month: Optional[int] = None) -> List[Dict]:
+        """
+        일진 달력 조회 (월 또는 연 단위)
+
+        만세력 일괄 계산(ganji_range)으로 기간 전체를 한 번에 구하고
+        응답 직전에만 문자열로 변환합니다.
+
+        Args:
+            year: 양력 년
+            month: 양력 월 (없으면 1년 전체)
+
+        Returns:
+            날짜별 간지/음력/절기 정보 목록
+        """
+        if month is None:
+            start, end = date(year, 1, 1), date(year, 12, 31)
+        else:
+            start = date(year, month, 1)
+            end = date(year, month, calendar.monthrange(year, month)[1])
+
+        days = self.lunar_calendar.ganji_range(start, end)
+
+        year_names = [GANJI_NAMES[g] for g in days['year_ganji'].tolist()]
+        month_names = [GANJI_NAMES[g] for g in days['month_ganji'].tolist()]
+        day_names = [GANJI_NAMES[g] for g in days['day_ganji'].tolist()]
+
+        return [
+            {
+                'date': day,
+                'year_pillar': year_names[i],
+                'month_pillar': month_names[i],
+                'day_pillar': day_names[i],
+                'day_element': ELEMENTS[day_element],
+                'lunar_date': {
+                    'lunar_year': lunar_year,
+                    'lunar_month': lunar_month,
+                    'lunar_day': lunar_day,
+                    'is_leap_month': is_leap
+                },
+                # 당일 절입하는 절기 (자정 기준 관할 절기의 다음 절기)
+                'solar_term': self.lunar_calendar.SOLAR_TERMS[(term + 1) % 24][0] if term_starts else None
+            }
+            for i, (day, day_element, lunar_year, lunar_month, lunar_day, is_leap, term, term_starts)
+            in enumerate(zip(
+                days['date'].astype(str).tolist(), days['day_stem_element'].tolist(),
+                days['lunar_year'].tolist(), days['lunar_month'].tolist(), days['lunar_day'].tolist(),
+                days['is_leap_month'].tolist(), days['solar_term'].tolist(), days['term_starts'].tolist()
+            ))
+        ]
+
     def check_compatibility(self, person1: SajuRequest, person2: SajuRequest) -> Dict:
         """궁합 분석"""
-        p1_day = self._calculate_day_pillar(person1.birth_year, person1.birth_month, person1.birth_day)
-        p2_day = self._calculate_day_pillar(person2.birth_year, person2.birth_month, person2.birth_day)
+        p1_day = self._calculate_day_pillar(*self._resolve_solar_date(person1))
+        p2_day = self._calculate_day_pillar(*self._resolve_solar_date(person2))
 
-        p1_element = self.STEM_ELEMENTS[p1_day.stem]
-        p2_element = self.STEM_ELEMENTS[p2_day.stem]
+        p1_element = ELEMENT_BY_CODE[p1_day.stem_element_code]
+        p2_element = ELEMENT_BY_CODE[p2_day.stem_element_code]
 
         score = 70  # 기본 점수
         analysis = []
@@ -488,8 +474,8 @@ class SajuService:
 
         return {
             "score": min(100, max(0, score)),
-            "person1_day_pillar": f"{p1_day.stem}{p1_day.branch}",
-            "person2_day_pillar": f"{p2_day.stem}{p2_day.branch}",
+            "person1_day_pillar": p1_day.name,
+            "person2_day_pillar": p2_day.name,
             "analysis": analysis,
             "summary": "좋은 궁합입니다." if score >= 70 else "노력이 필요한 궁합입니다."
         }
@@ -0,0 +1,210 @@
+"""
+사주팔자 전체 정의역 사전 계산 테이블
+1900-2100년 모든 (날짜, 시) 조합의 년/월/일/시주와 시간대 보정 후 날짜를
+고정 폭 레코드로 보관하는 메모리 매핑 바이너리 테이블 (선택 기능)
+
+약 7.3만 일 × 25 슬롯(시간 미입력 + 0-23시)을 담으며, 생성에는 수십 초가
+걸리므로 명시적으로 요청한 경우에만 만듭니다.
+
+    python services/saju_table.py build    # 테이블 생성
+"""
+
+from datetime import date, timedelta
+from typing import Optional, Tuple
+import mmap
+import struct
+import zlib
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.solar_terms import DATA_DIR, get_solar_term_table
+from services.manse_table import ManseDayTable, solar_terms_checksum
+
+
+SAJU_TABLE_PATH = os.path.join(DATA_DIR, 'saju_hours.bin')
+
+# 파일 헤더: magic, version, 날짜당 슬롯 수, 시작 ordinal, 날짜 수, 계산 규칙 CRC32
+_HEADER = struct.Struct('<4sHHiiI')
+_MAGIC = b'SJHR'
+_VERSION = 2
+
+# 슬롯 0 = 시간 미입력, 슬롯 1-24 = 0-23시
+SLOTS_PER_DAY = 25
+
+# 레코드: 년/월/일/시 간지 (0-59, 시주 없으면 NO_HOUR),
+#         보정 후 날짜 이동 (일), 보정 후 시각 (자정 기준 분, 없으면 NO_TIME)
+RECORD = struct.Struct('<BBBBbH')
+NO_HOUR = 0xFF
+NO_TIME = 0xFFFF
+
+# 레코드 필드 인덱스
+YEAR_GANJI, MONTH_GANJI, DAY_GANJI, HOUR_GANJI, DAY_SHIFT, CORRECTED_MINUTE = range(6)
+
+
+def rules_checksum(calendar) -> int:
+    """절기 인덱스와 시간대 보정 규칙 식별용 CRC32 (규칙이 바뀌면 재생성)"""
+    checksum = solar_terms_checksum(get_solar_term_table())
+    return zlib.crc32(repr(calendar.timezone_index.transitions).encode(), checksum) & 0xFFFFFFFF
+
+
+class SajuHourTable:
+    """사주팔자 사전 계산 테이블"""
+
+    START_DATE = ManseDayTable.START_DATE
+    END_DATE = ManseDayTable.END_DATE
+
+    def __init__(self, buffer, start_ordinal: int, count: int, checksum: int):
+        """
+        Args:
+            buffer: 헤더를 포함한 테이블 버퍼 (mmap 또는 bytes)
+            start_ordinal: 첫 날짜의 date.toordinal()
+            count: 날짜 수
+            checksum: 생성 시 계산 규칙 CRC32
+        """
+        self.buffer = buffer
+        self.start_ordinal = start_ordinal
+        self.count = count
+        self.checksum = checksum
+
+    @classmethod
+    def from_buffer(cls, buffer) -> 'SajuHourTable':
+        """헤더를 검증하고 버퍼를 테이블로 래핑"""
+        magic, version, slots, start_ordinal, count, checksum = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION or slots != SLOTS_PER_DAY:
+            raise ValueError("지원하지 않는 사주 테이블 형식입니다.")
+        if len(buffer) != _HEADER.size + count * SLOTS_PER_DAY * RECORD.size:
+            raise ValueError("사주 테이블 크기가 올바르지 않습니다.")
+        return cls(buffer, start_ordinal, count, checksum)
+
+    @classmethod
+    def load(cls, path: str = SAJU_TABLE_PATH) -> 'SajuHourTable':
+        """테이블 파일을 읽기 전용으로 메모리 매핑"""
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+
+    def lookup(self, year: int, month: int, day: int, hour: Optional[int] = None) -> Optional[Tuple]:
+        """
+        (날짜, 시) 레코드 반환
+
+        Returns:
+            레코드 튜플 (범위 밖이면 None)
+        """
+        index = date(year, month, day).toordinal() - self.start_ordinal
+        if not 0 <= index < self.count:
+            return None
+        slot = 0 if hour is None else hour + 1
+        return RECORD.unpack_from(self.buffer, _HEADER.size + (index * SLOTS_PER_DAY + slot) * RECORD.size)
+
+
+def build_saju_table(calendar) -> bytes:
+    """
+    사주팔자 사전 계산 테이블 생성 (시간대 보정 적용 기준)
+
+    Args:
+        calendar: 사전 계산 테이블을 사용하지 않는 LunarCalendar 인스턴스
+
+    Returns:
+        헤더를 포함한 테이블 바이트열
+    """
+    start = SajuHourTable.START_DATE.toordinal()
+    count = SajuHourTable.END_DATE.toordinal() - start + 1
+
+    out = bytearray(_HEADER.size + count * SLOTS_PER_DAY * RECORD.size)
+    offset = _HEADER.size
+
+    for index in range(count):
+        d = date.fromordinal(start + index)
+        for hour in (None, *range(24)):
+            saju = calendar.calculate_saju(d.year, d.month, d.day, hour, apply_timezone=True, use_cache=False)
+            solar = saju['solar_date']
+            shift = date(solar['year'], solar['month'], solar['day']).toordinal() - d.toordinal()
+
+            RECORD.pack_into(
+                out, offset,
+                saju['year'].index, saju['month'].index, saju['day'].index,
+                NO_HOUR if saju['hour'] is None else saju['hour'].index,
+                shift,
+                NO_TIME if solar['hour'] is None else solar['hour'] * 60 + solar['minute']
+            )
+            offset += RECORD.size
+
+    _HEADER.pack_into(out, 0, _MAGIC, _VERSION, SLOTS_PER_DAY, start, count, rules_checksum(calendar))
+    return bytes(out)
+
+
+def write_saju_table(data: bytes, path: str = SAJU_TABLE_PATH):
+    """테이블을 원자적으로 파일에 기록"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def shifted_date(year: int, month: int, day: int, shift: int) -> date:
+    """레코드의 날짜 이동을 적용한 보정 후 날짜"""
+    return date(year, month, day) + timedelta(days=shift)
+
+
+# 싱글톤 인스턴스
+_saju_table_instance = None
+
+
+def get_saju_table(calendar, path: str = SAJU_TABLE_PATH, build: bool = True) -> Optional[SajuHourTable]:
+    """
+    사주팔자 사전 계산 테이블 싱글톤 인스턴스 반환
+
+    파일이 없거나 계산 규칙이 바뀌었으면 build=True일 때 새로 생성하고,
+    build=False면 None을 반환합니다.
+
+    Args:
+        calendar: 테이블 생성/검증에 사용할 LunarCalendar (사전 계산 테이블 미사용)
+        path: 테이블 파일 경로
+        build: 없을 때 생성 여부
+    """
+    global _saju_table_instance
+    if _saju_table_instance is not None:
+        return _saju_table_instance
+
+    checksum = rules_checksum(calendar)
+    try:
+        table = SajuHourTable.load(path)
+        if table.checksum == checksum:
+            _saju_table_instance = table
+            return table
+    except (OSError, ValueError, struct.error):
+        pass
+
+    if not build:
+        return None
+
+    data = build_saju_table(calendar)
+    try:
+        write_saju_table(data, path)
+        _saju_table_instance = SajuHourTable.load(path)
+    except OSError:
+        _saju_table_instance = SajuHourTable.from_buffer(data)
+    return _saju_table_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="사주팔자 사전 계산 테이블 생성")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', default=SAJU_TABLE_PATH)
+    args = parser.parse_args()
+
+    from services.lunar_calendar import LunarCalendar
+
+    data = build_saju_table(LunarCalendar())
+    write_saju_table(data, args.output)
+    table = SajuHourTable.from_buffer(data)
+    print(f"{table.count} days x {SLOTS_PER_DAY} slots -> {args.output}")
@@ -0,0 +1,364 @@
+"""
+24절기 (二十四節氣) 절입 시각 인덱스
+1900-2100년 모든 절입 시각을 epoch 초 단위의 평탄한 정렬 배열로 보관하고
+bisect 한 번으로 년/월 경계를 판정
+
+정밀 절입 시각은 Swiss Ephemeris 태양 황경의 근을 구해 오프라인으로 생성한
+바이너리 테이블(data/solar_terms.bin)을 메모리 매핑하여 사용합니다.
+
+    python services/solar_terms.py build    # 테이블 재생성
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import mmap
+import struct
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 절기 (24절기) - 태양 황경 기준, 양력 연도 내 순서 (소한 → 동지)
+SOLAR_TERMS = [
+    ("소한", 285), ("대한", 300),   # 1월
+    ("입춘", 315), ("우수", 330),   # 2월
+    ("경칩", 345), ("춘분", 0),     # 3월
+    ("청명", 15), ("곡우", 30),     # 4월
+    ("입하", 45), ("소만", 60),     # 5월
+    ("망종", 75), ("하지", 90),     # 6월
+    ("소서", 105), ("대서", 120),   # 7월
+    ("입추", 135), ("처서", 150),   # 8월
+    ("백로", 165), ("추분", 180),   # 9월
+    ("한로", 195), ("상강", 210),   # 10월
+    ("입동", 225), ("소설", 240),   # 11월
+    ("대설", 255), ("동지", 270),   # 12월
+]
+
+TERMS_PER_YEAR = len(SOLAR_TERMS)
+
+# 입춘의 SOLAR_TERMS 내 위치 (사주 연도 경계)
+IPCHUN_INDEX = 2
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
+
+# Julian Day of 1970-01-01 00:00 UT
+EPOCH_JD = 2440587.5
+
+# 한국 표준시 (UTC+9) - 만세력 비교 기준 시각
+KST_OFFSET_SECONDS = 9 * 3600
+
+# 정밀 절입 시각 테이블 (오프라인 생성 산출물)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+SOLAR_TERMS_PATH = os.path.join(DATA_DIR, 'solar_terms.bin')
+
+# 파일 헤더: magic, version, reserved, start_year, count (16바이트, 8바이트 정렬 유지)
+_HEADER = struct.Struct('<4sHhii')
+_MAGIC = b'STRM'
+_VERSION = 1
+
+
+def datetime_to_epoch(dt: datetime) -> float:
+    """naive datetime을 epoch 초로 변환 (시간대 변환 없음)"""
+    return (
+        (dt.toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+        + dt.hour * 3600 + dt.minute * 60 + dt.second
+        + dt.microsecond / 1e6
+    )
+
+
+def date_to_epoch(year: int, month: int, day: int) -> int:
+    """날짜 자정(00:00)의 epoch 초"""
+    return (datetime(year, month, day).toordinal() - EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def epoch_to_datetime(seconds: float) -> datetime:
+    """epoch 초를 naive datetime으로 변환"""
+    return EPOCH + timedelta(seconds=seconds)
+
+
+def approximate_term_date(year: int, target_longitude: float) -> datetime:
+    """
+    특정 태양 황경에 도달하는 날짜 계산 (근사)
+
+    춘분(황경 0도)을 3월 21일로 두고 태양이 하루 0.9856도씩
+    이동한다고 가정합니다.
+
+    Args:
+        year: 연도
+        target_longitude: 목표 태양 황경 (도)
+
+    Returns:
+        해당 절기의 datetime
+    """
+    # 기준점: 춘분 (태양 황경 0도 ≈ 3월 21일)
+    spring_equinox = datetime(year, 3, 21, 0, 0, 0)
+
+    # 태양은 하루에 약 0.9856도 이동
+    days_per_degree = 1 / 0.9856
+
+    # 목표 황경까지의 각도 차이
+    if target_longitude == 0:
+        angle_diff = 0
+    elif target_longitude > 0:
+        angle_diff = target_longitude
+    else:
+        angle_diff = target_longitude + 360
+
+    days_diff = angle_diff * days_per_degree
+
+    result_date = spring_equinox + timedelta(days=days_diff)
+
+    # 연도 조정
+    if result_date.year != year:
+        if result_date.year > year:
+            result_date = result_date - timedelta(days=365)
+        else:
+            result_date = result_date + timedelta(days=365)
+
+    return result_date
+
+
+class SolarTermTable:
+    """
+    절입 시각 인덱스
+
+    instants[i]는 (start_year + i // 24)년의 SOLAR_TERMS[i % 24] 절입 시각
+    (epoch 초)이며 배열 전체가 시간순으로 정렬되어 있습니다.
+    조회 시각은 utc_offset만큼 빼서 테이블 기준 시각(UT)과 비교합니다.
+    """
+
+    # SajuRequest 범위(1900-2100)와 양 끝 연도의 인접 절기 구간 포함
+    START_YEAR = 1899
+    END_YEAR = 2101
+
+    def __init__(self, instants, start_year: int = START_YEAR, utc_offset: int = 0):
+        """
+        Args:
+            instants: 정렬된 절입 시각 시퀀스 (epoch 초, array 또는 memoryview)
+            start_year: 첫 24개 항목의 양력 연도
+            utc_offset: 조회 시각과 테이블 기준 시각의 차이 (초)
+        """
+        if len(instants) % TERMS_PER_YEAR != 0:
+            raise ValueError("절입 시각 배열 길이는 24의 배수여야 합니다.")
+
+        self.instants = instants
+        self.start_year = start_year
+        self.end_year = start_year + len(instants) // TERMS_PER_YEAR - 1
+        self.utc_offset = utc_offset
+        self.is_precise = False
+
+    @classmethod
+    def from_approximation(
+        cls,
+        start_year: int = START_YEAR,
+        end_year: int = END_YEAR
+    ) -> 'SolarTermTable':
+        """근사 절기 공식으로 인덱스 생성"""
+        instants = array('d')
+        for year in range(start_year, end_year + 1):
+            for _, longitude in SOLAR_TERMS:
+                instants.append(datetime_to_epoch(approximate_term_date(year, longitude)))
+
+        if any(a > b for a, b in zip(instants, instants[1:])):
+            raise ValueError("절입 시각이 시간순으로 정렬되어 있지 않습니다.")
+
+        return cls(instants, start_year)
+
+    @classmethod
+    def load(cls, path: str = SOLAR_TERMS_PATH, utc_offset: int = KST_OFFSET_SECONDS) -> 'SolarTermTable':
+        """
+        바이너리 절입 시각 테이블을 메모리 매핑하여 로드
+
+        Args:
+            path: build_ephemeris_table()로 생성한 파일 경로
+            utc_offset: 조회 시각의 UTC 오프셋 (초, 기본 KST)
+
+        Returns:
+            정밀 절입 시각 인덱스
+        """
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, start_year, count = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mm.close()
+            raise ValueError(f"지원하지 않는 절기 테이블 형식입니다: {path}")
+        if len(mm) != _HEADER.size + count * 8:
+            mm.close()
+            raise ValueError(f"절기 테이블 크기가 올바르지 않습니다: {path}")
+
+        if sys.byteorder == 'little':
+            instants = memoryview(mm)[_HEADER.size:].cast('d')
+        else:
+            instants = array('d', mm[_HEADER.size:])
+            instants.byteswap()
+            mm.close()
+
+        table = cls(instants, start_year, utc_offset)
+        table.is_precise = True
+        return table
+
+    def save(self, path: str = SOLAR_TERMS_PATH):
+        """테이블을 바이너리 파일로 저장 (리틀 엔디언 float64)"""
+        data = array('d', self.instants)
+        if sys.byteorder != 'little':
+            data.byteswap()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, self.start_year, len(data)))
+            f.write(data.tobytes())
+        os.replace(tmp_path, path)
+
+    def locate(self, seconds: float) -> int:
+        """
+        주어진 시각 직전(같거나 이전)의 절입 위치 반환
+
+        Args:
+            seconds: 조회 시각 (epoch 초)
+
+        Returns:
+            instants 내 위치
+        """
+        pos = bisect_right(self.instants, seconds - self.utc_offset) - 1
+        if pos < 0 or pos >= len(self.instants) - 1:
+            raise ValueError(
+                f"절기 인덱스 범위({self.start_year}-{self.end_year}) 밖의 날짜입니다."
+            )
+        return pos
+
+    def term_index(self, pos: int) -> int:
+        """위치의 절기 번호 (SOLAR_TERMS 인덱스, 0=소한)"""
+        return pos % TERMS_PER_YEAR
+
+    def term_name(self, pos: int) -> str:
+        """위치의 절기 이름"""
+        return SOLAR_TERMS[pos % TERMS_PER_YEAR][0]
+
+    def saju_year(self, pos: int) -> int:
+        """위치가 속한 사주 연도 (입춘 기준)"""
+        year = self.start_year + pos // TERMS_PER_YEAR
+        if pos % TERMS_PER_YEAR < IPCHUN_INDEX:
+            year -= 1
+        return year
+
+    def saju_month(self, pos: int) -> int:
+        """위치가 속한 절기 기준 월 (1-12, 1=인월, 12=축월)"""
+        return (pos % TERMS_PER_YEAR // 2 - 1) % 12 + 1
+
+    def year_terms(self, year: int) -> List[Tuple[str, float]]:
+        """특정 연도의 (절기명, epoch 초) 목록"""
+        if not self.start_year <= year <= self.end_year:
+            raise ValueError(
+                f"절기 인덱스 범위({self.start_year}-{self.end_year}) 밖의 연도입니다."
+            )
+
+        offset = (year - self.start_year) * TERMS_PER_YEAR
+        return [
+            (name, self.instants[offset + i] + self.utc_offset)
+            for i, (name, _) in enumerate(SOLAR_TERMS)
+        ]
+
+    def year_term_dates(self, year: int) -> Dict[str, datetime]:
+        """특정 연도의 절기명: datetime 딕셔너리"""
+        return {name: epoch_to_datetime(sec) for name, sec in self.year_terms(year)}
+
+
+def find_term_instant(ephemeris, target_longitude: float, guess_jd: float, max_iter: int = 20) -> float:
+    """
+    태양이 목표 황경에 도달하는 UT 시각(Julian Day)을 뉴턴 반복으로 계산
+
+    Args:
+        ephemeris: SwissEphemeris 인스턴스
+        target_longitude: 목표 태양 황경 (도)
+        guess_jd: 초기 추정 Julian Day
+        max_iter: 최대 반복 횟수
+
+    Returns:
+        절입 시각 Julian Day (UT)
+    """
+    jd = guess_jd
+    for _ in range(max_iter):
+        sun = ephemeris.get_planet_position('sun', jd)
+        # 목표 황경과의 차이를 -180~180도로 정규화
+        diff = (sun['longitude'] - target_longitude + 180) % 360 - 180
+        step = diff / (sun['speed'] or 0.9856)
+        jd -= step
+        if abs(step) < 1e-6:  # 약 0.1초
+            break
+    return jd
+
+
+def build_ephemeris_table(
+    start_year: int = SolarTermTable.START_YEAR,
+    end_year: int = SolarTermTable.END_YEAR,
+    ephemeris=None
+) -> SolarTermTable:
+    """
+    Swiss Ephemeris로 정밀 절입 시각 테이블 생성 (오프라인 1회 실행)
+
+    근사 공식의 날짜를 초기값으로 태양 황경이 15도 배수에 도달하는
+    UT 시각을 구합니다.
+
+    Returns:
+        UT epoch 초 기준 절입 시각 인덱스
+    """
+    if ephemeris is None:
+        from services.swiss_ephemeris import SwissEphemeris, SWISSEPH_AVAILABLE
+        if not SWISSEPH_AVAILABLE:
+            raise RuntimeError("정밀 절기 테이블 생성에는 pyswisseph가 필요합니다.")
+        ephemeris = SwissEphemeris()
+
+    instants = array('d')
+    for year in range(start_year, end_year + 1):
+        for _, longitude in SOLAR_TERMS:
+            guess = approximate_term_date(year, longitude)
+            guess_jd = EPOCH_JD + datetime_to_epoch(guess) / SECONDS_PER_DAY
+            jd = find_term_instant(ephemeris, longitude, guess_jd)
+            instants.append(round((jd - EPOCH_JD) * SECONDS_PER_DAY, 3))
+
+    if any(a >= b for a, b in zip(instants, instants[1:])):
+        raise ValueError("절입 시각이 시간순으로 정렬되어 있지 않습니다.")
+
+    return SolarTermTable(instants, start_year)
+
+
+# 싱글톤 인스턴스
+_solar_term_table_instance = None
+
+
+def get_solar_term_table(path: Optional[str] = None) -> SolarTermTable:
+    """
+    절기 인덱스 싱글톤 인스턴스 반환
+
+    정밀 테이블 파일이 있으면 메모리 매핑하고, 없으면 근사 공식으로
+    생성합니다 (최초 호출 시 1회).
+    """
+    global _solar_term_table_instance
+    if _solar_term_table_instance is None:
+        try:
+            _solar_term_table_instance = SolarTermTable.load(path or SOLAR_TERMS_PATH)
+        except (OSError, ValueError):
+            _solar_term_table_instance = SolarTermTable.from_approximation()
+    return _solar_term_table_instance
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="정밀 24절기 절입 시각 테이블 생성")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', default=SOLAR_TERMS_PATH)
+    parser.add_argument('--start-year', type=int, default=SolarTermTable.START_YEAR)
+    parser.add_argument('--end-year', type=int, default=SolarTermTable.END_YEAR)
+    args = parser.parse_args()
+
+    table = build_ephemeris_table(args.start_year, args.end_year)
+    table.save(args.output)
+    print(f"{len(table.instants)} solar terms ({table.start_year}-{table.end_year}) -> {args.output}")
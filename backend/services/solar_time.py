@@ -0,0 +1,126 @@
+"""
+진태양시 (眞太陽時) 보정
+표준시(동경 135도 기준)를 출생지 경도와 균시차로 보정하여 시주 판단에
+쓰는 지방 시태양시를 계산
+
+균시차는 모듈 로드 시 연중 일자(1-366)별로 한 번 계산한 조회 배열을 사용하며,
+단건(datetime)과 일괄(NumPy datetime64 배열) 보정을 모두 지원합니다.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Optional
+import math
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.gazetteer import get_gazetteer
+
+
+# 한국 표준시 기준 자오선 (UTC+9 = 동경 135도)
+STANDARD_MERIDIAN = 135.0
+
+# 경도 1도당 시간 차이 (분)
+MINUTES_PER_DEGREE = 4.0
+
+# 진태양시 보정 대상 국가 (한국 표준시 자오선 기준)
+KOREAN_PENINSULA_COUNTRIES = ('KR', 'KP')
+
+
+def _equation_of_time(day_of_year: int) -> float:
+    """
+    균시차 (분, 시태양시 - 평균태양시) - NOAA 푸리에 근사식, 정오 기준
+
+    Args:
+        day_of_year: 연중 일자 (1-366)
+    """
+    gamma = 2 * math.pi / 365 * (day_of_year - 1)
+    return 229.18 * (
+        0.000075
+        + 0.001868 * math.cos(gamma) - 0.032077 * math.sin(gamma)
+        - 0.014615 * math.cos(2 * gamma) - 0.040849 * math.sin(2 * gamma)
+    )
+
+
+# 연중 일자별 균시차 (분), 인덱스 = 연중 일자 - 1
+EQUATION_OF_TIME = array('d', (_equation_of_time(d) for d in range(1, 367)))
+_EQUATION_OF_TIME_ARRAY = np.frombuffer(EQUATION_OF_TIME, dtype=np.float64) if NUMPY_AVAILABLE else None
+
+
+def resolve_longitude(location: Optional[str]) -> Optional[float]:
+    """
+    출생 지역 문자열에서 경도 추출
+
+    '서울', '서울특별시 강남구', '부산 해운대'처럼 지명 사전으로 해석되는
+    한반도 지명이면 해당 지명의 경도를 반환합니다. 135도 표준 자오선 보정은
+    한국/북한 출생지에만 의미가 있으므로 해외 지명은 제외합니다.
+
+    Returns:
+        동경 경도 (도), 알 수 없으면 None
+    """
+    if not location:
+        return None
+    place = get_gazetteer().resolve(location)
+    if place is None or place.country not in KOREAN_PENINSULA_COUNTRIES:
+        return None
+    return place.longitude
+
+
+def solar_time_offset_minutes(day_of_year: int, longitude: float) -> float:
+    """
+    표준시 → 진태양시 보정량 (분)
+
+    Args:
+        day_of_year: 연중 일자 (1-366)
+        longitude: 출생지 경도 (동경 +)
+
+    Returns:
+        경도 보정 + 균시차 (분, 음수면 표준시보다 늦음)
+    """
+    return (longitude - STANDARD_MERIDIAN) * MINUTES_PER_DEGREE + EQUATION_OF_TIME[day_of_year - 1]
+
+
+def to_true_solar_time(dt: datetime, longitude: float) -> datetime:
+    """
+    표준시(UTC+9) datetime을 출생지 진태양시로 변환
+
+    Args:
+        dt: 한국 표준시 기준 출생 시각
+        longitude: 출생지 경도 (동경 +)
+
+    Returns:
+        진태양시 datetime (초 단위 반올림)
+    """
+    offset = solar_time_offset_minutes(dt.timetuple().tm_yday, longitude)
+    return dt + timedelta(seconds=round(offset * 60))
+
+
+def to_true_solar_time_array(datetimes: 'np.ndarray', longitudes) -> 'np.ndarray':
+    """
+    표준시 datetime64 배열을 진태양시로 일괄 변환
+
+    Args:
+        datetimes: 한국 표준시 기준 출생 시각 배열
+        longitudes: 출생지 경도 (스칼라 또는 같은 길이의 배열)
+
+    Returns:
+        진태양시 datetime64[s] 배열
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("일괄 진태양시 보정에는 numpy가 필요합니다.")
+
+    local = np.asarray(datetimes, dtype='datetime64[s]')
+    day_index = (local.astype('datetime64[D]') - local.astype('datetime64[Y]')).astype(np.int64)
+    offset = (
+        (np.asarray(longitudes, dtype=np.float64) - STANDARD_MERIDIAN) * MINUTES_PER_DEGREE
+        + _EQUATION_OF_TIME_ARRAY[day_index]
+    )
+    return local + np.round(offset * 60).astype('timedelta64[s]')
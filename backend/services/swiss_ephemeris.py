@@ -3,9 +3,16 @@ Swiss Ephemeris 연동 모듈
 pyswisseph를 활용한 정밀 천문 계산
 """
 
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, NamedTuple, Sequence, Tuple
+import bisect
 import math
+import threading
+
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     import swisseph as swe
@@ -14,6 +21,116 @@ except ImportError:
     SWISSEPH_AVAILABLE = False
     print("Warning: pyswisseph not installed. Using fallback calculations.")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.lru_cache import LRUCache
+from services.chebyshev_ephemeris import ChebyshevEphemeris, get_chebyshev_ephemeris
+from services.planet_events import PlanetEventTable, get_planet_event_table
+from services.aspect_engine import (
+    ASPECTS, MAJOR_ASPECTS, ALL_ASPECTS, OrbTable, find_aspects, position_columns
+)
+
+
+# get_positions_bulk 결과 레코드 (행성 × 시각)
+POSITION_DTYPE = [
+    ('longitude', 'f8'),      # 황경 (도)
+    ('latitude', 'f8'),       # 황위 (도)
+    ('distance', 'f8'),       # 거리 (AU)
+    ('speed', 'f8'),          # 황경 속도 (도/일)
+    ('sign_index', 'u1'),     # 별자리 인덱스 (0=aries)
+    ('is_retrograde', '?'),   # 역행 여부
+]
+
+# 항성황도 기준점 (ayanamsa)
+AYANAMSAS = {
+    'fagan_bradley': swe.SIDM_FAGAN_BRADLEY if SWISSEPH_AVAILABLE else 0,
+    'lahiri': swe.SIDM_LAHIRI if SWISSEPH_AVAILABLE else 1,
+    'raman': swe.SIDM_RAMAN if SWISSEPH_AVAILABLE else 3,
+}
+
+# set_sid_mode / set_topo는 프로세스 전역 C 상태이므로 설정과 계산을 묶어서 보호
+_MODE_LOCK = threading.RLock()
+
+
+class EphemerisMode(NamedTuple):
+    """
+    요청별 계산 모드 (전역 상태를 바꾸는 대신 호출마다 전달)
+
+    기본값은 회귀황도 · 지심 좌표입니다.
+    """
+    sidereal: bool = False
+    ayanamsa: str = 'fagan_bradley'
+    topocentric: bool = False
+    latitude: float = 0.0
+    longitude: float = 0.0
+    altitude: float = 0.0
+
+    @property
+    def is_default(self) -> bool:
+        """회귀황도 · 지심 (체비쇼프 테이블을 쓸 수 있는 모드) 여부"""
+        return not self.sidereal and not self.topocentric
+
+    def flags(self) -> int:
+        """calc_ut에 더할 모드 플래그"""
+        result = 0
+        if self.sidereal:
+            result |= swe.FLG_SIDEREAL
+        if self.topocentric:
+            result |= swe.FLG_TOPOCTR
+        return result
+
+    def apply(self):
+        """모드에 필요한 Swiss Ephemeris 전역 설정 (_MODE_LOCK 안에서 호출)"""
+        if self.sidereal:
+            if self.ayanamsa not in AYANAMSAS:
+                raise ValueError(f"Unknown ayanamsa: {self.ayanamsa}")
+            swe.set_sid_mode(AYANAMSAS[self.ayanamsa])
+        if self.topocentric:
+            swe.set_topo(self.longitude, self.latitude, self.altitude)
+
+
+# J2000.0 기준 시각 (julian_to_datetime용)
+J2000_JD = 2451545.0
+J2000_DATETIME = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+
+# 주요 행성 (get_all_planets 순서)
+MAJOR_PLANETS = ('sun', 'moon', 'mercury', 'venus', 'mars',
+                 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto')
+
+# 하우스 커스프 LRU 캐시 크기와 키 양자화 자릿수
+# (JD 1e-6일 ≈ 0.09초 → ASC 약 0.0004도, 위경도 1e-4도 ≈ 11m)
+HOUSE_CACHE_SIZE = 4096
+HOUSE_JD_DECIMALS = 6
+HOUSE_COORD_DECIMALS = 4
+
+
+def assign_houses(longitudes: Sequence[float], cusps: Sequence[float]) -> List[int]:
+    """
+    황경 목록을 하우스 번호(1-12)로 일괄 배정
+
+    1궁 커스프를 0도로 회전한 커스프 오프셋은 오름차순이므로
+    0도/360도 경계 검사 없이 searchsorted(bisect) 한 번으로 배정됩니다.
+
+    Args:
+        longitudes: 황경 (도)
+        cusps: 1궁부터 12궁까지 커스프 황경 (도)
+
+    Returns:
+        황경 순서대로 하우스 번호
+    """
+    first = cusps[0]
+    if NUMPY_AVAILABLE:
+        offsets = np.mod(np.asarray(cusps, dtype=np.float64) - first, 360.0)
+        positions = np.mod(np.asarray(longitudes, dtype=np.float64) - first, 360.0)
+        return np.searchsorted(offsets, positions, side='right').tolist()
+
+    offsets = [(cusp - first) % 360 for cusp in cusps]
+    return [bisect.bisect_right(offsets, (lon - first) % 360) for lon in longitudes]
+
 
 class SwissEphemeris:
     """Swiss Ephemeris 기반 천문 계산 클래스"""
@@ -55,34 +172,37 @@ class SwissEphemeris:
     ]
 
     # 아스펙트 각도와 허용 오브
-    ASPECTS = {
-        'conjunction': (0, 8),
-        'sextile': (60, 6),
-        'square': (90, 8),
-        'trine': (120, 8),
-        'opposition': (180, 8),
-        'quincunx': (150, 3),
-        'semi_sextile': (30, 2),
-        'semi_square': (45, 2),
-        'sesquiquadrate': (135, 2),
-    }
+    ASPECTS = ASPECTS
 
-    def __init__(self, ephe_path: Optional[str] = None):
+    def __init__(
+        self,
+        ephe_path: Optional[str] = None,
+        use_chebyshev: bool = True,
+        use_event_table: bool = True,
+        house_cache_size: int = HOUSE_CACHE_SIZE
+    ):
         """
         Swiss Ephemeris 초기화
 
         Args:
             ephe_path: Ephemeris 데이터 파일 경로 (없으면 기본 경로 사용)
+            use_chebyshev: 체비쇼프 보간 테이블이 있으면 범위 내 주요 행성 위치에 사용
+                (오차 상한은 services/chebyshev_ephemeris.py 참고)
+            use_event_table: 입궁/정류 테이블이 있으면 별자리/역행 조회에 사용
+            house_cache_size: 하우스 커스프 LRU 캐시 크기 (0이면 캐시 안 함)
         """
         self.initialized = False
+        self.house_cache = LRUCache(house_cache_size)
+        self.chebyshev: Optional[ChebyshevEphemeris] = get_chebyshev_ephemeris() if use_chebyshev else None
+        self.planet_events: Optional[PlanetEventTable] = (
+            get_planet_event_table() if use_event_table else None
+        )
 
         if SWISSEPH_AVAILABLE:
             if ephe_path:
                 swe.set_ephe_path(ephe_path)
 
-            # Ephemeris 타입 설정 (Swiss Ephemeris 사용)
-            swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)  # Sidereal mode (옵션)
-
+            # 항성황도/측심 설정은 EphemerisMode로 호출마다 전달
             self.initialized = True
 
     def datetime_to_julian(self, dt: datetime) -> float:
@@ -95,16 +215,16 @@ class SwissEphemeris:
         Returns:
             Julian Day 숫자
         """
-        if not SWISSEPH_AVAILABLE:
-            # 간단한 근사 계산
-            return self._approximate_julian_day(dt)
-
         # UTC로 변환
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
 
         utc_dt = dt.astimezone(timezone.utc)
 
+        if not SWISSEPH_AVAILABLE:
+            # 그레고리력 Julian Day 공식
+            return self._approximate_julian_day(utc_dt)
+
         # 시간을 소수점으로 변환
         hour_decimal = (
             utc_dt.hour +
@@ -122,6 +242,10 @@ class SwissEphemeris:
 
         return jd
 
+    def julian_to_datetime(self, jd: float) -> datetime:
+        """Julian Day (UT)를 UTC datetime으로 변환 (마이크로초 단위)"""
+        return J2000_DATETIME + timedelta(days=jd - J2000_JD)
+
     def _approximate_julian_day(self, dt: datetime) -> float:
         """Julian Day 근사 계산 (fallback)"""
         a = (14 - dt.month) // 12
@@ -137,7 +261,8 @@ class SwissEphemeris:
         self,
         planet: str,
         jd: float,
-        flags: int = None
+        flags: int = None,
+        mode: Optional[EphemerisMode] = None
     ) -> Dict:
         """
         행성 위치 계산
@@ -146,10 +271,18 @@ class SwissEphemeris:
             planet: 행성 이름 (sun, moon, mercury, etc.)
             jd: Julian Day
             flags: 계산 플래그 (기본: SEFLG_SWIEPH | SEFLG_SPEED)
+            mode: 계산 모드 (항성황도/측심, 기본 회귀황도 · 지심)
 
         Returns:
             행성 위치 정보 딕셔너리
         """
+        default_mode = mode is None or mode.is_default
+
+        # 기본 플래그 요청은 체비쇼프 보간 테이블 우선 (범위 밖/기타 천체는 Swiss Ephemeris)
+        if (flags is None and default_mode and self.chebyshev is not None
+                and self.chebyshev.covers(planet.lower(), jd)):
+            return self._position_dict(planet, *self.chebyshev.position(planet.lower(), jd))
+
         if not SWISSEPH_AVAILABLE:
             return self._fallback_planet_position(planet, jd)
 
@@ -162,39 +295,63 @@ class SwissEphemeris:
 
         try:
             # 행성 위치 계산
-            result, ret_flag = swe.calc_ut(jd, planet_code, flags)
-
-            longitude = result[0]  # 황경
-            latitude = result[1]   # 황위
-            distance = result[2]   # 거리 (AU)
-            speed_long = result[3]  # 황경 속도 (도/일)
-            speed_lat = result[4]   # 황위 속도
-            speed_dist = result[5]  # 거리 변화율
-
-            # 별자리 및 도수 계산
-            sign_index = int(longitude / 30)
-            sign_degree = longitude % 30
-
-            # 역행 여부
-            is_retrograde = speed_long < 0
-
-            return {
-                'planet': planet,
-                'longitude': round(longitude, 4),
-                'latitude': round(latitude, 4),
-                'distance': round(distance, 6),
-                'speed': round(speed_long, 4),
-                'sign': self.ZODIAC_SIGNS[sign_index],
-                'sign_index': sign_index,
-                'sign_degree': round(sign_degree, 4),
-                'is_retrograde': is_retrograde,
-                'degree_minute': self._degree_to_dms(sign_degree)
-            }
+            if default_mode:
+                result, ret_flag = swe.calc_ut(jd, planet_code, flags)
+            else:
+                with _MODE_LOCK:
+                    mode.apply()
+                    result, ret_flag = swe.calc_ut(jd, planet_code, flags | mode.flags())
+
+            # 황경, 황위, 거리 (AU), 황경 속도 (도/일)
+            return self._position_dict(planet, result[0], result[1], result[2], result[3])
 
         except Exception as e:
             print(f"Error calculating position for {planet}: {e}")
             return self._fallback_planet_position(planet, jd)
 
+    def get_sign_and_retrograde(self, planet: str, jd: float) -> Tuple[str, bool]:
+        """
+        행성의 별자리와 역행 여부
+
+        입궁/정류 테이블 범위 안이면 bisect로 조회하고, 아니면 위치를 계산합니다.
+
+        Returns:
+            (별자리 이름, 역행 여부)
+        """
+        name = planet.lower()
+        if self.planet_events is not None and self.planet_events.covers(name, jd):
+            return (self.ZODIAC_SIGNS[self.planet_events.sign_index(name, jd)],
+                    self.planet_events.is_retrograde(name, jd))
+
+        position = self.get_planet_position(planet, jd)
+        return position['sign'], position['is_retrograde']
+
+    def _position_dict(
+        self,
+        planet: str,
+        longitude: float,
+        latitude: float,
+        distance: float,
+        speed_long: float
+    ) -> Dict:
+        """황경/황위/거리/속도를 행성 위치 딕셔너리로 변환"""
+        # 별자리 및 도수 계산
+        sign_index = int(longitude / 30)
+        sign_degree = longitude % 30
+
+        return {
+            'planet': planet,
+            'longitude': round(longitude, 4),
+            'latitude': round(latitude, 4),
+            'distance': round(distance, 6),
+            'speed': round(speed_long, 4),
+            'sign': self.ZODIAC_SIGNS[sign_index],
+            'sign_index': sign_index,
+            'sign_degree': round(sign_degree, 4),
+            'is_retrograde': speed_long < 0,  # 역행 여부
+            'degree_minute': self._degree_to_dms(sign_degree)
+        }
+
     def _fallback_planet_position(self, planet: str, jd: float) -> Dict:
         """행성 위치 근사 계산 (fallback)"""
         # 매우 간략화된 근사
@@ -235,28 +392,124 @@ class SwissEphemeris:
             'degree_minute': self._degree_to_dms(sign_degree)
         }
 
-    def get_all_planets(self, jd: float) -> List[Dict]:
+    def get_all_planets(self, jd: float, mode: Optional[EphemerisMode] = None) -> List[Dict]:
         """모든 주요 행성 위치 계산"""
-        planets = ['sun', 'moon', 'mercury', 'venus', 'mars',
-                   'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
+        return [self.get_planet_position(p, jd, mode=mode) for p in MAJOR_PLANETS]
+
+    def get_positions_bulk(
+        self,
+        planets: Optional[List[str]] = None,
+        jd_array=None,
+        mode: Optional[EphemerisMode] = None
+    ) -> 'np.ndarray':
+        """
+        여러 행성 × 여러 시각의 위치를 구조화 배열로 일괄 계산
+
+        체비쇼프 테이블 범위 안의 시각은 배열 연산으로 평가하고, 나머지 시각과
+        테이블에 없는 천체는 calc_ut를 순서대로 호출해 채웁니다. 시각마다
+        딕셔너리/문자열을 만들지 않으므로 트랜짓 타임라인, 택일 탐색처럼
+        수천 개 시각이 필요한 계산에 사용합니다.
+
+        항성황도는 회귀황도 위치에서 시각별 기준점(ayanamsa)을 빼서 구하므로
+        체비쇼프 테이블을 그대로 쓰고, 측심 모드는 calc_ut로 계산합니다.
+
+        Args:
+            planets: 행성 이름 목록 (기본: 주요 10행성)
+            jd_array: Julian Day (UT) 배열
+            mode: 계산 모드 (항성황도/측심, 기본 회귀황도 · 지심)
+
+        Returns:
+            (행성 수, 시각 수) 구조화 배열 (POSITION_DTYPE), 반올림하지 않은 값
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("일괄 행성 위치 계산에는 numpy가 필요합니다.")
+
+        planets = [p.lower() for p in (planets or MAJOR_PLANETS)]
+        jd = np.atleast_1d(np.asarray(jd_array, dtype=np.float64))
+        result = np.zeros((len(planets), jd.size), dtype=POSITION_DTYPE)
+        topocentric = mode is not None and mode.topocentric
+
+        for row, planet in zip(result, planets):
+            if planet not in self.PLANETS:
+                raise ValueError(f"Unknown planet: {planet}")
+
+            remaining = np.ones(jd.size, dtype=bool)
+            if not topocentric and self.chebyshev is not None and planet in self.chebyshev.segments:
+                inside = (jd >= self.chebyshev.start_jd) & (jd < self.chebyshev.end_jd)
+                if inside.any():
+                    lon, lat, dist, speed = self.chebyshev.position_array(planet, jd[inside])
+                    row['longitude'][inside] = lon
+                    row['latitude'][inside] = lat
+                    row['distance'][inside] = dist
+                    row['speed'][inside] = speed
+                    remaining &= ~inside
+
+            for i in np.flatnonzero(remaining):
+                row[i] = self._calc_position_tuple(planet, float(jd[i]), mode if topocentric else None)
+
+        if mode is not None and mode.sidereal and not topocentric:
+            ayanamsa, rate = self._ayanamsa_array(jd, mode)
+            result['longitude'] = np.mod(result['longitude'] - ayanamsa, 360.0)
+            result['speed'] -= rate
+
+        result['sign_index'] = (result['longitude'] // 30).astype(np.uint8) % 12
+        result['is_retrograde'] = result['speed'] < 0
+        return result
 
-        return [self.get_planet_position(p, jd) for p in planets]
+    def _ayanamsa_array(self, jd: 'np.ndarray', mode: EphemerisMode) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        시각별 항성황도 기준점 (calc_ut의 FLG_SIDEREAL과 같은 값, 장동 포함)
+
+        Returns:
+            (기준점 배열 (도), 기준점 변화율 배열 (도/일, 전진 차분))
+        """
+        if not SWISSEPH_AVAILABLE:
+            return np.zeros(jd.size), np.zeros(jd.size)
+
+        with _MODE_LOCK:
+            mode.apply()
+            values = np.array([swe.get_ayanamsa_ex_ut(t, swe.FLG_SWIEPH)[1] for t in jd.tolist()])
+            ahead = np.array([swe.get_ayanamsa_ex_ut(t + 1.0, swe.FLG_SWIEPH)[1] for t in jd.tolist()])
+        return values, ahead - values
+
+    def _calc_position_tuple(self, planet: str, jd: float, mode: Optional[EphemerisMode] = None) -> Tuple:
+        """calc_ut 1회로 POSITION_DTYPE 레코드 값 계산 (Swiss Ephemeris 미설치 시 근사값)"""
+        if SWISSEPH_AVAILABLE:
+            try:
+                flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+                if mode is None or mode.is_default:
+                    result, _ = swe.calc_ut(jd, self.PLANETS[planet], flags)
+                else:
+                    with _MODE_LOCK:
+                        mode.apply()
+                        result, _ = swe.calc_ut(jd, self.PLANETS[planet], flags | mode.flags())
+                return (result[0], result[1], result[2], result[3], 0, False)
+            except Exception as e:
+                print(f"Error calculating position for {planet}: {e}")
+
+        fallback = self._fallback_planet_position(planet, jd)
+        return (fallback['longitude'], fallback['latitude'], fallback['distance'],
+                fallback['speed'], 0, False)
 
     def calculate_houses(
         self,
         jd: float,
         latitude: float,
         longitude: float,
-        house_system: str = 'placidus'
+        house_system: str = 'placidus',
+        mode: Optional[EphemerisMode] = None
     ) -> Dict:
         """
         하우스 커스프 계산
 
+        커스프는 (양자화한 JD, 위도, 경도, 하우스 시스템, 황도 기준) 키로 LRU 캐시에 보관합니다.
+
         Args:
             jd: Julian Day
             latitude: 위도
             longitude: 경도
             house_system: 하우스 시스템 이름
+            mode: 계산 모드 (항성황도면 커스프도 항성황도 기준)
 
         Returns:
             하우스 정보 딕셔너리
@@ -264,54 +517,211 @@ class SwissEphemeris:
         if not SWISSEPH_AVAILABLE:
             return self._fallback_houses(jd, latitude, longitude)
 
+        try:
+            key = self._house_key(jd, latitude, longitude, house_system, mode)
+            cusps, ascmc = self._house_cusps(key, mode)
+        except Exception as e:
+            print(f"Error calculating houses: {e}")
+            return self._fallback_houses(jd, latitude, longitude)
+
+        return self._house_dict(house_system, cusps, ascmc)
+
+    def calculate_houses_multi(
+        self,
+        jd: float,
+        latitude: float,
+        longitude: float,
+        house_systems: Optional[Sequence[str]] = None,
+        mode: Optional[EphemerisMode] = None
+    ) -> Dict[str, Dict]:
+        """
+        여러 하우스 시스템을 한 번에 계산 (하우스 시스템 비교용)
+
+        회귀황도는 ARMC(지방항성시)와 황도경사를 한 번만 구해 시스템마다 houses_armc로
+        커스프만 계산합니다. 항성황도는 홀 사인/이퀄이 항성황도 ASC 기준이라
+        시스템마다 houses_ex로 계산합니다. 결과는 calculate_houses와 같은 캐시를 씁니다.
+
+        Args:
+            jd: Julian Day
+            latitude: 위도
+            longitude: 경도
+            house_systems: 하우스 시스템 이름 목록 (기본: 전체)
+            mode: 계산 모드
+
+        Returns:
+            하우스 시스템 이름 -> calculate_houses 결과
+        """
+        house_systems = [name.lower() for name in (house_systems or self.HOUSE_SYSTEMS)]
+        unknown = [name for name in house_systems if name not in self.HOUSE_SYSTEMS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 하우스 시스템입니다: {', '.join(unknown)}")
+
+        if not SWISSEPH_AVAILABLE:
+            return {name: self._fallback_houses(jd, latitude, longitude) for name in house_systems}
+
+        sidereal = mode is not None and mode.sidereal
+        armc_eps = None
+        results = {}
+        for name in house_systems:
+            try:
+                key = self._house_key(jd, latitude, longitude, name, mode)
+                cached = self.house_cache.get(key)
+                if cached is None and not sidereal:
+                    if armc_eps is None:
+                        armc_eps = self.armc_and_obliquity(key[0], key[2])
+                    armc, eps = armc_eps
+                    cusps, ascmc = swe.houses_armc(armc, key[1], eps, key[3])
+                    cached = (self._normalize_cusps(cusps), tuple(ascmc[:4]))
+                    self.house_cache.put(key, cached)
+                elif cached is None:
+                    cached = self._house_cusps(key, mode)
+                results[name] = self._house_dict(name, *cached)
+            except Exception as e:
+                print(f"Error calculating houses ({name}): {e}")
+                results[name] = self._fallback_houses(jd, latitude, longitude)
+
+        return results
+
+    def calculate_houses_from_midheaven(
+        self,
+        midheaven: float,
+        latitude: float,
+        jd: float,
+        house_system: str = 'placidus',
+        mode: Optional[EphemerisMode] = None
+    ) -> Dict:
+        """
+        MC 황경에서 하우스 계산 (컴포지트 차트처럼 출생 시각/장소가 없는 차트용)
+
+        tan(ARMC) = tan(MC) · cos(ε) 로 ARMC를 구해 houses_armc로 커스프를 계산합니다.
+
+        Args:
+            midheaven: MC 황경 (도, mode 기준 황도)
+            latitude: 위도
+            jd: 황도경사/항성황도 기준점 기준 Julian Day
+            house_system: 하우스 시스템 이름
+            mode: 계산 모드 (항성황도면 MC와 커스프를 기준점만큼 보정)
+
+        Returns:
+            calculate_houses와 같은 형식의 하우스 정보 딕셔너리
+        """
         hsys = self.HOUSE_SYSTEMS.get(house_system.lower(), b'P')
+        if SWISSEPH_AVAILABLE:
+            try:
+                ayanamsa = 0.0
+                if mode is not None and mode.sidereal:
+                    with _MODE_LOCK:
+                        mode.apply()
+                        ayanamsa = swe.get_ayanamsa_ut(jd)
+                _, eps = self.armc_and_obliquity(jd, 0.0)
+                mc = math.radians((midheaven + ayanamsa) % 360.0)
+                armc = math.degrees(math.atan2(math.sin(mc) * math.cos(math.radians(eps)), math.cos(mc))) % 360.0
+                cusps, ascmc = swe.houses_armc(armc, latitude, eps, hsys)
+                cusps = tuple((c - ayanamsa) % 360.0 for c in self._normalize_cusps(cusps))
+                asc, mc_lon, _, vertex = ascmc[:4]
+                ascmc = ((asc - ayanamsa) % 360.0, (mc_lon - ayanamsa) % 360.0, armc,
+                         (vertex - ayanamsa) % 360.0)
+                return self._house_dict(house_system, cusps, ascmc)
+            except Exception as e:
+                print(f"Error calculating houses from midheaven: {e}")
+
+        # 근사: MC + 90도를 ASC로 하는 이퀄 하우스
+        asc = (midheaven + 90.0) % 360.0
+        cusps = tuple((asc + i * 30.0) % 360.0 for i in range(12))
+        return self._house_dict('equal', cusps, (asc, midheaven % 360.0, 0.0, 0.0))
+
+    def _house_key(
+        self,
+        jd: float,
+        latitude: float,
+        longitude: float,
+        house_system: str,
+        mode: Optional[EphemerisMode]
+    ) -> Tuple:
+        """하우스 캐시 키 - (JD, 위도, 경도, 시스템 코드, 항성황도 기준점 또는 None)"""
+        hsys = self.HOUSE_SYSTEMS.get(house_system.lower(), b'P')
+        ayanamsa = mode.ayanamsa if mode is not None and mode.sidereal else None
+        return (
+            round(jd, HOUSE_JD_DECIMALS),
+            round(latitude, HOUSE_COORD_DECIMALS),
+            round(longitude, HOUSE_COORD_DECIMALS),
+            hsys,
+            ayanamsa,
+        )
 
-        try:
-            # 하우스 계산
+    def _house_cusps(self, key: Tuple, mode: Optional[EphemerisMode]) -> Tuple[Tuple, Tuple]:
+        """
+        캐시 키의 (양자화된) 입력으로 커스프 계산
+
+        Returns:
+            (1-12궁 커스프, (ASC, MC, ARMC, Vertex))
+        """
+        cached = self.house_cache.get(key)
+        if cached is not None:
+            return cached
+
+        jd, latitude, longitude, hsys, _ = key
+        if mode is None or not mode.sidereal:
             cusps, ascmc = swe.houses(jd, latitude, longitude, hsys)
+        else:
+            with _MODE_LOCK:
+                mode.apply()
+                cusps, ascmc = swe.houses_ex(jd, latitude, longitude, hsys, swe.FLG_SIDEREAL)
 
-            # ASC, MC, ARMC, Vertex 추출
-            asc = ascmc[0]
-            mc = ascmc[1]
-            armc = ascmc[2]
-            vertex = ascmc[3]
-
-            houses = []
-            for i, cusp in enumerate(cusps[1:13], 1):  # cusps[0]은 더미
-                sign_index = int(cusp / 30)
-                sign_degree = cusp % 30
-
-                houses.append({
-                    'house': i,
-                    'cusp': round(cusp, 4),
-                    'sign': self.ZODIAC_SIGNS[sign_index],
-                    'sign_degree': round(sign_degree, 4),
-                    'degree_minute': self._degree_to_dms(sign_degree)
-                })
+        result = (self._normalize_cusps(cusps), tuple(ascmc[:4]))
+        self.house_cache.put(key, result)
+        return result
 
-            return {
-                'house_system': house_system,
-                'houses': houses,
-                'ascendant': {
-                    'longitude': round(asc, 4),
-                    'sign': self.ZODIAC_SIGNS[int(asc / 30)],
-                    'sign_degree': round(asc % 30, 4)
-                },
-                'midheaven': {
-                    'longitude': round(mc, 4),
-                    'sign': self.ZODIAC_SIGNS[int(mc / 30)],
-                    'sign_degree': round(mc % 30, 4)
-                },
-                'vertex': {
-                    'longitude': round(vertex, 4),
-                    'sign': self.ZODIAC_SIGNS[int(vertex / 30)],
-                    'sign_degree': round(vertex % 30, 4)
-                }
-            }
+    def armc_and_obliquity(self, jd: float, longitude: float) -> Tuple[float, float]:
+        """ARMC (도)와 진황도경사 - houses()가 내부에서 쓰는 값과 같음"""
+        armc = (swe.sidtime(jd) * 15.0 + longitude) % 360.0
+        eps = swe.calc_ut(jd, swe.ECL_NUT)[0][0]
+        return armc, eps
 
-        except Exception as e:
-            print(f"Error calculating houses: {e}")
-            return self._fallback_houses(jd, latitude, longitude)
+    @staticmethod
+    def _normalize_cusps(cusps: Sequence[float]) -> Tuple:
+        """1-12궁 커스프 (pyswisseph 버전에 따라 cusps[0]이 더미인 13개일 수 있음)"""
+        if len(cusps) == 13:
+            return tuple(cusps[1:13])
+        return tuple(cusps[:12])
+
+    def _house_dict(self, house_system: str, cusps: Sequence[float], ascmc: Sequence[float]) -> Dict:
+        """커스프와 ASC/MC/Vertex로 하우스 정보 딕셔너리 생성"""
+        # ASC, MC, ARMC, Vertex
+        asc, mc, _, vertex = ascmc
+
+        houses = []
+        for i, cusp in enumerate(cusps, 1):
+            sign_index = int(cusp / 30)
+            sign_degree = cusp % 30
+
+            houses.append({
+                'house': i,
+                'cusp': round(cusp, 4),
+                'sign': self.ZODIAC_SIGNS[sign_index],
+                'sign_degree': round(sign_degree, 4),
+                'degree_minute': self._degree_to_dms(sign_degree)
+            })
+
+        return {
+            'house_system': house_system,
+            'houses': houses,
+            'ascendant': {
+                'longitude': round(asc, 4),
+                'sign': self.ZODIAC_SIGNS[int(asc / 30)],
+                'sign_degree': round(asc % 30, 4)
+            },
+            'midheaven': {
+                'longitude': round(mc, 4),
+                'sign': self.ZODIAC_SIGNS[int(mc / 30)],
+                'sign_degree': round(mc % 30, 4)
+            },
+            'vertex': {
+                'longitude': round(vertex, 4),
+                'sign': self.ZODIAC_SIGNS[int(vertex / 30)],
+                'sign_degree': round(vertex % 30, 4)
+            }
+        }
 
     def _fallback_houses(self, jd: float, latitude: float, longitude: float) -> Dict:
         """하우스 근사 계산 (fallback)"""
@@ -358,7 +768,8 @@ class SwissEphemeris:
     def calculate_aspects(
         self,
         planets: List[Dict],
-        include_minor: bool = False
+        include_minor: bool = False,
+        orb_table: Optional[OrbTable] = None
     ) -> List[Dict]:
         """
         행성 간 아스펙트 계산
@@ -366,74 +777,21 @@ class SwissEphemeris:
         Args:
             planets: 행성 위치 목록
             include_minor: 마이너 아스펙트 포함 여부
+            orb_table: 행성별 오브 표 (없으면 기본 오브)
 
         Returns:
             아스펙트 목록
         """
-        aspects = []
-
-        # 사용할 아스펙트 종류
-        aspect_types = ['conjunction', 'sextile', 'square', 'trine', 'opposition']
-        if include_minor:
-            aspect_types.extend(['quincunx', 'semi_sextile', 'semi_square', 'sesquiquadrate'])
-
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i + 1:]:
-                # 두 행성 간 각도 차이
-                diff = abs(p1['longitude'] - p2['longitude'])
-                if diff > 180:
-                    diff = 360 - diff
-
-                # 각 아스펙트 타입 확인
-                for aspect_name in aspect_types:
-                    angle, orb = self.ASPECTS[aspect_name]
-                    orb_actual = abs(diff - angle)
-
-                    if orb_actual <= orb:
-                        # 어플라잉 vs 세퍼레이팅
-                        is_applying = self._is_applying(p1, p2, angle)
-
-                        aspects.append({
-                            'planet1': p1['planet'],
-                            'planet2': p2['planet'],
-                            'aspect': aspect_name,
-                            'angle': angle,
-                            'orb': round(orb_actual, 2),
-                            'is_applying': is_applying,
-                            'strength': self._aspect_strength(orb_actual, orb)
-                        })
-                        break  # 하나의 아스펙트만 기록
-
-        # 강도 순으로 정렬
-        aspects.sort(key=lambda x: x['orb'])
-
-        return aspects
-
-    def _is_applying(self, p1: Dict, p2: Dict, target_angle: float) -> bool:
-        """아스펙트가 강해지는 중인지 확인"""
-        current_diff = abs(p1['longitude'] - p2['longitude'])
-        if current_diff > 180:
-            current_diff = 360 - current_diff
+        aspect_types = ALL_ASPECTS if include_minor else MAJOR_ASPECTS
+        names, longitudes, speeds = position_columns(planets)
 
-        # 속도가 빠른 행성이 각도를 좁히고 있는지
-        relative_speed = p1.get('speed', 0) - p2.get('speed', 0)
+        hits = find_aspects(
+            longitudes, names, speed1=speeds, speed2=speeds,
+            aspects=aspect_types, orb_table=orb_table
+        )
 
-        if target_angle == 0:
-            return current_diff > 0 and relative_speed > 0
-        else:
-            return current_diff < target_angle
-
-    def _aspect_strength(self, orb_actual: float, orb_max: float) -> str:
-        """아스펙트 강도 계산"""
-        ratio = orb_actual / orb_max
-        if ratio <= 0.25:
-            return 'exact'
-        elif ratio <= 0.5:
-            return 'strong'
-        elif ratio <= 0.75:
-            return 'moderate'
-        else:
-            return 'weak'
+        # 강도 순으로 정렬
+        return hits.sorted_by_orb().to_dicts()
 
     def calculate_dignities(self, planets: List[Dict]) -> Dict:
         """
@@ -539,7 +897,8 @@ class SwissEphemeris:
         birth_datetime: datetime,
         latitude: float,
         longitude: float,
-        house_system: str = 'placidus'
+        house_system: str = 'placidus',
+        mode: Optional[EphemerisMode] = None
     ) -> Dict:
         """
         완전한 출생 차트 생성
@@ -549,6 +908,7 @@ class SwissEphemeris:
             latitude: 출생지 위도
             longitude: 출생지 경도
             house_system: 하우스 시스템
+            mode: 계산 모드 (항성황도/측심, 기본 회귀황도 · 지심)
 
         Returns:
             완전한 차트 데이터
@@ -556,17 +916,18 @@ class SwissEphemeris:
         jd = self.datetime_to_julian(birth_datetime)
 
         # 행성 위치
-        planets = self.get_all_planets(jd)
+        planets = self.get_all_planets(jd, mode)
 
         # 하우스
-        houses = self.calculate_houses(jd, latitude, longitude, house_system)
+        houses = self.calculate_houses(jd, latitude, longitude, house_system, mode)
 
-        # 행성이 속한 하우스 계산
-        for planet in planets:
-            planet['house'] = self._planet_in_house(
-                planet['longitude'],
-                houses['houses']
-            )
+        # 행성이 속한 하우스 계산 (전체 행성 일괄 배정)
+        house_numbers = assign_houses(
+            [planet['longitude'] for planet in planets],
+            [house['cusp'] for house in houses['houses']]
+        )
+        for planet, house in zip(planets, house_numbers):
+            planet['house'] = house
 
         # 아스펙트
         aspects = self.calculate_aspects(planets, include_minor=False)
@@ -586,25 +947,6 @@ class SwissEphemeris:
             'dignities': dignities
         }
 
-    def _planet_in_house(self, planet_longitude: float, houses: List[Dict]) -> int:
-        """행성이 속한 하우스 계산"""
-        for i, house in enumerate(houses):
-            next_house = houses[(i + 1) % 12]
-
-            cusp1 = house['cusp']
-            cusp2 = next_house['cusp']
-
-            # 경계 처리 (0도 / 360도)
-            if cusp2 < cusp1:
-                # 12궁에서 1궁으로 넘어가는 경우
-                if planet_longitude >= cusp1 or planet_longitude < cusp2:
-                    return house['house']
-            else:
-                if cusp1 <= planet_longitude < cusp2:
-                    return house['house']
-
-        return 1  # 기본값
-
     def close(self):
         """리소스 정리"""
         if SWISSEPH_AVAILABLE:
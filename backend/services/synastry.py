@@ -0,0 +1,182 @@
+"""
+시너스트리 / 합성 차트 (Synastry & Composite Charts)
+
+두 사람(또는 한 사람 × 여러 후보)의 출생 차트를 비교합니다.
+
+- 교차 아스펙트: A 행성 × B 행성 각거리 행렬을 find_aspects 한 번으로 계산
+  (후보 여러 명은 (후보 수, 행성 수) 배열로 묶어 epoch = 후보 인덱스)
+- 하우스 오버레이: 한 사람의 행성을 상대 커스프에 assign_houses(bisect)로 배정
+- 컴포지트: 행성/MC의 가까운 쪽 중간점, 하우스는 컴포지트 MC와 평균 위도로 계산
+- 데이비슨: 출생 시각과 출생지(대권 중간점)의 중간에서 계산한 실제 차트
+
+궁합 점수는 교차 아스펙트마다 (아스펙트 가중치 × 두 행성 가중치 × 정확도)를 더한
+조화/긴장 합으로 구하고, 순점수를 tanh로 0-100 범위에 눌러 담습니다.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.aspect_engine import AspectHits
+from services.swiss_ephemeris import EphemerisMode, SwissEphemeris, assign_houses
+
+
+# 아스펙트 가중치 (양수 = 조화, 음수 = 긴장)
+SYNASTRY_ASPECT_WEIGHTS = {
+    'conjunction': 0.6,
+    'sextile': 0.8,
+    'trine': 1.0,
+    'square': -0.8,
+    'opposition': -0.6,
+}
+
+# 행성 가중치 (개인 행성 > 사회 행성 > 외행성)
+SYNASTRY_PLANET_WEIGHTS = {
+    'sun': 1.0, 'moon': 1.0, 'venus': 1.0, 'mars': 0.9, 'mercury': 0.7,
+    'jupiter': 0.6, 'saturn': 0.6, 'uranus': 0.3, 'neptune': 0.3, 'pluto': 0.3,
+}
+DEFAULT_PLANET_WEIGHT = 0.3
+
+# 순점수 -> 0-100 변환 척도 (순점수 ±SCORE_SCALE 이면 약 12 / 88점)
+SCORE_SCALE = 4.0
+
+
+def midpoint(lon1: float, lon2: float) -> float:
+    """두 황경의 가까운 쪽 중간점 (도, 0-360)"""
+    return (lon1 + ((lon2 - lon1 + 180.0) % 360.0 - 180.0) / 2.0) % 360.0
+
+
+def geographic_midpoint(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """두 지점의 대권 중간점 (위도, 경도) - 날짜변경선을 넘어도 올바름"""
+    vectors = []
+    for lat, lon in ((lat1, lon1), (lat2, lon2)):
+        phi, lam = math.radians(lat), math.radians(lon)
+        vectors.append((math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)))
+    x, y, z = (a + b for a, b in zip(*vectors))
+    if math.hypot(x, y) < 1e-12 and abs(z) < 1e-12:
+        # 대척점 - 중간점이 정해지지 않으므로 단순 평균
+        return (lat1 + lat2) / 2.0, lon1
+    return math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x))
+
+
+def house_overlay(longitudes: Sequence[float], cusps: Sequence[float]) -> List[int]:
+    """한 사람의 행성 황경을 상대의 하우스 커스프에 배정 (1-12)"""
+    return assign_houses(longitudes, cusps)
+
+
+def synastry_scores(hits: AspectHits, count: int = 1) -> List[Dict]:
+    """
+    교차 아스펙트로 후보별 궁합 점수 계산
+
+    Args:
+        hits: find_aspects 결과 (여러 후보면 epoch = 후보 인덱스)
+        count: 후보 수
+
+    Returns:
+        후보 순서대로 {score (0-100), harmony, tension, aspect_count}
+    """
+    aspect_weights = [SYNASTRY_ASPECT_WEIGHTS.get(name, 0.0) for name in hits.aspects]
+    weights1 = [SYNASTRY_PLANET_WEIGHTS.get(name, DEFAULT_PLANET_WEIGHT) for name in hits.names1]
+    weights2 = [SYNASTRY_PLANET_WEIGHTS.get(name, DEFAULT_PLANET_WEIGHT) for name in hits.names2]
+
+    if NUMPY_AVAILABLE and isinstance(hits.orb, np.ndarray):
+        epoch = hits.epoch if hits.epoch is not None else np.zeros(len(hits), dtype=np.intp)
+        weight = (
+            np.asarray(aspect_weights)[hits.aspect]
+            * np.asarray(weights1)[hits.index1]
+            * np.asarray(weights2)[hits.index2]
+            * (1.0 - hits.orb / hits.max_orb)
+        )
+        harmony = np.bincount(epoch, np.maximum(weight, 0.0), minlength=count).tolist()
+        tension = np.bincount(epoch, np.maximum(-weight, 0.0), minlength=count).tolist()
+        aspect_count = np.bincount(epoch, minlength=count).tolist()
+    else:
+        harmony, tension, aspect_count = [0.0] * count, [0.0] * count, [0] * count
+        for k in range(len(hits)):
+            e = 0 if hits.epoch is None else int(hits.epoch[k])
+            weight = (
+                aspect_weights[hits.aspect[k]] * weights1[hits.index1[k]] * weights2[hits.index2[k]]
+                * (1.0 - hits.orb[k] / hits.max_orb[k])
+            )
+            if weight > 0:
+                harmony[e] += weight
+            else:
+                tension[e] -= weight
+            aspect_count[e] += 1
+
+    return [
+        {
+            'score': round(50.0 + 50.0 * math.tanh((h - t) / SCORE_SCALE), 1),
+            'harmony': round(h, 3),
+            'tension': round(t, 3),
+            'aspect_count': n,
+        }
+        for h, t, n in zip(harmony, tension, aspect_count)
+    ]
+
+
+def composite_chart_data(
+    ephemeris: SwissEphemeris,
+    planets_a: Sequence[Tuple[str, float]],
+    planets_b: Sequence[Tuple[str, float]],
+    midheaven: float,
+    latitude: float,
+    jd: float,
+    house_system: str = 'placidus',
+    mode: Optional[EphemerisMode] = None
+) -> Dict:
+    """
+    컴포지트(중간점) 차트 - SwissEphemeris.get_natal_chart와 같은 형식
+
+    Args:
+        ephemeris: 천체력
+        planets_a, planets_b: (행성 이름, 황경) 목록 (A에 있는 행성 중 B에도 있는 것만 사용)
+        midheaven: 컴포지트 MC (두 MC의 중간점)
+        latitude: 하우스 계산 위도 (두 출생지 평균)
+        jd: 황도경사 기준 Julian Day (두 출생 시각 평균)
+        house_system: 하우스 시스템
+        mode: 계산 모드 (항성황도면 MC를 회귀황도로 바꿔 하우스 계산)
+    """
+    longitudes_b = dict(planets_b)
+    planets = []
+    for name, lon_a in planets_a:
+        if name not in longitudes_b:
+            continue
+        longitude = midpoint(lon_a, longitudes_b[name])
+        sign_index = int(longitude / 30) % 12
+        planets.append({
+            'planet': name,
+            'longitude': round(longitude, 4),
+            'speed': 0.0,
+            'sign': ephemeris.ZODIAC_SIGNS[sign_index],
+            'sign_index': sign_index,
+            'sign_degree': round(longitude % 30, 4),
+            'is_retrograde': False,
+        })
+
+    houses = ephemeris.calculate_houses_from_midheaven(midheaven, latitude, jd, house_system, mode)
+    house_numbers = assign_houses(
+        [planet['longitude'] for planet in planets],
+        [house['cusp'] for house in houses['houses']]
+    )
+    for planet, house in zip(planets, house_numbers):
+        planet['house'] = house
+
+    return {
+        'julian_day': jd,
+        'latitude': latitude,
+        'house_system': house_system,
+        'planets': planets,
+        'houses': houses,
+        'aspects': ephemeris.calculate_aspects(planets, include_minor=False),
+        'dignities': ephemeris.calculate_dignities(planets),
+    }
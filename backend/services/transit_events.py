@@ -0,0 +1,495 @@
+"""
+트랜짓 이벤트 탐색 - 기간 내 트랜짓 × 네이탈 아스펙트의 정확 시각과 오브 진입/이탈 시각
+
+트랜짓 행성 황경 L(t), 네이탈 황경 N, 아스펙트 각도 A, 허용 오브 c에 대해
+    f(t) = wrap180(L(t) - N - T - k)    (T ∈ {+A, -A}, k ∈ {-c, 0, +c})
+의 부호 변화를 행성별 성긴 격자(get_positions_bulk 1회)에서 찾은 뒤,
+구간 안에서 황경 속도를 도함수로 쓰는 안전장치 뉴턴법으로 모든 근을 한꺼번에 다듬습니다.
+k = 0 이면 정확(exact), k = ±c 이면 |편차|가 줄어드는 방향이면 진입(enter), 아니면 이탈(exit).
+
+기간은 CHUNK_DAYS 단위로 나눠 계산하므로 메모리 사용량은 기간 길이와 무관하고,
+각 구간의 이벤트는 시각 순으로 정렬되어 제너레이터로 바로 내보내집니다.
+격자 간격보다 짧은 사이에 두 번 교차하는 경우(정류 직전 스치기)는 놓칠 수 있습니다.
+
+iter_transit_timeline은 같은 방식(구간별 get_positions_bulk 1회 + 시각 축으로 묶은
+find_aspects 1회)으로 일정 간격 스냅샷을 만듭니다. 첫 구간을 작게 잡고 두 배씩 늘려
+첫 스냅샷이 나오는 시간은 기간 길이와 무관합니다.
+
+두 스트림 모두 구간 분할(transit_event_chunks, timeline_chunks)과 구간 계산
+(transit_events_between, transit_timeline_snapshots)이 나뉘어 있어, 구간마다
+따로 워커 풀에 제출할 수 있습니다.
+
+find_returns는 트랜짓 행성이 자기 출생 황경으로 돌아오는 시각(솔라/루나 리턴)을
+같은 격자 부호 변화 + 뉴턴법으로 찾습니다.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from services.aspect_engine import ASPECTS, MAJOR_ASPECTS, DEFAULT_ORB_TABLE, OrbTable, find_aspects
+from services.swiss_ephemeris import MAJOR_PLANETS, EphemerisMode, SwissEphemeris, assign_houses, get_ephemeris
+
+
+# 행성별 탐색 격자 간격 (일) - 한 칸 이동량이 수 도 이내가 되도록
+GRID_STEP_DAYS = {
+    'moon': 0.25,
+    'mercury': 0.5,
+    'venus': 0.5,
+    'sun': 1.0,
+    'mars': 1.0,
+}
+DEFAULT_GRID_STEP_DAYS = 2.0
+
+# 한 번에 계산하는 기간 (일)
+CHUNK_DAYS = 30.0
+
+# 근 정밀도 (일, 약 0.01초)
+ROOT_TOLERANCE_DAYS = 1e-7
+MAX_ROOT_ITERATIONS = 40
+
+EVENT_KINDS = ('enter', 'exact', 'exit')
+
+# 타임라인 구간 크기 (스냅샷 수) - 첫 구간부터 두 배씩 최대 크기까지
+TIMELINE_FIRST_CHUNK_STEPS = 16
+TIMELINE_CHUNK_STEPS = 512
+
+
+class TransitEvent(NamedTuple):
+    """트랜짓 이벤트 1건"""
+    jd: float
+    kind: str                 # enter / exact / exit
+    transit_planet: str
+    natal_planet: str
+    aspect: str
+    angle: float              # 아스펙트 각도
+    orb: float                # 허용 오브
+    longitude: float          # 이벤트 시각의 트랜짓 행성 황경
+    is_retrograde: bool
+
+    def to_dict(self, ephemeris: Optional[SwissEphemeris] = None) -> Dict:
+        """NDJSON 응답용 dict"""
+        ephemeris = ephemeris or get_ephemeris()
+        return {
+            'datetime': ephemeris.julian_to_datetime(self.jd).isoformat(),
+            'jd': round(self.jd, 6),
+            'kind': self.kind,
+            'transit_planet': self.transit_planet,
+            'natal_planet': self.natal_planet,
+            'aspect': self.aspect,
+            'angle': self.angle,
+            'orb': self.orb,
+            'longitude': round(self.longitude, 4) % 360.0,
+            'is_retrograde': self.is_retrograde,
+        }
+
+
+def _wrap180(x: 'np.ndarray') -> 'np.ndarray':
+    """[-180, 180) 범위로 정규화"""
+    return (x + 180.0) % 360.0 - 180.0
+
+
+def _targets(natal_names, natal_longitudes, planet, aspects, orb_table, include_orb):
+    """
+    한 트랜짓 행성의 목표 황경 오프셋 목록
+
+    Returns:
+        (목표 황경 배열, 네이탈 인덱스, 아스펙트 인덱스, 오브 오프셋 k, 허용 오브)
+    """
+    columns = ([], [], [], [], [])
+    for i, (natal, longitude) in enumerate(zip(natal_names, natal_longitudes)):
+        for a, name in enumerate(aspects):
+            angle = ASPECTS[name][0]
+            orb = orb_table.pair_orb(planet, natal, name)
+            signs = (1.0,) if angle in (0, 180) else (1.0, -1.0)
+            offsets = (-orb, 0.0, orb) if include_orb else (0.0,)
+            for sign in signs:
+                for offset in offsets:
+                    for column, value in zip(columns, (
+                        longitude + sign * angle + offset, i, a, offset, orb
+                    )):
+                        column.append(value)
+    target, natal_index, aspect_index, offset, orb = columns
+    return (np.asarray(target, dtype=np.float64), np.asarray(natal_index, dtype=np.intp),
+            np.asarray(aspect_index, dtype=np.intp), np.asarray(offset, dtype=np.float64),
+            np.asarray(orb, dtype=np.float64))
+
+
+def _refine_roots(ephemeris, planet, target, lo, hi, f_lo, mode=None):
+    """
+    구간 [lo, hi]의 f(t) = wrap180(L(t) - target) 근을 일괄 정밀화
+
+    Returns:
+        (근 시각, 근에서의 황경, 근에서의 속도)
+    """
+    t = 0.5 * (lo + hi)
+    lo, hi = lo.copy(), hi.copy()
+    negative_lo = f_lo < 0
+    for _ in range(MAX_ROOT_ITERATIONS):
+        pos = ephemeris.get_positions_bulk([planet], t, mode)[0]
+        f = _wrap180(pos['longitude'] - target)
+
+        # 근을 포함하는 쪽으로 구간 축소
+        same = (f < 0) == negative_lo
+        lo = np.where(same, t, lo)
+        hi = np.where(same, hi, t)
+
+        # 뉴턴 스텝, 구간을 벗어나면 이분법
+        speed = pos['speed']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = t - f / speed
+        bisect = 0.5 * (lo + hi)
+        step = np.where(np.isfinite(newton) & (newton > lo) & (newton < hi), newton, bisect)
+        if np.all(np.abs(step - t) < ROOT_TOLERANCE_DAYS):
+            t = step
+            break
+        t = step
+
+    pos = ephemeris.get_positions_bulk([planet], t, mode)[0]
+    return t, pos['longitude'], pos['speed']
+
+
+def _chunk_events(ephemeris, start_jd, end_jd, natal_names, natal_longitudes,
+                  planets, aspects, orb_table, include_orb, mode=None) -> List[TransitEvent]:
+    """[start_jd, end_jd] 구간의 이벤트 (시각 순)"""
+    events = []
+    for planet in planets:
+        step = GRID_STEP_DAYS.get(planet, DEFAULT_GRID_STEP_DAYS)
+        count = max(int(np.ceil((end_jd - start_jd) / step)), 1)
+        grid = np.linspace(start_jd, end_jd, count + 1)
+        longitude = ephemeris.get_positions_bulk([planet], grid, mode)[0]['longitude']
+
+        target, natal_index, aspect_index, offset, orb = _targets(
+            natal_names, natal_longitudes, planet, aspects, orb_table, include_orb
+        )
+        f = _wrap180(longitude[:, None] - target[None, :])
+
+        # 부호 변화 구간 (±180 경계의 불연속은 제외)
+        f0, f1 = f[:-1], f[1:]
+        crossing = ((f0 < 0) != (f1 < 0)) & (np.abs(f1 - f0) < 180.0)
+        grid_index, target_index = np.nonzero(crossing)
+        if grid_index.size == 0:
+            continue
+
+        roots, root_longitude, root_speed = _refine_roots(
+            ephemeris, planet, target[target_index],
+            grid[grid_index], grid[grid_index + 1], f0[grid_index, target_index], mode
+        )
+
+        k = offset[target_index]
+        # 편차 d = f + k, |d|가 줄어들면 진입
+        entering = np.sign(root_speed) * np.sign(k) < 0
+        for jd, lon, speed, t_index, k_value, enter in zip(
+            roots, root_longitude, root_speed, target_index, k, entering
+        ):
+            name = aspects[aspect_index[t_index]]
+            if k_value == 0:
+                kind = 'exact'
+            else:
+                kind = 'enter' if enter else 'exit'
+            events.append(TransitEvent(
+                jd=float(jd),
+                kind=kind,
+                transit_planet=planet,
+                natal_planet=natal_names[natal_index[t_index]],
+                aspect=name,
+                angle=ASPECTS[name][0],
+                orb=float(orb[t_index]),
+                longitude=float(lon) % 360.0,
+                is_retrograde=bool(speed < 0),
+            ))
+
+    events.sort(key=lambda e: e.jd)
+    return events
+
+
+def transit_event_chunks(start_jd: float, end_jd: float) -> List[Tuple[float, float]]:
+    """
+    탐색 기간을 CHUNK_DAYS 구간으로 분할
+
+    부호 판정이 f < 0 기준이므로 구간 경계의 근은 한쪽 구간에서만 잡힙니다.
+
+    Returns:
+        [(구간 시작 JD, 구간 끝 JD)] 시각 순
+    """
+    if end_jd <= start_jd:
+        raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+
+    chunks = []
+    chunk_start = start_jd
+    while chunk_start < end_jd:
+        chunk_end = min(chunk_start + CHUNK_DAYS, end_jd)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return chunks
+
+
+def transit_events_between(
+    natal_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    start_jd: float,
+    end_jd: float,
+    planets: Optional[Sequence[str]] = None,
+    aspects: Sequence[str] = MAJOR_ASPECTS,
+    orb_table: Optional[OrbTable] = None,
+    include_orb: bool = True,
+    ephemeris: Optional[SwissEphemeris] = None,
+    mode: Optional[EphemerisMode] = None
+) -> List[TransitEvent]:
+    """
+    한 구간(transit_event_chunks 항목)의 트랜짓 × 네이탈 아스펙트 이벤트
+
+    인자는 iter_transit_events와 같습니다. 구간마다 따로 호출할 수 있으므로
+    스트리밍 응답은 구간을 워커 풀에 하나씩 제출합니다.
+
+    Returns:
+        시각 순 TransitEvent 목록
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("트랜짓 이벤트 탐색에는 numpy가 필요합니다.")
+
+    return _chunk_events(
+        ephemeris or get_ephemeris(), start_jd, end_jd, natal_names, natal_longitudes,
+        [p.lower() for p in (planets or MAJOR_PLANETS)], tuple(aspects),
+        orb_table or DEFAULT_ORB_TABLE, include_orb, mode
+    )
+
+
+def iter_transit_events(
+    natal_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    start_jd: float,
+    end_jd: float,
+    planets: Optional[Sequence[str]] = None,
+    aspects: Sequence[str] = MAJOR_ASPECTS,
+    orb_table: Optional[OrbTable] = None,
+    include_orb: bool = True,
+    ephemeris: Optional[SwissEphemeris] = None,
+    mode: Optional[EphemerisMode] = None
+) -> Iterator[TransitEvent]:
+    """
+    기간 내 트랜짓 × 네이탈 아스펙트 이벤트를 시각 순으로 생성
+
+    Args:
+        natal_names: 네이탈 행성 이름
+        natal_longitudes: 네이탈 황경 (도)
+        start_jd, end_jd: 탐색 기간 Julian Day (UT)
+        planets: 트랜짓 행성 (기본: 주요 10행성)
+        aspects: 아스펙트 이름 목록
+        orb_table: 오브 표 (기본 DEFAULT_ORB_TABLE)
+        include_orb: 오브 진입/이탈 이벤트 포함 여부
+        ephemeris: 천체력 (기본 싱글톤)
+        mode: 트랜짓 위치 계산 모드 (네이탈 황경과 같은 황도 기준이어야 함)
+
+    Yields:
+        TransitEvent
+    """
+    for chunk_start, chunk_end in transit_event_chunks(start_jd, end_jd):
+        yield from transit_events_between(
+            natal_names, natal_longitudes, chunk_start, chunk_end,
+            planets, aspects, orb_table, include_orb, ephemeris, mode
+        )
+
+
+def find_returns(
+    planet: str,
+    target_longitude: float,
+    start_jd: float,
+    end_jd: float,
+    ephemeris: Optional[SwissEphemeris] = None,
+    mode: Optional[EphemerisMode] = None
+) -> 'np.ndarray':
+    """
+    기간 내 행성이 target_longitude를 지나는 모든 시각 (리턴 차트 시각)
+
+    태양/달은 주기마다 한 번, 역행하는 행성은 역행 구간에서 여러 번 지날 수 있습니다.
+
+    Args:
+        planet: 행성 이름
+        target_longitude: 목표 황경 (도, mode와 같은 황도 기준)
+        start_jd, end_jd: 탐색 기간 Julian Day (UT)
+        ephemeris: 천체력 (기본 싱글톤)
+        mode: 계산 모드 (기본: 회귀황도/지심)
+
+    Returns:
+        시각 순 Julian Day 배열
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("리턴 시각 탐색에는 numpy가 필요합니다.")
+    if end_jd <= start_jd:
+        raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+
+    ephemeris = ephemeris or get_ephemeris()
+    planet = planet.lower()
+    step = GRID_STEP_DAYS.get(planet, DEFAULT_GRID_STEP_DAYS)
+    count = max(int(np.ceil((end_jd - start_jd) / step)), 1)
+    grid = np.linspace(start_jd, end_jd, count + 1)
+    f = _wrap180(ephemeris.get_positions_bulk([planet], grid, mode)[0]['longitude'] - target_longitude)
+
+    # 부호 변화 구간 (±180 경계의 불연속은 제외)
+    f0, f1 = f[:-1], f[1:]
+    index = np.flatnonzero(((f0 < 0) != (f1 < 0)) & (np.abs(f1 - f0) < 180.0))
+    if index.size == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    roots, _, _ = _refine_roots(
+        ephemeris, planet, np.full(index.size, float(target_longitude)),
+        grid[index], grid[index + 1], f0[index], mode
+    )
+    return np.sort(roots)
+
+
+def timeline_chunks(start_jd: float, end_jd: float, step_days: float) -> List[Tuple[int, int]]:
+    """
+    타임라인 스냅샷 인덱스를 구간으로 분할 (첫 구간부터 두 배씩 TIMELINE_CHUNK_STEPS까지)
+
+    Returns:
+        [(첫 스냅샷 인덱스, 끝 인덱스(미포함))] - 스냅샷 i의 시각은 start_jd + i * step_days
+    """
+    if end_jd < start_jd:
+        raise ValueError("종료 시각은 시작 시각보다 뒤여야 합니다.")
+    if step_days <= 0:
+        raise ValueError("스냅샷 간격은 0보다 커야 합니다.")
+
+    count = int((end_jd - start_jd) / step_days + 1e-9) + 1
+    chunks = []
+    offset, size = 0, TIMELINE_FIRST_CHUNK_STEPS
+    while offset < count:
+        stop = min(offset + size, count)
+        chunks.append((offset, stop))
+        offset = stop
+        size = min(size * 2, TIMELINE_CHUNK_STEPS)
+    return chunks
+
+
+def transit_timeline_snapshots(
+    natal_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    start_jd: float,
+    step_days: float,
+    first: int,
+    stop: int,
+    planets: Optional[Sequence[str]] = None,
+    aspects: Sequence[str] = MAJOR_ASPECTS,
+    orb_table: Optional[OrbTable] = None,
+    natal_cusps: Optional[Sequence[float]] = None,
+    ephemeris: Optional[SwissEphemeris] = None,
+    mode: Optional[EphemerisMode] = None
+) -> List[Dict]:
+    """
+    한 구간(timeline_chunks 항목)의 트랜짓 스냅샷
+
+    get_positions_bulk 1회 + 시각 축으로 묶은 find_aspects 1회로 계산합니다.
+    인자는 iter_transit_timeline과 같고, first/stop은 스냅샷 인덱스 범위입니다.
+
+    Returns:
+        시각 순 {datetime, jd, planets: [...], aspects: [...]} - 아스펙트는 오브가 작은 순
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("트랜짓 타임라인 계산에는 numpy가 필요합니다.")
+
+    ephemeris = ephemeris or get_ephemeris()
+    planets = [p.lower() for p in (planets or MAJOR_PLANETS)]
+    natal_longitudes = np.asarray(natal_longitudes, dtype=np.float64)
+    # 네이탈은 고정점이므로 속도 0 - 어플라잉은 트랜짓 행성 운동만으로 판정
+    natal_speeds = np.zeros_like(natal_longitudes)
+    signs = ephemeris.ZODIAC_SIGNS
+
+    jd = start_jd + step_days * np.arange(first, stop, dtype=np.float64)
+    positions = ephemeris.get_positions_bulk(planets, jd, mode).T    # (시각, 행성)
+
+    hits = find_aspects(
+        positions['longitude'], planets, natal_longitudes, natal_names,
+        positions['speed'], natal_speeds, tuple(aspects), orb_table or DEFAULT_ORB_TABLE
+    )
+    hits = hits.select(np.lexsort((hits.orb, hits.epoch)))
+    bounds = np.searchsorted(hits.epoch, np.arange(jd.size + 1)).tolist()
+    aspect_rows = [
+        {
+            'transit_planet': transit_planet,
+            'natal_planet': natal_planet,
+            'aspect': aspect,
+            'orb': round(orb, 2),
+            'is_applying': applying,
+        }
+        for _, transit_planet, natal_planet, aspect, _, orb, _, applying in hits.rows()
+    ]
+
+    houses = None
+    if natal_cusps is not None:
+        houses = np.reshape(
+            assign_houses(positions['longitude'].ravel(), natal_cusps), positions.shape
+        ).tolist()
+    longitudes = positions['longitude'].tolist()
+    sign_indexes = positions['sign_index'].tolist()
+    retrogrades = positions['is_retrograde'].tolist()
+
+    snapshots = []
+    for e, epoch_jd in enumerate(jd.tolist()):
+        snapshot_planets = []
+        for i, planet in enumerate(planets):
+            longitude = longitudes[e][i]
+            item = {
+                'planet': planet,
+                'longitude': round(longitude, 4),
+                'sign': signs[sign_indexes[e][i]],
+                'sign_degree': round(longitude % 30, 4),
+                'is_retrograde': retrogrades[e][i],
+            }
+            if houses is not None:
+                item['house'] = houses[e][i]
+            snapshot_planets.append(item)
+
+        snapshots.append({
+            'datetime': ephemeris.julian_to_datetime(epoch_jd).isoformat(),
+            'jd': round(epoch_jd, 6),
+            'planets': snapshot_planets,
+            'aspects': aspect_rows[bounds[e]:bounds[e + 1]],
+        })
+    return snapshots
+
+
+def iter_transit_timeline(
+    natal_names: Sequence[str],
+    natal_longitudes: Sequence[float],
+    start_jd: float,
+    end_jd: float,
+    step_days: float,
+    planets: Optional[Sequence[str]] = None,
+    aspects: Sequence[str] = MAJOR_ASPECTS,
+    orb_table: Optional[OrbTable] = None,
+    natal_cusps: Optional[Sequence[float]] = None,
+    ephemeris: Optional[SwissEphemeris] = None,
+    mode: Optional[EphemerisMode] = None
+) -> Iterator[Dict]:
+    """
+    start_jd부터 step_days 간격(end_jd 포함)의 트랜짓 스냅샷을 시각 순으로 생성
+
+    Args:
+        natal_names: 네이탈 행성 이름
+        natal_longitudes: 네이탈 황경 (도)
+        start_jd, end_jd: 기간 Julian Day (UT)
+        step_days: 스냅샷 간격 (일)
+        planets: 트랜짓 행성 (기본: 주요 10행성)
+        aspects: 아스펙트 이름 목록
+        orb_table: 오브 표 (기본 DEFAULT_ORB_TABLE)
+        natal_cusps: 네이탈 하우스 커스프 (있으면 트랜짓 행성의 네이탈 하우스 포함)
+        ephemeris: 천체력 (기본 싱글톤)
+        mode: 트랜짓 위치 계산 모드 (네이탈 황경과 같은 황도 기준이어야 함)
+
+    Yields:
+        {datetime, jd, planets: [...], aspects: [...]} - 아스펙트는 오브가 작은 순
+    """
+    for first, stop in timeline_chunks(start_jd, end_jd, step_days):
+        yield from transit_timeline_snapshots(
+            natal_names, natal_longitudes, start_jd, step_days, first, stop,
+            planets, aspects, orb_table, natal_cusps, ephemeris, mode
+        )